@@ -0,0 +1,472 @@
+"""
+Admin Commands for Gilderhaven
+===============================
+
+Commands for inspecting and tuning the game's in-memory caches.
+
+Commands:
+- rendercache: Room appearance and status display cache stats and invalidation
+- memcache: Object cache size by typeclass and targeted flushes
+- cmdprofile: Per-command latency, query, Attribute and message counts
+"""
+
+from evennia import CmdSet
+from commands.command import Command
+
+
+class CmdRenderCache(Command):
+    """
+    Inspect or clear the room appearance and status display caches.
+
+    Usage:
+        rendercache          - Show hit/miss counters
+        rendercache here     - Drop the cached text for this room
+        rendercache clear    - Drop all cached text and reset counters
+
+    Room descriptions are rendered once per time period, weather and
+    season and reused until something changes. Use 'here' after editing
+    a room's attributes by hand. Status bars and panels (status, stats,
+    the combat panel) rebuild by themselves when what they show changes.
+    """
+
+    key = "rendercache"
+    locks = "cmd:perm(Admin) or perm(Developer)"
+    help_category = "Admin"
+
+    def func(self):
+        from typeclasses.base_rooms import get_render_cache_stats, clear_render_cache
+        from world.display_cache import get_display_cache_stats, clear_display_cache
+
+        caller = self.caller
+        arg = self.args.strip().lower()
+
+        if arg == "clear":
+            clear_render_cache()
+            clear_display_cache()
+            caller.msg("Room render and status display caches cleared.")
+            return
+
+        if arg == "here":
+            room = caller.location
+            if not room or not hasattr(room, "invalidate_appearance"):
+                caller.msg("This room doesn't use the render cache.")
+                return
+            clear_render_cache(room)
+            caller.msg(f"Cleared cached appearance for {room.key}.")
+            return
+
+        if arg:
+            caller.msg("Usage: rendercache [here|clear]")
+            return
+
+        stats = get_render_cache_stats()
+        stats.update(get_display_cache_stats())
+        lines = ["|wRender Cache|n"]
+        lines.append("-" * 40)
+        for label, prefix in (
+            ("Static text", "static"),
+            ("Display names", "name"),
+            ("Status bars", "bar"),
+            ("Status panels", "panel"),
+        ):
+            hits = stats[f"{prefix}_hits"]
+            misses = stats[f"{prefix}_misses"]
+            total = hits + misses
+            rate = f"{hits * 100 / total:.1f}%" if total else "-"
+            lines.append(f"{label}: {hits} hits, {misses} misses ({rate})")
+        lines.append(f"Rooms cached: {stats['rooms_cached']}")
+        lines.append(f"Environment version: {stats['environment_version']}")
+        lines.append(f"Bars cached: {stats['bars_cached']}  Panels cached: {stats['panels_cached']}")
+        caller.msg("\n".join(lines))
+
+
+class CmdMemCache(Command):
+    """
+    Report or trim the object cache.
+
+    Usage:
+        memcache                        - RSS, budget and cache by typeclass
+        memcache flush <typeclass> [n]  - Evict cached objects of a typeclass
+        memcache budget                 - Enforce the memory budget now
+
+    Typeclasses match on the end of their path, so "Furniture" matches
+    typeclasses.objects.Furniture. Objects in rooms with players, and
+    anything a player carries, are never evicted.
+    """
+
+    key = "memcache"
+    locks = "cmd:perm(Admin) or perm(Developer)"
+    help_category = "Admin"
+
+    def func(self):
+        from world import memory
+
+        caller = self.caller
+        args = self.args.strip().split()
+
+        if not args:
+            self.show_report(memory)
+            return
+
+        if args[0] == "budget":
+            evicted = memory.enforce_memory_budget()
+            caller.msg(f"Budget check done; evicted {evicted} objects.")
+            return
+
+        if args[0] == "flush" and len(args) >= 2:
+            max_count = None
+            if len(args) >= 3:
+                try:
+                    max_count = int(args[2])
+                except ValueError:
+                    caller.msg("Count must be a number.")
+                    return
+            evicted, freed = memory.flush_objects(typeclass=args[1], max_count=max_count)
+            caller.msg(f"Evicted {evicted} objects (~{freed / 1024:.0f} KB).")
+            return
+
+        caller.msg("Usage: memcache [flush <typeclass> [count]] [budget]")
+
+    def show_report(self, memory):
+        stats = memory.get_memory_stats()
+        rss = stats["rss_mb"]
+        lines = ["|wObject Cache|n"]
+        lines.append("-" * 60)
+        lines.append(
+            f"RSS: {rss:.0f} MB" if rss is not None else "RSS: unknown"
+        )
+        lines.append(f"Budget: {stats['budget_mb']} MB (evict down to {stats['target_mb']} MB)")
+        lines.append(f"Cached objects: {stats['cached_objects']}  Evicted so far: {stats['evicted']}")
+        lines.append("")
+        lines.append(f"{'Typeclass':<40} {'Count':>6} {'~KB':>8} {'Pinned':>6}")
+        for path, count, size, pinned in memory.get_cache_report()[:20]:
+            lines.append(f"{path[-40:]:<40} {count:>6} {size / 1024:>8.0f} {pinned:>6}")
+        self.caller.msg("\n".join(lines))
+
+
+class CmdProfile(Command):
+    """
+    Profile what commands cost.
+
+    Usage:
+        cmdprofile                  - Show the most expensive commands
+        cmdprofile <sort> [n]       - Sort by total, calls, mean, p50, p95,
+                                      p99, max, queries, attr_reads,
+                                      attr_writes or msgs
+        cmdprofile on|off           - Start or stop profiling
+        cmdprofile reset            - Forget collected numbers
+        cmdprofile dump [path]      - Write everything to a JSON file
+
+    Times are milliseconds. Queries, Attribute reads/writes and messages
+    are shown per call. Profiling is off until turned on here or with
+    COMMAND_PROFILING in settings.
+    """
+
+    key = "cmdprofile"
+    locks = "cmd:perm(Admin) or perm(Developer)"
+    help_category = "Admin"
+
+    def func(self):
+        from world import profiler
+
+        caller = self.caller
+        args = self.args.strip().split()
+        action = args[0].lower() if args else "total"
+
+        if action == "on":
+            profiler.enable_profiling()
+            if profiler.is_profiling():
+                caller.msg("Command profiling is on.")
+            else:
+                caller.msg("Could not start the profiler; see the server log.")
+            return
+
+        if action == "off":
+            profiler.disable_profiling()
+            caller.msg("Command profiling is off. Collected numbers are kept.")
+            return
+
+        if action == "reset":
+            profiler.reset_profile()
+            caller.msg("Command profile cleared.")
+            return
+
+        if action == "dump":
+            path = args[1] if len(args) > 1 else None
+            try:
+                path = profiler.dump_profile(path)
+            except OSError as e:
+                caller.msg(f"Could not write the profile: {e}")
+                return
+            caller.msg(f"Command profile written to {path}.")
+            return
+
+        if action not in profiler.SORT_FIELDS:
+            caller.msg("Usage: cmdprofile [<sort> [n]|on|off|reset|dump [path]]")
+            return
+
+        limit = 20
+        if len(args) > 1:
+            try:
+                limit = int(args[1])
+            except ValueError:
+                caller.msg("Count must be a number.")
+                return
+        self.show_report(profiler, action, limit)
+
+    def show_report(self, profiler, sort, limit):
+        stats = profiler.get_profile_stats()
+        lines = ["|wCommand Profile|n"]
+        lines.append("-" * 78)
+        lines.append(
+            f"Profiling: {'on' if stats['enabled'] else 'off'}  "
+            f"Commands: {stats['commands']}  Calls: {stats['calls']}  Sorted by: {sort}"
+        )
+        rows = profiler.get_profile_report(sort=sort, limit=limit)
+        if not rows:
+            lines.append("Nothing recorded yet.")
+            self.caller.msg("\n".join(lines))
+            return
+
+        lines.append("")
+        lines.append(
+            f"{'Command':<14} {'Calls':>6} {'Total':>9} {'p50':>7} {'p95':>7} {'p99':>7} "
+            f"{'Max':>7} {'Qry':>5} {'AttR':>5} {'AttW':>5} {'Msg':>4}"
+        )
+        for row in rows:
+            calls = row["calls"] or 1
+            lines.append(
+                f"{row['key'][:14]:<14} {row['calls']:>6} {row['total_ms']:>9.1f} "
+                f"{row['p50_ms']:>7.2f} {row['p95_ms']:>7.2f} {row['p99_ms']:>7.2f} "
+                f"{row['max_ms']:>7.1f} {row['queries'] / calls:>5.1f} "
+                f"{row['attr_reads'] / calls:>5.1f} {row['attr_writes'] / calls:>5.1f} "
+                f"{row['msgs'] / calls:>4.1f}"
+            )
+        self.caller.msg("\n".join(lines))
+
+
+class CmdContentPack(Command):
+    """
+    Manage content packs.
+
+    Usage:
+        contentpack                 - List loaded packs
+        contentpack load            - Load new and changed pack files
+        contentpack reload <pack>   - Re-read one pack from its file
+        contentpack unload <pack>   - Take a pack's entries out again
+        contentpack validate <file> - Check a pack file without loading it
+
+    Packs are JSON, TOML or YAML files in content/packs/ that add or
+    replace item, recipe, creature, spawn table, quest, dialogue and
+    species templates. Reloading takes effect immediately.
+    """
+
+    key = "contentpack"
+    aliases = ["contentpacks"]
+    locks = "cmd:perm(Admin) or perm(Developer)"
+    help_category = "Admin"
+
+    def func(self):
+        from world import content_packs
+
+        caller = self.caller
+        args = self.args.strip().split(None, 1)
+        action = args[0].lower() if args else "list"
+        target = args[1].strip() if len(args) > 1 else ""
+
+        if action == "list":
+            self.show_packs(content_packs)
+            return
+
+        if action == "load":
+            results = content_packs.load_packs()
+            if not results:
+                caller.msg("No pack files found.")
+                return
+            for path, pack, errors in results:
+                self.report(path, pack, errors)
+            return
+
+        if action in ("reload", "unload", "validate") and not target:
+            caller.msg(f"Usage: contentpack {action} <{'file' if action == 'validate' else 'pack'}>")
+            return
+
+        if action == "reload":
+            pack, errors = content_packs.reload_pack(target)
+            self.report(target, pack, errors)
+            return
+
+        if action == "unload":
+            if content_packs.unload_pack(target):
+                caller.msg(f"Unloaded content pack '{target}'.")
+            else:
+                caller.msg(f"No content pack named '{target}' is loaded.")
+            return
+
+        if action == "validate":
+            data, errors, _, _ = content_packs.read_pack_file(target)
+            if errors:
+                caller.msg(f"|r{target}: {len(errors)} error(s)|n")
+                caller.msg("\n".join(f"  {error}" for error in errors[:30]))
+            else:
+                count = sum(len(data.get(section, {})) for section in content_packs.PACK_SECTIONS)
+                caller.msg(f"|g{target}: valid, {count} entries.|n")
+            return
+
+        caller.msg("Usage: contentpack [load|reload <pack>|unload <pack>|validate <file>]")
+
+    def report(self, label, pack, errors):
+        if errors:
+            self.caller.msg(f"|r{label}: not loaded|n")
+            self.caller.msg("\n".join(f"  {error}" for error in errors[:30]))
+            return
+        source = "cache" if pack.from_cache else "parsed"
+        self.caller.msg(f"|g{pack.name}|n: {pack.count()} entries ({source}, {pack.load_ms:.1f} ms)")
+        for warning in pack.warnings[:10]:
+            self.caller.msg(f"  |y{warning}|n")
+        if len(pack.warnings) > 10:
+            self.caller.msg(f"  ...and {len(pack.warnings) - 10} more warnings")
+
+    def show_packs(self, content_packs):
+        packs = content_packs.get_packs()
+        lines = ["|wContent Packs|n"]
+        lines.append("-" * 78)
+        if not packs:
+            lines.append("No content packs loaded.")
+        for name, pack in sorted(packs.items()):
+            sections = ", ".join(
+                f"{section} {len(pack.data[section])}"
+                for section in content_packs.PACK_SECTIONS if pack.data.get(section)
+            )
+            lines.append(f"{name:<20} {sections or 'empty'}")
+            lines.append(f"    {pack.path}  warnings: {len(pack.warnings)}")
+        self.caller.msg("\n".join(lines))
+
+
+class CmdAreaSync(Command):
+    """
+    Update a built area in place from its builder.
+
+    Usage:
+        areasync                    - List areas that can be synced
+        areasync <area>             - Show what a sync would change
+        areasync <area> apply       - Make those changes
+
+    Rooms, exits, NPCs and furniture keep their dbrefs; only what the
+    builder now makes differently is created, changed or deleted, in
+    one transaction. The area's hub is found from its entrance exit. To
+    build an area that doesn't exist yet, stand in the hub room.
+    """
+
+    key = "areasync"
+    locks = "cmd:perm(Admin) or perm(Developer)"
+    help_category = "Admin"
+
+    def func(self):
+        from world import area_sync
+
+        caller = self.caller
+        args = self.args.strip().lower().split()
+        if not args:
+            lines = ["|wSyncable areas|n"]
+            for area, (builder, area_name) in area_sync.AREA_SPECS.items():
+                hub = area_sync.find_hub(area)
+                where = f"hub {hub.key} ({hub.dbref})" if hub else "not built"
+                lines.append(f"  {area:<14} {builder:<20} {where}")
+            caller.msg("\n".join(lines))
+            return
+
+        area = args[0]
+        apply = len(args) > 1 and args[1] == "apply"
+        if len(args) > 1 and not apply:
+            caller.msg("Usage: areasync [<area> [apply]]")
+            return
+        if area not in area_sync.AREA_SPECS:
+            caller.msg(f"Unknown area '{area}'. Areas: {', '.join(area_sync.AREA_SPECS)}")
+            return
+
+        hub = area_sync.find_hub(area) or caller.location
+        plan, msg = area_sync.sync_area(area, hub, dry_run=not apply)
+        if plan is None:
+            caller.msg(msg)
+            return
+        caller.msg("\n".join(area_sync.format_plan(plan)))
+        if not apply and plan.ops:
+            caller.msg(f"Dry run. Use 'areasync {area} apply' to make these changes.")
+        elif apply:
+            caller.msg(msg)
+
+
+class CmdMsgBatch(Command):
+    """
+    Inspect outbound message batching.
+
+    Usage:
+        msgbatch            - Show batching counters
+        msgbatch on|off     - Start or stop batching
+        msgbatch reset      - Zero the counters
+
+    Plain text sent to a session during one tick goes out as a single
+    send. Ambient lines are capped per room (AMBIENT_RATE_LIMIT).
+    """
+
+    key = "msgbatch"
+    locks = "cmd:perm(Admin) or perm(Developer)"
+    help_category = "Admin"
+
+    def func(self):
+        from world import outbound
+
+        caller = self.caller
+        arg = self.args.strip().lower()
+
+        if arg == "on":
+            outbound.enable_batching()
+            caller.msg("Message batching is on.")
+            return
+        if arg == "off":
+            outbound.disable_batching()
+            caller.msg("Message batching is off.")
+            return
+        if arg == "reset":
+            outbound.reset_outbound_stats()
+            caller.msg("Message batching counters cleared.")
+            return
+        if arg:
+            caller.msg("Usage: msgbatch [on|off|reset]")
+            return
+
+        stats = outbound.get_outbound_stats()
+        messages = stats["messages"]
+        saved = stats["coalesced"] / messages * 100 if messages else 0.0
+        limit, window = outbound.AMBIENT_RATE_LIMIT
+        lines = ["|wOutbound Messages|n"]
+        lines.append("-" * 50)
+        lines.append(f"Batching:          {'on' if stats['enabled'] else 'off'}")
+        lines.append(f"Text messages:     {messages}")
+        lines.append(f"Sends:             {stats['sends']}  ({stats['flushes']} ticks)")
+        lines.append(f"Coalesced:         {stats['coalesced']}  ({saved:.1f}% of messages)")
+        lines.append(f"Sent unbatched:    {stats['passthrough']}")
+        lines.append(f"Ambient sent:      {stats['ambient_sent']}")
+        lines.append(f"Ambient dropped:   {stats['ambient_dropped']}  "
+                     f"(limit {limit} per {window:.0f}s; {stats['limited_rooms']} rooms at it)")
+        caller.msg("\n".join(lines))
+
+
+# =============================================================================
+# Command Set
+# =============================================================================
+
+class AdminCmdSet(CmdSet):
+    """Cache and diagnostics commands for admins."""
+
+    key = "admin"
+    priority = 1
+
+    def at_cmdset_creation(self):
+        self.add(CmdRenderCache())
+        self.add(CmdMemCache())
+        self.add(CmdProfile())
+        self.add(CmdContentPack())
+        self.add(CmdAreaSync())
+        self.add(CmdMsgBatch())
@@ -14,7 +14,8 @@ Commands:
 - heal/clean: Remove temporary modifiers
 """
 
-from evennia import Command, CmdSet
+from evennia import CmdSet
+from commands.command import Command
 from world.body import (
     get_body_parts, get_body_states, get_body_modifiers,
     add_part, edit_part, remove_part, set_part_state,
@@ -6,7 +6,8 @@ Works with WritableBook typeclass from typeclasses/objects/aurias_objects.py
 (or wherever you place it).
 """
 
-from evennia import Command, CmdSet
+from evennia import CmdSet
+from commands.command import Command
 
 
 class CmdNewBook(Command):
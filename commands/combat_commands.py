@@ -4,7 +4,8 @@ Combat Commands for Gilderhaven
 Commands for engaging in and managing combat encounters.
 """
 
-from evennia import Command, CmdSet
+from evennia import CmdSet
+from commands.command import Command
 from evennia.utils import evtable
 
 from world.combat import (
@@ -12,7 +12,8 @@ Commands:
 - workstation        - Use/examine workstation
 """
 
-from evennia import Command, CmdSet
+from evennia import CmdSet
+from commands.command import Command
 from evennia.utils.evtable import EvTable
 
 
@@ -27,6 +27,7 @@ from commands.time_commands import TimeCmdSet
 from commands.crafting_commands import CraftingCmdSet
 from commands.combat_commands import CombatCmdSet, CombatAdminCmdSet
 from commands.party_commands import PartyCmdSet
+from commands.admin_commands import AdminCmdSet
 
 
 class CharacterCmdSet(default_cmds.CharacterCmdSet):
@@ -60,6 +61,7 @@ class CharacterCmdSet(default_cmds.CharacterCmdSet):
         # Admin only:
         # self.add(CombatAdminCmdSet)
         self.add(PartyCmdSet)
+        self.add(AdminCmdSet)
 
 
 class AccountCmdSet(default_cmds.AccountCmdSet):
@@ -9,7 +9,8 @@ Commands:
 - furnish: Alias for furniture place
 """
 
-from evennia import Command, CmdSet
+from evennia import CmdSet
+from commands.command import Command
 from world.furniture import (
     FURNITURE_CATALOG, FURNITURE_CATEGORIES,
     get_catalog_item, list_catalog, create_furniture,
@@ -271,10 +272,8 @@ class CmdFurniture(Command):
         # Check room allows placement
         if room.db.is_home or room.db.is_home_room:
             # Check ownership/permission
-            from world.housing import get_permission_level, get_home_by_id, PERMISSION_LEVELS
-            home = room
-            if room.db.is_home_room:
-                home = get_home_by_id(room.db.parent_home_id)
+            from world.housing import get_permission_level, get_home_for_room, PERMISSION_LEVELS
+            home = get_home_for_room(room)
             
             if home:
                 perm = get_permission_level(home, caller)
@@ -8,7 +8,8 @@ Commands for interacting with the Garden of Knowledge room:
 Add to your default cmdset or create a room-based cmdset.
 """
 
-from evennia import Command, CmdSet
+from evennia import CmdSet
+from commands.command import Command
 
 
 class CmdDesk(Command):
@@ -27,7 +27,8 @@ Usage:
     resources               - List all gatherable nodes in room
 """
 
-from evennia import Command, CmdSet
+from evennia import CmdSet
+from commands.command import Command
 from evennia.utils import logger
 import random
 import time
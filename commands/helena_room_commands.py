@@ -11,7 +11,8 @@ Commands for interacting with Helena's Room:
 Add to your default cmdset or create a room-based cmdset.
 """
 
-from evennia import Command, CmdSet
+from evennia import CmdSet
+from commands.command import Command
 
 
 # =============================================================================
@@ -16,12 +16,14 @@ Commands:
 - kick          - Remove someone from your home
 """
 
-from evennia import Command, CmdSet
+from evennia import CmdSet
+from commands.command import Command
 from evennia.utils.search import search_object
 from world.housing import (
     # Core
     get_home, has_home, create_home, upgrade_home, add_room, purchase_upgrade,
-    get_all_home_rooms, get_home_type,
+    get_all_home_rooms, get_home_type, get_home_for_room, find_home,
+    materialize_home, use_visit,
     # Permissions
     get_permission_level, can_enter, set_permission, invite_visitor,
     revoke_visitor, kick_from_home,
@@ -129,22 +131,14 @@ class CmdHome(Command):
         
         # Check if already home
         current = self.caller.location
-        if current and current.db.is_home:
-            # Get the main home
-            if current.db.is_home_room:
-                main_home = search_object("#" + str(current.db.parent_home_id))
-                main_home = main_home[0] if main_home else None
-            else:
-                main_home = current
-            
-            if main_home and main_home.db.owner_id == self.caller.id:
-                # Already home - show info
-                self.caller.msg(get_home_info(home))
-                return
+        if current and current.db.is_home and current.db.owner_id == self.caller.id:
+            # Already home - show info
+            self.caller.msg(get_home_info(home))
+            return
         
         # Go home
         self.caller.msg("You head home...")
-        self.caller.move_to(home, quiet=False)
+        self.caller.move_to(materialize_home(home), quiet=False)
     
     def show_info(self):
         """Show home information."""
@@ -187,7 +181,7 @@ class CmdHome(Command):
         
         if not args:
             self.caller.msg("Usage: home upgrade <type>")
-            self.caller.msg(f"Current type: {home.db.home_type}")
+            self.caller.msg(f"Current type: {home.home_type}")
             self.caller.msg(list_available_homes())
             return
         
@@ -390,43 +384,35 @@ class CmdKnock(Command):
         
         # Search for a home by name or owner
         search_term = self.args.strip()
-        
-        # Try to find by home name first
-        results = search_object(search_term)
-        home = None
-        
-        for obj in results:
-            if hasattr(obj, 'db') and obj.db.is_home and not obj.db.is_home_room:
-                home = obj
-                break
-        
-        # Try by owner name
-        if not home:
-            owner = self.caller.search(search_term, global_search=True)
-            if owner:
-                home = get_home(owner)
+        home = find_home(search_term)
         
         if not home:
             self.caller.msg(f"Couldn't find a home matching '{search_term}'.")
             return
         
         # Check if already inside
-        if self.caller.location == home:
+        location = self.caller.location
+        if location and location.id in home.room_ids:
             self.caller.msg("You're already inside!")
             return
         
         # Knock
-        self.caller.msg(f"You knock on the door of {home.db.home_name}.")
+        self.caller.msg(f"You knock on the door of {home.home_name}.")
+        
+        # Only a live home has anyone in it to hear
+        rooms = get_all_home_rooms(home)
+        if not rooms:
+            return
         
-        # Notify owner if online and home
-        owner_id = home.db.owner_id
-        for obj in home.contents:
-            if hasattr(obj, 'id') and obj.id == owner_id:
-                obj.msg(f"|y{self.caller.key} is knocking at your door.|n")
-                break
+        # Notify owner if online and home; everyone else in the foyer
+        # just hears a knock
+        owner_id = home.owner_id
+        for room in rooms:
+            for obj in room.contents:
+                if hasattr(obj, 'id') and obj.id == owner_id:
+                    obj.msg(f"|y{self.caller.key} is knocking at your door.|n")
         
-        # Also notify anyone else in the home
-        for obj in home.contents:
+        for obj in rooms[0].contents:
             if hasattr(obj, 'msg') and obj != self.caller:
                 if not (hasattr(obj, 'id') and obj.id == owner_id):
                     obj.msg(f"Someone is knocking at the door.")
@@ -452,21 +438,7 @@ class CmdEnterHome(Command):
             return
         
         search_term = self.args.strip()
-        
-        # Try to find by home name first
-        results = search_object(search_term)
-        home = None
-        
-        for obj in results:
-            if hasattr(obj, 'db') and obj.db.is_home and not obj.db.is_home_room:
-                home = obj
-                break
-        
-        # Try by owner name
-        if not home:
-            owner = self.caller.search(search_term, global_search=True)
-            if owner:
-                home = get_home(owner)
+        home = find_home(search_term)
         
         if not home:
             self.caller.msg(f"Couldn't find a home matching '{search_term}'.")
@@ -474,15 +446,9 @@ class CmdEnterHome(Command):
         
         # Check if already inside
         current = self.caller.location
-        if current and current.db.is_home:
-            if current.db.is_home_room:
-                parent_id = current.db.parent_home_id
-            else:
-                parent_id = current.id
-            
-            if parent_id == home.id:
-                self.caller.msg("You're already in this home!")
-                return
+        if current and current.id in home.room_ids:
+            self.caller.msg("You're already in this home!")
+            return
         
         # Check permission
         allowed, reason = can_enter(home, self.caller)
@@ -492,14 +458,11 @@ class CmdEnterHome(Command):
             return
         
         # Enter
-        self.caller.msg(f"You enter {home.db.home_name}.")
-        self.caller.move_to(home, quiet=False)
+        self.caller.msg(f"You enter {home.home_name}.")
+        self.caller.move_to(materialize_home(home), quiet=False)
         
         # Clear visitor status after entering
-        visitors = home.db.visitors_allowed or []
-        if self.caller.id in visitors:
-            visitors.remove(self.caller.id)
-            home.db.visitors_allowed = visitors
+        use_visit(home, self.caller)
 
 
 class CmdInvite(Command):
@@ -528,13 +491,7 @@ class CmdInvite(Command):
             self.caller.msg("You need to be in your home to invite someone.")
             return
         
-        # Get main home
-        if room.db.is_home_room:
-            home = search_object("#" + str(room.db.parent_home_id))
-            home = home[0] if home else None
-        else:
-            home = room
-        
+        home = get_home_for_room(room)
         if not home:
             self.caller.msg("Error finding home.")
             return
@@ -547,8 +504,8 @@ class CmdInvite(Command):
         self.caller.msg(msg)
         
         if success:
-            target.msg(f"|y{self.caller.key} has invited you to enter {home.db.home_name}.|n")
-            target.msg(f"Use 'enter {home.db.home_name}' to enter.")
+            target.msg(f"|y{self.caller.key} has invited you to enter {home.home_name}.|n")
+            target.msg(f"Use 'enter {home.home_name}' to enter.")
 
 
 class CmdLeaveHome(Command):
@@ -619,8 +576,8 @@ class CmdVisit(Command):
             self.caller.msg(reason or "You don't have permission to visit.")
             return
         
-        self.caller.msg(f"You visit {home.db.home_name}...")
-        self.caller.move_to(home, quiet=False)
+        self.caller.msg(f"You visit {home.home_name}...")
+        self.caller.move_to(materialize_home(home), quiet=False)
 
 
 # =============================================================================
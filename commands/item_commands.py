@@ -16,16 +16,21 @@ Commands:
 - get/take: Pick up an item
 """
 
-from evennia import Command, CmdSet
+from evennia import CmdSet
+from commands.command import Command
 from world.items import (
     is_item, get_item_data, get_item_category, get_item_quantity,
     get_item_value, get_item_display_name,
     is_tool, get_tool_type, get_tool_tier,
     is_consumable, use_item,
     is_equipment, get_equipment_slot, equip_item, unequip_item,
-    get_equipped, get_all_equipped,
+    get_equipped, get_all_equipped, get_item_template,
     ITEM_CATEGORIES, EQUIPMENT_SLOTS, ITEM_QUALITIES
 )
+from world.materials import (
+    get_materials, count_material, find_material, materialize_material,
+    absorb_item, get_material_value, get_material_display_name
+)
 
 
 class CmdInventory(Command):
@@ -50,65 +55,74 @@ class CmdInventory(Command):
     def func(self):
         caller = self.caller
         
-        # Get all items
+        # Get all items, plus materials carried as counts
         items = [obj for obj in caller.contents if is_item(obj)]
+        materials = get_materials(caller)
         
-        if not items:
+        if not items and not materials:
             caller.msg("You aren't carrying anything.")
             return
         
+        # One row per object or ledger entry: (category, name, weight, value, extra)
+        rows = []
+        for item in items:
+            data = get_item_data(item)
+            weight = data.get("weight", 0) * get_item_quantity(item)
+            value = get_item_value(item, for_sale=True)
+            
+            # Show tool durability
+            extra = ""
+            if is_tool(item) and item.db.tool_data:
+                dur = item.db.tool_data.get("durability", 0)
+                max_dur = item.db.tool_data.get("max_durability", 100)
+                pct = int((dur / max_dur) * 100) if max_dur > 0 else 0
+                if pct < 25:
+                    extra = f" |r[{pct}%]|n"
+                elif pct < 50:
+                    extra = f" |y[{pct}%]|n"
+            
+            rows.append((get_item_category(item), get_item_display_name(item), weight, value, extra))
+        
+        for template_key, quality, quantity in materials:
+            template = get_item_template(template_key) or {}
+            rows.append((
+                template.get("category", "material"),
+                get_material_display_name(template_key, quality, quantity),
+                template.get("weight", 0) * quantity,
+                get_material_value(template_key, quality, quantity),
+                "",
+            ))
+        
         # Filter by category if specified
         filter_cat = self.args.strip().lower() if self.args else None
         if filter_cat:
-            items = [i for i in items if get_item_category(i) == filter_cat]
-            if not items:
+            rows = [row for row in rows if row[0] == filter_cat]
+            if not rows:
                 caller.msg(f"You have no {filter_cat} items.")
                 return
         
         # Group by category
         by_category = {}
-        for item in items:
-            cat = get_item_category(item)
-            if cat not in by_category:
-                by_category[cat] = []
-            by_category[cat].append(item)
+        for row in rows:
+            by_category.setdefault(row[0], []).append(row)
         
         # Calculate totals
-        total_weight = sum(
-            (get_item_data(i).get("weight", 0) * get_item_quantity(i))
-            for i in items
-        )
-        total_value = sum(get_item_value(i, for_sale=True) for i in items)
+        total_weight = sum(row[2] for row in rows)
+        total_value = sum(row[3] for row in rows)
         
         # Build output
         lines = ["|wInventory|n"]
         lines.append("-" * 50)
         
-        for cat, cat_items in sorted(by_category.items()):
+        for cat, cat_rows in sorted(by_category.items()):
             cat_name = ITEM_CATEGORIES.get(cat, cat.title())
             lines.append(f"\n|y{cat_name}:|n")
             
-            for item in cat_items:
-                name = get_item_display_name(item)
-                data = get_item_data(item)
-                weight = data.get("weight", 0) * get_item_quantity(item)
-                value = get_item_value(item, for_sale=True)
-                
-                # Show tool durability
-                extra = ""
-                if is_tool(item) and item.db.tool_data:
-                    dur = item.db.tool_data.get("durability", 0)
-                    max_dur = item.db.tool_data.get("max_durability", 100)
-                    pct = int((dur / max_dur) * 100) if max_dur > 0 else 0
-                    if pct < 25:
-                        extra = f" |r[{pct}%]|n"
-                    elif pct < 50:
-                        extra = f" |y[{pct}%]|n"
-                
+            for _, name, weight, value, extra in cat_rows:
                 lines.append(f"  {name}{extra} |x({weight:.1f} lb, {value}c)|n")
         
         lines.append("\n" + "-" * 50)
-        lines.append(f"|xTotal: {len(items)} items, {total_weight:.1f} lbs, worth ~{total_value}c|n")
+        lines.append(f"|xTotal: {len(rows)} items, {total_weight:.1f} lbs, worth ~{total_value}c|n")
         
         caller.msg("\n".join(lines))
 
@@ -350,9 +364,13 @@ class CmdExamine(Command):
             caller.msg("Examine what?")
             return
         
-        # Search inventory first, then room
+        # Search inventory first, then materials, then room
         item = caller.search(self.args, location=caller, quiet=True)
         if not item:
+            material = find_material(caller, self.args)
+            if material:
+                self.examine_material(material)
+                return
             item = caller.search(self.args, location=caller.location, quiet=True)
         if not item:
             caller.msg(f"You don't see '{self.args}' here.")
@@ -440,6 +458,32 @@ class CmdExamine(Command):
         
         lines.append("-" * 40)
         caller.msg("\n".join(lines))
+    
+    def examine_material(self, template_key):
+        """Describe a ledger material from its template; no object needed."""
+        template = get_item_template(template_key) or {}
+        lines = [f"|w{template.get('key', template_key)}|n"]
+        lines.append("-" * 40)
+        lines.append(template.get("desc") or "You see nothing special.")
+        lines.append("")
+        
+        cat = template.get("category", "material")
+        lines.append(f"|yCategory:|n {ITEM_CATEGORIES.get(cat, cat.title())}")
+        
+        for _, quality, quantity in [row for row in get_materials(self.caller) if row[0] == template_key]:
+            quality_name = ITEM_QUALITIES.get(quality, {}).get("name", quality.title())
+            value = get_material_value(template_key, quality, for_sale=False)
+            sell_value = get_material_value(template_key, quality)
+            lines.append(f"|yQuantity:|n {quantity} {quality_name} ({value}c each, sells for {sell_value}c)")
+        
+        lines.append(f"|yWeight:|n {template.get('weight', 0):.1f} lbs each")
+        
+        flags = template.get("flags", [])
+        if flags:
+            lines.append(f"|yFlags:|n {', '.join(flags)}")
+        
+        lines.append("-" * 40)
+        self.caller.msg("\n".join(lines))
 
 
 class CmdDrop(Command):
@@ -471,7 +515,8 @@ class CmdDrop(Command):
         # Find item
         item = caller.search(self.args, location=caller, quiet=True)
         if not item:
-            caller.msg(f"You don't have '{self.args}'.")
+            if not self.drop_material():
+                caller.msg(f"You don't have '{self.args}'.")
             return
         
         item = item[0] if isinstance(item, list) else item
@@ -490,6 +535,47 @@ class CmdDrop(Command):
             f"{caller.key} drops {item.key}.",
             exclude=[caller]
         )
+    
+    def drop_material(self):
+        """
+        Drop ledger materials as real objects.
+        
+        Accepts "<material>", "<count> <material>" or "all <material>".
+        
+        Returns:
+            bool: False if no material matched
+        """
+        caller = self.caller
+        args = self.args.strip().split()
+        quantity = None
+        if len(args) > 1 and args[0].isdigit():
+            quantity = int(args[0])
+            args = args[1:]
+        elif len(args) > 1 and args[0].lower() == "all":
+            args = args[1:]
+        
+        material = find_material(caller, " ".join(args))
+        if not material:
+            return False
+        
+        if "no_drop" in (get_item_template(material) or {}).get("flags", []):
+            caller.msg("You can't drop that.")
+            return True
+        
+        have = count_material(caller, material)
+        if quantity is not None and quantity > have:
+            caller.msg(f"You only have {have}.")
+            return True
+        
+        stacks = materialize_material(caller, material, quantity, location=caller.location)
+        if not stacks:
+            return False
+        
+        dropped = sum(get_item_quantity(stack) for stack in stacks)
+        name = stacks[0].key + (f" x{dropped}" if dropped > 1 else "")
+        caller.msg(f"You drop {name}.")
+        caller.location.msg_contents(f"{caller.key} drops {name}.", exclude=[caller])
+        return True
 
 
 class CmdGet(Command):
@@ -533,10 +619,13 @@ class CmdGet(Command):
             return
         
         # Pick it up
-        item.move_to(caller, quiet=True)
-        caller.msg(f"You pick up {item.key}.")
+        name = item.key
+        if item.move_to(caller, quiet=True):
+            # Materials fold into the material ledger
+            absorb_item(caller, item)
+        caller.msg(f"You pick up {name}.")
         caller.location.msg_contents(
-            f"{caller.key} picks up {item.key}.",
+            f"{caller.key} picks up {name}.",
             exclude=[caller]
         )
 
@@ -10,11 +10,12 @@ Commands:
 - npcs: List NPCs in room
 """
 
-from evennia import Command, CmdSet
+from evennia import CmdSet
+from commands.command import Command
 from world.npcs import (
     is_npc, start_dialogue, process_dialogue_choice,
     is_in_dialogue, end_dialogue, get_npc_data,
-    get_npc_memory, npc_ambient_action
+    get_npc_memory, npc_ambient_action, get_dialogue_partners
 )
 
 
@@ -191,11 +192,11 @@ class CmdNPCs(Command):
             flags = npc_data.get("flags", [])
             
             status = ""
-            if npc.db.npc_state and npc.db.npc_state.get("talking_to"):
-                if npc.db.npc_state["talking_to"] == caller.id:
-                    status = " |c(talking to you)|n"
-                else:
-                    status = " |x(busy)|n"
+            partners = get_dialogue_partners(npc)
+            if caller.id in partners:
+                status = " |c(talking to you)|n"
+            elif partners:
+                status = " |x(busy)|n"
             
             markers = []
             if "merchant" in flags:
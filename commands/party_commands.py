@@ -4,7 +4,8 @@ Party Commands for Gilderhaven
 Commands for forming, managing, and interacting with parties.
 """
 
-from evennia import Command, CmdSet
+from evennia import CmdSet
+from commands.command import Command
 
 from world.parties import (
     get_party, is_in_party, is_party_leader,
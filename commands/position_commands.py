@@ -14,7 +14,8 @@ Commands:
 - positions: List available positions
 """
 
-from evennia import Command, CmdSet
+from evennia import CmdSet
+from commands.command import Command
 from world.positions import (
     POSITIONS, POSITION_CATEGORIES,
     get_position, get_position_type, get_position_display,
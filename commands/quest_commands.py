@@ -12,7 +12,8 @@ Commands:
 - abandon: Abandon a quest
 """
 
-from evennia import Command, CmdSet
+from evennia import CmdSet
+from commands.command import Command
 from world.quests import (
     get_quest_log, get_active_quests, has_quest, has_completed,
     get_quest_progress, is_quest_complete, can_take_quest,
@@ -11,11 +11,12 @@ Commands:
 - browse: View shop inventory
 """
 
-from evennia import Command, CmdSet
+from evennia import CmdSet
+from commands.command import Command
 from world.shops import (
     is_shop, open_shop, close_shop, get_current_shop,
-    buy_item, sell_item, get_shop_data, get_shop_stock,
-    get_buy_price, get_sell_price, get_shop_inventory_display,
+    buy_item, sell_item, sell_material, get_shop_data,
+    get_buy_price, get_sell_price, get_shop_inventory_display, get_shop_catalog,
     ITEM_TEMPLATES
 )
 from world.items import (
@@ -23,6 +24,7 @@ from world.items import (
 )
 from world.npcs import is_npc
 from world.currency import balance
+from world.materials import find_material, count_material
 
 
 class CmdShop(Command):
@@ -143,11 +145,10 @@ class CmdBuy(Command):
             return
         
         # Find matching item in shop stock
-        stock = get_shop_stock(shop)
         item_name_lower = item_name.lower()
         
         matching_key = None
-        for template_key in stock.keys():
+        for template_key in get_shop_catalog(shop):
             template = ITEM_TEMPLATES.get(template_key)
             if not template:
                 continue
@@ -247,7 +248,17 @@ class CmdSell(Command):
         # Find item in inventory
         item = caller.search(item_name, location=caller, quiet=True)
         if not item:
-            caller.msg(f"You don't have '{item_name}'.")
+            # Materials are carried as counts, not objects
+            material = find_material(caller, item_name)
+            if not material:
+                caller.msg(f"You don't have '{item_name}'.")
+                return
+            if sell_all:
+                quantity = count_material(caller, material)
+            success, message = sell_material(caller, shop, material, quantity)
+            caller.msg(message)
+            if success:
+                caller.msg(f"|xBalance: {balance(caller)}c|n")
             return
         
         item = item[0] if isinstance(item, list) else item
@@ -11,7 +11,8 @@ Commands:
     compose     - Attempt to recover composure
 """
 
-from evennia import Command, CmdSet
+from evennia import CmdSet
+from commands.command import Command
 from evennia.utils import delay
 
 
@@ -5,7 +5,8 @@ Commands for viewing and managing character states like
 energy, arousal, condition, etc.
 """
 
-from evennia import Command, CmdSet
+from evennia import CmdSet
+from commands.command import Command
 
 from world.states import (
     get_state_display, get_state_summary, initialize_states,
@@ -10,7 +10,8 @@ Commands:
 - calendar: View calendar info
 """
 
-from evennia import Command, CmdSet
+from evennia import CmdSet
+from commands.command import Command
 from world.time_weather import (
     get_time, get_period, get_formatted_time, get_time_string,
     get_season, get_season_description, get_period_description,
@@ -17,6 +17,10 @@ Or build all from a central hub:
 
 Connect Limbo to your hub:
     @py from content.builders import connect_limbo; connect_limbo(here)
+
+Update a built area in place after editing its builder (keeps dbrefs):
+    areasync whisperwood            (shows the plan)
+    areasync whisperwood apply
 """
 
 from evennia import create_object, search_object
@@ -310,7 +310,6 @@ def build_market(hub_room):
             "dialogue_root": npc_data.get("dialogue_root", "shopkeeper_greeting"),
             "flags": ["merchant"],
         }
-        npc.db.npc_memory = {}
         npc.db.npc_state = {"current_activity": "shopkeeping"}
         
         # Set up shop
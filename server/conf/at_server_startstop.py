@@ -30,7 +30,25 @@ def at_server_start():
     This is called every time the server starts up, regardless of
     how it was shut down.
     """
-    pass
+    # Resolve the world clock once; everything else reads it from memory
+    from world.time_weather import start_world_clock
+    start_world_clock()
+
+    # Keep the object cache under its memory budget
+    from world.memory import start_memory_manager
+    start_memory_manager()
+
+    # Command cost accounting, if settings.COMMAND_PROFILING is on
+    from world.profiler import start_profiler
+    start_profiler()
+
+    # Template overrides and additions from content/packs/
+    from world.content_packs import start_content_packs
+    start_content_packs()
+
+    # Home records and idle home cleanup
+    from world.housing import start_home_registry
+    start_home_registry()
 
 
 def at_server_stop():
@@ -38,7 +56,12 @@ def at_server_stop():
     This is called just before the server is shut down, regardless
     of it is for a reload, reset or shutdown.
     """
-    pass
+    # Write back in-memory state that is persisted write-behind
+    from world.scenes import flush_scene_states
+    flush_scene_states()
+
+    from world.positions import flush_positions
+    flush_positions()
 
 
 def at_server_reload_start():
@@ -19,10 +19,15 @@ settings file:
 
     SERVER_SESSION_CLASS = "server.conf.serversession.ServerSession"
 
+Gilderhaven does, so that outgoing text is batched per tick (see
+world/outbound.py).
+
 """
 
 from evennia.server.serversession import ServerSession as BaseServerSession
 
+from world.outbound import session_data_out
+
 
 class ServerSession(BaseServerSession):
     """
@@ -34,4 +39,9 @@ class ServerSession(BaseServerSession):
     through their session(s).
     """
 
-    pass
+    def data_out(self, **kwargs):
+        """
+        Send output to this session, batched with the rest of this tick's
+        plain text when possible.
+        """
+        session_data_out(self, super().data_out, kwargs)
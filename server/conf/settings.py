@@ -55,3 +55,19 @@ BASE_EXIT_TYPECLASS = "typeclasses.exits.Exit"
 # Server name
 SERVERNAME = "Gilderhaven"
 GAME_SLOGAN = "Where worlds intersect"
+
+# Default commands (look, get, say...) inherit our base MuxCommand so
+# they are profiled along with the game's own commands
+COMMAND_DEFAULT_CLASS = "commands.command.MuxCommand"
+
+# Start with the command profiler on (see world/profiler.py and the
+# cmdprofile admin command)
+COMMAND_PROFILING = False
+
+# Batch each session's outgoing text into one send per tick (see
+# world/outbound.py and the msgbatch admin command)
+SERVER_SESSION_CLASS = "server.conf.serversession.ServerSession"
+MESSAGE_BATCHING = True
+
+# At most this many ambient lines per room per this many seconds
+AMBIENT_RATE_LIMIT = (3, 60.0)
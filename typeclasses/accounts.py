@@ -136,7 +136,11 @@ class Account(DefaultAccount):
 
     """
 
-    pass
+    def delete(self, *args, **kwargs):
+        """Delete the account along with its currency ledger."""
+        from world.currency import delete_ledger
+        delete_ledger(self)
+        return super().delete(*args, **kwargs)
 
 
 class Guest(DefaultGuest):
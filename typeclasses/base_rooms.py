@@ -59,19 +59,34 @@ Shortcode Reference:
         <terrain>           - Terrain type description
         <ground>            - Ground surface description
         <sky>               - Sky description (weather/time aware)
+
+Render Cache:
+    The static part of a room's text (desc, time/season/weather chunks,
+    surfaces, atmosphere) is rendered once per environment and cached.
+    Shortcodes named in a room's DYNAMIC_SHORTCODES (crowd, activity,
+    bleeding, exits, contents, anything tied to objects or the looker)
+    are left as placeholders and filled on every look. Call
+    room.invalidate_appearance() after changing room state that the
+    static text is built from; setting or removing one of the room's
+    APPEARANCE_ATTRIBUTES does this by itself.
 """
 
 from typing import Optional, Dict, Any, List, Tuple
-from evennia.objects.objects import DefaultRoom
-from evennia.utils.utils import lazy_property
+from evennia.objects.objects import DefaultRoom, DefaultObject, DefaultCharacter
+from evennia.utils.utils import lazy_property, make_iter
 
 # Handle early import during Django migration loading
 try:
-    from evennia.typeclasses.attributes import AttributeProperty
+    from evennia.typeclasses.attributes import (
+        AttributeHandler, AttributeProperty, ModelAttributeBackend,
+    )
 except (ImportError, TypeError, AttributeError):
     def AttributeProperty(default=None, **kwargs):
         return default
+    AttributeHandler = object
+    ModelAttributeBackend = None
 import random
+import re
 
 
 # =============================================================================
@@ -568,6 +583,195 @@ class Partition:
         return cls(**data)
 
 
+# =============================================================================
+# RENDER CACHE
+# =============================================================================
+# Static room text is cached per room, keyed by the environment version
+# (bumped by the world event bus when the period, weather or season
+# changes), the raw desc and the key; invalidate_appearance() drops it,
+# and the room's AttributeHandler drops it whenever one of the room's
+# APPEARANCE_ATTRIBUTES is set or removed. Display
+# names in contents listings are memoized per room, keyed by the room's
+# contents version (bumped when anything enters or leaves).
+
+# Wraps a dynamic shortcode left in cached static text
+_DYNAMIC_MARK = "\x00"
+# Separates dynamic shortcodes rendered together in one pass
+_DYNAMIC_SEP = "\x01"
+
+_SHORTCODE_RE = re.compile(r"<[^>]+>")
+_BLANK_LINES_RE = re.compile(r"\n\s*\n\s*\n")
+
+_environment_version = 0
+_watching_environment = False
+
+# Rebuildable per-room state kept on ndb
+_RENDER_NDB_KEYS = ("contents_version", "contents_partition", "display_names")
+
+# room.id -> (key, text)
+_static_appearance = {}
+
+_render_stats = {
+    "static_hits": 0,
+    "static_misses": 0,
+    "name_hits": 0,
+    "name_misses": 0,
+}
+
+
+class _AppearanceAttributeHandler(AttributeHandler):
+    """
+    AttributeHandler that drops the room's static text when an Attribute
+    it is rendered from changes, however it was set (property, db, @set).
+    Dicts edited in place bypass it; reassign them instead.
+    """
+    
+    def _changed(self, keys, category=None):
+        if category is None and (keys is None or any(
+                key in self.obj.APPEARANCE_ATTRIBUTES for key in make_iter(keys))):
+            _static_appearance.pop(self.obj.id, None)
+    
+    def add(self, key, value, category=None, **kwargs):
+        super().add(key, value, category=category, **kwargs)
+        self._changed(key, category)
+    
+    def batch_add(self, *args, **kwargs):
+        super().batch_add(*args, **kwargs)
+        for entry in args:
+            self._changed(entry[0], entry[2] if len(entry) > 2 else None)
+    
+    def remove(self, key=None, category=None, **kwargs):
+        super().remove(key=key, category=category, **kwargs)
+        self._changed(key, category)
+    
+    def clear(self, category=None, **kwargs):
+        super().clear(category=category, **kwargs)
+        self._changed(None, category)
+
+
+def _on_environment_changed(event):
+    global _environment_version
+    _environment_version += 1
+
+
+def _watch_environment():
+    """Subscribe to the environment topics on first render."""
+    global _watching_environment
+    if _watching_environment:
+        return
+    from world.events import subscribe, PERIOD_CHANGED, WEATHER_CHANGED, SEASON_CHANGED
+    for topic in (PERIOD_CHANGED, WEATHER_CHANGED, SEASON_CHANGED):
+        subscribe(topic, _on_environment_changed)
+    _watching_environment = True
+
+
+def clean_shortcodes(text: str) -> str:
+    """Strip unreplaced shortcodes and collapse runs of blank lines."""
+    text = _SHORTCODE_RE.sub("", text)
+    text = _BLANK_LINES_RE.sub("\n\n", text)
+    return text.strip()
+
+
+def get_render_cache_stats() -> dict:
+    """Hit/miss counters and size of the room render cache."""
+    stats = dict(_render_stats)
+    stats["rooms_cached"] = len(_static_appearance)
+    stats["environment_version"] = _environment_version
+    return stats
+
+
+def clear_render_cache(room=None) -> None:
+    """Drop cached appearance text, for one room or all of them."""
+    if room is not None:
+        room.invalidate_appearance()
+        return
+    global _environment_version
+    _static_appearance.clear()
+    # Name memos live on each room's ndb; a version bump orphans them
+    _environment_version += 1
+    for key in _render_stats:
+        _render_stats[key] = 0
+
+
+# =============================================================================
+# CONTENTS PARTITION
+# =============================================================================
+# Each room keeps its contents split by kind on its ndb, updated as things
+# enter and leave. A look filters the partitions for the looker in one
+# pass and reuses display names per (object, looker class).
+
+CONTENT_KINDS = ("characters", "npcs", "items", "exits")
+
+_memoizable_name_methods = None
+
+
+def get_content_kind(obj) -> str:
+    """Which partition of a room's contents an object belongs in."""
+    if obj.destination:
+        return "exits"
+    if getattr(obj, "is_npc", False):
+        return "npcs"
+    if isinstance(obj, DefaultCharacter):
+        return "characters"
+    return "items"
+
+
+def get_looker_class(looker) -> Optional[str]:
+    """Lookers in the same class see the same names; builders see dbrefs."""
+    if looker is None:
+        return None
+    if looker.locks.check_lockstring(looker, "perm(Builder)"):
+        return "builder"
+    return "player"
+
+
+def is_visible_to(obj, looker) -> bool:
+    """Whether looker can see obj in a room listing."""
+    if not getattr(obj, "visible", True):
+        return False
+    if getattr(obj, "is_hidden", False):
+        if looker is None:
+            return False
+        is_discovered_by = getattr(obj, "is_discovered_by", None)
+        if is_discovered_by:
+            return is_discovered_by(looker)
+        return looker.id in (getattr(obj, "discovered_by", None) or ())
+    return True
+
+
+def _name_is_memoizable(obj) -> bool:
+    """
+    Only names from the stock get_display_name implementations are
+    memoized; overrides elsewhere show live state (door open/locked,
+    depletion, traffic) and are asked every time.
+    """
+    global _memoizable_name_methods
+    if _memoizable_name_methods is None:
+        from typeclasses.objects import Object
+        _memoizable_name_methods = {
+            DefaultObject.get_display_name,
+            Object.get_display_name,
+        }
+    return type(obj).get_display_name in _memoizable_name_methods
+
+
+def _display_name(obj, looker, looker_class, names) -> str:
+    if not _name_is_memoizable(obj):
+        return obj.get_display_name(looker)
+    key = (obj.id, looker_class)
+    is_revealed_to = getattr(obj, "is_revealed_to", None)
+    if is_revealed_to is not None:
+        # Disguised objects (the Eevee) name themselves per reveal state
+        key += (bool(is_revealed_to(looker)),)
+    name = names.get(key)
+    if name is None:
+        _render_stats["name_misses"] += 1
+        name = names[key] = obj.get_display_name(looker)
+    else:
+        _render_stats["name_hits"] += 1
+    return name
+
+
 # =============================================================================
 # BASE ROOM
 # =============================================================================
@@ -660,6 +864,32 @@ class Room(DefaultRoom):
     
     partitions = AttributeProperty(default=dict)  # {name: partition_dict}
     
+    # -------------------------------------------------------------------------
+    # Render Cache
+    # -------------------------------------------------------------------------
+    
+    # Shortcodes re-rendered on every look rather than cached with the
+    # static text. Subclasses extend this with their own state/looker codes.
+    DYNAMIC_SHORTCODES = (
+        "crowd.level", "crowd.desc", "ambient.activity",
+        "sound.nearby", "scent.nearby", "exits", "contents",
+    )
+    
+    # Attributes the static text is rendered from. Setting one (in code
+    # or with @set) drops the cached text, so the edit shows at once.
+    # Subclasses extend this with their own.
+    APPEARANCE_ATTRIBUTES = (
+        "region", "zone", "subzone", "time_descriptions", "season_descriptions",
+        "weather_descriptions", "ambient_sounds", "ambient_scents",
+    )
+    
+    # Cache eviction order (see world.memory)
+    EVICTION_TIER = "room"
+    
+    @lazy_property
+    def attributes(self):
+        return _AppearanceAttributeHandler(self, ModelAttributeBackend)
+    
     # -------------------------------------------------------------------------
     # Room Hooks
     # -------------------------------------------------------------------------
@@ -690,52 +920,76 @@ class Room(DefaultRoom):
         self.ambient_sounds = preset.get("ambient_sounds", "")
         self.ambient_scents = preset.get("ambient_scents", "")
         self.mood = preset.get("mood", "")
+        self.invalidate_appearance()
         
         return True
     
     # -------------------------------------------------------------------------
     # Time/Weather/Season Getters
     # -------------------------------------------------------------------------
+    # These read the in-process world clock; no database access.
     
     def get_time_period(self) -> str:
         """Get current time period for this room."""
         try:
-            from world.world_state import get_world_state
-            return get_world_state().get_time_period()
-        except:
+            from world.time_weather import get_world_clock
+            return get_world_clock().get_time_period()
+        except Exception:
             return TimeOfDay.get_current_period()
     
     def get_weather(self) -> str:
         """Get current weather for this room."""
         try:
-            from world.world_state import get_world_state
-            return get_world_state().get_weather()
-        except:
+            from world.time_weather import get_world_clock
+            return get_world_clock().get_weather()
+        except Exception:
             return Weather.get_current_condition()
     
     def get_season(self) -> str:
         """Get current season for this room."""
         try:
-            from world.world_state import get_world_state
-            return get_world_state().get_season()
-        except:
+            from world.time_weather import get_world_clock
+            return get_world_clock().get_season()
+        except Exception:
             return Season.get_current_season()
     
+    # -------------------------------------------------------------------------
+    # Movement Hooks
+    # -------------------------------------------------------------------------
+    
+    def at_object_receive(self, moved_obj, source_location, move_type="move", **kwargs):
+        """Publish room_entered to this room's and area's subscribers."""
+        super().at_object_receive(moved_obj, source_location, move_type=move_type, **kwargs)
+        self.ndb.contents_version = (self.ndb.contents_version or 0) + 1
+        partition = self.ndb.contents_partition
+        if partition is not None:
+            bucket = partition[get_content_kind(moved_obj)]
+            if moved_obj not in bucket:
+                bucket.append(moved_obj)
+        from world.events import publish, ROOM_ENTERED
+        publish(ROOM_ENTERED, room=self, obj=moved_obj, source=source_location)
+    
+    def at_object_leave(self, moved_obj, target_location, move_type="move", **kwargs):
+        """Publish room_left to this room's and area's subscribers."""
+        super().at_object_leave(moved_obj, target_location, move_type=move_type, **kwargs)
+        self.ndb.contents_version = (self.ndb.contents_version or 0) + 1
+        partition = self.ndb.contents_partition
+        if partition is not None:
+            for bucket in partition.values():
+                if moved_obj in bucket:
+                    bucket.remove(moved_obj)
+        from world.events import publish, ROOM_LEFT
+        publish(ROOM_LEFT, room=self, obj=moved_obj, destination=target_location)
+    
     # -------------------------------------------------------------------------
     # Crowd Calculation
     # -------------------------------------------------------------------------
     
     def get_occupant_count(self) -> int:
         """Count players and NPCs in room."""
-        count = 0
-        for obj in self.contents:
-            # Count players
-            if hasattr(obj, 'account') and obj.account:
-                count += 1
-            # Count NPCs (would check for NPC typeclass)
-            elif hasattr(obj, 'is_npc') and obj.is_npc:
-                count += 1
-        return count
+        partition = self.get_contents_partition()
+        players = sum(1 for obj in partition["characters"] if obj.account)
+        return players + len(partition["npcs"])
     
     def get_crowd_level(self) -> str:
         """Calculate current crowd level."""
@@ -831,89 +1085,97 @@ class Room(DefaultRoom):
         if not text:
             return ""
         
+        # Sections only run when their shortcodes appear, so rendering a
+        # fragment of dynamic codes doesn't pay for the whole room.
+        
         # --- Room Identity ---
-        text = text.replace("<room.name>", self.key)
-        text = text.replace("<room.region>", self.region)
-        text = text.replace("<room.zone>", self.zone or "")
-        text = text.replace("<room.subzone>", self.subzone or "")
+        if "<room." in text:
+            text = text.replace("<room.name>", self.key)
+            text = text.replace("<room.region>", self.region)
+            text = text.replace("<room.zone>", self.zone or "")
+            text = text.replace("<room.subzone>", self.subzone or "")
         
         # --- Time ---
-        current_time = self.get_time_period()
-        time_data = TimeOfDay.get_period_data(current_time)
-        
-        text = text.replace("<time.period>", current_time)
-        
-        # Time description: use room-specific if available, else default
-        time_desc = self.time_descriptions.get(current_time, time_data["default_desc"])
-        text = text.replace("<time.desc>", time_desc)
+        if "<time." in text:
+            current_time = self.get_time_period()
+            time_data = TimeOfDay.get_period_data(current_time)
+            
+            text = text.replace("<time.period>", current_time)
+            
+            # Time description: use room-specific if available, else default
+            time_desc = self.time_descriptions.get(current_time, time_data["default_desc"])
+            text = text.replace("<time.desc>", time_desc)
         
         # --- Season ---
-        current_season = self.get_season()
-        season_data = Season.get_season_data(current_season)
-        
-        text = text.replace("<season>", current_season)
-        
-        season_desc = self.season_descriptions.get(current_season, season_data["desc"])
-        text = text.replace("<season.desc>", season_desc)
+        if "<season" in text:
+            current_season = self.get_season()
+            season_data = Season.get_season_data(current_season)
+            
+            text = text.replace("<season>", current_season)
+            
+            season_desc = self.season_descriptions.get(current_season, season_data["desc"])
+            text = text.replace("<season.desc>", season_desc)
         
         # --- Weather ---
-        current_weather = self.get_weather()
-        weather_data = Weather.get_condition_data(current_weather)
-        
-        text = text.replace("<weather>", current_weather)
-        
-        weather_desc = self.weather_descriptions.get(current_weather, weather_data.get("outdoor_desc", ""))
-        text = text.replace("<weather.desc>", weather_desc)
+        if "<weather>" in text or "<weather.desc>" in text:
+            current_weather = self.get_weather()
+            weather_data = Weather.get_condition_data(current_weather)
+            
+            text = text.replace("<weather>", current_weather)
+            
+            weather_desc = self.weather_descriptions.get(current_weather, weather_data.get("outdoor_desc", ""))
+            text = text.replace("<weather.desc>", weather_desc)
         
         # --- Crowd ---
-        crowd_level = self.get_crowd_level()
-        crowd_data = CrowdLevel.get_level_data(crowd_level)
-        
-        text = text.replace("<crowd.level>", crowd_level)
-        
-        crowd_desc = self.crowd_descriptions.get(crowd_level, crowd_data["desc"])
-        text = text.replace("<crowd.desc>", crowd_desc)
+        if "<crowd." in text:
+            crowd_level = self.get_crowd_level()
+            crowd_data = CrowdLevel.get_level_data(crowd_level)
+            
+            text = text.replace("<crowd.level>", crowd_level)
+            
+            crowd_desc = self.crowd_descriptions.get(crowd_level, crowd_data["desc"])
+            text = text.replace("<crowd.desc>", crowd_desc)
         
         # --- Ambient ---
-        text = text.replace("<ambient.sound>", self.ambient_sounds or "")
-        text = text.replace("<ambient.scent>", self.ambient_scents or "")
-        text = text.replace("<ambient.sounds>", self.ambient_sounds or "")
-        text = text.replace("<ambient.scents>", self.ambient_scents or "")
-        
-        activity = self.get_random_activity()
-        text = text.replace("<ambient.activity>", activity)
+        if "<ambient." in text:
+            text = text.replace("<ambient.sound>", self.ambient_sounds or "")
+            text = text.replace("<ambient.scent>", self.ambient_scents or "")
+            text = text.replace("<ambient.sounds>", self.ambient_sounds or "")
+            text = text.replace("<ambient.scents>", self.ambient_scents or "")
+            
+            if "<ambient.activity>" in text:
+                text = text.replace("<ambient.activity>", self.get_random_activity())
         
         # --- Sound/Scent Bleeding ---
-        nearby_sounds = self.get_nearby_sounds()
-        text = text.replace("<sound.nearby>", " ".join(nearby_sounds) if nearby_sounds else "")
+        if "<sound.nearby>" in text:
+            nearby_sounds = self.get_nearby_sounds()
+            text = text.replace("<sound.nearby>", " ".join(nearby_sounds) if nearby_sounds else "")
         
-        nearby_scents = self.get_nearby_scents()
-        text = text.replace("<scent.nearby>", " ".join(nearby_scents) if nearby_scents else "")
+        if "<scent.nearby>" in text:
+            nearby_scents = self.get_nearby_scents()
+            text = text.replace("<scent.nearby>", " ".join(nearby_scents) if nearby_scents else "")
         
         # --- Atmosphere (combined) ---
-        atmosphere_parts = []
-        if self.ambient_sounds:
-            atmosphere_parts.append(f"You hear {self.ambient_sounds}.")
-        if self.ambient_scents:
-            atmosphere_parts.append(f"The air carries the scent of {self.ambient_scents}.")
-        text = text.replace("<atmosphere>", " ".join(atmosphere_parts))
+        if "<atmosphere>" in text:
+            atmosphere_parts = []
+            if self.ambient_sounds:
+                atmosphere_parts.append(f"You hear {self.ambient_sounds}.")
+            if self.ambient_scents:
+                atmosphere_parts.append(f"The air carries the scent of {self.ambient_scents}.")
+            text = text.replace("<atmosphere>", " ".join(atmosphere_parts))
         
         # --- Dynamic Content ---
-        text = text.replace("<exits>", self.get_display_exits(looker))
-        text = text.replace("<contents>", self.get_display_contents(looker))
+        if "<exits>" in text:
+            text = text.replace("<exits>", self.get_display_exits(looker))
+        if "<contents>" in text:
+            text = text.replace("<contents>", self.get_display_contents(looker))
         
         # --- Sky (for outdoor rooms, combines time + weather) ---
-        sky_desc = self._get_sky_description()
-        text = text.replace("<sky>", sky_desc)
-        
-        # --- Clean up any remaining empty shortcodes ---
-        import re
-        text = re.sub(r'<[^>]+>', '', text)
-        
-        # --- Clean up extra whitespace ---
-        text = re.sub(r'\n\s*\n\s*\n', '\n\n', text)
-        text = text.strip()
+        if "<sky>" in text:
+            text = text.replace("<sky>", self._get_sky_description())
         
+        # Unreplaced shortcodes are left for subclasses; return_appearance
+        # strips whatever remains with clean_shortcodes().
         return text
     
     def _get_sky_description(self) -> str:
@@ -932,49 +1194,79 @@ class Room(DefaultRoom):
     # Display Methods
     # -------------------------------------------------------------------------
     
+    def get_contents_partition(self) -> Dict[str, list]:
+        """
+        Get this room's contents split into CONTENT_KINDS.
+        
+        Built on first use and kept current by the movement hooks.
+        """
+        partition = self.ndb.contents_partition
+        contents = self.contents
+        # Objects placed without the move hooks (creation, direct
+        # location writes) show up as a size mismatch; rebuild then.
+        if partition is None or sum(len(bucket) for bucket in partition.values()) != len(contents):
+            partition = {kind: [] for kind in CONTENT_KINDS}
+            for obj in contents:
+                partition[get_content_kind(obj)].append(obj)
+            self.ndb.contents_partition = partition
+        return partition
+    
+    def get_visible_contents(self, looker=None, kinds=CONTENT_KINDS) -> Dict[str, List[Tuple[Any, str]]]:
+        """
+        Filter the partitioned contents for one looker.
+        
+        Hidden exits, `visible` flags and reveal state are checked in a
+        single pass; objects with an empty display name are dropped.
+        
+        Args:
+            looker: The character viewing the room
+            kinds: Which partitions to include
+            
+        Returns:
+            {kind: [(obj, display name), ...]}
+        """
+        partition = self.get_contents_partition()
+        looker_class = get_looker_class(looker)
+        
+        version = (self.ndb.contents_version, _environment_version)
+        names = self.ndb.display_names
+        if names is None or names[0] != version:
+            names = self.ndb.display_names = (version, {})
+        names = names[1]
+        
+        visible = {}
+        for kind in kinds:
+            entries = []
+            for obj in partition[kind]:
+                if obj is looker or not is_visible_to(obj, looker):
+                    continue
+                name = _display_name(obj, looker, looker_class, names)
+                if name:
+                    entries.append((obj, name))
+            visible[kind] = entries
+        return visible
+    
     def get_display_exits(self, looker=None) -> str:
         """Format exits for display."""
-        exits = []
-        for exit in self.exits:
-            # Check if exit is hidden
-            if hasattr(exit, 'is_hidden') and exit.is_hidden:
-                if hasattr(exit, 'discovered_by'):
-                    if looker and looker not in exit.discovered_by:
-                        continue
-                else:
-                    continue
-            
-            exits.append(f"|w{exit.key}|n")
-        
+        exits = self.get_visible_contents(looker, ("exits",))["exits"]
         if not exits:
             return "There are no obvious exits."
         
-        return "Exits: " + ", ".join(exits)
+        return "Exits: " + ", ".join(f"|w{name}|n" for _, name in exits)
     
     def get_display_contents(self, looker=None) -> str:
         """Format visible contents for display."""
-        things = []
-        chars = []
-        
-        for obj in self.contents:
-            # Skip exits
-            if obj.destination:
-                continue
-            
-            # Skip invisible objects
-            if hasattr(obj, 'visible') and not obj.visible:
-                continue
-            
-            # Categorize
-            if hasattr(obj, 'account') or (hasattr(obj, 'is_npc') and obj.is_npc):
-                if obj != looker:
-                    chars.append(obj.get_display_name(looker))
-            else:
-                things.append(obj.get_display_name(looker))
+        visible = self.get_visible_contents(looker, ("characters", "npcs", "items"))
+        present = visible["characters"] + visible["npcs"]
+        chars = [name for _, name in present]
+        things = [name for _, name in visible["items"]]
         
         parts = []
         if chars:
             parts.append("Present: " + ", ".join(chars))
+            # Everyone's pose in one in-memory pass
+            from world.positions import get_positions_for_room
+            parts.extend(get_positions_for_room(self, [obj for obj, _ in present]))
         if things:
             parts.append("You see: " + ", ".join(things))
         
@@ -985,10 +1277,11 @@ class Room(DefaultRoom):
         Main appearance method. Called when someone looks at the room.
         """
         # Start with base description
-        desc = self.db.desc or "You see nothing special."
+        raw_desc = self.db.desc or "You see nothing special."
         
-        # Process all shortcodes
-        desc = self.process_shortcodes(desc, looker)
+        # Cached static text, then this look's dynamic shortcodes
+        desc = self.get_static_appearance(raw_desc, looker)
+        desc = clean_shortcodes(self.fill_dynamic_shortcodes(desc, looker))
         
         # Build full appearance
         parts = [
@@ -1011,6 +1304,90 @@ class Room(DefaultRoom):
         
         return "\n".join(parts)
     
+    def get_static_appearance(self, raw_desc: str, looker=None) -> str:
+        """
+        Get the desc with every static shortcode rendered.
+        
+        Dynamic shortcodes are left as placeholders for
+        fill_dynamic_shortcodes(). The result is cached until the period,
+        weather or season changes, the desc or key is edited, one of
+        APPEARANCE_ATTRIBUTES is set, or invalidate_appearance() is
+        called.
+        
+        Args:
+            raw_desc: The unprocessed description
+            looker: The character viewing the room
+            
+        Returns:
+            Rendered static text
+        """
+        _watch_environment()
+        key = (_environment_version, raw_desc, self.key)
+        cached = _static_appearance.get(self.id)
+        if cached and cached[0] == key:
+            _render_stats["static_hits"] += 1
+            return cached[1]
+        _render_stats["static_misses"] += 1
+        
+        text = raw_desc
+        for code in self.DYNAMIC_SHORTCODES:
+            text = text.replace(f"<{code}>", f"{_DYNAMIC_MARK}{code}{_DYNAMIC_MARK}")
+        # The looker is passed for subclasses that expect one; nothing
+        # looker-specific survives outside DYNAMIC_SHORTCODES.
+        text = self.process_shortcodes(text, looker)
+        
+        _static_appearance[self.id] = (key, text)
+        return text
+    
+    def fill_dynamic_shortcodes(self, text: str, looker=None) -> str:
+        """
+        Render the dynamic placeholders left by get_static_appearance().
+        
+        All placeholders are rendered in a single process_shortcodes()
+        pass over just those codes.
+        """
+        if _DYNAMIC_MARK not in text:
+            return text
+        
+        parts = text.split(_DYNAMIC_MARK)
+        codes = parts[1::2]
+        fragment = _DYNAMIC_SEP.join(f"<{code}>" for code in codes)
+        values = self.process_shortcodes(fragment, looker).split(_DYNAMIC_SEP)
+        if len(values) != len(codes):
+            # A subclass mangled the separators; render codes one at a time
+            values = [self.process_shortcodes(f"<{code}>", looker) for code in codes]
+        parts[1::2] = values
+        return "".join(parts)
+    
+    def at_idmapper_flush(self):
+        """
+        Stay cached while anyone is playing here.
+        
+        Otherwise drop the render caches first: Evennia won't flush an
+        object that still holds ndb data.
+        """
+        from world.memory import is_pinned
+        if is_pinned(self):
+            return False
+        _static_appearance.pop(self.id, None)
+        for key in _RENDER_NDB_KEYS:
+            self.nattributes.remove(key)
+        return super().at_idmapper_flush()
+    
+    def at_object_delete(self):
+        """Let id-keyed registries drop this room."""
+        if not super().at_object_delete():
+            return False
+        from world.events import publish, OBJECT_DELETED
+        publish(OBJECT_DELETED, obj=self)
+        return True
+    
+    def invalidate_appearance(self) -> None:
+        """Drop this room's cached text after changing what it's built from."""
+        self.ndb.contents_partition = None
+        self.ndb.display_names = None
+        _static_appearance.pop(self.id, None)
+    
     # -------------------------------------------------------------------------
     # Partition Management
     # -------------------------------------------------------------------------
@@ -1072,6 +1449,10 @@ class IndoorRoom(Room):
     weather_protected = AttributeProperty(default=True)
     can_hear_weather = AttributeProperty(default=True)  # Can you hear rain on roof?
     
+    APPEARANCE_ATTRIBUTES = Room.APPEARANCE_ATTRIBUTES + (
+        "lighting", "ceiling_desc", "floor_desc", "wall_desc", "temperature", "can_hear_weather",
+    )
+    
     # -------------------------------------------------------------------------
     # Lighting Effects
     # -------------------------------------------------------------------------
@@ -1215,6 +1596,8 @@ class OutdoorRoom(Room):
     # Time effects
     time_affects_desc = AttributeProperty(default=True)  # Does time change description?
     
+    APPEARANCE_ATTRIBUTES = Room.APPEARANCE_ATTRIBUTES + ("terrain", "ground_desc", "sky_desc_override")
+    
     # -------------------------------------------------------------------------
     # Terrain Data
     # -------------------------------------------------------------------------
@@ -1267,7 +1650,11 @@ class OutdoorRoom(Room):
     
     def process_shortcodes(self, text: str, looker=None) -> str:
         """Process outdoor-specific shortcodes."""
-        # Parent processing first
+        # --- Sky override (before the parent fills <sky> from time/weather) ---
+        if self.sky_desc_override:
+            text = text.replace("<sky>", self.sky_desc_override)
+        
+        # Parent processing
         text = super().process_shortcodes(text, looker)
         
         # --- Terrain ---
@@ -1283,11 +1670,6 @@ class OutdoorRoom(Room):
                 ground = f"{ground}. {wet_mod}"
         text = text.replace("<ground>", ground)
         
-        # --- Sky override ---
-        if self.sky_desc_override:
-            text = text.replace("<sky>", self.sky_desc_override)
-        # Parent handles <sky> with time/weather combo
-        
         # --- Footstep flavor (could be used in movement messages) ---
         text = text.replace("<footstep>", terrain_data.get("footstep", ""))
         
@@ -23,4 +23,22 @@ class Character(ObjectParent, DefaultCharacter):
 
     """
 
-    pass
+    # Cache eviction order (see world.memory); NPCs are tiered as "npc"
+    EVICTION_TIER = "character"
+
+    def at_post_puppet(self, **kwargs):
+        """Note a character waking up in a home, and an owner logging in at home."""
+        super().at_post_puppet(**kwargs)
+        from world.housing import update_home_sleeper, update_owner_presence
+        update_home_sleeper(self)
+        update_owner_presence(self)
+
+    def at_post_unpuppet(self, account=None, session=None, **kwargs):
+        """Wrap up a conversation left open and note where the player logged out."""
+        super().at_post_unpuppet(account=account, session=session, **kwargs)
+        from world.housing import update_home_sleeper, update_owner_presence
+        from world.npcs import end_dialogue, is_in_dialogue
+        if is_in_dialogue(self):
+            end_dialogue(self)
+        update_home_sleeper(self)
+        update_owner_presence(self)
@@ -131,6 +131,9 @@ class Exit(DefaultExit):
     - Peek functionality (see into next room)
     """
     
+    # Cache eviction order (see world.memory)
+    EVICTION_TIER = "exit"
+    
     # -------------------------------------------------------------------------
     # Descriptions
     # -------------------------------------------------------------------------
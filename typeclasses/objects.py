@@ -52,7 +52,21 @@ class ObjectParent:
     Evennia's default characters.py imports this.
     Put any methods here that should exist on BOTH objects and characters.
     """
-    pass
+    
+    def at_idmapper_flush(self):
+        """Stay cached while puppeted or carried by someone playing."""
+        from world.memory import is_pinned
+        if is_pinned(self):
+            return False
+        return super().at_idmapper_flush()
+    
+    def at_object_delete(self):
+        """Let id-keyed registries drop this object."""
+        if not super().at_object_delete():
+            return False
+        from world.events import publish, OBJECT_DELETED
+        publish(OBJECT_DELETED, obj=self)
+        return True
 
 
 # =============================================================================
@@ -161,6 +175,9 @@ class DescribableMixin:
     def set_state(self, state: str) -> bool:
         """Change the object's state."""
         self.current_state = state
+        # Listings may show the state through short_desc shortcodes
+        if self.location and hasattr(self.location, "invalidate_appearance"):
+            self.location.invalidate_appearance()
         return True
 
 
@@ -291,6 +308,9 @@ class Object(ObjectParent, DescribableMixin, PhysicalMixin, SensoryMixin, Defaul
     - Sensory properties (sight, sound, scent)
     """
     
+    # Cache eviction order (see world.memory)
+    EVICTION_TIER = "item"
+    
     def at_object_creation(self):
         """Called when object is first created."""
         super().at_object_creation()
@@ -454,6 +474,8 @@ class Furniture(Object):
     - Position-specific descriptions
     """
     
+    EVICTION_TIER = "furniture"
+    
     portable = AttributeProperty(default=False)
     weight = AttributeProperty(default="heavy")
     
@@ -215,7 +215,8 @@ class LivingEevee(Object):
         
         tell = self.get_ambient_tell()
         if tell:
-            self.location.msg_contents(f"|m{tell}|n")
+            from world.outbound import send_ambient
+            send_ambient(self.location, f"|m{tell}|n")
     
     # -------------------------------------------------------------------------
     # Appearance
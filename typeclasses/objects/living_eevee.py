@@ -580,21 +580,23 @@ class LivingEevee(Object):
         if not observers:
             return
         
+        from world.outbound import send_ambient
+        
         # Heat behaviors override
         if self.is_in_heat and self.is_revealed:
             msg = random.choice(HEAT_BEHAVIORS).format(name=self.key)
-            self.location.msg_contents(f"|y{msg}|n")
+            send_ambient(self.location, f"|y{msg}|n")
             return
         
         if self.is_revealed:
             behaviors = REVEALED_BEHAVIORS.get(self.creature_mood, [])
             if behaviors:
                 msg = random.choice(behaviors).format(name=self.key)
-                self.location.msg_contents(msg)
+                send_ambient(self.location, msg)
         else:
             if random.random() < 0.5:
                 msg = random.choice(DISGUISED_TELLS)
-                self.location.msg_contents(f"|m{msg}|n")
+                send_ambient(self.location, f"|m{msg}|n")
     
     # =========================================================================
     # SCENE INITIATION
@@ -234,6 +234,8 @@ stands against the southern wall. On a small table by the bed, a leather-bound
     # Shortcode Processing
     # -------------------------------------------------------------------------
     
+    DYNAMIC_SHORTCODES = IndoorRoom.DYNAMIC_SHORTCODES + ("eevee.state",)
+    
     def process_shortcodes(self, text: str, looker=None) -> str:
         """Process room-specific shortcodes."""
         # Parent processing first
@@ -298,7 +300,8 @@ stands against the southern wall. On a small table by the bed, a leather-bound
         """
         ambient = self.get_fae_ambient()
         if ambient:
-            self.msg_contents(f"|m{ambient}|n", exclude=exclude)
+            from world.outbound import send_ambient
+            send_ambient(self, f"|m{ambient}|n", exclude=exclude)
     
     # -------------------------------------------------------------------------
     # Entry/Exit Hooks
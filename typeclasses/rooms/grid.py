@@ -133,6 +133,11 @@ class GridRoomMixin:
     # Default position for new arrivals
     default_position = AttributeProperty(default="center")
     
+    # The looker's own position is re-rendered per look
+    DYNAMIC_SHORTCODES = Room.DYNAMIC_SHORTCODES + (
+        "position", "position.desc", "position.short",
+    )
+    
     # -------------------------------------------------------------------------
     # Position Management
     # -------------------------------------------------------------------------
@@ -94,30 +94,40 @@ class MuseumRoomBase(IndoorRoom):
     # Visitor tracking
     visitor_log = AttributeProperty(default=list)  # Recent visitors
     
+    # Re-rendered per look: they depend on who is in the room
+    DYNAMIC_SHORTCODES = IndoorRoom.DYNAMIC_SHORTCODES + (
+        "curator.presence", "curator.watching",
+        "visitor.count", "visitor.status", "basement.hint",
+    )
+    
+    APPEARANCE_ATTRIBUTES = IndoorRoom.APPEARANCE_ATTRIBUTES + ("wing", "displays")
+    
     def process_shortcodes(self, text: str, looker=None) -> str:
         """Process museum-specific shortcodes."""
         text = super().process_shortcodes(text, looker)
         
         # Curator presence (check if Curator NPC is in room or nearby)
-        curator_here = self._check_curator_presence()
-        if curator_here:
-            text = text.replace("<curator.presence>", "The Curator is here, observing everything with quiet intensity.")
-            text = text.replace("<curator.watching>", "You feel watched. Measured. Catalogued.")
-        else:
-            text = text.replace("<curator.presence>", "The Curator's presence lingers even in their absence.")
-            text = text.replace("<curator.watching>", "Even empty, this space feels observed.")
+        if "<curator." in text:
+            curator_here = self._check_curator_presence()
+            if curator_here:
+                text = text.replace("<curator.presence>", "The Curator is here, observing everything with quiet intensity.")
+                text = text.replace("<curator.watching>", "You feel watched. Measured. Catalogued.")
+            else:
+                text = text.replace("<curator.presence>", "The Curator's presence lingers even in their absence.")
+                text = text.replace("<curator.watching>", "Even empty, this space feels observed.")
         
         # Visitor count
-        visitor_count = len([c for c in self.contents if hasattr(c, 'account') and c.account and c != looker])
-        if visitor_count == 0:
-            text = text.replace("<visitor.count>", "You appear to be alone here")
-            text = text.replace("<visitor.status>", "The wing is quiet, your footsteps echoing")
-        elif visitor_count == 1:
-            text = text.replace("<visitor.count>", "One other visitor browses nearby")
-            text = text.replace("<visitor.status>", "Another visitor moves through the displays")
-        else:
-            text = text.replace("<visitor.count>", f"{visitor_count} other visitors are present")
-            text = text.replace("<visitor.status>", "Several visitors mill about, examining exhibits")
+        if "<visitor." in text:
+            visitor_count = len([c for c in self.contents if hasattr(c, 'account') and c.account and c != looker])
+            if visitor_count == 0:
+                text = text.replace("<visitor.count>", "You appear to be alone here")
+                text = text.replace("<visitor.status>", "The wing is quiet, your footsteps echoing")
+            elif visitor_count == 1:
+                text = text.replace("<visitor.count>", "One other visitor browses nearby")
+                text = text.replace("<visitor.status>", "Another visitor moves through the displays")
+            else:
+                text = text.replace("<visitor.count>", f"{visitor_count} other visitors are present")
+                text = text.replace("<visitor.status>", "Several visitors mill about, examining exhibits")
         
         # Display status shortcodes
         for display_name, display_data in self.displays.items():
@@ -171,6 +181,7 @@ class MuseumRoomBase(IndoorRoom):
             "item": None,
         }
         self.displays = displays
+        self.invalidate_appearance()
     
     def fill_display(self, name: str, item: str) -> bool:
         """Fill a display with an item."""
@@ -179,6 +190,7 @@ class MuseumRoomBase(IndoorRoom):
             displays[name]["filled"] = True
             displays[name]["item"] = item
             self.displays = displays
+            self.invalidate_appearance()
             return True
         return False
 
@@ -267,6 +279,8 @@ brass stand lists the wings:
 Why would you think there was a basement?|n
 """
     
+    DYNAMIC_SHORTCODES = MuseumRoomBase.DYNAMIC_SHORTCODES + ("donation.recent",)
+    
     def process_shortcodes(self, text: str, looker=None) -> str:
         text = super().process_shortcodes(text, looker)
         
@@ -438,6 +452,8 @@ Or something else. <basement.hint>
             "Behind protective glass, a flower that shouldn't exist blooms in defiance of nature—a hybrid created by the Curator's own hand."
         )
     
+    DYNAMIC_SHORTCODES = MuseumRoomBase.DYNAMIC_SHORTCODES + ("seasonal.bloom",)
+    
     def process_shortcodes(self, text: str, looker=None) -> str:
         text = super().process_shortcodes(text, looker)
         
@@ -501,6 +517,8 @@ One tank is marked "|rDO NOT MAKE EYE CONTACT.|n"
             "The deep tank holds nightmares from where light never reaches—luminescent horrors, impossible anatomies."
         )
     
+    DYNAMIC_SHORTCODES = MuseumRoomBase.DYNAMIC_SHORTCODES + ("feeding.status",)
+    
     def process_shortcodes(self, text: str, looker=None) -> str:
         text = super().process_shortcodes(text, looker)
         
@@ -610,6 +628,8 @@ to follow you. The landscapes feel like windows rather than paintings.
             "Sculptures capture moments: a figure in ecstasy, a creature in motion, something that might be abstract or might be too real."
         )
     
+    DYNAMIC_SHORTCODES = MuseumRoomBase.DYNAMIC_SHORTCODES + ("artist.name",)
+    
     def process_shortcodes(self, text: str, looker=None) -> str:
         text = super().process_shortcodes(text, looker)
         
@@ -668,6 +688,8 @@ The lock looks more symbolic than practical.|n
             "Rare texts rest under glass—original manuscripts, forbidden knowledge, words that shaped realms."
         )
     
+    DYNAMIC_SHORTCODES = MuseumRoomBase.DYNAMIC_SHORTCODES + ("recent.works",)
+    
     def process_shortcodes(self, text: str, looker=None) -> str:
         text = super().process_shortcodes(text, looker)
         
@@ -730,6 +752,8 @@ for those who can locate items of particular interest.|n
             "Something in this case defies identification. It shifts when not observed directly, its form uncertain."
         )
     
+    DYNAMIC_SHORTCODES = MuseumRoomBase.DYNAMIC_SHORTCODES + ("guard.status",)
+    
     def process_shortcodes(self, text: str, looker=None) -> str:
         text = super().process_shortcodes(text, looker)
         
@@ -799,6 +823,8 @@ The question is: what do they want?|n
             "The Curator's personal collection includes things that seem ordinary but clearly mean something—a lock of hair, a dried flower, a collar."
         )
     
+    DYNAMIC_SHORTCODES = MuseumRoomBase.DYNAMIC_SHORTCODES + ("appointment.status",)
+    
     def process_shortcodes(self, text: str, looker=None) -> str:
         text = super().process_shortcodes(text, looker)
         
@@ -851,6 +877,8 @@ this door. That would be the smart thing to do.
 |rThe door is waiting.|n
 """
     
+    DYNAMIC_SHORTCODES = MuseumRoomBase.DYNAMIC_SHORTCODES + ("door.status",)
+    
     def process_shortcodes(self, text: str, looker=None) -> str:
         text = super().process_shortcodes(text, looker)
         
@@ -1014,6 +1042,8 @@ Both columns have entries.|n
             "Extensive records document generations of successful breeding—lineages, traits, the slow perfection of specimens."
         )
     
+    DYNAMIC_SHORTCODES = MuseumRoomBase.DYNAMIC_SHORTCODES + ("active.programs", "chamber.status",)
+    
     def process_shortcodes(self, text: str, looker=None) -> str:
         text = super().process_shortcodes(text, looker)
         
@@ -1082,6 +1112,8 @@ The Curator finds both useful.
             "The manifest lists current occupants by cell number, species or type, date of acquisition, and 'disposition status.'"
         )
     
+    DYNAMIC_SHORTCODES = MuseumRoomBase.DYNAMIC_SHORTCODES + ("cell.status", "new.arrivals",)
+    
     def process_shortcodes(self, text: str, looker=None) -> str:
         text = super().process_shortcodes(text, looker)
         
@@ -1163,6 +1195,8 @@ The Curator is patient.|n
             "The Curator's current favorite occupies the place of honor—always visible, always appreciated, always reminded of their status."
         )
     
+    DYNAMIC_SHORTCODES = MuseumRoomBase.DYNAMIC_SHORTCODES + ("collection.status",)
+    
     def process_shortcodes(self, text: str, looker=None) -> str:
         text = super().process_shortcodes(text, looker)
         
@@ -1229,6 +1263,8 @@ The difference is significant.|n
             "Current equipment in use shows signs of recent activity. Cleaned, but not quite clean enough to hide purpose."
         )
     
+    DYNAMIC_SHORTCODES = MuseumRoomBase.DYNAMIC_SHORTCODES + ("processing.current", "processing.notes",)
+    
     def process_shortcodes(self, text: str, looker=None) -> str:
         text = super().process_shortcodes(text, looker)
         
@@ -1306,6 +1342,8 @@ Consider carefully what that means.|n
             "The bed is large, comfortable, currently occupied in ways that suggest the Curator is... busy."
         )
     
+    DYNAMIC_SHORTCODES = MuseumRoomBase.DYNAMIC_SHORTCODES + ("quarters.guest",)
+    
     def process_shortcodes(self, text: str, looker=None) -> str:
         text = super().process_shortcodes(text, looker)
         
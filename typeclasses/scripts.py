@@ -149,6 +149,9 @@ class WorldTimeScript(DefaultScript):
     """
     Global script that advances in-game time.
     
+    Superseded by the world clock in world.time_weather and no longer
+    started by start_world_scripts(); kept so existing scripts still load.
+    
     Tracks the current time of day and season.
     Updates room descriptions that use time-based shortcodes.
     
@@ -242,6 +245,9 @@ class WeatherScript(DefaultScript):
     """
     Global script that manages weather patterns.
     
+    Superseded by the world clock in world.time_weather and no longer
+    started by start_world_scripts(); kept so existing scripts still load.
+    
     Weather can change randomly or be set manually.
     Affects outdoor room descriptions.
     
@@ -434,8 +440,6 @@ def start_world_scripts():
     
     scripts_to_start = [
         ("random_event_ticker", RandomEventTickScript),
-        ("world_time", WorldTimeScript),
-        ("world_weather", WeatherScript),
         ("npc_scheduler", NPCScheduleScript),
         ("resource_respawn", ResourceRespawnScript),
     ]
@@ -493,24 +497,14 @@ def get_world_time():
     Returns:
         dict with hour, period, day, season
     """
-    from evennia import search_script
+    from world.time_weather import get_world_clock
     
-    results = search_script("world_time")
-    if results:
-        script = results[0]
-        return {
-            "hour": script.get_hour(),
-            "period": script.get_time_period(),
-            "day": script.db.day,
-            "season": script.get_season(),
-        }
-    
-    # Defaults if script not running
+    clock = get_world_clock()
     return {
-        "hour": 12,
-        "period": "midday",
-        "day": 1,
-        "season": "summer",
+        "hour": clock.get_hour(),
+        "period": clock.get_time_period(),
+        "day": clock.get_time()["day"],
+        "season": clock.get_season(),
     }
 
 
@@ -521,13 +515,8 @@ def get_world_weather():
     Returns:
         str: Current weather type
     """
-    from evennia import search_script
-    
-    results = search_script("world_weather")
-    if results:
-        return results[0].get_weather()
-    
-    return "clear"
+    from world.time_weather import get_world_clock
+    return get_world_clock().get_weather()
 
 
 def set_time(period: str):
@@ -540,26 +529,12 @@ def set_time(period: str):
     Usage:
         @py from typeclasses.scripts import set_time; set_time("night")
     """
-    from evennia import search_script
-    
-    period_hours = {
-        "dawn": 6,
-        "morning": 9,
-        "midday": 12,
-        "afternoon": 15,
-        "evening": 19,
-        "night": 22,
-    }
+    from world.time_weather import get_world_clock, ROOM_TIME_PERIODS
     
-    if period not in period_hours:
-        return f"Invalid period. Choose from: {', '.join(period_hours.keys())}"
+    if not get_world_clock().set_time_period(period):
+        return f"Invalid period. Choose from: {', '.join(ROOM_TIME_PERIODS)}"
     
-    results = search_script("world_time")
-    if results:
-        results[0].db.hour = period_hours[period]
-        return f"Time set to {period} ({period_hours[period]}:00)"
-    
-    return "WorldTimeScript not running. Start it first."
+    return f"Time set to {period} ({get_world_clock().get_hour()}:00)"
 
 
 def set_weather(weather: str):
@@ -572,19 +547,15 @@ def set_weather(weather: str):
     Usage:
         @py from typeclasses.scripts import set_weather; set_weather("storm")
     """
-    from evennia import search_script
+    from world.time_weather import get_world_clock
     
     valid = ["clear", "cloudy", "rain", "storm", "fog", "snow"]
     
     if weather not in valid:
         return f"Invalid weather. Choose from: {', '.join(valid)}"
     
-    results = search_script("world_weather")
-    if results:
-        results[0].set_weather(weather)
-        return f"Weather set to {weather}"
-    
-    return "WeatherScript not running. Start it first."
+    get_world_clock().set_weather(weather)
+    return f"Weather set to {weather}"
 
 
 # =============================================================================
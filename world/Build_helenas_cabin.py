@@ -245,11 +245,6 @@ class CabinRoom(IndoorRoom):
         text = text.replace("<ambient.scents>", scents or "")
         
         return text
-    
-    def return_appearance(self, looker, **kwargs):
-        """Return room description with shortcodes processed."""
-        appearance = super().return_appearance(looker, **kwargs)
-        return self.process_shortcodes(appearance, looker)
 
 
 class CabinObject(Object):
@@ -1196,6 +1191,8 @@ class WelcomeRoom(CabinRoom):
     
     shadow_present = AttributeProperty(default=False)
     
+    DYNAMIC_SHORTCODES = CabinRoom.DYNAMIC_SHORTCODES + ("wolf_prints.desc",)
+    
     def process_shortcodes(self, text: str, looker=None) -> str:
         text = super().process_shortcodes(text, looker)
         
@@ -1221,6 +1218,8 @@ class PassagewayRoom(CabinRoom):
     
     current_season = AttributeProperty(default="summer")
     
+    DYNAMIC_SHORTCODES = CabinRoom.DYNAMIC_SHORTCODES + ("potpourri.scent", "shadow_musk.desc")
+    
     def process_shortcodes(self, text: str, looker=None) -> str:
         text = super().process_shortcodes(text, looker)
         
@@ -1282,6 +1281,11 @@ class PassagewayRoom(CabinRoom):
 class HelenaRoom(CabinRoom):
     """Helena's Room with bed state, tapestry, and trapdoor shortcodes."""
     
+    DYNAMIC_SHORTCODES = CabinRoom.DYNAMIC_SHORTCODES + (
+        "bed.state", "trapdoor.state",
+        "tapestry_north.state", "tapestry_south.state", "tapestry_east.state",
+    )
+    
     def process_shortcodes(self, text: str, looker=None) -> str:
         text = super().process_shortcodes(text, looker)
         
@@ -1920,6 +1924,8 @@ class DisciplinationRoom(CabinRoom):
         self.lighting_mode = mode
         return f"Lighting set to {mode}.\n\n{self.lighting_descs[mode]}"
     
+    DYNAMIC_SHORTCODES = CabinRoom.DYNAMIC_SHORTCODES + ("lighting.desc",)
+    
     def process_shortcodes(self, text: str, looker=None) -> str:
         text = super().process_shortcodes(text, looker)
         
@@ -17,16 +17,19 @@ Systems:
 - furniture: Interactive furniture with slots
 - positions: Character interaction positions
 - npcs: NPC framework with dialogue trees
+- npc_memory: Per-(NPC, character) relationship records
 - items: Item system with tools, consumables, equipment
 - shops: Buy/sell interface with shopkeeper NPCs
 - body: Body parts, species, gender, modifiers, shortcodes
 - time_weather: Game time, seasons, weather conditions
+- events: Publish/subscribe bus for world-state transitions
 - quests: Quest and task system
 - crafting: Recipe-based item creation with skills
 - combat: Combat system with stats, actions, state machine
 - creatures: Creature templates, AI behaviors, spawn tables
 - parties: Party formation, movement, combat coordination
 - encounters: Random encounters, multi-wave combat, danger levels
+- registry: Static data tables loaded on first use
 
 Usage:
     from world.currency import balance, pay, receive
@@ -169,6 +172,10 @@ from .housing import (
     purchase_upgrade,
     get_all_home_rooms,
     get_home_type,
+    get_home_for_room,
+    find_home,
+    materialize_home,
+    dematerialize_home,
     get_permission_level,
     can_enter,
     set_permission,
@@ -228,6 +235,8 @@ from .positions import (
     force_clear_position,
     get_position_display,
     get_position_for_room,
+    get_positions_for_room,
+    flush_positions,
     get_partner,
     get_partners,
     add_partner,
@@ -251,7 +260,10 @@ from .npcs import (
     has_npc_flag,
     set_npc_flag,
     clear_npc_flag,
+    increment_npc_counter,
     get_dialogue_node,
+    clear_dialogue_nodes,
+    get_dialogue_partners,
     start_dialogue,
     process_dialogue_choice,
     end_dialogue,
@@ -271,6 +283,9 @@ from .items import (
     get_item_template,
     list_templates,
     create_item,
+    create_items_bulk,
+    get_item_prototype,
+    clear_item_prototypes,
     is_item,
     get_item_data,
     get_item_category,
@@ -302,6 +317,22 @@ from .items import (
     take_item,
 )
 
+# Material Ledger
+from .materials import (
+    is_ledger_material,
+    get_materials,
+    count_material,
+    add_material,
+    remove_material,
+    find_material,
+    get_material_value,
+    get_material_display_name,
+    materialize_material,
+    absorb_item,
+    absorb_inventory,
+    clear_material_cache,
+)
+
 # Shops
 from .shops import (
     SHOP_TYPES,
@@ -309,15 +340,22 @@ from .shops import (
     SHOPKEEPER_TEMPLATES,
     setup_shop,
     is_shop,
+    get_all_shops,
     get_shop_data,
     get_shop_stock,
+    get_current_stock,
+    get_shop_catalog,
     get_buy_price,
+    set_shop_markup,
+    invalidate_shop_prices,
     get_sell_price,
+    get_material_sell_price,
     open_shop,
     close_shop,
     get_current_shop,
     buy_item,
     sell_item,
+    sell_material,
     restock_shop,
     restock_all_shops,
 )
@@ -424,6 +462,70 @@ from .time_weather import (
     set_season,
     force_weather,
     get_time_debug,
+    # World clock
+    get_world_clock,
+)
+
+# World event bus
+from .events import (
+    PERIOD_CHANGED,
+    WEATHER_CHANGED,
+    SEASON_CHANGED,
+    ROOM_ENTERED,
+    ROOM_LEFT,
+    ITEM_CRAFTED,
+    subscribe,
+    unsubscribe,
+    publish,
+)
+
+# Weighted sampling
+from .sampling import (
+    AliasTable,
+    SubsetCache,
+    compile_tiers,
+    seed_rng,
+)
+
+# Lazy data registries
+from .registry import (
+    LazyRegistry,
+    get_registries,
+    load_all_registries,
+)
+
+# Content packs
+from .content_packs import (
+    ContentPack,
+    load_packs,
+    load_pack_file,
+    reload_pack,
+    unload_pack,
+    get_packs,
+    validate_pack,
+)
+
+# Area sync
+from .area_sync import (
+    SyncPlan,
+    plan_area,
+    apply_plan,
+    sync_area,
+    find_hub,
+    format_plan,
+)
+
+# Outbound message batching
+from .outbound import (
+    send_ambient,
+    flush_outbound,
+    get_outbound_stats,
+)
+
+# Status display cache
+from .display_cache import (
+    get_display_cache_stats,
+    clear_display_cache,
 )
 
 # Quests
@@ -561,6 +663,7 @@ from .creatures import (
     get_creature_template,
     get_spawn_table,
     roll_encounter,
+    clear_creature_tables,
     get_creature_stats,
     select_creature_attack,
     calculate_creature_damage,
@@ -609,6 +712,12 @@ from .encounters import (
     ENCOUNTER_TEMPLATES,
     AREA_ENCOUNTERS,
     Encounter,
+    Creature,
+    acquire_creature,
+    release_creature,
+    promote_creature,
+    clear_creature_pool,
+    get_creature_pool_stats,
     get_area_danger,
     get_room_danger,
     check_random_encounter,
@@ -0,0 +1,942 @@
+"""
+Area Sync for Gilderhaven
+==========================
+
+Update a built area in place instead of tearing it down and rebuilding
+it. cleanup_area() followed by build_whisperwood() deletes and recreates
+every room, exit, NPC and piece of furniture, so anything holding their
+dbrefs (homes, visited rooms, quest progress, NPC memories) breaks. A
+sync compares what the builder would make with what exists and changes
+only the difference, in one transaction.
+
+How it works:
+
+1. Record: the area's builder from content/builders.py runs against a
+   recorder instead of the database. Every create_object() it makes
+   returns a stand-in that remembers its typeclass, key, location,
+   destination, aliases, tags and Attributes. Nothing is written.
+2. Match: each recorded object gets a stable id from the builder's room
+   names ("whisperwood:deep_woods", "whisperwood:deep_woods>east"...).
+   Objects a sync created or adopted carry that id as a tag. Areas
+   built before syncing existed are matched by area_name, key and
+   location the first time, then tagged.
+3. Diff: each object remembers a digest of every field a sync last
+   wrote. A field is only rewritten when the builder's value has
+   changed since then, so runtime changes (shop stock, NPC state,
+   resource depletion) survive syncs that didn't touch them.
+4. Apply: creates, updates and deletes run in one transaction.
+
+A dry run (the default) only returns the plan, with timing estimates
+for it and for a full rebuild.
+
+Usage:
+    from world.area_sync import sync_area, format_plan
+
+    plan, msg = sync_area("whisperwood", here)              # dry run
+    print("\\n".join(format_plan(plan)))
+    plan, msg = sync_area("whisperwood", here, dry_run=False)
+"""
+
+import hashlib
+import time
+from importlib import import_module
+
+from evennia.utils import logger
+
+
+# =============================================================================
+# Configuration
+# =============================================================================
+
+# Area -> (builder in content.builders, area_name its rooms carry)
+AREA_SPECS = {
+    "whisperwood": ("build_whisperwood", "Whisperwood"),
+    "moonshallow": ("build_moonshallow", "Moonshallow"),
+    "sunny_meadow": ("build_sunny_meadow", "Sunny Meadow"),
+    "copper_hill": ("build_copper_hill", "Copper Hill"),
+    "tidepools": ("build_tidepools", "Tidepools"),
+    "museum": ("build_museum", "Museum"),
+    "market": ("build_market", "Market Square"),
+}
+
+# Tag category prefix marking synced objects; the tag key is the stable id
+SYNC_TAG_CATEGORY = "area_sync"
+
+# Attribute category of the per-object record of what a sync last wrote
+SYNC_RECORD_CATEGORY = "area_sync"
+
+# Attributes the game changes as it runs: set on create, never synced
+RUNTIME_ATTRIBUTES = ("npc_state", "shop_stock_levels", "occupants")
+
+# Per-operation cost in ms until an apply has measured real ones
+DEFAULT_OP_COSTS_MS = {
+    "create": 20.0,
+    "update": 4.0,
+    "delete": 15.0,
+}
+
+# Modules whose create_object the recorder replaces while a builder runs
+_RECORDED_MODULES = ("evennia", "content.builders", "content.market", "world.npcs", "world.furniture")
+
+# kind -> (total ms, count) from real applies
+_op_costs = {}
+
+
+# =============================================================================
+# Recording
+# =============================================================================
+
+class _SpecId(int):
+    """A recorded object's .id; swapped for the real id on apply."""
+
+
+class _Namespace:
+    """obj.db / obj.ndb stand-in: reads go to get, writes to add."""
+
+    def __init__(self, get, add):
+        object.__setattr__(self, "_get", get)
+        object.__setattr__(self, "_add", add)
+
+    def __getattr__(self, name):
+        return self._get(name)
+
+    def __setattr__(self, name, value):
+        self._add(name, value)
+
+    def __delattr__(self, name):
+        self._add(name, None)
+
+
+class _Attributes:
+    """AttributeHandler stand-in writing into a dict keyed (name, category)."""
+
+    def __init__(self, store, fallback=None):
+        self._store = store
+        self._fallback = fallback
+
+    def add(self, key, value, category=None, **kwargs):
+        self._store[(key, category)] = value
+
+    def batch_add(self, *args, **kwargs):
+        for entry in args:
+            self.add(*entry[:3])
+
+    def get(self, key, default=None, category=None, **kwargs):
+        if (key, category) in self._store:
+            return self._store[(key, category)]
+        if self._fallback is not None:
+            return self._fallback.get(key, default=default, category=category)
+        return default
+
+    def has(self, key, category=None):
+        return (key, category) in self._store or bool(self._fallback and self._fallback.has(key, category=category))
+
+    def remove(self, key, category=None, **kwargs):
+        self._store.pop((key, category), None)
+
+
+class _Tags:
+    """TagHandler / AliasHandler stand-in over a set of (key, category)."""
+
+    def __init__(self, store):
+        self._store = store
+
+    def add(self, tag, category=None, **kwargs):
+        for key in ([tag] if isinstance(tag, str) else tag):
+            self._store.add((key.strip().lower(), category))
+
+    def has(self, tag, category=None, **kwargs):
+        return (tag.strip().lower(), category) in self._store
+
+    def remove(self, tag, category=None, **kwargs):
+        self._store.discard((tag.strip().lower(), category))
+
+    def get(self, key=None, category=None, return_list=False, **kwargs):
+        found = [k for k, c in self._store if c == category and (key is None or k == key)]
+        return found if return_list else (found[0] if len(found) == 1 else found or None)
+
+    def all(self, **kwargs):
+        return sorted(k for k, _ in self._store)
+
+
+class _Noop:
+    """Handler stand-in that ignores everything (locks, permissions...)."""
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+class SpecObject:
+    """One object a builder would create, as recorded."""
+
+    def __init__(self, recorder, typeclass, key, location=None, destination=None):
+        self._recorder = recorder
+        self.sid = None
+        self.typeclass = _typeclass_path(typeclass)
+        self.key = key
+        self.location = location
+        self.destination = destination
+        self.attrs = {}
+        self.tag_set = set()
+        self.alias_set = set()
+        self.id = self.pk = _SpecId(-len(recorder.objects) - 1)
+        self.db = _Namespace(lambda name: self.attrs.get((name, None)),
+                             lambda name, value: self.attrs.__setitem__((name, None), value))
+        self.ndb = _Namespace(lambda name: None, lambda name, value: None)
+        self.attributes = _Attributes(self.attrs)
+        self.tags = _Tags(self.tag_set)
+        self.aliases = _Tags(self.alias_set)
+        self.locks = self.permissions = self.scripts = _Noop()
+
+    @property
+    def dbref(self):
+        return f"#{self.id}"
+
+    @property
+    def contents(self):
+        return [obj for obj in self._recorder.objects if obj.location is self]
+
+    @property
+    def kind(self):
+        if self.destination is not None:
+            return "exit"
+        return "room" if self.location is None else "object"
+
+    def move_to(self, destination, **kwargs):
+        self.location = destination
+        return True
+
+    def msg(self, *args, **kwargs):
+        pass
+
+    def msg_contents(self, *args, **kwargs):
+        pass
+
+    def __repr__(self):
+        return f"<SpecObject {self.sid or self.key}>"
+
+
+class _External:
+    """A live object handed to a builder (the hub); records writes to it."""
+
+    def __init__(self, recorder, obj):
+        self._recorder = recorder
+        self.obj = obj
+        self.attrs = {}
+        self.db = _Namespace(lambda name: self.attrs.get((name, None), obj.attributes.get(name)),
+                             lambda name, value: self.attrs.__setitem__((name, None), value))
+        self.attributes = _Attributes(self.attrs, obj.attributes)
+        # Tags on the hub aren't synced; keep a builder's away from the live ones
+        self.tags = _Tags(set())
+        self.aliases = _Tags(set())
+
+    @property
+    def contents(self):
+        return list(self.obj.contents) + [o for o in self._recorder.objects if o.location is self]
+
+    def move_to(self, *args, **kwargs):
+        raise RuntimeError(f"builder tried to move {self.obj.key}, which the sync doesn't own")
+
+    def msg(self, *args, **kwargs):
+        pass
+
+    def msg_contents(self, *args, **kwargs):
+        pass
+
+    def __getattr__(self, name):
+        # Reads (key, id, dbref...) pass through
+        return getattr(self.obj, name)
+
+
+class _Recorder:
+    """Collects SpecObjects while a builder runs against it."""
+
+    def __init__(self):
+        self.objects = []
+        self.externals = {}
+
+    def wrap(self, obj):
+        if obj is None or isinstance(obj, (SpecObject, _External)):
+            return obj
+        if obj.id not in self.externals:
+            self.externals[obj.id] = _External(self, obj)
+        return self.externals[obj.id]
+
+    def create_object(self, typeclass=None, key=None, location=None, destination=None,
+                      aliases=None, tags=None, attributes=None, **kwargs):
+        spec = SpecObject(self, typeclass, key, self.wrap(location), self.wrap(destination))
+        self.objects.append(spec)
+        if aliases:
+            spec.aliases.add(aliases)
+        for tag in tags or ():
+            if isinstance(tag, str):
+                spec.tags.add(tag)
+            else:
+                spec.tags.add(tag[0], category=tag[1] if len(tag) > 1 else None)
+        for attr in attributes or ():
+            spec.attributes.add(attr[0], attr[1], category=attr[2] if len(attr) > 2 else None)
+        return spec
+
+
+def _typeclass_path(typeclass):
+    if typeclass is None:
+        from django.conf import settings
+        return settings.BASE_OBJECT_TYPECLASS
+    if isinstance(typeclass, str):
+        return typeclass
+    return f"{typeclass.__module__}.{typeclass.__name__}"
+
+
+def record_area(area, hub_room):
+    """
+    Run an area's builder against the recorder.
+
+    Args:
+        area: Key in AREA_SPECS
+        hub_room: The live room the area hangs off
+
+    Returns:
+        tuple: (list of SpecObject or None, dict of _External by id, error or None)
+    """
+    import evennia
+    from evennia.utils import logger as evennia_logger
+
+    builder_name, _ = AREA_SPECS[area]
+    recorder = _Recorder()
+    patched = []
+
+    def patch(owner, name, value):
+        patched.append((owner, name, getattr(owner, name)))
+        setattr(owner, name, value)
+
+    # Import everything first: a module imported while evennia is patched
+    # would bind the recorder's create_object for good
+    modules = [evennia if path == "evennia" else import_module(path) for path in _RECORDED_MODULES]
+    try:
+        for module in modules:
+            if hasattr(module, "create_object"):
+                patch(module, "create_object", recorder.create_object)
+        patch(import_module("world.npcs"), "register_npc_schedule", lambda npc: None)
+        # The builders log what they "created"; nothing was
+        patch(evennia_logger, "log_info", lambda *args, **kwargs: None)
+
+        builder = getattr(import_module("content.builders"), builder_name)
+        rooms = builder(recorder.wrap(hub_room))
+    except Exception as e:
+        return None, None, f"{builder_name} could not be recorded: {e}"
+    finally:
+        for owner, name, original in reversed(patched):
+            setattr(owner, name, original)
+
+    _assign_ids(area, recorder.objects, rooms if isinstance(rooms, dict) else {})
+    return recorder.objects, recorder.externals, None
+
+
+def _slug(text):
+    return str(text).strip().lower().replace(" ", "_")
+
+
+def _assign_ids(area, objects, rooms):
+    names = {id(room): name for name, room in rooms.items()}
+    seen = {}
+    for spec in objects:
+        if spec.kind == "room":
+            sid = f"{area}:{_slug(names.get(id(spec), spec.key))}"
+        else:
+            where = _ref_token(spec.location)
+            sid = f"{area}:{where}{'>' if spec.kind == 'exit' else '/'}{_slug(spec.key)}"
+        seen[sid] = seen.get(sid, 0) + 1
+        spec.sid = sid if seen[sid] == 1 else f"{sid}~{seen[sid]}"
+
+
+# =============================================================================
+# Values
+# =============================================================================
+
+def _ref_token(ref):
+    """A stable name for an object reference, recorded or live."""
+    if ref is None:
+        return None
+    if isinstance(ref, SpecObject):
+        return ref.sid.split(":", 1)[1] if ref.sid else ref.key
+    obj = ref.obj if isinstance(ref, _External) else ref
+    return f"#{obj.id}"
+
+
+def _token(value, ids):
+    """Value with object references replaced by stable names, for digests."""
+    if isinstance(value, (SpecObject, _External)):
+        return ("@ref", _ref_token(value))
+    if isinstance(value, _SpecId):
+        return ("@id", ids[value].sid)
+    if isinstance(value, dict):
+        return tuple((_token(k, ids), _token(v, ids)) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_token(v, ids) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return ("@set",) + tuple(sorted(repr(_token(v, ids)) for v in value))
+    return value
+
+
+def _digest(value, ids):
+    return hashlib.blake2b(repr(_token(value, ids)).encode(), digest_size=8).hexdigest()
+
+
+def _to_live(value, live, ids):
+    """Value with recorded references swapped for the live objects."""
+    if isinstance(value, SpecObject):
+        return live.get(value.sid)
+    if isinstance(value, _External):
+        return value.obj
+    if isinstance(value, _SpecId):
+        obj = live.get(ids[value].sid)
+        return obj.id if obj else None
+    if isinstance(value, dict):
+        return {_to_live(k, live, ids): _to_live(v, live, ids) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_to_live(v, live, ids) for v in value]
+    if isinstance(value, tuple):
+        return tuple(_to_live(v, live, ids) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return type(value)(_to_live(v, live, ids) for v in value)
+    return value
+
+
+def _plain(value):
+    """A live Attribute value as plain Python, for comparing."""
+    from evennia.utils.dbserialize import deserialize
+    return deserialize(value)
+
+
+def _fields(spec):
+    """Every synced field of a recorded object: name -> value."""
+    fields = {
+        "@typeclass": spec.typeclass,
+        "@key": spec.key,
+        "@location": spec.location,
+        "@destination": spec.destination,
+        "@aliases": sorted(k for k, _ in spec.alias_set),
+        "@tags": sorted(spec.tag_set, key=repr),
+    }
+    for (name, category), value in spec.attrs.items():
+        fields[f"{name}|{category or ''}"] = value
+    return fields
+
+
+# =============================================================================
+# Planning
+# =============================================================================
+
+class SyncOp:
+    """One planned change."""
+
+    __slots__ = ("kind", "sid", "obj", "spec", "changes", "adopt")
+
+    def __init__(self, kind, sid, obj=None, spec=None, changes=(), adopt=False):
+        self.kind = kind           # "create", "update" or "delete"
+        self.sid = sid
+        self.obj = obj             # live object (update, delete)
+        self.spec = spec           # SpecObject or _External (create, update)
+        self.changes = list(changes)
+        self.adopt = adopt         # first sync of a pre-existing object
+
+
+class SyncPlan:
+    """What a sync would do to one area."""
+
+    def __init__(self, area, hub_room):
+        self.area = area
+        self.hub = hub_room
+        self.ops = []
+        self.unchanged = 0
+        self.live_count = 0
+        self.spec_count = 0
+        self.plan_ms = 0.0
+        self.apply_ms = None
+        self.records = {}   # sid -> new sync record, written on apply
+        self.ids = {}       # _SpecId -> SpecObject
+
+    def count(self, kind):
+        return sum(1 for op in self.ops if op.kind == kind)
+
+    def estimate_ms(self):
+        """Estimated apply time for this plan."""
+        return sum(op_cost(op.kind) for op in self.ops)
+
+    def rebuild_estimate_ms(self):
+        """Estimated time to delete everything and build from scratch."""
+        return self.live_count * op_cost("delete") + self.spec_count * op_cost("create")
+
+
+def op_cost(kind):
+    """Average ms per operation: measured if an apply has run, else a default."""
+    total, count = _op_costs.get(kind, (0.0, 0))
+    return total / count if count else DEFAULT_OP_COSTS_MS[kind]
+
+
+def _sync_category(area):
+    return f"{SYNC_TAG_CATEGORY}:{area}"
+
+
+def _managed_objects(area):
+    """Live objects a sync has tagged for this area, by stable id."""
+    from evennia import search_tag
+
+    category = _sync_category(area)
+    managed = {}
+    for obj in search_tag(category=category):
+        for sid in obj.tags.get(category=category, return_list=True):
+            managed[sid] = obj
+    return managed
+
+
+def _is_synced(obj):
+    return any(category and category.startswith(SYNC_TAG_CATEGORY + ":")
+               for _, category in obj.tags.all(return_key_and_category=True))
+
+
+def _adopt_legacy(area, specs, live):
+    """
+    Match objects built before syncing existed to recorded ones.
+
+    Rooms match by area_name and key; exits and other objects by
+    location and key. Returns the area's unmatched legacy rooms and
+    exits, which a rebuild would have deleted.
+    """
+    from evennia.objects.models import ObjectDB
+
+    _, area_name = AREA_SPECS[area]
+    rooms = [obj for obj in ObjectDB.objects.get_by_attribute(key="area_name", value=area_name)
+             if not obj.location and not _is_synced(obj)]
+    claimed = set(id(obj) for obj in live.values())
+    adopted = set()
+
+    by_key = {}
+    for obj in rooms:
+        by_key.setdefault(obj.key, []).append(obj)
+    for spec in specs:
+        if spec.kind == "room" and spec.sid not in live and by_key.get(spec.key):
+            obj = by_key[spec.key].pop(0)
+            live[spec.sid] = obj
+            claimed.add(id(obj))
+            adopted.add(spec.sid)
+
+    area_rooms = set(id(obj) for obj in rooms)
+    for spec in specs:
+        if spec.kind == "room" or spec.sid in live:
+            continue
+        location = spec.location.obj if isinstance(spec.location, _External) else live.get(spec.location.sid)
+        if location is None:
+            continue
+        for obj in location.contents:
+            if id(obj) in claimed or obj.key != spec.key or obj.account or _is_synced(obj):
+                continue
+            if isinstance(spec.location, _External):
+                # Outside the area: only take exits that lead into it
+                if spec.kind != "exit" or id(obj.destination) not in area_rooms:
+                    continue
+            if (spec.kind == "exit") != bool(obj.destination):
+                continue
+            live[spec.sid] = obj
+            claimed.add(id(obj))
+            adopted.add(spec.sid)
+            break
+
+    leftovers = [obj for obj in rooms if id(obj) not in claimed]
+    for room in rooms:
+        leftovers.extend(obj for obj in room.contents
+                         if obj.destination and id(obj) not in claimed and not _is_synced(obj))
+    return leftovers, adopted
+
+
+def find_hub(area):
+    """
+    The room a built area hangs off: where its entrance exit starts.
+
+    Returns:
+        Object or None: None if the area isn't built
+    """
+    from evennia.objects.models import ObjectDB
+
+    for sid, obj in _managed_objects(area).items():
+        if obj.destination and sid.split(":", 1)[1].startswith("#"):
+            return obj.location
+    _, area_name = AREA_SPECS[area]
+    rooms = set(obj.id for obj in ObjectDB.objects.get_by_attribute(key="area_name", value=area_name))
+    for room_id in rooms:
+        for exit_obj in ObjectDB.objects.filter(db_destination__id=room_id):
+            if exit_obj.location and exit_obj.location.id not in rooms:
+                return exit_obj.location
+    return None
+
+
+def _live_value(obj, field):
+    if field == "@typeclass":
+        return obj.typeclass_path
+    if field == "@key":
+        return obj.key
+    if field == "@location":
+        return obj.location
+    if field == "@destination":
+        return obj.destination
+    if field == "@aliases":
+        return sorted(obj.aliases.all())
+    if field == "@tags":
+        return sorted(obj.tags.all(return_key_and_category=True), key=repr)
+    name, _, category = field.partition("|")
+    return _plain(obj.attributes.get(name, category=category or None))
+
+
+def _diff(spec, obj, record, live, ids):
+    """
+    Fields of obj to rewrite, and the record to store afterwards.
+
+    A field whose builder value still matches what the last sync wrote
+    is left alone, whatever its live value is now.
+    """
+    fields = _fields(spec) if isinstance(spec, SpecObject) else {
+        f"{name}|{category or ''}": value for (name, category), value in spec.attrs.items()
+    }
+    new_record = {
+        "fields": {},
+        "tags": sorted(spec.tag_set, key=repr) if isinstance(spec, SpecObject) else [],
+        "aliases": fields.get("@aliases", []),
+    }
+    applied = record.get("fields", {}) if record else {}
+    changes = []
+    for field, value in fields.items():
+        digest = _digest(value, ids)
+        new_record["fields"][field] = digest
+        if applied.get(field) == digest:
+            continue
+        name = field.partition("|")[0]
+        if name in RUNTIME_ATTRIBUTES and obj is not None:
+            continue
+        if obj is None:
+            changes.append(field)
+            continue
+        wanted = _to_live(value, live, ids)
+        current = _live_value(obj, field)
+        if field == "@tags":
+            # Add what's missing, drop what an earlier sync added and the
+            # builder no longer does; other tags are left alone
+            wanted, current = set(wanted), set(current)
+            dropped = set(map(tuple, record.get("tags", []))) - wanted if record else set()
+            if not wanted <= current or dropped & current:
+                changes.append(field)
+        elif current != wanted:
+            changes.append(field)
+    # Attributes the builder used to set but no longer does
+    for field in applied:
+        if field not in fields and not field.startswith("@"):
+            changes.append(field)
+    return changes, new_record
+
+
+def plan_area(area, hub_room):
+    """
+    Work out what syncing an area would change. Writes nothing.
+
+    Args:
+        area: Key in AREA_SPECS
+        hub_room: The live room the area hangs off
+
+    Returns:
+        tuple: (SyncPlan or None, error message or None)
+    """
+    if area not in AREA_SPECS:
+        return None, f"Unknown area '{area}'. Areas: {', '.join(AREA_SPECS)}"
+    start = time.perf_counter()
+    specs, externals, error = record_area(area, hub_room)
+    if error:
+        return None, error
+
+    plan = SyncPlan(area, hub_room)
+    plan.ids = {spec.id: spec for spec in specs}
+    live = _managed_objects(area)
+    managed = dict(live)
+    leftovers, adopted = _adopt_legacy(area, specs, live)
+    plan.live_count = len(managed) + len(adopted) + len(leftovers)
+    plan.spec_count = len(specs)
+
+    for spec in specs:
+        obj = live.get(spec.sid)
+        record = obj.attributes.get("applied", category=SYNC_RECORD_CATEGORY) if obj else None
+        changes, plan.records[spec.sid] = _diff(spec, obj, _plain(record) if record else None, live, plan.ids)
+        if obj is None:
+            plan.ops.append(SyncOp("create", spec.sid, spec=spec, changes=changes))
+        elif changes or spec.sid in adopted:
+            plan.ops.append(SyncOp("update", spec.sid, obj, spec, changes, adopt=spec.sid in adopted))
+        else:
+            plan.unchanged += 1
+
+    # Attribute writes the builder makes on the hub itself
+    for external in externals.values():
+        if external.attrs:
+            changes, _ = _diff(external, external.obj, None, live, plan.ids)
+            if changes:
+                plan.ops.append(SyncOp("update", f"#{external.obj.id}", external.obj, external, changes))
+
+    wanted = set(spec.sid for spec in specs)
+    for sid, obj in managed.items():
+        if sid not in wanted:
+            plan.ops.append(SyncOp("delete", sid, obj))
+    for obj in leftovers:
+        plan.ops.append(SyncOp("delete", f"#{obj.id}", obj, adopt=True))
+
+    plan.plan_ms = (time.perf_counter() - start) * 1000.0
+    return plan, None
+
+
+# =============================================================================
+# Applying
+# =============================================================================
+
+def _apply_structure(op, live, ids):
+    """Create or move/rename/retype an object (phase 1)."""
+    from evennia import create_object
+
+    spec = op.spec
+    location = _to_live(spec.location, live, ids)
+    destination = _to_live(spec.destination, live, ids)
+    if op.kind == "create":
+        obj = create_object(spec.typeclass, key=spec.key, location=location, destination=destination)
+        live[op.sid] = obj
+        return obj
+
+    obj = op.obj
+    if "@typeclass" in op.changes:
+        obj.swap_typeclass(spec.typeclass, clean_attributes=False)
+    if "@key" in op.changes:
+        obj.key = spec.key
+    if "@destination" in op.changes:
+        obj.destination = destination
+    if "@location" in op.changes:
+        if spec.kind == "object":
+            obj.move_to(location, quiet=True)
+        else:
+            obj.location = location
+    return obj
+
+
+def _apply_fields(op, obj, record, old_record, live, ids):
+    """Write Attributes, tags, aliases and the sync record (phase 2)."""
+    spec = op.spec
+    if isinstance(spec, SpecObject):
+        attrs = [(name, _to_live(value, live, ids), category)
+                 for (name, category), value in spec.attrs.items()
+                 if op.kind == "create" or f"{name}|{category or ''}" in op.changes]
+        if attrs:
+            obj.attributes.batch_add(*attrs)
+        previous = set(map(tuple, old_record.get("tags", []))) if old_record else set()
+        if op.kind == "create" or "@tags" in op.changes:
+            for key, category in spec.tag_set - set(obj.tags.all(return_key_and_category=True)):
+                obj.tags.add(key, category=category)
+            for key, category in previous - spec.tag_set:
+                obj.tags.remove(key, category=category)
+        if op.kind == "create" or "@aliases" in op.changes:
+            wanted = set(record["aliases"])
+            previous = set(old_record.get("aliases", [])) if old_record else set()
+            current = set(obj.aliases.all())
+            if wanted - current:
+                obj.aliases.add(sorted(wanted - current))
+            for alias in (previous - wanted) & current:
+                obj.aliases.remove(alias)
+        for field in op.changes:
+            name, sep, category = field.partition("|")
+            if sep and (name, category or None) not in spec.attrs:
+                obj.attributes.remove(name, category=category or None)
+        obj.tags.add(op.sid, category=_sync_category(op.sid.split(":", 1)[0]))
+        obj.attributes.add("applied", record, category=SYNC_RECORD_CATEGORY)
+    else:
+        for field in op.changes:
+            name, _, category = field.partition("|")
+            obj.attributes.add(name, _to_live(spec.attrs[(name, category or None)], live, ids),
+                               category=category or None)
+
+
+def _time_op(kind, elapsed_ms, ops=1):
+    total, count = _op_costs.get(kind, (0.0, 0))
+    _op_costs[kind] = (total + elapsed_ms, count + ops)
+
+
+def apply_plan(plan):
+    """
+    Apply a plan in one transaction.
+
+    If anything fails the database rolls back, but the objects in memory
+    keep whatever was done to them before the failure (typeclass, moves,
+    cached Attributes and tags), so every object the apply touched is
+    dropped from the object cache and reloads from the database.
+
+    Returns:
+        tuple: (bool success, message)
+    """
+    from django.db import transaction
+
+    area = plan.area
+    live = _managed_objects(area)
+    live.update({op.sid: op.obj for op in plan.ops if op.kind == "update" and op.obj})
+    touched_rooms = set()
+    objs = {}
+    start = time.perf_counter()
+    try:
+        with transaction.atomic():
+            for op in plan.ops:
+                if op.kind == "delete":
+                    continue
+                op_start = time.perf_counter()
+                if isinstance(op.spec, SpecObject):
+                    if op.kind == "update" and op.obj.location:
+                        touched_rooms.add(op.obj.location)
+                    objs[op.sid] = _apply_structure(op, live, plan.ids)
+                else:
+                    objs[op.sid] = op.obj
+                # Counted once the second phase has run too
+                _time_op(op.kind, (time.perf_counter() - op_start) * 1000.0, ops=0)
+
+            for op in plan.ops:
+                if op.kind == "delete":
+                    continue
+                op_start = time.perf_counter()
+                obj = objs[op.sid]
+                old = obj.attributes.get("applied", category=SYNC_RECORD_CATEGORY) if op.kind == "update" else None
+                _apply_fields(op, obj, plan.records.get(op.sid), _plain(old) if old else None, live, plan.ids)
+                touched_rooms.add(obj if not obj.location else obj.location)
+                _time_op(op.kind, (time.perf_counter() - op_start) * 1000.0)
+
+            # Objects before rooms, so nothing is moved home needlessly
+            deletes = [op for op in plan.ops if op.kind == "delete"]
+            deletes.sort(key=lambda op: op.obj.location is None)
+            for op in deletes:
+                op_start = time.perf_counter()
+                if op.obj.location:
+                    touched_rooms.add(op.obj.location)
+                op.obj.delete()
+                _time_op("delete", (time.perf_counter() - op_start) * 1000.0)
+    except Exception as e:
+        logger.log_trace(f"Area sync of {area} failed")
+        _flush_touched(plan, objs, touched_rooms)
+        return False, (f"Sync of {area} failed: {e}. The database was rolled back "
+                       f"and the objects it touched were reloaded from it.")
+
+    plan.apply_ms = (time.perf_counter() - start) * 1000.0
+    _after_apply(plan, objs, touched_rooms)
+    msg = (f"Synced {area}: {plan.count('create')} created, {plan.count('update')} updated, "
+           f"{plan.count('delete')} deleted, {plan.unchanged} unchanged in {plan.apply_ms:.0f} ms.")
+    logger.log_info(msg)
+    return True, msg
+
+
+def _flush_touched(plan, objs, touched_rooms):
+    """Drop everything a failed apply touched from the object cache."""
+    touched = {}
+    for obj in list(objs.values()) + [op.obj for op in plan.ops if op.obj] + list(touched_rooms):
+        touched[id(obj)] = obj
+        if obj.location is not None:
+            touched[id(obj.location)] = obj.location
+    for obj in touched.values():
+        try:
+            obj.flush_from_cache(force=True)
+        except Exception:
+            logger.log_trace(f"Area sync: could not flush {obj!r} after rollback")
+
+
+def _after_apply(plan, objs, touched_rooms):
+    """Drop caches built from what changed."""
+    from world.npcs import register_npc_schedule
+    from world.triggers import invalidate_triggers
+
+    for room in touched_rooms:
+        if room.pk and hasattr(room, "invalidate_appearance"):
+            room.invalidate_appearance()
+    for op in plan.ops:
+        obj = objs.get(op.sid)
+        if obj is None or not obj.pk:
+            continue
+        invalidate_triggers(obj)
+        if obj.attributes.has("npc_template"):
+            register_npc_schedule(obj)
+
+
+def sync_area(area, hub_room=None, dry_run=True):
+    """
+    Bring a built area in line with its builder.
+
+    Args:
+        area: Key in AREA_SPECS
+        hub_room: The live room the area hangs off (what the builder
+            was called with). Found from the built area if not given.
+        dry_run: Only plan; change nothing
+
+    Returns:
+        tuple: (SyncPlan or None, message)
+    """
+    if area in AREA_SPECS and hub_room is None:
+        hub_room = find_hub(area)
+        if hub_room is None:
+            return None, f"{area} isn't built yet; give the hub room to build it from."
+    plan, error = plan_area(area, hub_room)
+    if error:
+        return None, error
+    if dry_run or not plan.ops:
+        return plan, f"{area}: {len(plan.ops)} changes planned, {plan.unchanged} objects unchanged."
+    success, msg = apply_plan(plan)
+    return (plan if success else None), msg
+
+
+# =============================================================================
+# Display
+# =============================================================================
+
+_OP_MARKS = {"create": "|g+|n", "update": "|y~|n", "delete": "|r-|n"}
+
+
+def _describe(op):
+    if op.kind == "create":
+        spec = op.spec
+        where = f" in {_ref_token(spec.location)}" if spec.location is not None else ""
+        return f"{spec.kind} '{spec.key}'{where}"
+    obj = op.obj
+    kind = "exit" if obj.destination else ("room" if not obj.location else "object")
+    text = f"{kind} '{obj.key}' ({obj.dbref})"
+    if op.kind == "update":
+        fields = [field.lstrip("@").partition("|")[0] for field in op.changes]
+        if fields:
+            text += ": " + ", ".join(fields)
+        if op.adopt:
+            text += " [adopt]"
+    elif op.adopt:
+        text += " [not in builder]"
+    return text
+
+
+def format_plan(plan, limit=60):
+    """
+    Lines describing a plan, with timing estimates.
+
+    Args:
+        plan: SyncPlan
+        limit: Most operations to list
+
+    Returns:
+        list: Lines of text
+    """
+    measured = "measured" if _op_costs else "default"
+    lines = [
+        f"|wArea sync: {plan.area}|n (hub {plan.hub.key})",
+        f"{plan.count('create')} create, {plan.count('update')} update, "
+        f"{plan.count('delete')} delete, {plan.unchanged} unchanged "
+        f"({plan.spec_count} in builder, {plan.live_count} live)",
+    ]
+    for op in plan.ops[:limit]:
+        lines.append(f"  {_OP_MARKS[op.kind]} {_describe(op)}")
+    if len(plan.ops) > limit:
+        lines.append(f"  ...and {len(plan.ops) - limit} more")
+    lines.append(
+        f"Planned in {plan.plan_ms:.0f} ms. Estimated apply: {plan.estimate_ms():.0f} ms; "
+        f"full rebuild: {plan.rebuild_estimate_ms():.0f} ms ({measured} costs)."
+    )
+    if plan.apply_ms is not None:
+        lines.append(f"Applied in {plan.apply_ms:.0f} ms.")
+    return lines
@@ -0,0 +1,59 @@
+"""
+Micro-benchmarks for Gilderhaven world systems.
+
+Each module exposes run() which prints its results. Most use light
+in-memory stand-ins instead of database objects, so they measure the
+system code itself; items and loadtest write real objects. Run them
+from `evennia shell`:
+
+    from world.benchmarks import shops
+    shops.run()
+"""
+
+
+class BenchDB:
+    """Attribute namespace stand-in: unset attributes read as None."""
+
+    def __getattr__(self, name):
+        return None
+
+
+class BenchTags:
+    """Tag handler stand-in."""
+
+    def __init__(self):
+        self._tags = set()
+
+    def add(self, tag, category=None):
+        self._tags.add((tag, category))
+
+    def has(self, tag, category=None):
+        return (tag, category) in self._tags
+
+    def remove(self, tag, category=None):
+        self._tags.discard((tag, category))
+
+
+class BenchObject:
+    """Minimal object stand-in with id, key, db, ndb, tags and msg."""
+
+    _next_id = 1_000_000
+
+    def __init__(self, key="bench"):
+        BenchObject._next_id += 1
+        self.id = self.pk = BenchObject._next_id
+        self.key = key
+        self.db = BenchDB()
+        self.ndb = BenchDB()
+        self.tags = BenchTags()
+        self.location = None
+        self.contents = []
+
+    def msg(self, *args, **kwargs):
+        pass
+
+
+def report(label, count, seconds):
+    """Print a rate line."""
+    rate = count / seconds if seconds else float("inf")
+    print(f"  {label:<32} {count:>8} in {seconds * 1000:8.1f} ms  ({rate:,.0f}/s)")
@@ -0,0 +1,94 @@
+"""
+Content pack benchmark: load, reload and unload a generated pack with
+thousands of items and recipes, parsed cold and from the pack cache.
+
+The pack is written to a temporary directory and unloaded afterwards,
+so the live tables end up as they started.
+
+    from world.benchmarks import content_packs
+    content_packs.run()
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import time
+
+from world import content_packs
+from world.benchmarks import report
+
+
+def _make_pack(folder, items, recipes):
+    """Write a JSON pack of synthetic items and recipes that use them."""
+    data = {"pack": "bench_pack", "items": {}, "recipes": {}}
+    for i in range(items):
+        data["items"][f"bench_pack_item_{i:05d}"] = {
+            "key": f"bench item {i}",
+            "category": ("material", "tool", "consumable", "equipment")[i % 4],
+            "desc": f"Benchmark item number {i}.",
+            "base_value": 5 + i % 100,
+            "weight": 0.1 * (i % 10),
+        }
+    for i in range(recipes):
+        data["recipes"][f"bench_pack_recipe_{i:05d}"] = {
+            "name": f"Bench Recipe {i}",
+            "category": "alchemy",
+            "ingredients": [
+                {"item": f"bench_pack_item_{(i * 3 + j) % items:05d}", "amount": 1 + j}
+                for j in range(3)
+            ],
+            "output": {"item": f"bench_pack_item_{i % items:05d}", "amount": 1},
+            "skill_required": i % 50,
+            "workstation": None,
+            "exp": 10,
+        }
+    path = os.path.join(folder, "bench_pack.json")
+    with open(path, "w") as handle:
+        handle.write(json.dumps(data))
+    return path
+
+
+def run(items=2000, recipes=1000, reloads=20):
+    """Time cold and cached pack loads, reloads and an unload."""
+    folder = tempfile.mkdtemp(prefix="gilderhaven_packs_")
+    try:
+        path = _make_pack(folder, items, recipes)
+        entries = items + recipes
+        print(f"Content pack benchmark ({items} items, {recipes} recipes, "
+              f"{os.path.getsize(path) // 1024} KB JSON)")
+
+        start = time.perf_counter()
+        data, errors, _, _ = content_packs.read_pack_file(path)
+        report("parse + validate (cold)", entries, time.perf_counter() - start)
+        if errors:
+            print(f"  Pack did not validate: {errors[0]}")
+            return
+
+        start = time.perf_counter()
+        content_packs.read_pack_file(path)
+        report("read from cache", entries, time.perf_counter() - start)
+
+        start = time.perf_counter()
+        pack, _ = content_packs.load_pack_file(path)
+        report("load (cached) + apply", entries, time.perf_counter() - start)
+        print(f"  {len(pack.warnings)} reference warnings")
+
+        # An unchanged file is a no-op; change the data so reloads apply.
+        # Only the reload is timed, not writing the file.
+        elapsed = 0.0
+        for i in range(reloads):
+            data["desc"] = f"reload {i}"
+            with open(path, "w") as handle:
+                handle.write(json.dumps(data))
+            start = time.perf_counter()
+            content_packs.reload_pack("bench_pack")
+            elapsed += time.perf_counter() - start
+        report("edit + reload (cold parse)", reloads, elapsed)
+
+        start = time.perf_counter()
+        content_packs.unload_pack("bench_pack")
+        report("unload", entries, time.perf_counter() - start)
+    finally:
+        content_packs.unload_pack("bench_pack")
+        shutil.rmtree(folder, ignore_errors=True)
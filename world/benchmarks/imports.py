@@ -0,0 +1,84 @@
+"""
+Import-time benchmark: what a server start or reload pays to import the
+game's command and world modules, and what the lazy data registries
+cost when they are first used.
+
+Each measurement runs in a fresh Python process, because a module can
+only be imported for the first time once per process. The child process
+sets up Django and Evennia the way `evennia shell` does before timing
+anything, so that setup is not counted.
+
+    from world.benchmarks import imports
+    imports.run()
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+from django.conf import settings
+
+
+# What a reload imports: the cmdsets pull in every command module,
+# which pull in the world modules they use
+IMPORT_TARGETS = (
+    "commands.default_cmdsets",
+    "world",
+)
+
+_CHILD = r"""
+import json, sys, time
+import django
+django.setup()
+import evennia
+evennia._init()
+
+timings = {}
+for target in TARGETS:
+    start = time.perf_counter()
+    __import__(target)
+    timings[target] = (time.perf_counter() - start) * 1000.0
+
+from world.registry import get_registries, load_all_registries
+loaded_before = [name for name, loaded, _ in get_registries() if loaded]
+timings["registries"] = load_all_registries()
+per_registry = {name: ms for name, _, ms in get_registries()}
+print(json.dumps({"timings": timings, "per_registry": per_registry,
+                  "loaded_at_import": loaded_before}))
+"""
+
+
+def _run_child(targets):
+    env = dict(os.environ)
+    env.setdefault("DJANGO_SETTINGS_MODULE", "server.conf.settings")
+    code = _CHILD.replace("TARGETS", repr(tuple(targets)))
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=settings.GAME_DIR, env=env, capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr else "child failed")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def run(repeats=5, targets=IMPORT_TARGETS):
+    """Time fresh imports (median of repeats) and first registry loads."""
+    print(f"Import benchmark ({repeats} fresh processes)")
+    samples = [_run_child(targets) for _ in range(repeats)]
+
+    for key in list(targets) + ["registries"]:
+        values = [sample["timings"][key] for sample in samples]
+        label = f"import {key}" if key != "registries" else "load all registries"
+        print(f"  {label:<32} {statistics.median(values):8.1f} ms  "
+              f"(min {min(values):.1f}, max {max(values):.1f})")
+
+    print("  First load per registry:")
+    per_registry = samples[-1]["per_registry"]
+    for name, ms in sorted(per_registry.items(), key=lambda row: -(row[1] or 0)):
+        print(f"    {name:<30} {ms or 0:8.2f} ms")
+
+    eager = samples[-1]["loaded_at_import"]
+    if eager:
+        print(f"  Loaded during import (something reads them eagerly): {', '.join(eager)}")
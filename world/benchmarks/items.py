@@ -0,0 +1,59 @@
+"""
+Item creation benchmark: one-by-one create_item() against create_items_bulk().
+
+Unlike the other benchmarks this one writes real objects, so it needs a
+database; the items it creates are deleted afterwards.
+
+    from world.benchmarks import items
+    items.run()
+"""
+
+import time
+
+from world import items
+from world.items import ITEM_TEMPLATES
+from world.benchmarks import report
+
+
+# A plain material, a tool and a consumable
+BENCH_TEMPLATES = ("iron_ore", "basic_pickaxe", "bread")
+
+
+def _entries(count):
+    keys = [key for key in BENCH_TEMPLATES if key in ITEM_TEMPLATES] or list(ITEM_TEMPLATES)[:3]
+    return [keys[i % len(keys)] for i in range(count)]
+
+
+def _delete(created):
+    for item in created:
+        if item:
+            item.delete()
+
+
+def run(count=200, compiles=10_000):
+    """Time prototype compilation and single vs bulk item creation."""
+    entries = _entries(count)
+    print(f"Item creation benchmark ({count} items)")
+
+    start = time.perf_counter()
+    for i in range(compiles):
+        items.clear_item_prototypes()
+        items.get_item_prototype(entries[i % len(entries)])
+    report("prototype compiles", compiles, time.perf_counter() - start)
+
+    created = []
+    try:
+        start = time.perf_counter()
+        for key in entries:
+            created.append(items.create_item(key))
+        report("create_item", count, time.perf_counter() - start)
+    finally:
+        _delete(created)
+
+    created = []
+    try:
+        start = time.perf_counter()
+        created = items.create_items_bulk(entries)
+        report("create_items_bulk", count, time.perf_counter() - start)
+    finally:
+        _delete(created)
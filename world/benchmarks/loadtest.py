@@ -0,0 +1,491 @@
+"""
+Scenario load test: scripted player personas driving the real cmdsets.
+
+Builds a private copy of the newbie areas and the market from
+content/builders.py under a "Load Test Hub" room. Then it creates bot
+characters for each persona and runs them round-robin: every tick, each
+bot runs the next step of its persona script, so N bots behave like N
+players each typing one command per tick. Everything the run creates is
+tagged and deleted afterwards; cleanup() removes anything left over by a
+crashed run.
+
+Commands are dispatched the way Evennia's own command tests do it. The
+command is looked up in CharacterCmdSet, lock-checked, and then put
+through at_pre_cmd, parse, func and at_post_cmd. The game code that
+runs is real; there is just no network, session or reactor. Each bot has
+a LoadSession that swallows its messages and counts them. The command
+profiler is switched on for the run, so the per-command profile
+(`cmdprofile`) fills in as well.
+
+This writes to the game database, so run it against a local SQLite copy
+of the game rather than production. It refuses other database engines
+unless force=True. Run from `evennia shell`:
+
+    from world.benchmarks import loadtest
+    loadtest.run(players=200, ticks=20)
+    loadtest.run(personas={"gatherer": 50, "shopper": 10}, ticks=50)
+"""
+
+import random
+import time
+import traceback
+from copy import copy
+
+from django.conf import settings
+from evennia import create_object
+from evennia.utils import logger, search
+
+from world import profiler
+
+
+LOADTEST_TAG = "loadtest"
+LOADTEST_TAG_CATEGORY = "benchmark"
+
+BOT_TYPECLASS = "typeclasses.characters.Character"
+HUB_TYPECLASS = "typeclasses.rooms.Room"
+
+# Builders from content/builders.py and the name @goto uses for each
+AREA_BUILDERS = (
+    ("whisperwood", "build_whisperwood"),
+    ("moonshallow", "build_moonshallow"),
+    ("sunny_meadow", "build_sunny_meadow"),
+    ("copper_hill", "build_copper_hill"),
+    ("tidepools", "build_tidepools"),
+    ("market", "build_market"),
+)
+
+# Fighters are grouped into parties of this size
+FIGHTER_PARTY_SIZE = 3
+
+
+# =============================================================================
+# Personas
+# =============================================================================
+
+# Each persona has a kit (template, quantity) given at setup, a starting
+# area and a script run in a loop. Script steps are command lines, or:
+#   @goto <area>   - jump to a random room of a built area
+#                    ("resources" is any room with resource nodes)
+#   @move          - walk through a random exit
+#   @encounter     - party leaders start a random encounter
+PERSONAS = {
+    "gatherer": {
+        "kit": (("basic_pickaxe", 1), ("basic_fishing_rod", 1), ("foraging_basket", 1),
+                ("bug_net", 1)),
+        "start": "resources",
+        "script": (
+            "resources", "gather", "forage", "mine", "fish", "inventory",
+            "@move", "gather", "catch", "search", "@goto resources", "gathering",
+        ),
+    },
+    "crafter": {
+        "kit": (("wild_herbs", 60), ("honey", 20), ("mortar_pestle", 1)),
+        "start": "workshop",
+        "script": (
+            "recipes", "recipe herb paste", "craft herb paste", "skills",
+            "craft healing salve", "inventory", "examine wild herbs", "workstation",
+        ),
+    },
+    "fighter": {
+        "kit": (("bread", 5),),
+        "start": "whisperwood",
+        "script": (
+            "party", "danger", "@encounter", "encounter", "attack", "combat",
+            "defend", "attack", "power", "flee", "rest", "@move", "equipment",
+        ),
+    },
+    "shopper": {
+        "kit": (("iron_ore", 20), ("copper_ore", 20)),
+        "start": "market",
+        "coins": 500,
+        "script": (
+            "shops", "@goto market", "shop", "buy bread", "balance", "value bread",
+            "sell 2 iron ore", "inventory", "@move", "shop", "buy 2 bread", "sell copper ore",
+        ),
+    },
+    "socialiser": {
+        "kit": (),
+        "start": "hub",
+        "script": (
+            "look", "say Hello, everyone!", "pose waves.", "home", "party", "@move",
+            "look", "emote stretches.", "inventory", "@move", "say Nice day for it.",
+        ),
+    },
+}
+
+# Share of players per persona when run() is given a total
+DEFAULT_MIX = {
+    "gatherer": 0.35,
+    "crafter": 0.15,
+    "fighter": 0.2,
+    "shopper": 0.15,
+    "socialiser": 0.15,
+}
+
+
+# =============================================================================
+# Sessions and Dispatch
+# =============================================================================
+
+# Messages received by every bot in the run
+_received = [0]
+
+
+class LoadSession:
+    """Stands in for a bot's connection: counts and drops its messages."""
+
+    __slots__ = ("received", "last")
+
+    def __init__(self):
+        self.received = 0
+        self.last = None
+
+    def msg(self, text=None, *args, **kwargs):
+        self.received += 1
+        self.last = text
+        _received[0] += 1
+
+
+class Dispatcher:
+    """Command line -> command lookup over CharacterCmdSet."""
+
+    def __init__(self):
+        from commands.default_cmdsets import CharacterCmdSet
+
+        self.cmdset = CharacterCmdSet()
+        self.names = {}
+        for cmd in self.cmdset.commands:
+            for name in [cmd.key] + list(cmd.aliases):
+                self.names.setdefault(name.lower(), cmd)
+        # Longest first so "party invite" wins over "party"
+        self.ordered = sorted(self.names, key=len, reverse=True)
+
+    def match(self, line):
+        """(command, cmdname, args) for a line, or None."""
+        lowered = line.lower()
+        for name in self.ordered:
+            if lowered == name or lowered.startswith(name + " "):
+                return self.names[name], line[:len(name)], line[len(name):]
+        return None
+
+    def run(self, caller, line):
+        """
+        Run one command line as caller.
+
+        Returns:
+            tuple: (command key, outcome) where outcome is "ok",
+            "unknown" or "denied"; exceptions propagate
+        """
+        found = self.match(line)
+        if not found:
+            return line.split(" ", 1)[0], "unknown"
+        cmd, cmdname, args = found
+        if not cmd.access(caller, "cmd"):
+            return cmd.key, "denied"
+
+        cmd = copy(cmd)
+        cmd.caller = cmd.obj = caller
+        cmd.cmdname = cmd.cmdstring = cmd.raw_cmdname = cmdname
+        cmd.args = args
+        cmd.raw_string = line
+        cmd.cmdset = self.cmdset
+        cmd.session = None
+        cmd.account = None
+
+        if cmd.at_pre_cmd():
+            return cmd.key, "ok"
+        cmd.parse()
+        ret = cmd.func()
+        if hasattr(ret, "__next__"):
+            # Commands that yield to pause: no reactor here, so don't wait
+            for _ in ret:
+                pass
+        cmd.at_post_cmd()
+        return cmd.key, "ok"
+
+
+# =============================================================================
+# World Setup
+# =============================================================================
+
+def _tag(obj):
+    obj.tags.add(LOADTEST_TAG, category=LOADTEST_TAG_CATEGORY)
+
+
+def build_world():
+    """
+    Build the test areas under a fresh hub.
+
+    Returns:
+        dict: area name -> list of rooms, plus "hub" and "workshop"
+    """
+    from content import builders
+
+    hub = create_object(HUB_TYPECLASS, key="Load Test Hub")
+    hub.db.desc = "A plain stone plaza built for load tests."
+    areas = {"hub": [hub]}
+
+    for area, builder in AREA_BUILDERS:
+        try:
+            rooms = getattr(builders, builder)(hub)
+        except Exception as e:
+            logger.log_err(f"Load test: {builder} failed: {e}")
+            continue
+        areas[area] = list(rooms.values())
+
+    workshop = create_object(HUB_TYPECLASS, key="Load Test Workshop")
+    create_object("typeclasses.objects.Object", key="alchemy table", location=workshop,
+                  attributes=[("workstation_type", "alchemy_table")])
+    builders.link_rooms(hub, workshop, "workshop", "plaza")
+    areas["workshop"] = [workshop]
+
+    areas["resources"] = [
+        room for name, rooms in areas.items() for room in rooms if room.db.resource_nodes
+    ]
+
+    # Tag everything so cleanup() can find it even after a crash
+    for name, rooms in areas.items():
+        if name == "resources":
+            continue
+        for room in rooms:
+            _tag(room)
+            for obj in room.contents:
+                _tag(obj)
+    return areas
+
+
+def create_bots(counts, areas, rng):
+    """
+    Create persona bots with their kits, in their starting areas.
+
+    Returns:
+        list: (persona, bot, LoadSession) tuples
+    """
+    from world.items import get_item_template, give_item
+    from world.currency import set_balance
+    from world.parties import invite_to_party, accept_party_invite
+
+    bots = []
+    for persona, count in counts.items():
+        spec = PERSONAS[persona]
+        rooms = areas.get(spec["start"]) or areas["hub"]
+        for i in range(count):
+            bot = create_object(BOT_TYPECLASS, key=f"Loadbot-{persona}-{i}",
+                                location=rng.choice(rooms))
+            _tag(bot)
+            session = LoadSession()
+            # Instance attribute: every msg to this bot, including
+            # msg_contents fan-out, lands in its session
+            bot.msg = session.msg
+            for template_key, quantity in spec["kit"]:
+                if get_item_template(template_key):
+                    give_item(bot, template_key, quantity)
+            if spec.get("coins"):
+                set_balance(bot, spec["coins"], reason="load test")
+            bots.append((persona, bot, session))
+
+    # Fighters go out in parties, following their leader
+    fighters = [bot for persona, bot, _ in bots if persona == "fighter"]
+    for start in range(0, len(fighters), FIGHTER_PARTY_SIZE):
+        leader, *members = fighters[start:start + FIGHTER_PARTY_SIZE]
+        leader.ndb.loadtest_leader = True
+        for member in members:
+            member.move_to(leader.location, quiet=True)
+            invite_to_party(leader, member)
+            accept_party_invite(member, leader)
+    return bots
+
+
+def cleanup():
+    """
+    Delete everything a load test created, including leftovers.
+
+    Returns:
+        int: Objects deleted
+    """
+    from world.encounters import clear_creature_pool
+    from world.materials import clear_material_cache
+    from world.parties import is_in_party, leave_party
+
+    objs = search.search_tag(LOADTEST_TAG, category=LOADTEST_TAG_CATEGORY)
+    # Bots and things first, rooms last, so nothing is moved home mid-delete
+    objs = sorted(objs, key=lambda obj: obj.location is None)
+    deleted = 0
+    for obj in objs:
+        if not obj.pk:
+            # Already deleted along with its room
+            continue
+        if is_in_party(obj):
+            leave_party(obj)
+        for content in obj.contents:
+            if not content.has_account and content.delete():
+                deleted += 1
+        if obj.delete():
+            deleted += 1
+    clear_material_cache()
+    clear_creature_pool()
+    return deleted
+
+
+# =============================================================================
+# Steps
+# =============================================================================
+
+def _move(bot, rng):
+    exits = [obj for obj in bot.location.contents if obj.destination] if bot.location else []
+    if not exits:
+        return "move", "ok"
+    exit_obj = rng.choice(exits)
+    exit_obj.at_traverse(bot, exit_obj.destination)
+    return "move", "ok"
+
+
+def _goto(bot, area, areas, rng):
+    rooms = areas.get(area)
+    if rooms:
+        bot.move_to(rng.choice(rooms), quiet=True)
+    return "goto", "ok"
+
+
+def _encounter(bot, rng):
+    from world.encounters import ENCOUNTER_TEMPLATES, trigger_encounter
+
+    if not bot.ndb.loadtest_leader or bot.ndb.encounter or bot.ndb.combat:
+        return "encounter*", "ok"
+    trigger_encounter(bot, rng.choice(list(ENCOUNTER_TEMPLATES)), force=True)
+    return "encounter*", "ok"
+
+
+def run_step(dispatcher, bot, step, areas, rng):
+    """Run one persona script step; returns (label, outcome)."""
+    if step == "@move":
+        return _move(bot, rng)
+    if step.startswith("@goto "):
+        return _goto(bot, step[6:], areas, rng)
+    if step == "@encounter":
+        return _encounter(bot, rng)
+    return dispatcher.run(bot, step)
+
+
+# =============================================================================
+# Running
+# =============================================================================
+
+def _persona_counts(players, personas):
+    if personas:
+        return {name: count for name, count in personas.items() if name in PERSONAS and count > 0}
+    counts = {name: int(players * share) for name, share in DEFAULT_MIX.items()}
+    # Rounding leftovers go to the first personas
+    for name in list(DEFAULT_MIX)[:players - sum(counts.values())]:
+        counts[name] += 1
+    return counts
+
+
+def run(players=200, ticks=20, personas=None, seed=1, keep=False, force=False):
+    """
+    Run the scenario and print a per-persona report.
+
+    Args:
+        players: Total bots, split by DEFAULT_MIX
+        ticks: Rounds; each bot runs one script step per round
+        personas: {persona: count} instead of players/DEFAULT_MIX
+        seed: RNG seed for room and exit choices
+        keep: Leave the world and bots in place afterwards
+        force: Run even if the database isn't SQLite
+
+    Returns:
+        dict: persona -> report row (see CommandStats.as_dict), plus
+        "all" for the whole run
+    """
+    engine = settings.DATABASES["default"]["ENGINE"]
+    if "sqlite" not in engine and not force:
+        print(f"Refusing to load test against {engine}; use a local SQLite copy or force=True.")
+        return {}
+
+    rng = random.Random(seed)
+    counts = _persona_counts(players, personas)
+    was_profiling = profiler.is_profiling()
+    profiler.enable_profiling()
+    _received[0] = 0
+
+    stats = {name: profiler.CommandStats(name) for name in list(counts) + ["all"]}
+    errors = {}
+    outcomes = {"unknown": 0, "denied": 0}
+
+    print(f"Load test: {sum(counts.values())} bots "
+          f"({', '.join(f'{n} {p}' for p, n in counts.items())}), {ticks} ticks")
+    try:
+        start = time.perf_counter()
+        areas = build_world()
+        bots = create_bots(counts, areas, rng)
+        print(f"  setup in {time.perf_counter() - start:.1f}s: "
+              f"{sum(len(r) for n, r in areas.items() if n != 'resources')} rooms")
+
+        dispatcher = Dispatcher()
+        positions = {bot.id: rng.randrange(len(PERSONAS[p]["script"])) for p, bot, _ in bots}
+        run_start = time.perf_counter()
+        for _ in range(ticks):
+            for persona, bot, session in bots:
+                script = PERSONAS[persona]["script"]
+                step = script[positions[bot.id] % len(script)]
+                positions[bot.id] += 1
+
+                before = profiler.get_counters()
+                received = _received[0]
+                began = time.perf_counter()
+                try:
+                    label, outcome = run_step(dispatcher, bot, step, areas, rng)
+                except Exception:
+                    label, outcome = step.split(" ", 1)[0], "error"
+                    if label not in errors:
+                        errors[label] = traceback.format_exc()
+                elapsed = (time.perf_counter() - began) * 1000.0
+                if outcome in outcomes:
+                    outcomes[outcome] += 1
+
+                after = profiler.get_counters()
+                cost = (
+                    elapsed,
+                    after["queries"] - before["queries"],
+                    after["attr_reads"] - before["attr_reads"],
+                    after["attr_writes"] - before["attr_writes"],
+                    _received[0] - received,
+                )
+                for key in (persona, "all"):
+                    row = stats[key]
+                    row.latency.add(cost[0])
+                    row.queries += cost[1]
+                    row.attr_reads += cost[2]
+                    row.attr_writes += cost[3]
+                    row.msgs += cost[4]
+        wall = time.perf_counter() - run_start
+    finally:
+        if not was_profiling:
+            profiler.disable_profiling()
+        if not keep:
+            deleted = cleanup()
+            print(f"  cleaned up {deleted} objects")
+
+    report = {key: row.as_dict() for key, row in stats.items()}
+    _print_report(report, wall, outcomes, errors)
+    return report
+
+
+def _print_report(report, wall, outcomes, errors):
+    total = report["all"]["calls"]
+    print(f"  {total} steps in {wall:.2f}s ({total / wall if wall else 0:,.0f} steps/s)")
+    print(f"  {'Persona':<12} {'Steps':>6} {'/s':>7} {'p50':>7} {'p95':>7} {'p99':>7} "
+          f"{'Max':>7} {'Qry':>5} {'AttW':>5} {'Msg':>5}")
+    for key, row in report.items():
+        calls = row["calls"] or 1
+        print(
+            f"  {key:<12} {row['calls']:>6} {row['calls'] / wall if wall else 0:>7.0f} "
+            f"{row['p50_ms']:>7.2f} {row['p95_ms']:>7.2f} {row['p99_ms']:>7.2f} "
+            f"{row['max_ms']:>7.1f} {row['queries'] / calls:>5.1f} "
+            f"{row['attr_writes'] / calls:>5.1f} {row['msgs'] / calls:>5.1f}"
+        )
+    print("  Times in ms; queries, Attribute writes and messages per step.")
+    if outcomes["unknown"] or outcomes["denied"]:
+        print(f"  Unknown commands: {outcomes['unknown']}  Denied: {outcomes['denied']}")
+    for label, trace in errors.items():
+        print(f"  Error in {label}:\n{trace}")
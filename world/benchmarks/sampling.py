@@ -0,0 +1,76 @@
+"""
+Sampling benchmark: alias-table rolls against a linear cumulative walk,
+and the game's compiled encounter, spawn, attack and event tables.
+
+    from world.benchmarks import sampling
+    sampling.run()
+"""
+
+import random
+import time
+
+from world import creatures, encounters, random_events
+from world.sampling import AliasTable, seed_rng
+from world.benchmarks import BenchObject, report
+
+
+POOL_SIZE = 100
+
+
+def _linear_pick(items, weights, total):
+    """The per-roll walk the game used before compiled tables."""
+    roll = random.random() * total
+    cumulative = 0
+    for item, weight in zip(items, weights):
+        cumulative += weight
+        if roll <= cumulative:
+            return item
+    return items[-1]
+
+
+def run(rolls=100_000):
+    """Time rolls/sec for the sampling tables."""
+    seed_rng(1)
+    items = [f"entry_{i}" for i in range(POOL_SIZE)]
+    weights = [1 + (i % 7) for i in range(POOL_SIZE)]
+    total = sum(weights)
+    table = AliasTable(items, weights)
+
+    room = BenchObject("bench glade")
+    room.tags.add("outdoor", category="room_type")
+    room.tags.add("market")
+
+    print(f"Sampling benchmark ({POOL_SIZE}-entry pool)")
+
+    start = time.perf_counter()
+    for _ in range(rolls):
+        _linear_pick(items, weights, total)
+    report("linear cumulative walk", rolls, time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for _ in range(rolls):
+        table.sample()
+    report("alias table", rolls, time.perf_counter() - start)
+
+    area = next(iter(encounters.AREA_ENCOUNTERS))
+    start = time.perf_counter()
+    for _ in range(rolls):
+        encounters._get_encounter_sampler(area).sample()
+    report("area encounter table", rolls, time.perf_counter() - start)
+
+    area = next(iter(creatures.SPAWN_TABLES))
+    start = time.perf_counter()
+    for _ in range(rolls):
+        creatures.roll_encounter(area)
+    report("roll_encounter", rolls, time.perf_counter() - start)
+
+    creature = next(iter(creatures.CREATURE_TEMPLATES))
+    start = time.perf_counter()
+    for _ in range(rolls):
+        creatures.select_creature_attack(creature)
+    report("select_creature_attack", rolls, time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for _ in range(rolls):
+        random_events.select_weighted_event(random_events.AMBIENT_EVENTS, room=room)
+    report("ambient event (room)", rolls, time.perf_counter() - start)
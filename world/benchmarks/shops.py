@@ -0,0 +1,68 @@
+"""
+Shop benchmark: list and buy from a 200-item shop.
+
+    from world.benchmarks import shops
+    shops.run()
+"""
+
+import time
+
+from world import shops
+from world.items import ITEM_TEMPLATES
+from world.benchmarks import BenchObject, report
+
+
+SHOP_SIZE = 200
+
+
+def _make_shop():
+    """A shop stocking SHOP_SIZE synthetic templates."""
+    keys = []
+    for i in range(SHOP_SIZE):
+        key = f"bench_item_{i:03d}"
+        ITEM_TEMPLATES[key] = {
+            "key": f"bench item {i}",
+            "category": ("material", "tool", "consumable", "equipment")[i % 4],
+            "base_value": 5 + i,
+        }
+        keys.append(key)
+
+    shop = BenchObject("bench shop")
+    inventory = [{"template": key, "stock": 10_000, "restock_rate": 5} for key in keys]
+    shops.setup_shop(shop, "general", custom_inventory=inventory)
+    return shop, keys
+
+
+def run(listings=500, purchases=2000):
+    """Time shop listings and purchases."""
+    shop, keys = _make_shop()
+    buyer = BenchObject("bench buyer")
+    buyer.db.currency = 10 ** 12
+
+    # Only the shop engine is timed here, not item creation or ledger writes
+    real_give_item = shops.give_item
+    real_pay = shops.pay
+    shops.give_item = lambda *args, **kwargs: None
+    shops.pay = lambda *args, **kwargs: True
+    try:
+        print(f"Shop benchmark ({SHOP_SIZE} items)")
+
+        start = time.perf_counter()
+        shops.get_shop_inventory_display(shop, buyer)
+        report("first listing (cold prices)", 1, time.perf_counter() - start)
+
+        start = time.perf_counter()
+        for _ in range(listings):
+            shops.get_shop_inventory_display(shop, buyer)
+        report("listings", listings, time.perf_counter() - start)
+
+        start = time.perf_counter()
+        for i in range(purchases):
+            shops.buy_item(buyer, shop, keys[i % SHOP_SIZE])
+        report("purchases", purchases, time.perf_counter() - start)
+    finally:
+        shops.give_item = real_give_item
+        shops.pay = real_pay
+        for key in keys:
+            ITEM_TEMPLATES.pop(key, None)
+        shops.invalidate_shop_prices(shop)
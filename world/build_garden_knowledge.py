@@ -169,6 +169,8 @@ class GardenRoom(IndoorRoom):
                 return obj
         return None
     
+    DYNAMIC_SHORTCODES = IndoorRoom.DYNAMIC_SHORTCODES + ("desk.state",)
+    
     def process_shortcodes(self, text: str, looker=None) -> str:
         """Process room description shortcodes."""
         # Call parent if exists
@@ -190,16 +192,6 @@ class GardenRoom(IndoorRoom):
         
         return text
     
-    def return_appearance(self, looker, **kwargs):
-        """Return room description with shortcodes processed."""
-        # Get base appearance
-        appearance = super().return_appearance(looker, **kwargs)
-        
-        # Process shortcodes
-        appearance = self.process_shortcodes(appearance, looker)
-        
-        return appearance
-    
     def at_object_receive(self, moved_obj, source_location, **kwargs):
         """Called when something enters the room."""
         super().at_object_receive(moved_obj, source_location, **kwargs)
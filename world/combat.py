@@ -11,6 +11,8 @@ NO DEATH - only capture, defeat, exhaustion, or submission.
 from random import randint, random, choice
 from evennia.utils import delay
 
+from world.display_cache import cached_bar, cached_panel
+
 # =============================================================================
 # PRIMARY ATTRIBUTES
 # =============================================================================
@@ -640,10 +642,13 @@ def restore_all_resources(character):
 
 def get_resource_display(character, resource_key, bar_length=10):
     """Get a visual bar display for a resource."""
-    pool = RESOURCE_POOLS.get(resource_key, {})
     current = get_resource(character, resource_key)
     max_val = get_max_resource(character, resource_key)
-    
+    return cached_bar(_draw_resource, resource_key, current, max_val, bar_length)
+
+
+def _draw_resource(resource_key, current, max_val, bar_length):
+    pool = RESOURCE_POOLS.get(resource_key, {})
     filled = int((current / max_val) * bar_length) if max_val > 0 else 0
     empty = bar_length - filled
     
@@ -1427,6 +1432,11 @@ class CombatInstance:
             )
             result["befriended"] = True
             
+            # Encounter creatures only get a database object when something
+            # needs one (pets, quest targets); the rest go back to the pool
+            if hasattr(target, "promote") and target.db.persist_on_befriend:
+                result["befriended_obj"] = target.promote(actor)
+            
             # Could increase reputation with creature type here
         else:
             result["success"] = False
@@ -1487,41 +1497,30 @@ class CombatInstance:
         return self.outcome
     
     def get_status_display(self, for_character):
-        """Get a formatted combat status display."""
-        lines = []
-        lines.append("|w=== COMBAT ===|n")
-        lines.append(f"Round {self.round}")
-        lines.append("")
-        
-        # Show all combatants
-        for char, data in self.participants.items():
-            if data.get("fled"):
-                continue
-            
-            side_marker = "|g[ALLY]|n" if data["side"] == self.participants.get(for_character, {}).get("side") else "|r[ENEMY]|n"
-            turn_marker = " |y<--|n" if char == self.get_current_combatant() else ""
-            
-            lines.append(f"{side_marker} {char.key}{turn_marker}")
-            lines.append(f"  {get_resource_display(char, 'hp')}")
-            lines.append(f"  {get_resource_display(char, 'stamina')}")
-            lines.append(f"  {get_resource_display(char, 'composure')}")
-            
-            # Show states
-            states = data.get("states", [])
-            if states:
-                state_names = [COMBAT_STATES.get(s, {}).get("name", s) for s in states]
-                lines.append(f"  Status: {', '.join(state_names)}")
-            lines.append("")
-        
-        # Show available actions for current character
+        """
+        Get a formatted combat status display.
+
+        Sent after every action, so the panel is cached per viewer and
+        only rebuilt when something on it changed.
+        """
         current = self.get_current_combatant()
-        if current == for_character:
-            lines.append("|wYour turn! Actions:|n")
-            available = self.get_available_actions(for_character)
-            action_list = ", ".join(available)
-            lines.append(f"  {action_list}")
-        
-        return "\n".join(lines)
+        my_side = self.participants.get(for_character, {}).get("side")
+        
+        # Everything the panel shows, one row per combatant still fighting
+        rows = tuple(
+            (
+                char.key,
+                data["side"] == my_side,
+                char == current,
+                tuple(get_resource_display(char, key) for key in ("hp", "stamina", "composure")),
+                tuple(data.get("states", [])),
+            )
+            for char, data in self.participants.items()
+            if not data.get("fled")
+        )
+        actions = tuple(self.get_available_actions(for_character)) if current == for_character else None
+        signature = (self.round, rows, actions)
+        return cached_panel(for_character, "combat", signature, _build_status_display, signature)
     
     def get_available_actions(self, character):
         """Get list of actions available to a character."""
@@ -1550,6 +1549,38 @@ class CombatInstance:
         return available
 
 
+def _build_status_display(signature):
+    """Render the combat panel from CombatInstance.get_status_display's signature."""
+    round_num, rows, actions = signature
+    lines = []
+    lines.append("|w=== COMBAT ===|n")
+    lines.append(f"Round {round_num}")
+    lines.append("")
+    
+    # Show all combatants
+    for key, ally, their_turn, resources, states in rows:
+        side_marker = "|g[ALLY]|n" if ally else "|r[ENEMY]|n"
+        turn_marker = " |y<--|n" if their_turn else ""
+        
+        lines.append(f"{side_marker} {key}{turn_marker}")
+        for resource in resources:
+            lines.append(f"  {resource}")
+        
+        # Show states
+        if states:
+            state_names = [COMBAT_STATES.get(s, {}).get("name", s) for s in states]
+            lines.append(f"  Status: {', '.join(state_names)}")
+        lines.append("")
+    
+    # Show available actions for current character
+    if actions is not None:
+        lines.append("|wYour turn! Actions:|n")
+        action_list = ", ".join(actions)
+        lines.append(f"  {action_list}")
+    
+    return "\n".join(lines)
+
+
 # =============================================================================
 # Encounter Initialization
 # =============================================================================
@@ -0,0 +1,598 @@
+"""
+Content Packs for Gilderhaven
+==============================
+
+Templates from data files instead of Python modules. A content pack is
+one JSON, TOML or YAML file in a pack directory (content/packs/ by
+default) that adds or replaces entries in the game's template tables:
+
+    {
+        "pack": "autumn_harvest",
+        "items": {
+            "pumpkin": {"key": "pumpkin", "category": "material", ...}
+        },
+        "recipes": {
+            "pumpkin_pie": {"name": "Pumpkin Pie", "category": "cooking", ...}
+        }
+    }
+
+Sections map onto the registries in PACK_SECTIONS. Entries use the same
+fields as the built-in templates and are checked against PACK_SCHEMAS
+before anything is applied. A pack with schema errors is rejected as a
+whole and whatever it replaced stays in place. References to other
+templates (recipe ingredients, loot, dialogue links...) that don't
+resolve are reported as warnings.
+
+Each parsed and validated pack is cached as a marshal file in
+__packcache__ next to it, keyed by a hash of the file's bytes. Loading
+an unchanged pack skips parsing and validation entirely.
+
+A pack can be reloaded or unloaded on its own while the server runs.
+Its previous entries are taken out (restoring any built-in entries it
+replaced), the new ones are applied, and the compiled caches built from
+those tables are dropped so they rebuild on next use.
+
+YAML packs need PyYAML. TOML packs need Python 3.11+ or tomli.
+
+Usage:
+    from world.content_packs import load_packs, reload_pack
+
+    load_packs()                       # every pack in CONTENT_PACK_DIRS
+    pack, errors = reload_pack("autumn_harvest")
+"""
+
+import hashlib
+import json
+import marshal
+import os
+import sys
+import time
+from importlib import import_module
+
+from django.conf import settings
+from evennia.utils import logger
+
+
+# =============================================================================
+# Configuration
+# =============================================================================
+
+CONTENT_PACK_DIRS = getattr(
+    settings, "CONTENT_PACK_DIRS", [os.path.join(settings.GAME_DIR, "content", "packs")]
+)
+
+CACHE_DIRNAME = "__packcache__"
+
+# Bump when the cached form changes
+PACK_CACHE_VERSION = 1
+
+# Pack section -> (module, registry name)
+PACK_SECTIONS = {
+    "items": ("world.items", "ITEM_TEMPLATES"),
+    "recipes": ("world.crafting", "RECIPE_TEMPLATES"),
+    "creatures": ("world.creatures", "CREATURE_TEMPLATES"),
+    "spawn_tables": ("world.creatures", "SPAWN_TABLES"),
+    "quests": ("world.quests", "QUEST_TEMPLATES"),
+    "dialogue": ("world.npcs", "DIALOGUE_TREES"),
+    "species": ("world.body", "SPECIES_TEMPLATES"),
+}
+
+# Top-level keys that aren't sections
+PACK_META_KEYS = ("pack", "desc", "version", "author")
+
+_NUMBER = (int, float)
+_RANGE = (list, tuple)
+_OPT_STR = (str, type(None))
+
+# Section -> field -> (allowed types, required). Other fields are
+# allowed; templates carry plenty of optional extras.
+PACK_SCHEMAS = {
+    "items": {
+        "key": (str, True),
+        "category": (str, True),
+        "desc": (str, False),
+        "aliases": (list, False),
+        "base_value": (_NUMBER, False),
+        "weight": (_NUMBER, False),
+        "stackable": (bool, False),
+        "max_stack": (int, False),
+        "flags": (list, False),
+        "tool_type": (str, False),
+        "tool_tier": (int, False),
+        "durability": (int, False),
+        "edible": (bool, False),
+        "use_effect": (dict, False),
+        "slot": (str, False),
+    },
+    "recipes": {
+        "name": (str, True),
+        "category": (str, True),
+        "ingredients": (list, True),
+        "output": (dict, True),
+        "skill_required": (int, False),
+        "workstation": (_OPT_STR, False),
+        "tools": (list, False),
+        "difficulty": (str, False),
+        "exp": (_NUMBER, False),
+        "discovered_by_default": (bool, False),
+        "discovery_source": (str, False),
+    },
+    "creatures": {
+        "name": (str, True),
+        "category": (str, True),
+        "level": (int, True),
+        "base_hp": (_NUMBER, True),
+        "behavior": (str, False),
+        "attributes": (dict, False),
+        "skills": (dict, False),
+        "attacks": (list, False),
+        "loot": (list, False),
+        "spawn_areas": (list, False),
+        "pack_size": (_RANGE, False),
+        "exp_reward": (_NUMBER, False),
+    },
+    "spawn_tables": {
+        "weights": (dict, True),
+        "common": (list, False),
+        "uncommon": (list, False),
+        "rare": (list, False),
+    },
+    "quests": {
+        "name": (str, True),
+        "objectives": (list, True),
+        "category": (str, False),
+        "giver": (_OPT_STR, False),
+        "level": (int, False),
+        "rewards": (dict, False),
+        "repeatable": (bool, False),
+        "cooldown": (_NUMBER, False),
+    },
+    "dialogue": {
+        "text": (str, False),
+        "choices": (list, False),
+        "conditions": ((dict, type(None)), False),
+    },
+    "species": {
+        "name": (str, True),
+        "desc": (str, False),
+        "parts": (dict, False),
+        "abilities": (list, False),
+    },
+}
+
+# pack name -> ContentPack
+_packs = {}
+
+# (section, key) -> pack name that last set it
+_owners = {}
+
+# Marker for "no entry before this pack"
+_MISSING = object()
+
+
+class ContentPack:
+    """A loaded pack and what it changed."""
+
+    __slots__ = ("name", "path", "digest", "data", "replaced", "warnings",
+                 "loaded_at", "load_ms", "from_cache")
+
+    def __init__(self, name, path, digest, data):
+        self.name = name
+        self.path = path
+        self.digest = digest
+        self.data = data
+        # section -> {key: previous entry or _MISSING}
+        self.replaced = {}
+        self.warnings = []
+        self.loaded_at = None
+        self.load_ms = 0.0
+        self.from_cache = False
+
+    def count(self):
+        return sum(len(self.data.get(section, {})) for section in PACK_SECTIONS)
+
+
+# =============================================================================
+# Parsing
+# =============================================================================
+
+def _parse_json(raw):
+    return json.loads(raw)
+
+
+def _parse_toml(raw):
+    try:
+        import tomllib
+    except ImportError:
+        try:
+            import tomli as tomllib
+        except ImportError:
+            raise ValueError("TOML packs need Python 3.11+ or the tomli package")
+    return tomllib.loads(raw.decode("utf-8"))
+
+
+def _parse_yaml(raw):
+    try:
+        import yaml
+    except ImportError:
+        raise ValueError("YAML packs need the PyYAML package")
+    return yaml.safe_load(raw)
+
+
+PACK_PARSERS = {
+    ".json": _parse_json,
+    ".toml": _parse_toml,
+    ".yaml": _parse_yaml,
+    ".yml": _parse_yaml,
+}
+
+
+def _cache_path(path, digest):
+    folder, filename = os.path.split(path)
+    tag = f"v{PACK_CACHE_VERSION}-py{sys.version_info[0]}{sys.version_info[1]}"
+    return os.path.join(folder, CACHE_DIRNAME, f"{filename}.{digest}.{tag}.marshal")
+
+
+def _write_cache(path, digest, data):
+    cache_path = _cache_path(path, digest)
+    folder = os.path.dirname(cache_path)
+    try:
+        os.makedirs(folder, exist_ok=True)
+        # Drop caches of older versions of this file
+        prefix = os.path.basename(path) + "."
+        for name in os.listdir(folder):
+            if name.startswith(prefix):
+                os.remove(os.path.join(folder, name))
+        with open(cache_path, "wb") as handle:
+            handle.write(marshal.dumps(data))
+    except (OSError, ValueError) as e:
+        # ValueError: something marshal can't store (e.g. TOML dates)
+        logger.log_warn(f"Content pack cache not written for {path}: {e}")
+
+
+def read_pack_file(path):
+    """
+    Parse and validate a pack file, using the cache when it is current.
+
+    Args:
+        path: Pack file path
+
+    Returns:
+        tuple: (data dict or None, list of errors, digest, bool from cache)
+    """
+    parser = PACK_PARSERS.get(os.path.splitext(path)[1].lower())
+    if not parser:
+        return None, [f"{path}: not a pack file ({', '.join(PACK_PARSERS)})"], None, False
+    try:
+        with open(path, "rb") as handle:
+            raw = handle.read()
+    except OSError as e:
+        return None, [f"{path}: {e}"], None, False
+
+    digest = hashlib.blake2b(raw, digest_size=12).hexdigest()
+    try:
+        with open(_cache_path(path, digest), "rb") as handle:
+            # marshal.load() on a file reads it in tiny pieces; loads() doesn't
+            return marshal.loads(handle.read()), [], digest, True
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+
+    try:
+        data = parser(raw)
+    except Exception as e:
+        return None, [f"{path}: {e}"], digest, False
+
+    errors = validate_pack(data)
+    if errors:
+        return None, errors, digest, False
+    _write_cache(path, digest, data)
+    return data, [], digest, False
+
+
+# =============================================================================
+# Validation
+# =============================================================================
+
+def _type_names(types):
+    types = types if isinstance(types, tuple) else (types,)
+    return " or ".join("null" if t is type(None) else t.__name__ for t in types)
+
+
+def validate_entry(section, key, entry):
+    """
+    Check one entry against its section schema.
+
+    Returns:
+        list: Error strings, empty if the entry is fine
+    """
+    where = f"{section}.{key}"
+    if not isinstance(entry, dict):
+        return [f"{where}: expected a table of fields"]
+    errors = []
+    for field, (types, required) in PACK_SCHEMAS[section].items():
+        if field not in entry:
+            if required:
+                errors.append(f"{where}: missing required field '{field}'")
+            continue
+        value = entry[field]
+        # bool is an int in Python; don't let True pass as a number
+        if isinstance(value, bool) and bool not in (types if isinstance(types, tuple) else (types,)):
+            errors.append(f"{where}.{field}: expected {_type_names(types)}, got bool")
+        elif not isinstance(value, types):
+            errors.append(f"{where}.{field}: expected {_type_names(types)}, got {type(value).__name__}")
+
+    if section == "recipes" and not errors:
+        for i, ingredient in enumerate(entry["ingredients"]):
+            if not isinstance(ingredient, dict) or not isinstance(ingredient.get("item"), str) \
+                    or not isinstance(ingredient.get("amount"), int):
+                errors.append(f"{where}.ingredients[{i}]: expected {{item: str, amount: int}}")
+        if not isinstance(entry["output"].get("item"), str):
+            errors.append(f"{where}.output: missing 'item'")
+    elif section == "dialogue" and "text" not in entry and "choices" not in entry:
+        errors.append(f"{where}: a dialogue node needs 'text' or 'choices'")
+    elif section == "quests" and not errors:
+        for i, objective in enumerate(entry["objectives"]):
+            if not isinstance(objective, dict) or not isinstance(objective.get("type"), str):
+                errors.append(f"{where}.objectives[{i}]: expected a table with a 'type'")
+    return errors
+
+
+def validate_pack(data):
+    """
+    Check a parsed pack's layout and every entry's schema.
+
+    Returns:
+        list: Error strings, empty if the pack can be applied
+    """
+    if not isinstance(data, dict):
+        return ["pack: the top level must be a table"]
+    errors = []
+    for section, entries in data.items():
+        if section in PACK_META_KEYS:
+            continue
+        if section not in PACK_SECTIONS:
+            errors.append(f"{section}: unknown section (expected one of {', '.join(PACK_SECTIONS)})")
+            continue
+        if not isinstance(entries, dict):
+            errors.append(f"{section}: expected a table of entries")
+            continue
+        for key, entry in entries.items():
+            errors.extend(validate_entry(section, key, entry))
+    return errors
+
+
+def check_references(data):
+    """
+    Look for references that don't resolve against the live tables.
+
+    Run after a pack is applied, so its own entries count.
+
+    Returns:
+        list: Warning strings
+    """
+    from world.items import ITEM_TEMPLATES, ITEM_CATEGORIES
+    from world.crafting import CRAFTING_CATEGORIES
+    from world.creatures import CREATURE_TEMPLATES, CREATURE_CATEGORIES
+    from world.quests import OBJECTIVE_TYPES
+    from world.npcs import DIALOGUE_TREES
+
+    warnings = []
+    for key, entry in data.get("items", {}).items():
+        if entry["category"] not in ITEM_CATEGORIES:
+            warnings.append(f"items.{key}: unknown category '{entry['category']}'")
+    for key, entry in data.get("recipes", {}).items():
+        if entry["category"] not in CRAFTING_CATEGORIES:
+            warnings.append(f"recipes.{key}: unknown category '{entry['category']}'")
+        for ingredient in entry["ingredients"]:
+            if ingredient["item"] not in ITEM_TEMPLATES:
+                warnings.append(f"recipes.{key}: unknown ingredient '{ingredient['item']}'")
+        if entry["output"]["item"] not in ITEM_TEMPLATES:
+            warnings.append(f"recipes.{key}: unknown output item '{entry['output']['item']}'")
+    for key, entry in data.get("creatures", {}).items():
+        if entry["category"] not in CREATURE_CATEGORIES:
+            warnings.append(f"creatures.{key}: unknown category '{entry['category']}'")
+        for drop in entry.get("loot", ()):
+            if drop.get("item") not in ITEM_TEMPLATES:
+                warnings.append(f"creatures.{key}: unknown loot item '{drop.get('item')}'")
+    for key, entry in data.get("spawn_tables", {}).items():
+        for tier in ("common", "uncommon", "rare"):
+            for creature in entry.get(tier, ()):
+                if creature not in CREATURE_TEMPLATES:
+                    warnings.append(f"spawn_tables.{key}: unknown creature '{creature}'")
+    for key, entry in data.get("quests", {}).items():
+        for objective in entry["objectives"]:
+            if objective["type"] not in OBJECTIVE_TYPES:
+                warnings.append(f"quests.{key}: unknown objective type '{objective['type']}'")
+    for key, entry in data.get("dialogue", {}).items():
+        for choice in entry.get("choices", ()):
+            target = choice.get("next") if isinstance(choice, dict) else None
+            if target is not None and target not in DIALOGUE_TREES:
+                warnings.append(f"dialogue.{key}: choice leads to unknown node '{target}'")
+    return warnings
+
+
+# =============================================================================
+# Applying
+# =============================================================================
+
+def _registry(section):
+    module_path, name = PACK_SECTIONS[section]
+    return getattr(import_module(module_path), name)
+
+
+def _invalidate(sections):
+    """Drop compiled caches built from the tables a pack touched."""
+    if "items" in sections:
+        from world.items import clear_item_prototypes
+        from world.shops import invalidate_shop_prices
+        clear_item_prototypes()
+        invalidate_shop_prices()
+    if "creatures" in sections or "spawn_tables" in sections:
+        from world.creatures import clear_creature_tables
+        from world.encounters import clear_creature_pool
+        clear_creature_tables()
+        clear_creature_pool()
+    if "dialogue" in sections:
+        from world.npcs import clear_dialogue_nodes
+        clear_dialogue_nodes()
+
+
+def _apply(pack):
+    for section in PACK_SECTIONS:
+        entries = pack.data.get(section)
+        if not entries:
+            continue
+        registry = _registry(section)
+        replaced = pack.replaced.setdefault(section, {})
+        for key, entry in entries.items():
+            owner = _owners.get((section, key))
+            if owner and owner != pack.name:
+                pack.warnings.append(f"{section}.{key}: replaces the entry from pack '{owner}'")
+            if key not in replaced:
+                replaced[key] = registry.get(key, _MISSING)
+            registry[key] = entry
+            _owners[(section, key)] = pack.name
+
+
+def _unapply(pack):
+    for section, replaced in pack.replaced.items():
+        registry = _registry(section)
+        for key, previous in replaced.items():
+            owner = _owners.get((section, key))
+            if owner != pack.name:
+                # A later pack has since replaced it; that pack now
+                # restores what this one replaced
+                if owner in _packs:
+                    _packs[owner].replaced[section][key] = previous
+                continue
+            del _owners[(section, key)]
+            if previous is _MISSING:
+                registry.pop(key, None)
+            else:
+                registry[key] = previous
+    pack.replaced = {}
+
+
+def _touched(*packs):
+    return {section for pack in packs if pack for section in PACK_SECTIONS if pack.data.get(section)}
+
+
+# =============================================================================
+# Loading
+# =============================================================================
+
+def find_pack_files(dirs=None):
+    """Pack files in the pack directories, sorted by name."""
+    paths = []
+    for folder in dirs or CONTENT_PACK_DIRS:
+        if not os.path.isdir(folder):
+            continue
+        for filename in sorted(os.listdir(folder)):
+            if os.path.splitext(filename)[1].lower() in PACK_PARSERS and not filename.startswith("_"):
+                paths.append(os.path.join(folder, filename))
+    return paths
+
+
+def load_pack_file(path):
+    """
+    Load (or reload) the pack in a file.
+
+    If the file is unchanged since it was last applied, nothing happens.
+    On errors the previously loaded version, if any, stays applied.
+
+    Returns:
+        tuple: (ContentPack or None, list of errors)
+    """
+    start = time.perf_counter()
+    data, errors, digest, from_cache = read_pack_file(path)
+    if errors:
+        for error in errors:
+            logger.log_err(f"Content pack: {error}")
+        return None, errors
+
+    name = str(data.get("pack") or os.path.splitext(os.path.basename(path))[0])
+    old = _packs.get(name)
+    if old and old.digest == digest and old.path == path:
+        return old, []
+    if old and old.path != path:
+        error = f"{path}: pack name '{name}' is already used by {old.path}"
+        logger.log_err(f"Content pack: {error}")
+        return None, [error]
+
+    pack = ContentPack(name, path, digest, data)
+    pack.from_cache = from_cache
+    if old:
+        _unapply(old)
+    _apply(pack)
+    _invalidate(_touched(old, pack))
+    pack.warnings.extend(check_references(data))
+    pack.loaded_at = time.time()
+    pack.load_ms = (time.perf_counter() - start) * 1000.0
+    _packs[name] = pack
+
+    for warning in pack.warnings:
+        logger.log_warn(f"Content pack {name}: {warning}")
+    return pack, []
+
+
+def load_packs(dirs=None):
+    """
+    Load every pack file in the pack directories.
+
+    Returns:
+        list: (path, ContentPack or None, errors) per file
+    """
+    results = []
+    for path in find_pack_files(dirs):
+        pack, errors = load_pack_file(path)
+        results.append((path, pack, errors))
+    loaded = [pack for _, pack, _ in results if pack]
+    if results:
+        logger.log_info(
+            f"Content packs: {len(loaded)}/{len(results)} loaded, "
+            f"{sum(pack.count() for pack in loaded)} entries."
+        )
+    return results
+
+
+def reload_pack(name):
+    """
+    Re-read one loaded pack from its file and reapply it.
+
+    Returns:
+        tuple: (ContentPack or None, list of errors)
+    """
+    pack = _packs.get(name)
+    if not pack:
+        return None, [f"No content pack named '{name}' is loaded."]
+    if not os.path.exists(pack.path):
+        return None, [f"{pack.path} no longer exists; unload the pack instead."]
+    return load_pack_file(pack.path)
+
+
+def unload_pack(name):
+    """
+    Take a pack's entries out, restoring whatever they replaced.
+
+    Returns:
+        bool: False if no such pack was loaded
+    """
+    pack = _packs.pop(name, None)
+    if not pack:
+        return False
+    _unapply(pack)
+    _invalidate(_touched(pack))
+    return True
+
+
+def get_packs():
+    """Loaded packs by name."""
+    return dict(_packs)
+
+
+def start_content_packs():
+    """Load the content packs. Called from at_server_start."""
+    try:
+        load_packs()
+    except Exception as e:
+        logger.log_err(f"Content packs failed to load: {e}")
@@ -20,13 +20,56 @@ Usage:
     
     # Transfer between characters
     transfer(sender, receiver, 75, reason="trade")
+    
+    # History, a page at a time
+    get_transaction_log(character, count=10, page=2)
+
+Balances are cached in memory and written through to the currency
+Attribute. Every change is also recorded in an append-only ledger: one
+row per party in Evennia's Attribute table (category "currency_ledger",
+keyed by owner model and id, e.g. "objectdb#5" or "accountdb#5"),
+written in the same database transaction as the balances, so a transfer
+can't half-happen. An object's rows are deleted along with it.
 """
 
+import time
+import uuid
+
+from evennia.utils import logger
+
 # Currency name - change this to rename your currency globally
 CURRENCY_NAME = "gold"
 CURRENCY_PLURAL = "gold"
 STARTING_CURRENCY = 100
 
+# Ledger rows are standalone Attributes in this category, keyed by owner
+# model and id (see ledger_key)
+LEDGER_CATEGORY = "currency_ledger"
+
+
+# =============================================================================
+# Balances
+# =============================================================================
+# Balances are read once from target.db.currency and then served from
+# memory. Every change writes through to the Attribute in the same
+# database transaction as its ledger rows.
+
+# ledger key -> balance
+_balances = {}
+
+# ledger keys already checked for an old db.currency_log this run
+_legacy_checked = set()
+
+
+def ledger_key(target):
+    """
+    Key for a target's balance and ledger rows.
+    
+    Accounts and objects have separate id sequences, so the id alone
+    would give Account #5 and Character #5 one history.
+    """
+    return f"{target._meta.concrete_model._meta.model_name}#{target.id}"
+
 
 def balance(target):
     """
@@ -38,8 +81,190 @@ def balance(target):
     Returns:
         int: Current balance (0 if not set)
     """
-    return target.db.currency or 0
+    key = ledger_key(target)
+    amount = _balances.get(key)
+    if amount is None:
+        amount = _balances[key] = target.db.currency or 0
+    return amount
+
+
+def clear_balance_cache(target=None):
+    """Forget cached balances, for one target or all of them."""
+    if target is None:
+        _balances.clear()
+        _legacy_checked.clear()
+    else:
+        key = ledger_key(target)
+        _balances.pop(key, None)
+        _legacy_checked.discard(key)
+
+
+def _write_balance(target, amount):
+    target.db.currency = amount
+    _balances[ledger_key(target)] = amount
+
+
+# =============================================================================
+# Ledger
+# =============================================================================
+# Each posting is one row: (txn, amount, type, reason, timestamp,
+# balance_after, counterparty ledger key). Rows are only inserted while
+# their owner exists; history is read a page at a time straight from
+# the table.
+
+def _ledger_rows():
+    from evennia.typeclasses.attributes import Attribute
+    return Attribute.objects.filter(db_category=LEDGER_CATEGORY)
+
+
+def _new_row(owner_key, entry):
+    from evennia.typeclasses.attributes import Attribute
+    return Attribute(db_key=owner_key, db_category=LEDGER_CATEGORY, db_value=entry)
+
+
+def delete_ledger(target):
+    """Delete a target's ledger rows and cached balance."""
+    key = ledger_key(target)
+    _ledger_rows().filter(db_key=key).delete()
+    _balances.pop(key, None)
+    _legacy_checked.discard(key)
+
+
+def _on_object_deleted(event):
+    delete_ledger(event.obj)
+
+
+def _subscribe():
+    from world.events import subscribe, OBJECT_DELETED
+    subscribe(OBJECT_DELETED, _on_object_deleted)
+
+
+_subscribe()
+
+
+def _entry_dict(entry):
+    txn, amount, transaction_type, reason, timestamp, balance_after, counterparty = entry
+    return {
+        "txn": txn,
+        "amount": amount,
+        "type": transaction_type,
+        "reason": reason,
+        "timestamp": timestamp,
+        "balance_after": balance_after,
+        "counterparty": counterparty,
+    }
+
+
+def post(postings, transaction_type, reason=None, force=False):
+    """
+    Apply balance changes to several parties as one transaction.
+    
+    Either every balance changes and every ledger row is written, or
+    nothing does.
+    
+    Args:
+        postings: list of (target, delta) pairs
+        transaction_type: str, ledger type for every row
+        reason: str, optional reason
+        force: bool, if True allow balances to go negative
+    
+    Returns:
+        str or None: Transaction id, or None if a party can't afford
+        their debit (nothing is changed)
+    """
+    from django.db import transaction
+    from evennia.typeclasses.attributes import Attribute
+    
+    new_balances = []
+    for target, delta in postings:
+        new_balance = balance(target) + delta
+        if new_balance < 0 and delta < 0 and not force:
+            return None
+        new_balances.append(new_balance)
+    
+    for target, _ in postings:
+        _check_legacy_log(target)
+    
+    txn = uuid.uuid4().hex[:12]
+    now = time.time()
+    # With two parties each row names the other; otherwise no counterparty
+    counterparties = [None] * len(postings)
+    if len(postings) == 2:
+        counterparties = [ledger_key(postings[1][0]), ledger_key(postings[0][0])]
+    
+    try:
+        with transaction.atomic():
+            rows = []
+            for (target, delta), new_balance, counterparty in zip(postings, new_balances, counterparties):
+                _write_balance(target, new_balance)
+                entry = (txn, delta, transaction_type, reason, now, new_balance, counterparty)
+                rows.append(_new_row(ledger_key(target), entry))
+            Attribute.objects.bulk_create(rows)
+    except Exception:
+        # The database rolled back; drop the in-memory values too
+        for target, _ in postings:
+            _balances.pop(ledger_key(target), None)
+            target.attributes.reset_cache()
+        logger.log_trace(f"Currency transaction {txn} rolled back.")
+        raise
+    
+    return txn
+
+
+def get_transaction_log(target, count=10, page=1):
+    """
+    Get transaction history, a page at a time.
+    
+    Args:
+        target: Object to check
+        count: Transactions per page
+        page: 1 for the most recent page
+    
+    Returns:
+        list: Transactions (newest first) as dicts with txn, amount,
+        type, reason, timestamp, balance_after and counterparty
+    """
+    _check_legacy_log(target)
+    
+    offset = (page - 1) * count
+    rows = _ledger_rows().filter(db_key=ledger_key(target)).order_by("-id")[offset:offset + count]
+    return [_entry_dict(row.value) for row in rows]
+
+
+def count_transactions(target):
+    """Total ledger rows for a target."""
+    return _ledger_rows().filter(db_key=ledger_key(target)).count()
+
+
+def _check_legacy_log(target):
+    key = ledger_key(target)
+    if key in _legacy_checked:
+        return
+    _legacy_checked.add(key)
+    if target.attributes.has("currency_log"):
+        migrate_currency_log(target)
+
+
+def migrate_currency_log(target):
+    """Move an old db.currency_log list into the ledger, oldest first."""
+    from evennia.typeclasses.attributes import Attribute
+    
+    legacy = target.attributes.get("currency_log") or []
+    rows = []
+    for record in legacy:
+        entry = (
+            None, record.get("amount", 0), record.get("type", ""), record.get("reason"),
+            record.get("timestamp", 0), record.get("balance_after", 0), None,
+        )
+        rows.append(_new_row(ledger_key(target), entry))
+    if rows:
+        Attribute.objects.bulk_create(rows)
+    target.attributes.remove("currency_log")
+
 
+# =============================================================================
+# Transactions
+# =============================================================================
 
 def receive(target, amount, reason=None, silent=False):
     """
@@ -57,12 +282,7 @@ def receive(target, amount, reason=None, silent=False):
     if amount < 0:
         raise ValueError("Cannot receive negative currency. Use pay() instead.")
     
-    current = balance(target)
-    new_balance = current + amount
-    target.db.currency = new_balance
-    
-    # Log the transaction
-    _log_transaction(target, amount, "receive", reason)
+    post([(target, amount)], "receive", reason)
     
     # Notify target if they can receive messages
     if not silent and hasattr(target, 'msg'):
@@ -71,7 +291,7 @@ def receive(target, amount, reason=None, silent=False):
         else:
             target.msg(f"|gYou receive {amount} {CURRENCY_PLURAL}|n.")
     
-    return new_balance
+    return balance(target)
 
 
 def pay(target, amount, reason=None, silent=False, force=False):
@@ -93,18 +313,12 @@ def pay(target, amount, reason=None, silent=False, force=False):
     
     current = balance(target)
     
-    if current < amount and not force:
+    if not post([(target, -amount)], "pay", reason, force=force):
         if not silent and hasattr(target, 'msg'):
             target.msg(f"|rYou don't have enough {CURRENCY_PLURAL}.|n "
                       f"(Need {amount}, have {current})")
         return False
     
-    new_balance = current - amount
-    target.db.currency = new_balance
-    
-    # Log the transaction
-    _log_transaction(target, -amount, "pay", reason)
-    
     if not silent and hasattr(target, 'msg'):
         if reason:
             target.msg(f"|yYou pay {amount} {CURRENCY_PLURAL}|n ({reason}).")
@@ -132,6 +346,9 @@ def transfer(sender, receiver, amount, reason=None, silent=False):
     """
     Transfer currency between two targets.
     
+    Both balances and both ledger rows are written in one database
+    transaction.
+    
     Args:
         sender: Object paying
         receiver: Object receiving
@@ -142,18 +359,14 @@ def transfer(sender, receiver, amount, reason=None, silent=False):
     Returns:
         bool: True if transfer succeeded
     """
-    if not can_afford(sender, amount):
+    if amount < 0:
+        raise ValueError("Cannot transfer negative currency.")
+    
+    if not post([(sender, -amount), (receiver, amount)], "transfer", reason):
         if not silent and hasattr(sender, 'msg'):
             sender.msg(f"|rYou don't have enough {CURRENCY_PLURAL} to transfer.|n")
         return False
     
-    # Perform atomic-ish transfer
-    sender.db.currency = balance(sender) - amount
-    receiver.db.currency = balance(receiver) + amount
-    
-    _log_transaction(sender, -amount, "transfer_out", reason)
-    _log_transaction(receiver, amount, "transfer_in", reason)
-    
     if not silent:
         if hasattr(sender, 'msg'):
             receiver_name = getattr(receiver, 'key', 'someone')
@@ -165,6 +378,25 @@ def transfer(sender, receiver, amount, reason=None, silent=False):
     return True
 
 
+def transfer_many(postings, reason=None):
+    """
+    Move currency between any number of parties at once.
+    
+    For splits like a buyer paying a seller and a fee in one go. The
+    deltas must sum to zero; nothing is created or destroyed.
+    
+    Args:
+        postings: list of (target, delta) pairs, debits negative
+        reason: str, optional reason
+    
+    Returns:
+        bool: True if every party could cover their debit
+    """
+    if sum(delta for _, delta in postings) != 0:
+        raise ValueError("Transfer postings must sum to zero.")
+    return post(postings, "transfer", reason) is not None
+
+
 def set_balance(target, amount, reason=None):
     """
     Set currency to exact amount (admin function).
@@ -177,9 +409,7 @@ def set_balance(target, amount, reason=None):
     Returns:
         int: New balance
     """
-    old_balance = balance(target)
-    target.db.currency = amount
-    _log_transaction(target, amount - old_balance, "set", reason)
+    post([(target, amount - balance(target))], "set", reason, force=True)
     return amount
 
 
@@ -199,50 +429,10 @@ def initialize_currency(target, amount=None):
         amount = STARTING_CURRENCY
     
     if target.db.currency is None:
-        target.db.currency = amount
-        _log_transaction(target, amount, "initialize", "new character")
-    
-    return target.db.currency
-
-
-def _log_transaction(target, amount, transaction_type, reason=None):
-    """
-    Log a currency transaction for history/debugging.
-    
-    Stores last 50 transactions on the target.
-    """
-    import time
+        _balances.pop(ledger_key(target), None)
+        post([(target, amount)], "initialize", "new character")
     
-    if target.db.currency_log is None:
-        target.db.currency_log = []
-    
-    log = target.db.currency_log
-    log.append({
-        "amount": amount,
-        "type": transaction_type,
-        "reason": reason,
-        "timestamp": time.time(),
-        "balance_after": balance(target)
-    })
-    
-    # Keep only last 50 entries
-    if len(log) > 50:
-        target.db.currency_log = log[-50:]
-
-
-def get_transaction_log(target, count=10):
-    """
-    Get recent transaction history.
-    
-    Args:
-        target: Object to check
-        count: Number of recent transactions
-    
-    Returns:
-        list: Recent transactions (newest first)
-    """
-    log = target.db.currency_log or []
-    return list(reversed(log[-count:]))
+    return balance(target)
 
 
 # =============================================================================
@@ -5,6 +5,10 @@ Static data for world building:
 - Ambient activity pools
 - Sound profiles and bleeding
 - Time/weather descriptions
+
+The game tables (items, recipes, dialogue, creatures, quests, species)
+also live here but are not imported by this package; each is loaded on
+first use through a LazyRegistry in its game module (see world.registry).
 """
 
 from .activities import *
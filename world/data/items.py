@@ -0,0 +1,1354 @@
+"""
+Item Templates
+
+Data for world.items: materials, tools, consumables, equipment and
+keys. world.items merges these into ITEM_TEMPLATES on first use; read
+them through world.items, not from here.
+
+Template fields are described in world/items.py.
+"""
+
+# =============================================================================
+# Item Templates - Materials
+# =============================================================================
+
+MATERIAL_TEMPLATES = {
+    # Foraged Materials
+    "wild_herbs": {
+        "key": "bundle of wild herbs",
+        "aliases": ["herbs", "wild herbs"],
+        "desc": "A bundle of assorted wild herbs, fragrant and fresh.",
+        "category": "material",
+        "subcategory": "herb",
+        "base_value": 5,
+        "weight": 0.1,
+        "stackable": True,
+        "max_stack": 50,
+    },
+    "medicinal_roots": {
+        "key": "medicinal roots",
+        "aliases": ["roots"],
+        "desc": "Gnarled roots with known healing properties.",
+        "category": "material",
+        "subcategory": "herb",
+        "base_value": 12,
+        "weight": 0.2,
+        "stackable": True,
+        "max_stack": 50,
+    },
+    "wild_berries": {
+        "key": "handful of wild berries",
+        "aliases": ["berries", "wild berries"],
+        "desc": "Small, ripe berries. Safe to eat, mildly sweet.",
+        "category": "material",
+        "subcategory": "food_raw",
+        "base_value": 3,
+        "weight": 0.1,
+        "stackable": True,
+        "max_stack": 50,
+        "edible": True,
+        "hunger_restore": 5,
+    },
+    "edible_mushrooms": {
+        "key": "edible mushrooms",
+        "aliases": ["mushrooms"],
+        "desc": "Common forest mushrooms, good for cooking.",
+        "category": "material",
+        "subcategory": "food_raw",
+        "base_value": 4,
+        "weight": 0.1,
+        "stackable": True,
+        "max_stack": 50,
+        "edible": True,
+        "hunger_restore": 8,
+    },
+    "glowing_mushroom": {
+        "key": "glowing mushroom",
+        "aliases": ["glowing mushrooms", "glow mushroom"],
+        "desc": "A mushroom that emits a soft, ethereal glow. Alchemically valuable.",
+        "category": "material",
+        "subcategory": "herb",
+        "base_value": 25,
+        "weight": 0.1,
+        "stackable": True,
+        "max_stack": 20,
+        "flags": ["magical"],
+    },
+    "wild_flowers": {
+        "key": "wild flowers",
+        "aliases": ["flowers"],
+        "desc": "A small bouquet of colorful wildflowers.",
+        "category": "material",
+        "subcategory": "misc",
+        "base_value": 2,
+        "weight": 0.1,
+        "stackable": True,
+        "max_stack": 50,
+    },
+    "forest_nuts": {
+        "key": "forest nuts",
+        "aliases": ["nuts"],
+        "desc": "Assorted nuts gathered from the forest floor.",
+        "category": "material",
+        "subcategory": "food_raw",
+        "base_value": 4,
+        "weight": 0.2,
+        "stackable": True,
+        "max_stack": 50,
+        "edible": True,
+        "hunger_restore": 10,
+    },
+    "bird_egg": {
+        "key": "bird egg",
+        "aliases": ["egg"],
+        "desc": "A small speckled egg from a wild bird's nest.",
+        "category": "material",
+        "subcategory": "food_raw",
+        "base_value": 6,
+        "weight": 0.1,
+        "stackable": True,
+        "max_stack": 20,
+        "edible": True,
+        "hunger_restore": 12,
+    },
+    "honey": {
+        "key": "jar of wild honey",
+        "aliases": ["honey", "wild honey"],
+        "desc": "Sweet golden honey harvested from a wild hive.",
+        "category": "material",
+        "subcategory": "food_raw",
+        "base_value": 15,
+        "weight": 0.3,
+        "stackable": True,
+        "max_stack": 20,
+        "edible": True,
+        "hunger_restore": 15,
+    },
+    
+    # Fishing Materials
+    "common_fish": {
+        "key": "common fish",
+        "aliases": ["fish"],
+        "desc": "An ordinary freshwater fish. Good eating.",
+        "category": "material",
+        "subcategory": "fish",
+        "base_value": 8,
+        "weight": 0.5,
+        "stackable": True,
+        "max_stack": 20,
+        "edible": True,
+        "hunger_restore": 20,
+    },
+    "silver_fish": {
+        "key": "silver fish",
+        "aliases": ["silverfish"],
+        "desc": "A fish with distinctive silver scales. Prized by cooks.",
+        "category": "material",
+        "subcategory": "fish",
+        "base_value": 15,
+        "weight": 0.6,
+        "stackable": True,
+        "max_stack": 20,
+    },
+    "golden_carp": {
+        "key": "golden carp",
+        "aliases": ["carp", "golden fish"],
+        "desc": "A beautiful fish with golden scales. Very valuable.",
+        "category": "material",
+        "subcategory": "fish",
+        "base_value": 50,
+        "weight": 0.8,
+        "stackable": True,
+        "max_stack": 10,
+        "flags": ["rare"],
+    },
+    "old_boot": {
+        "key": "old boot",
+        "aliases": ["boot"],
+        "desc": "A waterlogged boot. Not much use to anyone.",
+        "category": "junk",
+        "base_value": 1,
+        "weight": 0.5,
+        "stackable": False,
+    },
+    "freshwater_clam": {
+        "key": "freshwater clam",
+        "aliases": ["clam"],
+        "desc": "A small clam from the riverbed. Might contain a pearl.",
+        "category": "material",
+        "subcategory": "shellfish",
+        "base_value": 5,
+        "weight": 0.2,
+        "stackable": True,
+        "max_stack": 30,
+    },
+    "river_pearl": {
+        "key": "river pearl",
+        "aliases": ["pearl"],
+        "desc": "A lustrous pearl from a freshwater clam.",
+        "category": "treasure",
+        "base_value": 100,
+        "weight": 0.05,
+        "stackable": True,
+        "max_stack": 20,
+        "flags": ["valuable"],
+    },
+    
+    # Mining Materials
+    "copper_ore": {
+        "key": "copper ore",
+        "aliases": ["copper"],
+        "desc": "Raw copper ore, ready for smelting.",
+        "category": "material",
+        "subcategory": "ore",
+        "base_value": 10,
+        "weight": 1.0,
+        "stackable": True,
+        "max_stack": 50,
+    },
+    "iron_ore": {
+        "key": "iron ore",
+        "aliases": ["iron"],
+        "desc": "Raw iron ore streaked with rust-red coloring.",
+        "category": "material",
+        "subcategory": "ore",
+        "base_value": 15,
+        "weight": 1.2,
+        "stackable": True,
+        "max_stack": 50,
+    },
+    "tin_ore": {
+        "key": "tin ore",
+        "aliases": ["tin"],
+        "desc": "Silvery tin ore, useful for making bronze.",
+        "category": "material",
+        "subcategory": "ore",
+        "base_value": 8,
+        "weight": 0.9,
+        "stackable": True,
+        "max_stack": 50,
+    },
+    "silver_ore": {
+        "key": "silver ore",
+        "aliases": ["silver"],
+        "desc": "Ore with veins of precious silver running through it.",
+        "category": "material",
+        "subcategory": "ore",
+        "base_value": 40,
+        "weight": 1.0,
+        "stackable": True,
+        "max_stack": 50,
+        "flags": ["valuable"],
+    },
+    "gold_ore": {
+        "key": "gold ore",
+        "aliases": ["gold"],
+        "desc": "Heavy ore glittering with gold deposits.",
+        "category": "material",
+        "subcategory": "ore",
+        "base_value": 80,
+        "weight": 1.5,
+        "stackable": True,
+        "max_stack": 30,
+        "flags": ["valuable"],
+    },
+    "raw_gemstone": {
+        "key": "raw gemstone",
+        "aliases": ["gemstone", "gem"],
+        "desc": "An uncut gemstone, cloudy but promising.",
+        "category": "material",
+        "subcategory": "gem",
+        "base_value": 30,
+        "weight": 0.2,
+        "stackable": True,
+        "max_stack": 30,
+    },
+    "coal": {
+        "key": "lump of coal",
+        "aliases": ["coal"],
+        "desc": "Black coal, useful as fuel.",
+        "category": "material",
+        "subcategory": "fuel",
+        "base_value": 3,
+        "weight": 0.5,
+        "stackable": True,
+        "max_stack": 100,
+    },
+    "stone": {
+        "key": "chunk of stone",
+        "aliases": ["stone", "rock"],
+        "desc": "A chunk of common stone.",
+        "category": "material",
+        "subcategory": "stone",
+        "base_value": 1,
+        "weight": 1.0,
+        "stackable": True,
+        "max_stack": 50,
+    },
+    "flint": {
+        "key": "piece of flint",
+        "aliases": ["flint"],
+        "desc": "Sharp flint, good for starting fires or knapping.",
+        "category": "material",
+        "subcategory": "stone",
+        "base_value": 5,
+        "weight": 0.3,
+        "stackable": True,
+        "max_stack": 30,
+    },
+    
+    # Bug Catching Materials
+    "common_butterfly": {
+        "key": "common butterfly",
+        "aliases": ["butterfly"],
+        "desc": "A delicate butterfly with patterned wings.",
+        "category": "material",
+        "subcategory": "bug",
+        "base_value": 5,
+        "weight": 0.01,
+        "stackable": True,
+        "max_stack": 20,
+    },
+    "dragonfly": {
+        "key": "dragonfly",
+        "aliases": [],
+        "desc": "An iridescent dragonfly, wings shimmering.",
+        "category": "material",
+        "subcategory": "bug",
+        "base_value": 12,
+        "weight": 0.01,
+        "stackable": True,
+        "max_stack": 20,
+    },
+    "firefly": {
+        "key": "firefly",
+        "aliases": ["lightning bug"],
+        "desc": "A firefly that glows softly even when captured.",
+        "category": "material",
+        "subcategory": "bug",
+        "base_value": 8,
+        "weight": 0.01,
+        "stackable": True,
+        "max_stack": 30,
+        "flags": ["glowing"],
+    },
+    "beetle": {
+        "key": "beetle",
+        "aliases": [],
+        "desc": "A shiny beetle with a hard carapace.",
+        "category": "material",
+        "subcategory": "bug",
+        "base_value": 4,
+        "weight": 0.02,
+        "stackable": True,
+        "max_stack": 30,
+    },
+    "rare_moth": {
+        "key": "rare moon moth",
+        "aliases": ["moon moth", "moth"],
+        "desc": "A large moth with wings that seem to glow in moonlight.",
+        "category": "material",
+        "subcategory": "bug",
+        "base_value": 35,
+        "weight": 0.02,
+        "stackable": True,
+        "max_stack": 10,
+        "flags": ["rare", "magical"],
+    },
+    "spider_silk": {
+        "key": "spider silk",
+        "aliases": ["silk"],
+        "desc": "Fine silk harvested from spider webs.",
+        "category": "material",
+        "subcategory": "textile",
+        "base_value": 15,
+        "weight": 0.05,
+        "stackable": True,
+        "max_stack": 50,
+    },
+    
+    # Beach/Tidepool Materials
+    "seashell": {
+        "key": "seashell",
+        "aliases": ["shell"],
+        "desc": "A pretty seashell from the beach.",
+        "category": "material",
+        "subcategory": "shell",
+        "base_value": 2,
+        "weight": 0.1,
+        "stackable": True,
+        "max_stack": 50,
+    },
+    "conch_shell": {
+        "key": "conch shell",
+        "aliases": ["conch"],
+        "desc": "A large spiral shell. You can hear the ocean in it.",
+        "category": "material",
+        "subcategory": "shell",
+        "base_value": 10,
+        "weight": 0.4,
+        "stackable": True,
+        "max_stack": 20,
+    },
+    "sea_glass": {
+        "key": "piece of sea glass",
+        "aliases": ["sea glass", "beach glass"],
+        "desc": "Glass worn smooth by the sea, frosted and beautiful.",
+        "category": "material",
+        "subcategory": "misc",
+        "base_value": 5,
+        "weight": 0.1,
+        "stackable": True,
+        "max_stack": 50,
+    },
+    "driftwood": {
+        "key": "piece of driftwood",
+        "aliases": ["driftwood"],
+        "desc": "Weathered wood from the sea, smooth and pale.",
+        "category": "material",
+        "subcategory": "wood",
+        "base_value": 3,
+        "weight": 0.3,
+        "stackable": True,
+        "max_stack": 30,
+    },
+    "crab": {
+        "key": "small crab",
+        "aliases": ["crab"],
+        "desc": "A small crab that keeps trying to pinch you.",
+        "category": "material",
+        "subcategory": "shellfish",
+        "base_value": 8,
+        "weight": 0.3,
+        "stackable": True,
+        "max_stack": 20,
+    },
+    "starfish": {
+        "key": "starfish",
+        "aliases": ["sea star"],
+        "desc": "A colorful five-armed starfish.",
+        "category": "material",
+        "subcategory": "misc",
+        "base_value": 6,
+        "weight": 0.1,
+        "stackable": True,
+        "max_stack": 20,
+    },
+    "sea_urchin": {
+        "key": "sea urchin",
+        "aliases": ["urchin"],
+        "desc": "A spiny sea urchin. Handle with care.",
+        "category": "material",
+        "subcategory": "misc",
+        "base_value": 10,
+        "weight": 0.2,
+        "stackable": True,
+        "max_stack": 20,
+    },
+    "seaweed": {
+        "key": "strand of seaweed",
+        "aliases": ["seaweed", "kelp"],
+        "desc": "Fresh seaweed from the tide pools.",
+        "category": "material",
+        "subcategory": "plant",
+        "base_value": 2,
+        "weight": 0.1,
+        "stackable": True,
+        "max_stack": 50,
+        "edible": True,
+        "hunger_restore": 3,
+    },
+    
+    # Additional Crafting Materials
+    "red_herb": {
+        "key": "red herb",
+        "aliases": ["healing herb"],
+        "desc": "A herb with distinctive red leaves, known for healing properties.",
+        "category": "material",
+        "subcategory": "herb",
+        "base_value": 8,
+        "weight": 0.1,
+        "stackable": True,
+        "max_stack": 50,
+    },
+    "green_herb": {
+        "key": "green herb",
+        "aliases": ["vigor herb"],
+        "desc": "A vibrant green herb that restores energy.",
+        "category": "material",
+        "subcategory": "herb",
+        "base_value": 6,
+        "weight": 0.1,
+        "stackable": True,
+        "max_stack": 50,
+    },
+    "bitter_root": {
+        "key": "bitter root",
+        "aliases": ["antidote root"],
+        "desc": "A bitter tasting root with detoxifying properties.",
+        "category": "material",
+        "subcategory": "herb",
+        "base_value": 15,
+        "weight": 0.2,
+        "stackable": True,
+        "max_stack": 30,
+    },
+    "passion_poppy": {
+        "key": "passion poppy",
+        "aliases": ["passion flower", "red poppy"],
+        "desc": "A red flower with intoxicating properties. Handle with care.",
+        "category": "material",
+        "subcategory": "herb",
+        "base_value": 20,
+        "weight": 0.1,
+        "stackable": True,
+        "max_stack": 30,
+        "flags": ["adult"],
+    },
+    "moon_lily": {
+        "key": "moon lily",
+        "aliases": ["moonflower"],
+        "desc": "A pale flower that blooms only at night. Magically potent.",
+        "category": "material",
+        "subcategory": "herb",
+        "base_value": 40,
+        "weight": 0.1,
+        "stackable": True,
+        "max_stack": 20,
+        "flags": ["magical", "rare"],
+    },
+    "beast_essence": {
+        "key": "beast essence",
+        "aliases": ["beast extract"],
+        "desc": "A shimmering liquid extracted from magical beasts.",
+        "category": "material",
+        "subcategory": "magical",
+        "base_value": 75,
+        "weight": 0.2,
+        "stackable": True,
+        "max_stack": 10,
+        "flags": ["magical", "rare"],
+    },
+    "glowing_algae": {
+        "key": "glowing algae",
+        "aliases": ["luminous algae"],
+        "desc": "Algae that glows with bioluminescent light.",
+        "category": "material",
+        "subcategory": "plant",
+        "base_value": 18,
+        "weight": 0.1,
+        "stackable": True,
+        "max_stack": 30,
+        "flags": ["glowing"],
+    },
+    "empty_vial": {
+        "key": "empty vial",
+        "aliases": ["vial", "glass vial"],
+        "desc": "A small glass vial, perfect for potions.",
+        "category": "material",
+        "subcategory": "container",
+        "base_value": 5,
+        "weight": 0.1,
+        "stackable": True,
+        "max_stack": 50,
+    },
+    "fiber": {
+        "key": "plant fiber",
+        "aliases": ["fiber", "plant fibers"],
+        "desc": "Strong plant fibers useful for rope and cloth.",
+        "category": "material",
+        "subcategory": "textile",
+        "base_value": 2,
+        "weight": 0.1,
+        "stackable": True,
+        "max_stack": 100,
+    },
+    "cloth": {
+        "key": "bolt of cloth",
+        "aliases": ["cloth", "fabric"],
+        "desc": "A bolt of woven fabric.",
+        "category": "material",
+        "subcategory": "textile",
+        "base_value": 15,
+        "weight": 0.3,
+        "stackable": True,
+        "max_stack": 50,
+    },
+    "silk": {
+        "key": "silk fabric",
+        "aliases": ["silk"],
+        "desc": "Fine silk fabric, smooth and luxurious.",
+        "category": "material",
+        "subcategory": "textile",
+        "base_value": 50,
+        "weight": 0.2,
+        "stackable": True,
+        "max_stack": 30,
+        "flags": ["valuable"],
+    },
+    "lace": {
+        "key": "delicate lace",
+        "aliases": ["lace"],
+        "desc": "Intricate lace fabric for fine clothing.",
+        "category": "material",
+        "subcategory": "textile",
+        "base_value": 35,
+        "weight": 0.1,
+        "stackable": True,
+        "max_stack": 30,
+    },
+    "hide": {
+        "key": "animal hide",
+        "aliases": ["hide", "raw hide", "pelt"],
+        "desc": "An untreated animal hide, needs tanning.",
+        "category": "material",
+        "subcategory": "leather",
+        "base_value": 10,
+        "weight": 1.0,
+        "stackable": True,
+        "max_stack": 20,
+    },
+    "leather": {
+        "key": "piece of leather",
+        "aliases": ["leather", "tanned leather"],
+        "desc": "Properly tanned and treated leather.",
+        "category": "material",
+        "subcategory": "leather",
+        "base_value": 25,
+        "weight": 0.5,
+        "stackable": True,
+        "max_stack": 30,
+    },
+    "wood": {
+        "key": "piece of wood",
+        "aliases": ["wood", "timber", "log"],
+        "desc": "A piece of raw wood, suitable for crafting.",
+        "category": "material",
+        "subcategory": "wood",
+        "base_value": 5,
+        "weight": 1.0,
+        "stackable": True,
+        "max_stack": 50,
+    },
+    "plank": {
+        "key": "wooden plank",
+        "aliases": ["plank", "board"],
+        "desc": "A cut and smoothed wooden plank.",
+        "category": "material",
+        "subcategory": "wood",
+        "base_value": 8,
+        "weight": 0.8,
+        "stackable": True,
+        "max_stack": 50,
+    },
+    "flour": {
+        "key": "bag of flour",
+        "aliases": ["flour"],
+        "desc": "Finely ground flour for baking.",
+        "category": "material",
+        "subcategory": "cooking",
+        "base_value": 4,
+        "weight": 0.5,
+        "stackable": True,
+        "max_stack": 30,
+    },
+    "water": {
+        "key": "bottle of water",
+        "aliases": ["water"],
+        "desc": "Clean, fresh water.",
+        "category": "material",
+        "subcategory": "cooking",
+        "base_value": 1,
+        "weight": 0.5,
+        "stackable": True,
+        "max_stack": 30,
+    },
+    "salt": {
+        "key": "pinch of salt",
+        "aliases": ["salt"],
+        "desc": "Fine salt for cooking and preserving.",
+        "category": "material",
+        "subcategory": "cooking",
+        "base_value": 2,
+        "weight": 0.1,
+        "stackable": True,
+        "max_stack": 50,
+    },
+    "egg": {
+        "key": "fresh egg",
+        "aliases": ["egg", "chicken egg"],
+        "desc": "A fresh egg from a chicken.",
+        "category": "material",
+        "subcategory": "cooking",
+        "base_value": 3,
+        "weight": 0.1,
+        "stackable": True,
+        "max_stack": 30,
+    },
+    "chocolate": {
+        "key": "piece of chocolate",
+        "aliases": ["chocolate"],
+        "desc": "Rich, dark chocolate. A luxury ingredient.",
+        "category": "material",
+        "subcategory": "cooking",
+        "base_value": 20,
+        "weight": 0.2,
+        "stackable": True,
+        "max_stack": 20,
+    },
+    "mussel": {
+        "key": "fresh mussel",
+        "aliases": ["mussel"],
+        "desc": "A fresh mussel from the shore.",
+        "category": "material",
+        "subcategory": "shellfish",
+        "base_value": 4,
+        "weight": 0.1,
+        "stackable": True,
+        "max_stack": 50,
+    },
+    "raw_fish": {
+        "key": "raw fish",
+        "aliases": ["uncooked fish"],
+        "desc": "A fresh, uncooked fish.",
+        "category": "material",
+        "subcategory": "fish",
+        "base_value": 6,
+        "weight": 0.4,
+        "stackable": True,
+        "max_stack": 20,
+    },
+    "copper_ingot": {
+        "key": "copper ingot",
+        "aliases": ["copper bar"],
+        "desc": "A bar of refined copper.",
+        "category": "material",
+        "subcategory": "metal",
+        "base_value": 25,
+        "weight": 1.0,
+        "stackable": True,
+        "max_stack": 50,
+    },
+    "iron_ingot": {
+        "key": "iron ingot",
+        "aliases": ["iron bar"],
+        "desc": "A bar of refined iron.",
+        "category": "material",
+        "subcategory": "metal",
+        "base_value": 40,
+        "weight": 1.2,
+        "stackable": True,
+        "max_stack": 50,
+    },
+    "silver_ingot": {
+        "key": "silver ingot",
+        "aliases": ["silver bar"],
+        "desc": "A bar of refined silver.",
+        "category": "material",
+        "subcategory": "metal",
+        "base_value": 100,
+        "weight": 1.0,
+        "stackable": True,
+        "max_stack": 30,
+        "flags": ["valuable"],
+    },
+    "rough_gem": {
+        "key": "rough gemstone",
+        "aliases": ["rough gem", "uncut gem"],
+        "desc": "An uncut gemstone, cloudy but with potential.",
+        "category": "material",
+        "subcategory": "gem",
+        "base_value": 30,
+        "weight": 0.2,
+        "stackable": True,
+        "max_stack": 30,
+    },
+    "cut_gem": {
+        "key": "cut gemstone",
+        "aliases": ["cut gem", "polished gem"],
+        "desc": "A properly cut and polished gemstone.",
+        "category": "material",
+        "subcategory": "gem",
+        "base_value": 75,
+        "weight": 0.1,
+        "stackable": True,
+        "max_stack": 20,
+        "flags": ["valuable"],
+    },
+    "fishing_hook": {
+        "key": "fishing hook",
+        "aliases": ["hook", "fish hook"],
+        "desc": "A small metal hook for fishing.",
+        "category": "material",
+        "subcategory": "misc",
+        "base_value": 2,
+        "weight": 0.01,
+        "stackable": True,
+        "max_stack": 50,
+    },
+    "rope": {
+        "key": "length of rope",
+        "aliases": ["rope"],
+        "desc": "A sturdy rope woven from plant fibers.",
+        "category": "material",
+        "subcategory": "misc",
+        "base_value": 12,
+        "weight": 0.5,
+        "stackable": True,
+        "max_stack": 20,
+    },
+    "chains": {
+        "key": "metal chains",
+        "aliases": ["chains", "chain"],
+        "desc": "Sturdy metal chains with many uses.",
+        "category": "material",
+        "subcategory": "metal",
+        "base_value": 35,
+        "weight": 1.5,
+        "stackable": True,
+        "max_stack": 10,
+        "flags": ["adult"],
+    },
+    "nails": {
+        "key": "iron nails",
+        "aliases": ["nails"],
+        "desc": "A handful of sturdy iron nails.",
+        "category": "material",
+        "subcategory": "metal",
+        "base_value": 1,
+        "weight": 0.1,
+        "stackable": True,
+        "max_stack": 100,
+    },
+    "metal_ring": {
+        "key": "metal ring",
+        "aliases": ["ring", "iron ring"],
+        "desc": "A simple metal ring. Useful for crafting.",
+        "category": "material",
+        "subcategory": "metal",
+        "base_value": 3,
+        "weight": 0.1,
+        "stackable": True,
+        "max_stack": 50,
+    },
+    "gold_ingot": {
+        "key": "gold ingot",
+        "aliases": ["gold bar"],
+        "desc": "A bar of refined gold.",
+        "category": "material",
+        "subcategory": "metal",
+        "base_value": 200,
+        "weight": 1.5,
+        "stackable": True,
+        "max_stack": 20,
+        "flags": ["valuable"],
+    },
+    "herb_paste": {
+        "key": "herb paste",
+        "aliases": ["paste"],
+        "desc": "A ground herbal paste, foundation for many remedies.",
+        "category": "material",
+        "subcategory": "alchemy",
+        "base_value": 8,
+        "weight": 0.2,
+        "stackable": True,
+        "max_stack": 30,
+    },
+    "handle": {
+        "key": "wooden handle",
+        "aliases": ["handle"],
+        "desc": "A shaped wooden handle for tools.",
+        "category": "material",
+        "subcategory": "wood",
+        "base_value": 3,
+        "weight": 0.2,
+        "stackable": True,
+        "max_stack": 30,
+    },
+    "leather_strips": {
+        "key": "leather strips",
+        "aliases": ["strips"],
+        "desc": "Thin strips of leather for crafting.",
+        "category": "material",
+        "subcategory": "leather",
+        "base_value": 5,
+        "weight": 0.1,
+        "stackable": True,
+        "max_stack": 50,
+    },
+    "rubber_ball": {
+        "key": "rubber ball",
+        "aliases": ["ball"],
+        "desc": "A small rubber ball. Has various uses.",
+        "category": "material",
+        "subcategory": "misc",
+        "base_value": 10,
+        "weight": 0.1,
+        "stackable": True,
+        "max_stack": 20,
+    },
+    "bandages": {
+        "key": "bandages",
+        "aliases": ["bandage"],
+        "desc": "Clean cloth bandages for treating wounds.",
+        "category": "consumable",
+        "subcategory": "medicine",
+        "base_value": 8,
+        "weight": 0.1,
+        "stackable": True,
+        "max_stack": 30,
+        "use_effect": {"type": "heal", "amount": 10},
+        "use_message": "You wrap the bandages around your wounds.",
+    },
+}
+
+
+# =============================================================================
+# Item Templates - Tools
+# =============================================================================
+
+TOOL_TEMPLATES = {
+    # Gathering Tools
+    "basic_fishing_rod": {
+        "key": "basic fishing rod",
+        "aliases": ["fishing rod", "rod", "pole"],
+        "desc": "A simple wooden fishing rod with basic tackle.",
+        "category": "tool",
+        "subcategory": "fishing",
+        "tool_type": "fishing_rod",
+        "tool_tier": 1,
+        "base_value": 50,
+        "weight": 1.5,
+        "durability": 100,
+        "gathering_bonus": 0,
+    },
+    "quality_fishing_rod": {
+        "key": "quality fishing rod",
+        "aliases": ["good rod", "quality rod"],
+        "desc": "A well-crafted fishing rod with quality line.",
+        "category": "tool",
+        "subcategory": "fishing",
+        "tool_type": "fishing_rod",
+        "tool_tier": 2,
+        "base_value": 150,
+        "weight": 1.3,
+        "durability": 200,
+        "gathering_bonus": 10,
+    },
+    "master_fishing_rod": {
+        "key": "master fishing rod",
+        "aliases": ["master rod"],
+        "desc": "An expertly crafted fishing rod, perfectly balanced.",
+        "category": "tool",
+        "subcategory": "fishing",
+        "tool_type": "fishing_rod",
+        "tool_tier": 3,
+        "base_value": 500,
+        "weight": 1.0,
+        "durability": 500,
+        "gathering_bonus": 25,
+    },
+    
+    "basic_pickaxe": {
+        "key": "basic pickaxe",
+        "aliases": ["pickaxe", "pick"],
+        "desc": "A simple pickaxe with a wooden handle and iron head.",
+        "category": "tool",
+        "subcategory": "mining",
+        "tool_type": "pickaxe",
+        "tool_tier": 1,
+        "base_value": 75,
+        "weight": 3.0,
+        "durability": 100,
+        "gathering_bonus": 0,
+    },
+    "quality_pickaxe": {
+        "key": "quality pickaxe",
+        "aliases": ["good pickaxe", "good pick"],
+        "desc": "A well-forged pickaxe that bites into stone easily.",
+        "category": "tool",
+        "subcategory": "mining",
+        "tool_type": "pickaxe",
+        "tool_tier": 2,
+        "base_value": 200,
+        "weight": 2.5,
+        "durability": 200,
+        "gathering_bonus": 10,
+    },
+    "master_pickaxe": {
+        "key": "master pickaxe",
+        "aliases": ["master pick"],
+        "desc": "A masterwork pickaxe that makes mining feel effortless.",
+        "category": "tool",
+        "subcategory": "mining",
+        "tool_type": "pickaxe",
+        "tool_tier": 3,
+        "base_value": 600,
+        "weight": 2.0,
+        "durability": 500,
+        "gathering_bonus": 25,
+    },
+    
+    "bug_net": {
+        "key": "bug catching net",
+        "aliases": ["bug net", "net", "butterfly net"],
+        "desc": "A fine mesh net on a long handle for catching insects.",
+        "category": "tool",
+        "subcategory": "catching",
+        "tool_type": "bug_net",
+        "tool_tier": 1,
+        "base_value": 40,
+        "weight": 0.5,
+        "durability": 50,
+        "gathering_bonus": 0,
+    },
+    "quality_bug_net": {
+        "key": "quality bug net",
+        "aliases": ["good net", "good bug net"],
+        "desc": "A well-made net with a wider mouth and sturdier handle.",
+        "category": "tool",
+        "subcategory": "catching",
+        "tool_type": "bug_net",
+        "tool_tier": 2,
+        "base_value": 120,
+        "weight": 0.4,
+        "durability": 100,
+        "gathering_bonus": 15,
+    },
+    
+    "foraging_basket": {
+        "key": "foraging basket",
+        "aliases": ["basket"],
+        "desc": "A woven basket for gathering herbs and plants.",
+        "category": "tool",
+        "subcategory": "foraging",
+        "tool_type": "foraging_basket",
+        "tool_tier": 1,
+        "base_value": 25,
+        "weight": 0.5,
+        "durability": 75,
+        "gathering_bonus": 5,
+    },
+    "herbalist_satchel": {
+        "key": "herbalist's satchel",
+        "aliases": ["satchel", "herb bag"],
+        "desc": "A leather satchel designed for collecting and preserving herbs.",
+        "category": "tool",
+        "subcategory": "foraging",
+        "tool_type": "foraging_basket",
+        "tool_tier": 2,
+        "base_value": 100,
+        "weight": 0.3,
+        "durability": 150,
+        "gathering_bonus": 15,
+    },
+    
+    "beach_bucket": {
+        "key": "beach bucket",
+        "aliases": ["bucket", "pail"],
+        "desc": "A sturdy bucket for collecting shells and beach finds.",
+        "category": "tool",
+        "subcategory": "beach",
+        "tool_type": "beach_bucket",
+        "tool_tier": 1,
+        "base_value": 20,
+        "weight": 0.5,
+        "durability": 100,
+        "gathering_bonus": 5,
+    },
+    
+    # Crafting Tools
+    "mortar_pestle": {
+        "key": "mortar and pestle",
+        "aliases": ["mortar", "pestle"],
+        "desc": "A stone bowl and grinding tool for preparing alchemical ingredients.",
+        "category": "tool",
+        "subcategory": "alchemy",
+        "tool_type": "mortar_pestle",
+        "tool_tier": 1,
+        "base_value": 40,
+        "weight": 1.5,
+        "durability": 200,
+    },
+    "smithing_hammer": {
+        "key": "smithing hammer",
+        "aliases": ["smith hammer", "forging hammer"],
+        "desc": "A heavy hammer designed for working hot metal on an anvil.",
+        "category": "tool",
+        "subcategory": "smithing",
+        "tool_type": "smithing_hammer",
+        "tool_tier": 1,
+        "base_value": 60,
+        "weight": 2.5,
+        "durability": 300,
+    },
+    "carpentry_tools": {
+        "key": "carpentry toolkit",
+        "aliases": ["carpentry tools", "woodworking tools", "carpenter's tools"],
+        "desc": "A set of saws, chisels, and planes for working wood.",
+        "category": "tool",
+        "subcategory": "woodworking",
+        "tool_type": "carpentry_tools",
+        "tool_tier": 1,
+        "base_value": 80,
+        "weight": 3.0,
+        "durability": 250,
+    },
+    "sewing_kit": {
+        "key": "sewing kit",
+        "aliases": ["sewing tools", "needle and thread"],
+        "desc": "A compact kit with needles, thread, scissors, and thimbles.",
+        "category": "tool",
+        "subcategory": "tailoring",
+        "tool_type": "sewing_kit",
+        "tool_tier": 1,
+        "base_value": 30,
+        "weight": 0.3,
+        "durability": 100,
+    },
+    "jeweler_tools": {
+        "key": "jeweler's toolkit",
+        "aliases": ["jeweler tools", "jeweling tools"],
+        "desc": "Delicate tools for working with precious metals and gems.",
+        "category": "tool",
+        "subcategory": "jewelcrafting",
+        "tool_type": "jeweler_tools",
+        "tool_tier": 1,
+        "base_value": 100,
+        "weight": 0.8,
+        "durability": 150,
+    },
+    "leatherworking_tools": {
+        "key": "leatherworking toolkit",
+        "aliases": ["leather tools", "tanning tools"],
+        "desc": "Tools for cutting, stitching, and treating leather.",
+        "category": "tool",
+        "subcategory": "leatherworking",
+        "tool_type": "leatherworking_tools",
+        "tool_tier": 1,
+        "base_value": 55,
+        "weight": 1.5,
+        "durability": 200,
+    },
+    "cooking_pot": {
+        "key": "cooking pot",
+        "aliases": ["pot", "stew pot"],
+        "desc": "A large iron pot for cooking stews and soups.",
+        "category": "tool",
+        "subcategory": "cooking",
+        "tool_type": "cooking_pot",
+        "tool_tier": 1,
+        "base_value": 35,
+        "weight": 3.0,
+        "durability": 500,
+    },
+}
+
+
+# =============================================================================
+# Item Templates - Consumables
+# =============================================================================
+
+CONSUMABLE_TEMPLATES = {
+    "health_potion_minor": {
+        "key": "minor health potion",
+        "aliases": ["health potion", "healing potion", "red potion"],
+        "desc": "A small vial of red liquid that restores health.",
+        "category": "consumable",
+        "subcategory": "potion",
+        "base_value": 25,
+        "weight": 0.2,
+        "stackable": True,
+        "max_stack": 20,
+        "use_effect": {"type": "heal", "amount": 20},
+        "use_message": "You drink the potion. Warmth spreads through your body.",
+    },
+    "health_potion_major": {
+        "key": "major health potion",
+        "aliases": ["big health potion", "large healing potion"],
+        "desc": "A large vial of deep red liquid that greatly restores health.",
+        "category": "consumable",
+        "subcategory": "potion",
+        "base_value": 75,
+        "weight": 0.3,
+        "stackable": True,
+        "max_stack": 10,
+        "use_effect": {"type": "heal", "amount": 50},
+        "use_message": "You drink the potion. Injuries mend as energy surges through you.",
+    },
+    
+    "stamina_potion": {
+        "key": "stamina potion",
+        "aliases": ["energy potion", "green potion"],
+        "desc": "A green potion that restores energy.",
+        "category": "consumable",
+        "subcategory": "potion",
+        "base_value": 20,
+        "weight": 0.2,
+        "stackable": True,
+        "max_stack": 20,
+        "use_effect": {"type": "restore_stamina", "amount": 30},
+        "use_message": "You drink the potion. Your fatigue melts away.",
+    },
+    
+    "antidote": {
+        "key": "antidote",
+        "aliases": ["cure poison", "anti-venom"],
+        "desc": "A bitter medicine that cures poison.",
+        "category": "consumable",
+        "subcategory": "medicine",
+        "base_value": 30,
+        "weight": 0.2,
+        "stackable": True,
+        "max_stack": 10,
+        "use_effect": {"type": "cure", "cures": ["poisoned"]},
+        "use_message": "You drink the bitter antidote. The poison in your veins neutralizes.",
+    },
+    
+    "bread": {
+        "key": "loaf of bread",
+        "aliases": ["bread"],
+        "desc": "A fresh loaf of crusty bread.",
+        "category": "consumable",
+        "subcategory": "food",
+        "base_value": 5,
+        "weight": 0.3,
+        "stackable": True,
+        "max_stack": 20,
+        "edible": True,
+        "hunger_restore": 25,
+        "use_message": "You eat the bread. It's simple but filling.",
+    },
+    
+    "cooked_fish": {
+        "key": "cooked fish",
+        "aliases": ["grilled fish", "fish dinner"],
+        "desc": "A nicely grilled fish, seasoned and ready to eat.",
+        "category": "consumable",
+        "subcategory": "food",
+        "base_value": 15,
+        "weight": 0.4,
+        "stackable": True,
+        "max_stack": 10,
+        "edible": True,
+        "hunger_restore": 40,
+        "use_message": "You eat the fish. Delicious!",
+    },
+    
+    "ale": {
+        "key": "mug of ale",
+        "aliases": ["ale", "beer"],
+        "desc": "A frothy mug of ale.",
+        "category": "consumable",
+        "subcategory": "drink",
+        "base_value": 3,
+        "weight": 0.5,
+        "stackable": False,
+        "use_effect": {"type": "apply_effect", "effect": "tipsy", "duration": 300},
+        "use_message": "You drink the ale. It's bitter but refreshing.",
+    },
+    
+    "aphrodisiac_potion": {
+        "key": "aphrodisiac potion",
+        "aliases": ["pink potion", "love potion"],
+        "desc": "A shimmering pink potion that heightens... sensitivity.",
+        "category": "consumable",
+        "subcategory": "potion",
+        "base_value": 50,
+        "weight": 0.2,
+        "stackable": True,
+        "max_stack": 5,
+        "flags": ["adult"],
+        "use_effect": {"type": "apply_effect", "effect": "aroused", "duration": 600},
+        "use_message": "You drink the potion. Heat spreads through your body...",
+    },
+}
+
+
+# =============================================================================
+# Item Templates - Equipment
+# =============================================================================
+
+EQUIPMENT_TEMPLATES = {
+    "leather_gloves": {
+        "key": "leather gloves",
+        "aliases": ["gloves"],
+        "desc": "Simple leather gloves that protect your hands.",
+        "category": "equipment",
+        "slot": "hands",
+        "base_value": 20,
+        "weight": 0.3,
+        "armor": 1,
+    },
+    
+    "work_boots": {
+        "key": "sturdy work boots",
+        "aliases": ["boots", "work boots"],
+        "desc": "Heavy boots suitable for rough terrain.",
+        "category": "equipment",
+        "slot": "feet",
+        "base_value": 35,
+        "weight": 1.0,
+        "armor": 2,
+    },
+    
+    "simple_ring": {
+        "key": "simple silver ring",
+        "aliases": ["ring", "silver ring"],
+        "desc": "A plain silver ring.",
+        "category": "equipment",
+        "slot": "finger_l",
+        "base_value": 50,
+        "weight": 0.05,
+    },
+    
+    "collar_leather": {
+        "key": "leather collar",
+        "aliases": ["collar"],
+        "desc": "A simple leather collar with a metal ring.",
+        "category": "equipment",
+        "slot": "neck",
+        "base_value": 30,
+        "weight": 0.2,
+        "flags": ["adult", "collar"],
+    },
+    
+    "collar_elegant": {
+        "key": "elegant collar",
+        "aliases": ["nice collar", "fancy collar"],
+        "desc": "A beautifully crafted collar of soft leather with silver fittings.",
+        "category": "equipment",
+        "slot": "neck",
+        "base_value": 150,
+        "weight": 0.2,
+        "flags": ["adult", "collar"],
+    },
+}
+
+
+# =============================================================================
+# Item Templates - Keys and Special
+# =============================================================================
+
+KEY_TEMPLATES = {
+    "curator_card": {
+        "key": "Curator's access card",
+        "aliases": ["access card", "card", "curator card"],
+        "desc": "A cream-colored card with elegant script. It grants access to the Curator's private areas.",
+        "category": "key",
+        "base_value": 0,
+        "weight": 0.01,
+        "flags": ["quest", "no_sell", "no_drop"],
+        "grants_access": ["curator_office", "curator_archives"],
+    },
+    
+    "home_key": {
+        "key": "house key",
+        "aliases": ["key", "home key"],
+        "desc": "A key to your home.",
+        "category": "key",
+        "base_value": 0,
+        "weight": 0.05,
+        "flags": ["no_sell"],
+    },
+}
@@ -0,0 +1,324 @@
+"""
+Quest Templates
+
+Data for world.quests's QUEST_TEMPLATES, loaded on first use. Objective
+types and categories are defined in world/quests.py.
+"""
+
+# =============================================================================
+# QUEST TEMPLATES
+# =============================================================================
+
+QUEST_TEMPLATES = {
+    # ===================
+    # TUTORIAL QUESTS
+    # ===================
+    "tutorial_gather": {
+        "name": "First Steps: Gathering",
+        "desc": "Learn how to gather resources in the Grove.",
+        "giver": None,  # Auto-given or from board
+        "category": "tutorial",
+        "level": 1,
+        "objectives": [
+            {"type": "gather", "target": "any", "amount": 5, "desc": "Gather 5 of any resource"},
+        ],
+        "rewards": {
+            "coins": 25,
+            "items": [],
+            "exp": 10,
+        },
+        "on_complete": "You've learned the basics of gathering!",
+        "repeatable": False,
+    },
+    
+    "tutorial_shop": {
+        "name": "First Steps: Shopping",
+        "desc": "Learn how to buy and sell at the market.",
+        "giver": None,
+        "category": "tutorial",
+        "level": 1,
+        "objectives": [
+            {"type": "visit", "target": "Market Square", "desc": "Visit the Market Square"},
+            {"type": "talk", "target": "Greta", "desc": "Talk to Greta the Toolsmith"},
+        ],
+        "rewards": {
+            "coins": 50,
+            "items": ["basic_fishing_rod"],
+            "exp": 15,
+        },
+        "on_complete": "You now know your way around the market!",
+        "repeatable": False,
+    },
+    
+    "tutorial_fishing": {
+        "name": "First Steps: Fishing",
+        "desc": "Try your hand at fishing.",
+        "giver": None,
+        "category": "tutorial",
+        "level": 1,
+        "requires": ["tutorial_shop"],  # Must complete shop tutorial first
+        "objectives": [
+            {"type": "fish", "target": "any", "amount": 3, "desc": "Catch 3 fish"},
+        ],
+        "rewards": {
+            "coins": 30,
+            "items": [],
+            "exp": 15,
+        },
+        "on_complete": "You're getting the hang of fishing!",
+        "repeatable": False,
+    },
+    
+    # ===================
+    # DAILY TASKS
+    # ===================
+    "daily_gather": {
+        "name": "Daily: Resource Run",
+        "desc": "Gather resources for the Grove's stores.",
+        "giver": "task_board",
+        "category": "daily",
+        "level": 1,
+        "objectives": [
+            {"type": "gather", "target": "any", "amount": 10, "desc": "Gather 10 resources"},
+        ],
+        "rewards": {
+            "coins": 50,
+            "items": [],
+            "exp": 25,
+        },
+        "on_complete": "Another productive day!",
+        "repeatable": True,
+        "cooldown": 86400,  # 24 hours in seconds (or 1 game day)
+        "daily": True,
+    },
+    
+    "daily_fishing": {
+        "name": "Daily: Fresh Catch",
+        "desc": "The tavern needs fresh fish for today's menu.",
+        "giver": "task_board",
+        "category": "daily",
+        "level": 1,
+        "objectives": [
+            {"type": "fish", "target": "any", "amount": 5, "desc": "Catch 5 fish"},
+        ],
+        "rewards": {
+            "coins": 60,
+            "items": [],
+            "exp": 30,
+        },
+        "on_complete": "Big Tom will be happy with this catch!",
+        "repeatable": True,
+        "daily": True,
+    },
+    
+    "daily_mining": {
+        "name": "Daily: Ore Collection",
+        "desc": "The smithy needs ore for repairs.",
+        "giver": "task_board",
+        "category": "daily",
+        "level": 1,
+        "objectives": [
+            {"type": "mine", "target": "any", "amount": 5, "desc": "Mine 5 ore"},
+        ],
+        "rewards": {
+            "coins": 75,
+            "items": [],
+            "exp": 35,
+        },
+        "on_complete": "The smithy thanks you for the ore.",
+        "repeatable": True,
+        "daily": True,
+    },
+    
+    "daily_exploration": {
+        "name": "Daily: Wanderer",
+        "desc": "Explore the lands around the Grove.",
+        "giver": "task_board",
+        "category": "daily",
+        "level": 1,
+        "objectives": [
+            {"type": "explore", "target": "any", "amount": 5, "desc": "Visit 5 different rooms"},
+        ],
+        "rewards": {
+            "coins": 40,
+            "items": [],
+            "exp": 20,
+        },
+        "on_complete": "Your wandering has paid off!",
+        "repeatable": True,
+        "daily": True,
+    },
+    
+    # ===================
+    # NPC QUESTS
+    # ===================
+    "greta_tools": {
+        "name": "Quality Materials",
+        "desc": "Greta needs raw materials for her tools.",
+        "giver": "Greta",
+        "category": "npc",
+        "level": 2,
+        "objectives": [
+            {"type": "gather", "target": "iron_ore", "amount": 10, "desc": "Gather 10 Iron Ore"},
+            {"type": "gather", "target": "oak_wood", "amount": 5, "desc": "Gather 5 Oak Wood"},
+        ],
+        "rewards": {
+            "coins": 150,
+            "items": ["quality_pickaxe"],
+            "exp": 50,
+        },
+        "on_complete": "Greta crafts you a quality pickaxe as thanks.",
+        "repeatable": True,
+        "cooldown": 172800,  # 48 hours
+    },
+    
+    "whisper_herbs": {
+        "name": "Rare Ingredients",
+        "desc": "Whisper the Apothecary needs rare herbs.",
+        "giver": "Whisper",
+        "category": "npc",
+        "level": 2,
+        "objectives": [
+            {"type": "forage", "target": "moonpetal", "amount": 3, "desc": "Find 3 Moonpetals"},
+            {"type": "forage", "target": "starleaf", "amount": 3, "desc": "Find 3 Starleaves"},
+        ],
+        "rewards": {
+            "coins": 200,
+            "items": ["health_potion", "health_potion", "stamina_potion"],
+            "exp": 60,
+        },
+        "on_complete": "Whisper brews you some potions in gratitude.",
+        "repeatable": True,
+        "cooldown": 172800,
+    },
+    
+    "tom_delivery": {
+        "name": "Special Delivery",
+        "desc": "Big Tom needs supplies delivered.",
+        "giver": "Big Tom",
+        "category": "npc",
+        "level": 1,
+        "objectives": [
+            {"type": "deliver", "target": "supplies", "destination": "Greta", 
+             "desc": "Deliver supplies to Greta"},
+        ],
+        "rewards": {
+            "coins": 50,
+            "items": ["bread", "ale"],
+            "exp": 25,
+        },
+        "gives_item": "tom_supplies",  # Given when quest accepted
+        "on_complete": "Tom tosses you some food and drink for your trouble.",
+        "repeatable": True,
+        "cooldown": 86400,
+    },
+    
+    # ===================
+    # EXPLORATION QUESTS
+    # ===================
+    "explore_whisperwood": {
+        "name": "Whispers in the Wood",
+        "desc": "Explore the mysterious Whisperwood.",
+        "giver": "task_board",
+        "category": "exploration",
+        "level": 1,
+        "objectives": [
+            {"type": "visit", "target": "Whisperwood Entrance", "desc": "Enter the Whisperwood"},
+            {"type": "visit", "target": "Ancient Tree", "desc": "Find the Ancient Tree"},
+            {"type": "scene", "target": "whisperwood_spirit", "desc": "Meet the forest spirit"},
+        ],
+        "rewards": {
+            "coins": 100,
+            "items": [],
+            "exp": 75,
+        },
+        "on_complete": "You've uncovered some of the Whisperwood's secrets.",
+        "repeatable": False,
+    },
+    
+    "explore_tidepools": {
+        "name": "Secrets of the Shore",
+        "desc": "Discover what lies along the coast.",
+        "giver": "task_board",
+        "category": "exploration",
+        "level": 1,
+        "objectives": [
+            {"type": "visit", "target": "Tidepools", "desc": "Visit the Tidepools"},
+            {"type": "gather", "target": "shell", "amount": 5, "desc": "Collect 5 shells"},
+            {"type": "fish", "target": "any", "amount": 3, "desc": "Catch 3 fish"},
+        ],
+        "rewards": {
+            "coins": 120,
+            "items": ["pearl"],
+            "exp": 60,
+        },
+        "on_complete": "The shore has revealed its treasures to you.",
+        "repeatable": False,
+    },
+    
+    # ===================
+    # MUSEUM QUESTS (Curator/Claude)
+    # ===================
+    "museum_tour": {
+        "name": "A Grand Tour",
+        "desc": "The Curator wishes to show you the museum.",
+        "giver": "The Curator",
+        "category": "museum",
+        "level": 1,
+        "objectives": [
+            {"type": "visit", "target": "Museum Foyer", "desc": "Enter the Museum"},
+            {"type": "visit", "target": "The Gallery", "desc": "Visit the Gallery"},
+            {"type": "visit", "target": "Hall of Curiosities", "desc": "See the Curiosities"},
+            {"type": "talk", "target": "The Curator", "desc": "Speak with the Curator"},
+        ],
+        "rewards": {
+            "coins": 75,
+            "items": [],
+            "exp": 50,
+        },
+        "on_complete": "The Curator seems pleased by your interest.",
+        "repeatable": False,
+    },
+    
+    "museum_donation": {
+        "name": "A Worthy Donation",
+        "desc": "The Curator seeks interesting specimens for the collection.",
+        "giver": "The Curator",
+        "category": "museum",
+        "level": 2,
+        "objectives": [
+            {"type": "deliver", "target": "rare_specimen", "destination": "The Curator",
+             "desc": "Bring a rare find to the Curator"},
+        ],
+        "rewards": {
+            "coins": 200,
+            "items": [],
+            "exp": 100,
+        },
+        "on_complete": "The Curator accepts your donation with great interest.",
+        "repeatable": True,
+        "cooldown": 86400,
+    },
+    
+    # ===================
+    # SPECIAL/CHAIN QUESTS  
+    # ===================
+    "first_home": {
+        "name": "A Place to Call Home",
+        "desc": "Save up for your first home in the Grove.",
+        "giver": None,
+        "category": "progression",
+        "level": 1,
+        "objectives": [
+            {"type": "earn", "target": "coins", "amount": 500, "desc": "Earn 500 coins"},
+        ],
+        "rewards": {
+            "coins": 0,
+            "items": [],
+            "exp": 100,
+            "unlock": "housing",  # Unlocks housing system
+        },
+        "on_complete": "You can now purchase a home! Visit the housing office.",
+        "repeatable": False,
+    },
+}
@@ -0,0 +1,1733 @@
+"""
+Crafting Recipes
+
+Data for world.crafting's RECIPE_TEMPLATES, loaded on first use. Read
+recipes through world.crafting (get_recipe, RECIPE_TEMPLATES).
+"""
+
+# =============================================================================
+# Recipe Templates
+# =============================================================================
+
+# =============================================================================
+# Recipe Discovery Sources
+# =============================================================================
+# "discovered_by_default": True  - Everyone knows this
+# "discovery_source": "npc:Name" - Learned from talking to NPC
+# "discovery_source": "skill:30" - Auto-learned at skill level 30
+# "discovery_source": "scene:scene_key" - Learned from completing scene
+# "discovery_source": "item:recipe_scroll" - Learned from using item
+# No discovery = must be taught or found
+
+RECIPE_TEMPLATES = {
+    # =========================================================================
+    # ALCHEMY - Whisper teaches advanced, basics are shop-bought
+    # =========================================================================
+    
+    # --- Skill 0-15: Basic Brewing ---
+    "herb_paste": {
+        "name": "Herb Paste",
+        "desc": "A basic herbal preparation. Foundation for many remedies.",
+        "category": "alchemy",
+        "skill_required": 0,
+        "workstation": "alchemy_table",
+        "ingredients": [
+            {"item": "wild_herbs", "amount": 3},
+        ],
+        "tools": ["mortar_pestle"],
+        "output": {"item": "herb_paste", "amount": 2},
+        "difficulty": "trivial",
+        "exp": 5,
+        "discovered_by_default": True,
+    },
+    "healing_salve": {
+        "name": "Healing Salve",
+        "desc": "A topical ointment that speeds healing.",
+        "category": "alchemy",
+        "skill_required": 5,
+        "workstation": "alchemy_table",
+        "ingredients": [
+            {"item": "herb_paste", "amount": 1},
+            {"item": "honey", "amount": 1},
+        ],
+        "tools": [],
+        "output": {"item": "healing_salve", "amount": 1},
+        "difficulty": "easy",
+        "exp": 8,
+        "discovered_by_default": True,
+    },
+    "health_potion": {
+        "name": "Health Potion",
+        "desc": "A red potion that restores health.",
+        "category": "alchemy",
+        "skill_required": 10,
+        "workstation": "alchemy_table",
+        "ingredients": [
+            {"item": "red_herb", "amount": 2},
+            {"item": "herb_paste", "amount": 1},
+            {"item": "empty_vial", "amount": 1},
+        ],
+        "tools": [],
+        "output": {"item": "health_potion", "amount": 1},
+        "difficulty": "easy",
+        "exp": 12,
+        "discovery_source": "npc:Whisper",  # Must learn from Whisper
+    },
+    "stamina_potion": {
+        "name": "Stamina Potion",
+        "desc": "A green potion that restores energy.",
+        "category": "alchemy",
+        "skill_required": 10,
+        "workstation": "alchemy_table",
+        "ingredients": [
+            {"item": "green_herb", "amount": 2},
+            {"item": "herb_paste", "amount": 1},
+            {"item": "empty_vial", "amount": 1},
+        ],
+        "tools": [],
+        "output": {"item": "stamina_potion", "amount": 1},
+        "difficulty": "easy",
+        "exp": 12,
+        "discovery_source": "npc:Whisper",
+    },
+    
+    # --- Skill 15-30: Intermediate ---
+    "antidote": {
+        "name": "Antidote",
+        "desc": "Cures poison effects.",
+        "category": "alchemy",
+        "skill_required": 15,
+        "workstation": "alchemy_table",
+        "ingredients": [
+            {"item": "bitter_root", "amount": 1},
+            {"item": "green_herb", "amount": 1},
+            {"item": "empty_vial", "amount": 1},
+        ],
+        "tools": ["mortar_pestle"],
+        "output": {"item": "antidote", "amount": 1},
+        "difficulty": "normal",
+        "exp": 15,
+        "discovery_source": "npc:Whisper",
+    },
+    "soothing_oil": {
+        "name": "Soothing Oil",
+        "desc": "A fragrant oil that relaxes muscles and calms nerves.",
+        "category": "alchemy",
+        "skill_required": 15,
+        "workstation": "alchemy_table",
+        "ingredients": [
+            {"item": "wild_flowers", "amount": 3},
+            {"item": "honey", "amount": 1},
+        ],
+        "tools": [],
+        "output": {"item": "soothing_oil", "amount": 1},
+        "difficulty": "normal",
+        "exp": 15,
+        "discovered_by_default": True,
+    },
+    "glowing_oil": {
+        "name": "Glowing Oil",
+        "desc": "An oil that makes skin glow faintly. Decorative.",
+        "category": "alchemy",
+        "skill_required": 20,
+        "workstation": "alchemy_table",
+        "ingredients": [
+            {"item": "glowing_mushroom", "amount": 2},
+            {"item": "soothing_oil", "amount": 1},
+        ],
+        "tools": [],
+        "output": {"item": "glowing_oil", "amount": 1},
+        "difficulty": "normal",
+        "exp": 20,
+        "discovery_source": "skill:20",  # Auto-learn at skill 20
+    },
+    "arousal_elixir": {
+        "name": "Arousal Elixir",
+        "desc": "A pink potion that heightens... sensitivity.",
+        "category": "alchemy",
+        "skill_required": 25,
+        "workstation": "alchemy_table",
+        "ingredients": [
+            {"item": "passion_poppy", "amount": 3},
+            {"item": "honey", "amount": 1},
+            {"item": "empty_vial", "amount": 1},
+        ],
+        "tools": ["mortar_pestle"],
+        "output": {"item": "arousal_elixir", "amount": 1},
+        "difficulty": "normal",
+        "exp": 25,
+        "discovery_source": "scene:sunny_meadow_poppies_01",  # Found in poppy field
+    },
+    "numbing_cream": {
+        "name": "Numbing Cream",
+        "desc": "Reduces sensitivity temporarily. Has uses.",
+        "category": "alchemy",
+        "skill_required": 25,
+        "workstation": "alchemy_table",
+        "ingredients": [
+            {"item": "bitter_root", "amount": 2},
+            {"item": "herb_paste", "amount": 1},
+        ],
+        "tools": ["mortar_pestle"],
+        "output": {"item": "numbing_cream", "amount": 1},
+        "difficulty": "normal",
+        "exp": 25,
+        "discovery_source": "npc:Whisper",
+    },
+    
+    # --- Skill 30-50: Advanced ---
+    "glowing_potion": {
+        "name": "Glowing Potion",
+        "desc": "Makes the drinker glow faintly for a time.",
+        "category": "alchemy",
+        "skill_required": 30,
+        "workstation": "alchemy_table",
+        "ingredients": [
+            {"item": "glowing_mushroom", "amount": 2},
+            {"item": "glowing_algae", "amount": 1},
+            {"item": "empty_vial", "amount": 1},
+        ],
+        "tools": [],
+        "output": {"item": "glowing_potion", "amount": 1},
+        "difficulty": "normal",
+        "exp": 30,
+        "discovery_source": "skill:30",
+    },
+    "heat_potion": {
+        "name": "Heat Potion",
+        "desc": "Induces artificial heat. Very potent.",
+        "category": "alchemy",
+        "skill_required": 35,
+        "workstation": "alchemy_table",
+        "ingredients": [
+            {"item": "passion_poppy", "amount": 2},
+            {"item": "beast_essence", "amount": 1},
+            {"item": "arousal_elixir", "amount": 1},
+        ],
+        "tools": ["mortar_pestle"],
+        "output": {"item": "heat_potion", "amount": 1},
+        "difficulty": "hard",
+        "exp": 40,
+        "discovery_source": "npc:Curator",  # The Curator knows things
+    },
+    "obedience_draught": {
+        "name": "Obedience Draught",
+        "desc": "Increases suggestibility temporarily. Consent required.",
+        "category": "alchemy",
+        "skill_required": 40,
+        "workstation": "alchemy_table",
+        "ingredients": [
+            {"item": "moon_lily", "amount": 1},
+            {"item": "passion_poppy", "amount": 2},
+            {"item": "honey", "amount": 2},
+            {"item": "empty_vial", "amount": 1},
+        ],
+        "tools": ["mortar_pestle"],
+        "output": {"item": "obedience_draught", "amount": 1},
+        "difficulty": "hard",
+        "exp": 45,
+        "discovery_source": "npc:Curator",
+    },
+    "sensitivity_oil": {
+        "name": "Sensitivity Oil",
+        "desc": "Greatly heightens tactile sensitivity when applied.",
+        "category": "alchemy",
+        "skill_required": 40,
+        "workstation": "alchemy_table",
+        "ingredients": [
+            {"item": "arousal_elixir", "amount": 1},
+            {"item": "soothing_oil", "amount": 1},
+            {"item": "passion_poppy", "amount": 1},
+        ],
+        "tools": [],
+        "output": {"item": "sensitivity_oil", "amount": 1},
+        "difficulty": "hard",
+        "exp": 40,
+        "discovery_source": "skill:40",
+    },
+    
+    # --- Skill 50+: Expert ---
+    "transformation_draught": {
+        "name": "Transformation Draught",
+        "desc": "Temporarily grants animal features.",
+        "category": "alchemy",
+        "skill_required": 50,
+        "workstation": "alchemy_table",
+        "ingredients": [
+            {"item": "moon_lily", "amount": 2},
+            {"item": "beast_essence", "amount": 1},
+            {"item": "empty_vial", "amount": 1},
+        ],
+        "tools": ["mortar_pestle"],
+        "output": {"item": "transformation_draught", "amount": 1},
+        "difficulty": "hard",
+        "exp": 50,
+        "discovery_source": "npc:Curator",
+    },
+    "permanent_dye": {
+        "name": "Permanent Dye",
+        "desc": "Changes hair/fur color permanently until washed with solvent.",
+        "category": "alchemy",
+        "skill_required": 50,
+        "workstation": "alchemy_table",
+        "ingredients": [
+            {"item": "wild_flowers", "amount": 5},
+            {"item": "glowing_mushroom", "amount": 1},
+            {"item": "empty_vial", "amount": 1},
+        ],
+        "tools": ["mortar_pestle"],
+        "output": {"item": "permanent_dye", "amount": 1},
+        "difficulty": "hard",
+        "exp": 50,
+        "discovery_source": "skill:50",
+    },
+    "lactation_elixir": {
+        "name": "Lactation Elixir",
+        "desc": "Induces or enhances milk production.",
+        "category": "alchemy",
+        "skill_required": 55,
+        "workstation": "alchemy_table",
+        "ingredients": [
+            {"item": "moon_lily", "amount": 2},
+            {"item": "honey", "amount": 3},
+            {"item": "beast_essence", "amount": 1},
+            {"item": "empty_vial", "amount": 1},
+        ],
+        "tools": ["mortar_pestle"],
+        "output": {"item": "lactation_elixir", "amount": 1},
+        "difficulty": "expert",
+        "exp": 60,
+        "discovery_source": "npc:Curator",
+    },
+    "virility_tonic": {
+        "name": "Virility Tonic",
+        "desc": "Greatly enhances... production and stamina.",
+        "category": "alchemy",
+        "skill_required": 55,
+        "workstation": "alchemy_table",
+        "ingredients": [
+            {"item": "beast_essence", "amount": 2},
+            {"item": "red_herb", "amount": 3},
+            {"item": "passion_poppy", "amount": 2},
+            {"item": "empty_vial", "amount": 1},
+        ],
+        "tools": ["mortar_pestle"],
+        "output": {"item": "virility_tonic", "amount": 1},
+        "difficulty": "expert",
+        "exp": 60,
+        "discovery_source": "npc:Curator",
+    },
+    "growth_formula": {
+        "name": "Growth Formula",
+        "desc": "Temporarily enhances specific body part size.",
+        "category": "alchemy",
+        "skill_required": 60,
+        "workstation": "alchemy_table",
+        "ingredients": [
+            {"item": "beast_essence", "amount": 2},
+            {"item": "moon_lily", "amount": 2},
+            {"item": "glowing_mushroom", "amount": 2},
+            {"item": "empty_vial", "amount": 1},
+        ],
+        "tools": ["mortar_pestle"],
+        "output": {"item": "growth_formula", "amount": 1},
+        "difficulty": "expert",
+        "exp": 70,
+        "discovery_source": "npc:Curator",
+    },
+    
+    # =========================================================================
+    # SMITHING - Greta sells basic tools, you craft upgrades and specialty
+    # =========================================================================
+    
+    # --- Skill 0-15: Basic Metalwork ---
+    "copper_ingot": {
+        "name": "Copper Ingot",
+        "desc": "A bar of refined copper.",
+        "category": "smithing",
+        "skill_required": 0,
+        "workstation": "forge",
+        "ingredients": [
+            {"item": "copper_ore", "amount": 3},
+            {"item": "coal", "amount": 1},
+        ],
+        "tools": [],
+        "output": {"item": "copper_ingot", "amount": 1},
+        "difficulty": "easy",
+        "exp": 5,
+        "discovered_by_default": True,
+    },
+    "fishing_hooks": {
+        "name": "Fishing Hooks",
+        "desc": "Bent metal hooks for fishing.",
+        "category": "smithing",
+        "skill_required": 5,
+        "workstation": "forge",
+        "ingredients": [
+            {"item": "copper_ore", "amount": 1},
+        ],
+        "tools": [],
+        "output": {"item": "fishing_hook", "amount": 5},
+        "difficulty": "trivial",
+        "exp": 3,
+        "discovered_by_default": True,
+    },
+    "nails": {
+        "name": "Iron Nails",
+        "desc": "Basic iron nails for construction.",
+        "category": "smithing",
+        "skill_required": 10,
+        "workstation": "forge",
+        "ingredients": [
+            {"item": "iron_ore", "amount": 1},
+        ],
+        "tools": ["smithing_hammer"],
+        "output": {"item": "nails", "amount": 10},
+        "difficulty": "trivial",
+        "exp": 5,
+        "discovered_by_default": True,
+    },
+    
+    # --- Skill 15-30: Ingots and Repairs ---
+    "iron_ingot": {
+        "name": "Iron Ingot",
+        "desc": "A bar of refined iron.",
+        "category": "smithing",
+        "skill_required": 15,
+        "workstation": "forge",
+        "ingredients": [
+            {"item": "iron_ore", "amount": 3},
+            {"item": "coal", "amount": 2},
+        ],
+        "tools": [],
+        "output": {"item": "iron_ingot", "amount": 1},
+        "difficulty": "normal",
+        "exp": 10,
+        "discovered_by_default": True,
+    },
+    "silver_ingot": {
+        "name": "Silver Ingot",
+        "desc": "A bar of refined silver.",
+        "category": "smithing",
+        "skill_required": 25,
+        "workstation": "forge",
+        "ingredients": [
+            {"item": "silver_ore", "amount": 3},
+            {"item": "coal", "amount": 2},
+        ],
+        "tools": [],
+        "output": {"item": "silver_ingot", "amount": 1},
+        "difficulty": "normal",
+        "exp": 15,
+        "discovery_source": "npc:Greta",  # Greta teaches smelting
+    },
+    "gold_ingot": {
+        "name": "Gold Ingot",
+        "desc": "A bar of refined gold.",
+        "category": "smithing",
+        "skill_required": 35,
+        "workstation": "forge",
+        "ingredients": [
+            {"item": "gold_ore", "amount": 3},
+            {"item": "coal", "amount": 3},
+        ],
+        "tools": [],
+        "output": {"item": "gold_ingot", "amount": 1},
+        "difficulty": "hard",
+        "exp": 25,
+        "discovery_source": "npc:Greta",
+    },
+    
+    # --- Skill 25-40: Tool Upgrades (NOT basic tools - buy those from Greta) ---
+    "reinforced_pickaxe": {
+        "name": "Reinforced Pickaxe",
+        "desc": "An upgraded pickaxe with better durability.",
+        "category": "smithing",
+        "skill_required": 25,
+        "workstation": "forge",
+        "ingredients": [
+            {"item": "basic_pickaxe", "amount": 1},  # Upgrade existing
+            {"item": "iron_ingot", "amount": 2},
+        ],
+        "tools": ["smithing_hammer"],
+        "output": {"item": "quality_pickaxe", "amount": 1},
+        "difficulty": "normal",
+        "exp": 25,
+        "discovery_source": "npc:Greta",
+    },
+    "reinforced_fishing_rod": {
+        "name": "Reinforced Fishing Rod",
+        "desc": "An upgraded rod with better line.",
+        "category": "smithing",
+        "skill_required": 25,
+        "workstation": "forge",
+        "ingredients": [
+            {"item": "basic_fishing_rod", "amount": 1},
+            {"item": "iron_ingot", "amount": 1},
+            {"item": "silk", "amount": 2},
+        ],
+        "tools": ["smithing_hammer"],
+        "output": {"item": "quality_fishing_rod", "amount": 1},
+        "difficulty": "normal",
+        "exp": 25,
+        "discovery_source": "npc:Greta",
+    },
+    
+    # --- Skill 30-50: Specialty Metal Items ---
+    "chains": {
+        "name": "Metal Chains",
+        "desc": "Sturdy metal chains. Many uses.",
+        "category": "smithing",
+        "skill_required": 30,
+        "workstation": "forge",
+        "ingredients": [
+            {"item": "iron_ingot", "amount": 2},
+        ],
+        "tools": ["smithing_hammer"],
+        "output": {"item": "chains", "amount": 1},
+        "difficulty": "normal",
+        "exp": 25,
+        "discovery_source": "skill:30",
+    },
+    "metal_ring": {
+        "name": "Metal Ring",
+        "desc": "A simple iron ring. Component for other items.",
+        "category": "smithing",
+        "skill_required": 30,
+        "workstation": "forge",
+        "ingredients": [
+            {"item": "iron_ingot", "amount": 1},
+        ],
+        "tools": ["smithing_hammer"],
+        "output": {"item": "metal_ring", "amount": 3},
+        "difficulty": "normal",
+        "exp": 20,
+        "discovered_by_default": True,
+    },
+    "shackles": {
+        "name": "Shackles",
+        "desc": "Restraints for wrists or ankles.",
+        "category": "smithing",
+        "skill_required": 35,
+        "workstation": "forge",
+        "ingredients": [
+            {"item": "iron_ingot", "amount": 2},
+            {"item": "chains", "amount": 1},
+        ],
+        "tools": ["smithing_hammer"],
+        "output": {"item": "shackles", "amount": 1},
+        "difficulty": "hard",
+        "exp": 35,
+        "discovery_source": "npc:Curator",
+    },
+    "spreader_bar": {
+        "name": "Spreader Bar",
+        "desc": "A rigid bar with cuffs at each end.",
+        "category": "smithing",
+        "skill_required": 40,
+        "workstation": "forge",
+        "ingredients": [
+            {"item": "iron_ingot", "amount": 3},
+            {"item": "leather", "amount": 2},
+        ],
+        "tools": ["smithing_hammer"],
+        "output": {"item": "spreader_bar", "amount": 1},
+        "difficulty": "hard",
+        "exp": 40,
+        "discovery_source": "npc:Curator",
+    },
+    "cage_frame": {
+        "name": "Cage Frame",
+        "desc": "Metal framework for a small cage.",
+        "category": "smithing",
+        "skill_required": 45,
+        "workstation": "forge",
+        "ingredients": [
+            {"item": "iron_ingot", "amount": 6},
+            {"item": "chains", "amount": 2},
+        ],
+        "tools": ["smithing_hammer"],
+        "output": {"item": "cage_frame", "amount": 1},
+        "difficulty": "hard",
+        "exp": 50,
+        "discovery_source": "npc:Curator",
+    },
+    "bell_collar": {
+        "name": "Bell Collar",
+        "desc": "A metal collar with a small bell attached.",
+        "category": "smithing",
+        "skill_required": 35,
+        "workstation": "forge",
+        "ingredients": [
+            {"item": "silver_ingot", "amount": 1},
+            {"item": "iron_ingot", "amount": 1},
+        ],
+        "tools": ["smithing_hammer"],
+        "output": {"item": "bell_collar", "amount": 1},
+        "difficulty": "normal",
+        "exp": 35,
+        "discovery_source": "skill:35",
+    },
+    
+    # --- Skill 50+: Master Smithing ---
+    "master_pickaxe": {
+        "name": "Master Pickaxe",
+        "desc": "A masterwork pickaxe that makes mining effortless.",
+        "category": "smithing",
+        "skill_required": 50,
+        "workstation": "forge",
+        "ingredients": [
+            {"item": "quality_pickaxe", "amount": 1},
+            {"item": "silver_ingot", "amount": 2},
+            {"item": "iron_ingot", "amount": 3},
+        ],
+        "tools": ["smithing_hammer"],
+        "output": {"item": "master_pickaxe", "amount": 1},
+        "difficulty": "expert",
+        "exp": 60,
+        "discovery_source": "npc:Greta",
+    },
+    "chastity_cage": {
+        "name": "Chastity Cage",
+        "desc": "A locking device for denial play.",
+        "category": "smithing",
+        "skill_required": 55,
+        "workstation": "forge",
+        "ingredients": [
+            {"item": "silver_ingot", "amount": 2},
+            {"item": "iron_ingot", "amount": 1},
+        ],
+        "tools": ["smithing_hammer"],
+        "output": {"item": "chastity_cage", "amount": 1},
+        "difficulty": "expert",
+        "exp": 60,
+        "discovery_source": "npc:Curator",
+    },
+    "branding_iron": {
+        "name": "Branding Iron",
+        "desc": "A custom branding iron. Handle with extreme care.",
+        "category": "smithing",
+        "skill_required": 60,
+        "workstation": "forge",
+        "ingredients": [
+            {"item": "iron_ingot", "amount": 3},
+            {"item": "wood", "amount": 1},
+        ],
+        "tools": ["smithing_hammer"],
+        "output": {"item": "branding_iron", "amount": 1},
+        "difficulty": "master",
+        "exp": 75,
+        "discovery_source": "npc:Curator",
+    },
+    
+    # =========================================================================
+    # COOKING - Tom sells basic food, you craft specialty/buff food
+    # =========================================================================
+    
+    # --- Skill 0-15: Basic Cooking ---
+    "cooked_fish": {
+        "name": "Cooked Fish",
+        "desc": "A simply prepared fish.",
+        "category": "cooking",
+        "skill_required": 0,
+        "workstation": "cooking_fire",
+        "ingredients": [
+            {"item": "raw_fish", "amount": 1},
+        ],
+        "tools": [],
+        "output": {"item": "cooked_fish", "amount": 1},
+        "difficulty": "trivial",
+        "exp": 3,
+        "discovered_by_default": True,
+    },
+    "roasted_mushrooms": {
+        "name": "Roasted Mushrooms",
+        "desc": "Simple roasted mushrooms.",
+        "category": "cooking",
+        "skill_required": 0,
+        "workstation": "cooking_fire",
+        "ingredients": [
+            {"item": "edible_mushrooms", "amount": 3},
+        ],
+        "tools": [],
+        "output": {"item": "roasted_mushrooms", "amount": 1},
+        "difficulty": "trivial",
+        "exp": 3,
+        "discovered_by_default": True,
+    },
+    "trail_rations": {
+        "name": "Trail Rations",
+        "desc": "Simple preserved food for travel.",
+        "category": "cooking",
+        "skill_required": 5,
+        "workstation": "cooking_fire",
+        "ingredients": [
+            {"item": "wild_berries", "amount": 2},
+            {"item": "forest_nuts", "amount": 2},
+            {"item": "honey", "amount": 1},
+        ],
+        "tools": [],
+        "output": {"item": "trail_rations", "amount": 3},
+        "difficulty": "easy",
+        "exp": 8,
+        "discovered_by_default": True,
+    },
+    
+    # --- Skill 15-30: Intermediate Cooking ---
+    "herb_bread": {
+        "name": "Herb Bread",
+        "desc": "Fresh bread with herbs baked in. Slight healing effect.",
+        "category": "cooking",
+        "skill_required": 15,
+        "workstation": "cooking_fire",
+        "ingredients": [
+            {"item": "flour", "amount": 2},
+            {"item": "green_herb", "amount": 1},
+            {"item": "water", "amount": 1},
+        ],
+        "tools": [],
+        "output": {"item": "herb_bread", "amount": 2},
+        "difficulty": "easy",
+        "exp": 12,
+        "discovery_source": "npc:Big Tom",
+    },
+    "honey_cake": {
+        "name": "Honey Cake",
+        "desc": "A sweet cake drizzled with honey. Restores energy.",
+        "category": "cooking",
+        "skill_required": 20,
+        "workstation": "cooking_fire",
+        "ingredients": [
+            {"item": "flour", "amount": 2},
+            {"item": "honey", "amount": 2},
+            {"item": "egg", "amount": 1},
+        ],
+        "tools": [],
+        "output": {"item": "honey_cake", "amount": 1},
+        "difficulty": "normal",
+        "exp": 20,
+        "discovery_source": "npc:Big Tom",
+    },
+    "fish_soup": {
+        "name": "Fish Soup",
+        "desc": "A warming fish soup. Good for cold weather.",
+        "category": "cooking",
+        "skill_required": 20,
+        "workstation": "cooking_fire",
+        "ingredients": [
+            {"item": "raw_fish", "amount": 2},
+            {"item": "wild_herbs", "amount": 1},
+            {"item": "water", "amount": 1},
+        ],
+        "tools": ["cooking_pot"],
+        "output": {"item": "fish_soup", "amount": 1},
+        "difficulty": "normal",
+        "exp": 18,
+        "discovered_by_default": True,
+    },
+    
+    # --- Skill 25-40: Specialty Foods ---
+    "seafood_stew": {
+        "name": "Seafood Stew",
+        "desc": "A hearty stew of ocean bounty. Stamina boost.",
+        "category": "cooking",
+        "skill_required": 25,
+        "workstation": "cooking_fire",
+        "ingredients": [
+            {"item": "raw_fish", "amount": 2},
+            {"item": "mussel", "amount": 3},
+            {"item": "seaweed", "amount": 1},
+            {"item": "water", "amount": 1},
+        ],
+        "tools": ["cooking_pot"],
+        "output": {"item": "seafood_stew", "amount": 1},
+        "difficulty": "normal",
+        "exp": 28,
+        "discovery_source": "skill:25",
+    },
+    "energy_bar": {
+        "name": "Energy Bar",
+        "desc": "A dense, portable food that restores stamina quickly.",
+        "category": "cooking",
+        "skill_required": 25,
+        "workstation": None,  # Hand-craftable
+        "ingredients": [
+            {"item": "forest_nuts", "amount": 3},
+            {"item": "honey", "amount": 2},
+            {"item": "wild_berries", "amount": 2},
+        ],
+        "tools": [],
+        "output": {"item": "energy_bar", "amount": 2},
+        "difficulty": "normal",
+        "exp": 22,
+        "discovered_by_default": True,
+    },
+    "chocolate_truffle": {
+        "name": "Chocolate Truffle",
+        "desc": "Rich chocolate confection. Mood enhancer.",
+        "category": "cooking",
+        "skill_required": 30,
+        "workstation": "cooking_fire",
+        "ingredients": [
+            {"item": "chocolate", "amount": 2},
+            {"item": "honey", "amount": 1},
+        ],
+        "tools": [],
+        "output": {"item": "chocolate_truffle", "amount": 3},
+        "difficulty": "normal",
+        "exp": 25,
+        "discovery_source": "npc:Big Tom",
+    },
+    
+    # --- Skill 35-50: Aphrodisiac and Special Foods ---
+    "aphrodisiac_treat": {
+        "name": "Aphrodisiac Treat",
+        "desc": "A confection with... interesting effects.",
+        "category": "cooking",
+        "skill_required": 35,
+        "workstation": "cooking_fire",
+        "ingredients": [
+            {"item": "honey", "amount": 2},
+            {"item": "passion_poppy", "amount": 2},
+            {"item": "chocolate", "amount": 1},
+        ],
+        "tools": [],
+        "output": {"item": "aphrodisiac_treat", "amount": 2},
+        "difficulty": "hard",
+        "exp": 35,
+        "discovery_source": "scene:sunny_meadow_poppies_01",
+    },
+    "stamina_feast": {
+        "name": "Stamina Feast",
+        "desc": "A full meal that greatly extends endurance.",
+        "category": "cooking",
+        "skill_required": 40,
+        "workstation": "stove",  # Requires better equipment
+        "ingredients": [
+            {"item": "raw_fish", "amount": 2},
+            {"item": "egg", "amount": 2},
+            {"item": "green_herb", "amount": 2},
+            {"item": "honey", "amount": 1},
+        ],
+        "tools": ["cooking_pot"],
+        "output": {"item": "stamina_feast", "amount": 1},
+        "difficulty": "hard",
+        "exp": 45,
+        "discovery_source": "npc:Big Tom",
+    },
+    "lovers_chocolate": {
+        "name": "Lover's Chocolate",
+        "desc": "Exquisite chocolate infused with... special ingredients.",
+        "category": "cooking",
+        "skill_required": 45,
+        "workstation": "stove",
+        "ingredients": [
+            {"item": "chocolate", "amount": 3},
+            {"item": "passion_poppy", "amount": 2},
+            {"item": "honey", "amount": 2},
+            {"item": "moon_lily", "amount": 1},
+        ],
+        "tools": [],
+        "output": {"item": "lovers_chocolate", "amount": 2},
+        "difficulty": "hard",
+        "exp": 50,
+        "discovery_source": "npc:Curator",
+    },
+    "beast_treat": {
+        "name": "Beast Treat",
+        "desc": "A treat that temporarily enhances animal instincts.",
+        "category": "cooking",
+        "skill_required": 50,
+        "workstation": "stove",
+        "ingredients": [
+            {"item": "beast_essence", "amount": 1},
+            {"item": "raw_fish", "amount": 2},
+            {"item": "honey", "amount": 2},
+        ],
+        "tools": ["cooking_pot"],
+        "output": {"item": "beast_treat", "amount": 1},
+        "difficulty": "expert",
+        "exp": 55,
+        "discovery_source": "npc:Curator",
+    },
+    
+    # =========================================================================
+    # TAILORING - Fiber from gathering, cloth and specialty from crafting
+    # =========================================================================
+    
+    # --- Skill 0-15: Basic Fiber Work ---
+    "rope": {
+        "name": "Rope",
+        "desc": "Strong rope woven from fibers.",
+        "category": "tailoring",
+        "skill_required": 0,
+        "workstation": None,  # Hand-craftable
+        "ingredients": [
+            {"item": "fiber", "amount": 5},
+        ],
+        "tools": [],
+        "output": {"item": "rope", "amount": 1},
+        "difficulty": "trivial",
+        "exp": 3,
+        "discovered_by_default": True,
+    },
+    "cloth": {
+        "name": "Cloth",
+        "desc": "A bolt of basic fabric.",
+        "category": "tailoring",
+        "skill_required": 5,
+        "workstation": "loom",
+        "ingredients": [
+            {"item": "fiber", "amount": 5},
+        ],
+        "tools": [],
+        "output": {"item": "cloth", "amount": 1},
+        "difficulty": "easy",
+        "exp": 5,
+        "discovered_by_default": True,
+    },
+    "bandages": {
+        "name": "Bandages",
+        "desc": "Clean cloth bandages for wounds.",
+        "category": "tailoring",
+        "skill_required": 5,
+        "workstation": None,
+        "ingredients": [
+            {"item": "cloth", "amount": 1},
+        ],
+        "tools": [],
+        "output": {"item": "bandages", "amount": 3},
+        "difficulty": "trivial",
+        "exp": 3,
+        "discovered_by_default": True,
+    },
+    
+    # --- Skill 15-30: Clothing ---
+    "simple_clothing": {
+        "name": "Simple Clothing",
+        "desc": "Basic but functional garments.",
+        "category": "tailoring",
+        "skill_required": 15,
+        "workstation": "loom",
+        "ingredients": [
+            {"item": "cloth", "amount": 3},
+        ],
+        "tools": ["sewing_kit"],
+        "output": {"item": "simple_clothing", "amount": 1},
+        "difficulty": "easy",
+        "exp": 15,
+        "discovered_by_default": True,
+    },
+    "blindfold": {
+        "name": "Blindfold",
+        "desc": "A soft blindfold that blocks vision completely.",
+        "category": "tailoring",
+        "skill_required": 15,
+        "workstation": None,
+        "ingredients": [
+            {"item": "cloth", "amount": 1},
+            {"item": "silk", "amount": 1},
+        ],
+        "tools": ["sewing_kit"],
+        "output": {"item": "blindfold", "amount": 1},
+        "difficulty": "easy",
+        "exp": 15,
+        "discovery_source": "skill:15",
+    },
+    "gag": {
+        "name": "Cloth Gag",
+        "desc": "A simple cloth gag. Muffles speech.",
+        "category": "tailoring",
+        "skill_required": 15,
+        "workstation": None,
+        "ingredients": [
+            {"item": "cloth", "amount": 1},
+            {"item": "rope", "amount": 1},
+        ],
+        "tools": [],
+        "output": {"item": "gag", "amount": 1},
+        "difficulty": "easy",
+        "exp": 12,
+        "discovery_source": "npc:Curator",
+    },
+    
+    # --- Skill 25-40: Silk and Specialty ---
+    "silk_cloth": {
+        "name": "Silk Fabric",
+        "desc": "Fine woven silk. Luxurious.",
+        "category": "tailoring",
+        "skill_required": 25,
+        "workstation": "loom",
+        "ingredients": [
+            {"item": "spider_silk", "amount": 5},
+        ],
+        "tools": [],
+        "output": {"item": "silk", "amount": 1},
+        "difficulty": "normal",
+        "exp": 20,
+        "discovered_by_default": True,
+    },
+    "silk_rope": {
+        "name": "Silk Rope",
+        "desc": "Soft but strong rope. Doesn't leave marks.",
+        "category": "tailoring",
+        "skill_required": 30,
+        "workstation": "loom",
+        "ingredients": [
+            {"item": "silk", "amount": 3},
+        ],
+        "tools": [],
+        "output": {"item": "silk_rope", "amount": 1},
+        "difficulty": "normal",
+        "exp": 25,
+        "discovery_source": "skill:30",
+    },
+    "lace": {
+        "name": "Lace",
+        "desc": "Delicate lace fabric for fine clothing.",
+        "category": "tailoring",
+        "skill_required": 35,
+        "workstation": "loom",
+        "ingredients": [
+            {"item": "silk", "amount": 2},
+            {"item": "fiber", "amount": 3},
+        ],
+        "tools": ["sewing_kit"],
+        "output": {"item": "lace", "amount": 1},
+        "difficulty": "hard",
+        "exp": 30,
+        "discovery_source": "skill:35",
+    },
+    "elegant_dress": {
+        "name": "Elegant Dress",
+        "desc": "A beautiful formal dress.",
+        "category": "tailoring",
+        "skill_required": 40,
+        "workstation": "loom",
+        "ingredients": [
+            {"item": "silk", "amount": 3},
+            {"item": "lace", "amount": 1},
+        ],
+        "tools": ["sewing_kit"],
+        "output": {"item": "elegant_dress", "amount": 1},
+        "difficulty": "hard",
+        "exp": 40,
+        "discovery_source": "skill:40",
+    },
+    
+    # --- Skill 40+: Adult Items ---
+    "lingerie": {
+        "name": "Lingerie",
+        "desc": "Delicate, revealing undergarments.",
+        "category": "tailoring",
+        "skill_required": 40,
+        "workstation": "loom",
+        "ingredients": [
+            {"item": "silk", "amount": 2},
+            {"item": "lace", "amount": 1},
+        ],
+        "tools": ["sewing_kit"],
+        "output": {"item": "lingerie", "amount": 1},
+        "difficulty": "hard",
+        "exp": 40,
+        "discovery_source": "npc:Curator",
+    },
+    "corset": {
+        "name": "Corset",
+        "desc": "A structured corset that shapes the figure.",
+        "category": "tailoring",
+        "skill_required": 45,
+        "workstation": "loom",
+        "ingredients": [
+            {"item": "cloth", "amount": 3},
+            {"item": "silk", "amount": 1},
+            {"item": "metal_ring", "amount": 6},
+        ],
+        "tools": ["sewing_kit"],
+        "output": {"item": "corset", "amount": 1},
+        "difficulty": "hard",
+        "exp": 50,
+        "discovery_source": "npc:Curator",
+    },
+    "maid_outfit": {
+        "name": "Maid Outfit",
+        "desc": "A classic maid uniform. Short skirt optional.",
+        "category": "tailoring",
+        "skill_required": 45,
+        "workstation": "loom",
+        "ingredients": [
+            {"item": "cloth", "amount": 4},
+            {"item": "lace", "amount": 2},
+        ],
+        "tools": ["sewing_kit"],
+        "output": {"item": "maid_outfit", "amount": 1},
+        "difficulty": "hard",
+        "exp": 50,
+        "discovery_source": "npc:Curator",
+    },
+    "pet_costume": {
+        "name": "Pet Costume",
+        "desc": "A costume with ears, tail, and paw mittens.",
+        "category": "tailoring",
+        "skill_required": 50,
+        "workstation": "loom",
+        "ingredients": [
+            {"item": "cloth", "amount": 2},
+            {"item": "silk", "amount": 1},
+            {"item": "leather", "amount": 2},
+        ],
+        "tools": ["sewing_kit"],
+        "output": {"item": "pet_costume", "amount": 1},
+        "difficulty": "expert",
+        "exp": 55,
+        "discovery_source": "npc:Curator",
+    },
+    
+    # =========================================================================
+    # WOODWORKING - Wood from gathering, items and furniture crafted
+    # =========================================================================
+    
+    # --- Skill 0-15: Basic Wood ---
+    "plank": {
+        "name": "Wooden Plank",
+        "desc": "A cut and smoothed plank of wood.",
+        "category": "woodworking",
+        "skill_required": 0,
+        "workstation": "workbench",
+        "ingredients": [
+            {"item": "wood", "amount": 1},
+        ],
+        "tools": [],
+        "output": {"item": "plank", "amount": 2},
+        "difficulty": "trivial",
+        "exp": 2,
+        "discovered_by_default": True,
+    },
+    "handle": {
+        "name": "Wooden Handle",
+        "desc": "A shaped wooden handle for tools.",
+        "category": "woodworking",
+        "skill_required": 5,
+        "workstation": "workbench",
+        "ingredients": [
+            {"item": "wood", "amount": 1},
+        ],
+        "tools": [],
+        "output": {"item": "handle", "amount": 2},
+        "difficulty": "trivial",
+        "exp": 3,
+        "discovered_by_default": True,
+    },
+    "bug_net": {
+        "name": "Bug Net",
+        "desc": "A net for catching insects.",
+        "category": "woodworking",
+        "skill_required": 10,
+        "workstation": None,
+        "ingredients": [
+            {"item": "wood", "amount": 1},
+            {"item": "fiber", "amount": 3},
+        ],
+        "tools": [],
+        "output": {"item": "bug_net", "amount": 1},
+        "difficulty": "easy",
+        "exp": 10,
+        "discovered_by_default": True,
+    },
+    "fishing_rod": {
+        "name": "Basic Fishing Rod",
+        "desc": "A basic fishing rod. Functional but simple.",
+        "category": "woodworking",
+        "skill_required": 15,
+        "workstation": "workbench",
+        "ingredients": [
+            {"item": "wood", "amount": 2},
+            {"item": "fiber", "amount": 3},
+            {"item": "fishing_hook", "amount": 1},
+        ],
+        "tools": [],
+        "output": {"item": "basic_fishing_rod", "amount": 1},
+        "difficulty": "easy",
+        "exp": 15,
+        "discovered_by_default": True,
+    },
+    
+    # --- Skill 20-35: Furniture Basics ---
+    "wooden_box": {
+        "name": "Wooden Box",
+        "desc": "A simple storage box.",
+        "category": "woodworking",
+        "skill_required": 15,
+        "workstation": "workbench",
+        "ingredients": [
+            {"item": "plank", "amount": 4},
+            {"item": "nails", "amount": 8},
+        ],
+        "tools": ["carpentry_tools"],
+        "output": {"item": "wooden_box", "amount": 1},
+        "difficulty": "easy",
+        "exp": 15,
+        "discovered_by_default": True,
+    },
+    "wooden_chair": {
+        "name": "Wooden Chair",
+        "desc": "A simple but sturdy chair.",
+        "category": "woodworking",
+        "skill_required": 25,
+        "workstation": "workbench",
+        "ingredients": [
+            {"item": "plank", "amount": 4},
+            {"item": "nails", "amount": 10},
+        ],
+        "tools": ["carpentry_tools"],
+        "output": {"item": "wooden_chair", "amount": 1},
+        "output_type": "furniture",
+        "difficulty": "normal",
+        "exp": 25,
+        "discovered_by_default": True,
+    },
+    "wooden_table": {
+        "name": "Wooden Table",
+        "desc": "A functional wooden table.",
+        "category": "woodworking",
+        "skill_required": 30,
+        "workstation": "workbench",
+        "ingredients": [
+            {"item": "plank", "amount": 6},
+            {"item": "nails", "amount": 12},
+        ],
+        "tools": ["carpentry_tools"],
+        "output": {"item": "wooden_table", "amount": 1},
+        "output_type": "furniture",
+        "difficulty": "normal",
+        "exp": 30,
+        "discovered_by_default": True,
+    },
+    "bed_frame": {
+        "name": "Simple Bed Frame",
+        "desc": "A basic bed frame. Add bedding separately.",
+        "category": "woodworking",
+        "skill_required": 35,
+        "workstation": "workbench",
+        "ingredients": [
+            {"item": "plank", "amount": 8},
+            {"item": "nails", "amount": 16},
+            {"item": "rope", "amount": 2},
+        ],
+        "tools": ["carpentry_tools"],
+        "output": {"item": "simple_bed", "amount": 1},
+        "output_type": "furniture",
+        "difficulty": "normal",
+        "exp": 35,
+        "discovery_source": "skill:35",
+    },
+    
+    # --- Skill 35-50: Specialty Items ---
+    "paddle": {
+        "name": "Paddle",
+        "desc": "A wooden paddle. For... rowing.",
+        "category": "woodworking",
+        "skill_required": 20,
+        "workstation": "workbench",
+        "ingredients": [
+            {"item": "plank", "amount": 2},
+        ],
+        "tools": ["carpentry_tools"],
+        "output": {"item": "paddle", "amount": 1},
+        "difficulty": "easy",
+        "exp": 15,
+        "discovery_source": "npc:Curator",
+    },
+    "spanking_bench": {
+        "name": "Spanking Bench",
+        "desc": "A padded bench designed for... discipline.",
+        "category": "woodworking",
+        "skill_required": 45,
+        "workstation": "workbench",
+        "ingredients": [
+            {"item": "plank", "amount": 10},
+            {"item": "leather", "amount": 3},
+            {"item": "nails", "amount": 20},
+        ],
+        "tools": ["carpentry_tools"],
+        "output": {"item": "spanking_bench", "amount": 1},
+        "output_type": "furniture",
+        "difficulty": "hard",
+        "exp": 50,
+        "discovery_source": "npc:Curator",
+    },
+    "stocks": {
+        "name": "Stocks",
+        "desc": "Wooden restraints for public display.",
+        "category": "woodworking",
+        "skill_required": 45,
+        "workstation": "workbench",
+        "ingredients": [
+            {"item": "plank", "amount": 8},
+            {"item": "iron_ingot", "amount": 2},
+            {"item": "nails", "amount": 16},
+        ],
+        "tools": ["carpentry_tools"],
+        "output": {"item": "stocks", "amount": 1},
+        "output_type": "furniture",
+        "difficulty": "hard",
+        "exp": 50,
+        "discovery_source": "npc:Curator",
+    },
+    "st_andrews_cross": {
+        "name": "St. Andrew's Cross",
+        "desc": "An X-shaped frame with restraint points.",
+        "category": "woodworking",
+        "skill_required": 55,
+        "workstation": "workbench",
+        "ingredients": [
+            {"item": "plank", "amount": 12},
+            {"item": "leather", "amount": 4},
+            {"item": "metal_ring", "amount": 8},
+            {"item": "nails", "amount": 24},
+        ],
+        "tools": ["carpentry_tools"],
+        "output": {"item": "st_andrews_cross", "amount": 1},
+        "output_type": "furniture",
+        "difficulty": "expert",
+        "exp": 65,
+        "discovery_source": "npc:Curator",
+    },
+    
+    # =========================================================================
+    # JEWELCRAFTING - Gems from mining, jewelry crafted
+    # =========================================================================
+    
+    # --- Skill 0-15: Basic Gemwork ---
+    "cut_gem": {
+        "name": "Cut Gemstone",
+        "desc": "A properly cut and polished gem.",
+        "category": "jewelcrafting",
+        "skill_required": 10,
+        "workstation": "jeweler_bench",
+        "ingredients": [
+            {"item": "rough_gem", "amount": 1},
+        ],
+        "tools": ["jeweler_tools"],
+        "output": {"item": "cut_gem", "amount": 1},
+        "difficulty": "normal",
+        "exp": 12,
+        "discovered_by_default": True,
+    },
+    "simple_pendant": {
+        "name": "Simple Pendant",
+        "desc": "A basic metal pendant on a chain.",
+        "category": "jewelcrafting",
+        "skill_required": 15,
+        "workstation": "jeweler_bench",
+        "ingredients": [
+            {"item": "copper_ingot", "amount": 1},
+            {"item": "chains", "amount": 1},
+        ],
+        "tools": ["jeweler_tools"],
+        "output": {"item": "simple_pendant", "amount": 1},
+        "difficulty": "easy",
+        "exp": 15,
+        "discovered_by_default": True,
+    },
+    
+    # --- Skill 20-35: Silver Work ---
+    "silver_ring": {
+        "name": "Silver Ring",
+        "desc": "A simple silver band.",
+        "category": "jewelcrafting",
+        "skill_required": 20,
+        "workstation": "jeweler_bench",
+        "ingredients": [
+            {"item": "silver_ingot", "amount": 1},
+        ],
+        "tools": ["jeweler_tools"],
+        "output": {"item": "silver_ring", "amount": 1},
+        "difficulty": "normal",
+        "exp": 20,
+        "discovered_by_default": True,
+    },
+    "silver_bracelet": {
+        "name": "Silver Bracelet",
+        "desc": "An elegant silver bracelet.",
+        "category": "jewelcrafting",
+        "skill_required": 25,
+        "workstation": "jeweler_bench",
+        "ingredients": [
+            {"item": "silver_ingot", "amount": 2},
+        ],
+        "tools": ["jeweler_tools"],
+        "output": {"item": "silver_bracelet", "amount": 1},
+        "difficulty": "normal",
+        "exp": 25,
+        "discovery_source": "skill:25",
+    },
+    "gem_ring": {
+        "name": "Gemmed Ring",
+        "desc": "A ring set with a beautiful gemstone.",
+        "category": "jewelcrafting",
+        "skill_required": 35,
+        "workstation": "jeweler_bench",
+        "ingredients": [
+            {"item": "silver_ingot", "amount": 1},
+            {"item": "cut_gem", "amount": 1},
+        ],
+        "tools": ["jeweler_tools"],
+        "output": {"item": "gem_ring", "amount": 1},
+        "difficulty": "hard",
+        "exp": 40,
+        "discovery_source": "skill:35",
+    },
+    
+    # --- Skill 30-50: Collars and Adult Jewelry ---
+    "collar": {
+        "name": "Leather Collar",
+        "desc": "A decorative collar with a ring for attachments.",
+        "category": "jewelcrafting",
+        "skill_required": 30,
+        "workstation": "jeweler_bench",
+        "ingredients": [
+            {"item": "silver_ingot", "amount": 1},
+            {"item": "leather", "amount": 2},
+            {"item": "metal_ring", "amount": 1},
+        ],
+        "tools": ["jeweler_tools"],
+        "output": {"item": "collar", "amount": 1},
+        "difficulty": "normal",
+        "exp": 30,
+        "discovery_source": "npc:Curator",
+    },
+    "ornate_collar": {
+        "name": "Ornate Collar",
+        "desc": "A beautiful collar with gem inlays.",
+        "category": "jewelcrafting",
+        "skill_required": 45,
+        "workstation": "jeweler_bench",
+        "ingredients": [
+            {"item": "silver_ingot", "amount": 2},
+            {"item": "leather", "amount": 2},
+            {"item": "cut_gem", "amount": 2},
+            {"item": "metal_ring", "amount": 1},
+        ],
+        "tools": ["jeweler_tools"],
+        "output": {"item": "ornate_collar", "amount": 1},
+        "difficulty": "hard",
+        "exp": 50,
+        "discovery_source": "npc:Curator",
+    },
+    "nipple_jewelry": {
+        "name": "Nipple Jewelry",
+        "desc": "Decorative piercings or clamps.",
+        "category": "jewelcrafting",
+        "skill_required": 30,
+        "workstation": "jeweler_bench",
+        "ingredients": [
+            {"item": "silver_ingot", "amount": 1},
+        ],
+        "tools": ["jeweler_tools"],
+        "output": {"item": "nipple_jewelry", "amount": 1},
+        "difficulty": "normal",
+        "exp": 30,
+        "discovery_source": "npc:Curator",
+    },
+    "clit_jewelry": {
+        "name": "Intimate Jewelry",
+        "desc": "Delicate jewelry for intimate piercings.",
+        "category": "jewelcrafting",
+        "skill_required": 40,
+        "workstation": "jeweler_bench",
+        "ingredients": [
+            {"item": "silver_ingot", "amount": 1},
+            {"item": "cut_gem", "amount": 1},
+        ],
+        "tools": ["jeweler_tools"],
+        "output": {"item": "intimate_jewelry", "amount": 1},
+        "difficulty": "hard",
+        "exp": 45,
+        "discovery_source": "npc:Curator",
+    },
+    "ankle_bells": {
+        "name": "Ankle Bells",
+        "desc": "Decorative bells that chime with movement.",
+        "category": "jewelcrafting",
+        "skill_required": 25,
+        "workstation": "jeweler_bench",
+        "ingredients": [
+            {"item": "silver_ingot", "amount": 1},
+            {"item": "chains", "amount": 1},
+        ],
+        "tools": ["jeweler_tools"],
+        "output": {"item": "ankle_bells", "amount": 1},
+        "difficulty": "normal",
+        "exp": 25,
+        "discovery_source": "skill:25",
+    },
+    "ownership_tag": {
+        "name": "Ownership Tag",
+        "desc": "A metal tag that can be engraved with a name.",
+        "category": "jewelcrafting",
+        "skill_required": 35,
+        "workstation": "jeweler_bench",
+        "ingredients": [
+            {"item": "silver_ingot", "amount": 1},
+        ],
+        "tools": ["jeweler_tools"],
+        "output": {"item": "ownership_tag", "amount": 1},
+        "difficulty": "normal",
+        "exp": 35,
+        "discovery_source": "npc:Curator",
+    },
+    
+    # =========================================================================
+    # LEATHERWORKING - Hides from future hunting, leather goods crafted
+    # =========================================================================
+    
+    # --- Skill 0-15: Basic Leather ---
+    "leather": {
+        "name": "Leather",
+        "desc": "Tanned and treated hide.",
+        "category": "leatherworking",
+        "skill_required": 0,
+        "workstation": "tanning_rack",
+        "ingredients": [
+            {"item": "hide", "amount": 1},
+            {"item": "salt", "amount": 1},
+        ],
+        "tools": [],
+        "output": {"item": "leather", "amount": 1},
+        "difficulty": "easy",
+        "exp": 8,
+        "discovered_by_default": True,
+    },
+    "leather_strips": {
+        "name": "Leather Strips",
+        "desc": "Thin strips of leather for crafting.",
+        "category": "leatherworking",
+        "skill_required": 5,
+        "workstation": None,
+        "ingredients": [
+            {"item": "leather", "amount": 1},
+        ],
+        "tools": ["leatherworking_tools"],
+        "output": {"item": "leather_strips", "amount": 4},
+        "difficulty": "trivial",
+        "exp": 3,
+        "discovered_by_default": True,
+    },
+    "leather_belt": {
+        "name": "Leather Belt",
+        "desc": "A sturdy leather belt.",
+        "category": "leatherworking",
+        "skill_required": 10,
+        "workstation": None,
+        "ingredients": [
+            {"item": "leather", "amount": 1},
+            {"item": "metal_ring", "amount": 1},
+        ],
+        "tools": ["leatherworking_tools"],
+        "output": {"item": "leather_belt", "amount": 1},
+        "difficulty": "easy",
+        "exp": 10,
+        "discovered_by_default": True,
+    },
+    
+    # --- Skill 15-30: Gear and Accessories ---
+    "leather_gloves": {
+        "name": "Leather Gloves",
+        "desc": "Sturdy leather work gloves.",
+        "category": "leatherworking",
+        "skill_required": 15,
+        "workstation": None,
+        "ingredients": [
+            {"item": "leather", "amount": 2},
+        ],
+        "tools": ["leatherworking_tools"],
+        "output": {"item": "leather_gloves", "amount": 1},
+        "difficulty": "easy",
+        "exp": 15,
+        "discovered_by_default": True,
+    },
+    "leather_armor": {
+        "name": "Leather Armor",
+        "desc": "Basic protective leather gear.",
+        "category": "leatherworking",
+        "skill_required": 25,
+        "workstation": "tanning_rack",
+        "ingredients": [
+            {"item": "leather", "amount": 4},
+            {"item": "fiber", "amount": 2},
+        ],
+        "tools": ["leatherworking_tools"],
+        "output": {"item": "leather_armor", "amount": 1},
+        "difficulty": "normal",
+        "exp": 30,
+        "discovered_by_default": True,
+    },
+    "satchel": {
+        "name": "Leather Satchel",
+        "desc": "A sturdy bag for carrying items.",
+        "category": "leatherworking",
+        "skill_required": 20,
+        "workstation": None,
+        "ingredients": [
+            {"item": "leather", "amount": 3},
+            {"item": "metal_ring", "amount": 2},
+        ],
+        "tools": ["leatherworking_tools"],
+        "output": {"item": "satchel", "amount": 1},
+        "difficulty": "normal",
+        "exp": 22,
+        "discovery_source": "skill:20",
+    },
+    
+    # --- Skill 25-40: Restraints ---
+    "leash": {
+        "name": "Leash",
+        "desc": "A leather lead with a sturdy clasp.",
+        "category": "leatherworking",
+        "skill_required": 20,
+        "workstation": None,
+        "ingredients": [
+            {"item": "leather", "amount": 1},
+            {"item": "metal_ring", "amount": 2},
+        ],
+        "tools": ["leatherworking_tools"],
+        "output": {"item": "leash", "amount": 1},
+        "difficulty": "easy",
+        "exp": 18,
+        "discovery_source": "npc:Curator",
+    },
+    "leather_cuffs": {
+        "name": "Leather Cuffs",
+        "desc": "Padded leather restraints for wrists.",
+        "category": "leatherworking",
+        "skill_required": 25,
+        "workstation": None,
+        "ingredients": [
+            {"item": "leather", "amount": 2},
+            {"item": "metal_ring", "amount": 2},
+        ],
+        "tools": ["leatherworking_tools"],
+        "output": {"item": "leather_cuffs", "amount": 1},
+        "difficulty": "normal",
+        "exp": 25,
+        "discovery_source": "npc:Curator",
+    },
+    "ankle_cuffs": {
+        "name": "Ankle Cuffs",
+        "desc": "Padded leather restraints for ankles.",
+        "category": "leatherworking",
+        "skill_required": 25,
+        "workstation": None,
+        "ingredients": [
+            {"item": "leather", "amount": 2},
+            {"item": "metal_ring", "amount": 2},
+        ],
+        "tools": ["leatherworking_tools"],
+        "output": {"item": "ankle_cuffs", "amount": 1},
+        "difficulty": "normal",
+        "exp": 25,
+        "discovery_source": "npc:Curator",
+    },
+    "blindfold_leather": {
+        "name": "Leather Blindfold",
+        "desc": "A padded leather blindfold. Complete darkness.",
+        "category": "leatherworking",
+        "skill_required": 25,
+        "workstation": None,
+        "ingredients": [
+            {"item": "leather", "amount": 1},
+            {"item": "cloth", "amount": 1},
+        ],
+        "tools": ["leatherworking_tools"],
+        "output": {"item": "leather_blindfold", "amount": 1},
+        "difficulty": "normal",
+        "exp": 22,
+        "discovery_source": "skill:25",
+    },
+    "ball_gag": {
+        "name": "Ball Gag",
+        "desc": "A leather strap with a ball for the mouth.",
+        "category": "leatherworking",
+        "skill_required": 30,
+        "workstation": None,
+        "ingredients": [
+            {"item": "leather", "amount": 1},
+            {"item": "rubber_ball", "amount": 1},
+        ],
+        "tools": ["leatherworking_tools"],
+        "output": {"item": "ball_gag", "amount": 1},
+        "difficulty": "normal",
+        "exp": 28,
+        "discovery_source": "npc:Curator",
+    },
+    
+    # --- Skill 40+: Advanced Restraints ---
+    "harness": {
+        "name": "Body Harness",
+        "desc": "A leather harness with multiple attachment points.",
+        "category": "leatherworking",
+        "skill_required": 40,
+        "workstation": "tanning_rack",
+        "ingredients": [
+            {"item": "leather", "amount": 4},
+            {"item": "metal_ring", "amount": 6},
+        ],
+        "tools": ["leatherworking_tools"],
+        "output": {"item": "harness", "amount": 1},
+        "difficulty": "hard",
+        "exp": 45,
+        "discovery_source": "npc:Curator",
+    },
+    "posture_collar": {
+        "name": "Posture Collar",
+        "desc": "A tall collar that restricts head movement.",
+        "category": "leatherworking",
+        "skill_required": 45,
+        "workstation": "tanning_rack",
+        "ingredients": [
+            {"item": "leather", "amount": 3},
+            {"item": "metal_ring", "amount": 2},
+            {"item": "iron_ingot", "amount": 1},
+        ],
+        "tools": ["leatherworking_tools"],
+        "output": {"item": "posture_collar", "amount": 1},
+        "difficulty": "hard",
+        "exp": 50,
+        "discovery_source": "npc:Curator",
+    },
+    "pony_harness": {
+        "name": "Pony Harness",
+        "desc": "A full harness set for pony play.",
+        "category": "leatherworking",
+        "skill_required": 55,
+        "workstation": "tanning_rack",
+        "ingredients": [
+            {"item": "leather", "amount": 6},
+            {"item": "metal_ring", "amount": 8},
+            {"item": "chains", "amount": 1},
+        ],
+        "tools": ["leatherworking_tools"],
+        "output": {"item": "pony_harness", "amount": 1},
+        "difficulty": "expert",
+        "exp": 65,
+        "discovery_source": "npc:Curator",
+    },
+    "bondage_hood": {
+        "name": "Bondage Hood",
+        "desc": "A full head covering with optional blindfold and gag attachments.",
+        "category": "leatherworking",
+        "skill_required": 60,
+        "workstation": "tanning_rack",
+        "ingredients": [
+            {"item": "leather", "amount": 4},
+            {"item": "cloth", "amount": 2},
+            {"item": "metal_ring", "amount": 4},
+        ],
+        "tools": ["leatherworking_tools"],
+        "output": {"item": "bondage_hood", "amount": 1},
+        "difficulty": "expert",
+        "exp": 70,
+        "discovery_source": "npc:Curator",
+    },
+}
@@ -0,0 +1,490 @@
+"""
+Species Templates
+
+Data for world.body's SPECIES_TEMPLATES, loaded on first use. Read
+species through world.body (get_species_template, SPECIES_TEMPLATES).
+"""
+
+# =============================================================================
+# SPECIES TEMPLATES
+# =============================================================================
+
+SPECIES_TEMPLATES = {
+    # -------------------------------------------------------------------------
+    # Humanoid Species
+    # -------------------------------------------------------------------------
+    "human": {
+        "name": "Human",
+        "desc": "Standard human features.",
+        "parts": {
+            "eyes": {"default": "eyes"},
+            "hair": {"default": "hair"},
+            "skin": {"default": "skin"},
+        },
+        "genital_category": "human",
+        "covering": "skin",
+        "abilities": [],
+    },
+    
+    "elf": {
+        "name": "Elf",
+        "desc": "Graceful humanoid with pointed ears.",
+        "parts": {
+            "eyes": {"default": "sharp, luminous eyes"},
+            "ears": {"default": "long, elegantly pointed ears"},
+            "hair": {"default": "fine, silken hair"},
+            "skin": {"default": "flawless skin"},
+        },
+        "genital_category": "human",
+        "covering": "skin",
+        "abilities": ["darkvision", "trance"],
+    },
+    
+    "dwarf": {
+        "name": "Dwarf",
+        "desc": "Stocky humanoid, often bearded.",
+        "parts": {
+            "eyes": {"default": "keen eyes"},
+            "hair": {"default": "thick, often braided hair"},
+            "beard": {"default": "impressive beard"},
+            "skin": {"default": "weathered skin"},
+        },
+        "genital_category": "human",
+        "covering": "skin",
+        "abilities": ["darkvision", "stonecunning"],
+    },
+    
+    "orc": {
+        "name": "Orc",
+        "desc": "Powerful, tusked humanoid.",
+        "parts": {
+            "eyes": {"default": "fierce eyes"},
+            "tusks": {"default": "prominent tusks"},
+            "skin": {"default": "green-gray skin"},
+        },
+        "genital_category": "human",
+        "covering": "skin",
+        "abilities": ["relentless"],
+    },
+    
+    "goblin": {
+        "name": "Goblin",
+        "desc": "Small, clever creature with pointed ears.",
+        "parts": {
+            "eyes": {"default": "large, cunning eyes"},
+            "ears": {"default": "long, pointed ears"},
+            "skin": {"default": "mottled green skin"},
+        },
+        "genital_category": "human",
+        "covering": "skin",
+        "abilities": ["nimble_escape"],
+    },
+    
+    # -------------------------------------------------------------------------
+    # Canine Species
+    # -------------------------------------------------------------------------
+    "canine": {
+        "name": "Canine",
+        "desc": "Wolf or dog-like anthro.",
+        "parts": {
+            "eyes": {"default": "amber eyes"},
+            "ears": {"default": "pointed canine ears", "alert": "perked ears"},
+            "muzzle": {"default": "canine muzzle"},
+            "tail": {"default": "bushy tail", "wagging": "wagging tail", "tucked": "tucked tail"},
+            "fur": {"default": "soft fur"},
+            "paws": {"default": "padded paws"},
+            "cock": {
+                "default": "canine cock hidden in its sheath",
+                "aroused": "red tapered cock, knot visible at the base",
+                "knotted": "swollen knot locked inside",
+            },
+        },
+        "genital_category": "canine",
+        "covering": "fur",
+        "abilities": ["enhanced_smell", "pack_tactics"],
+    },
+    
+    "wolf": {
+        "name": "Wolf",
+        "desc": "Larger, wilder canine.",
+        "parts": {
+            "eyes": {"default": "golden predator eyes"},
+            "ears": {"default": "tall wolf ears"},
+            "muzzle": {"default": "powerful wolf muzzle"},
+            "tail": {"default": "thick wolf tail"},
+            "fur": {"default": "dense gray fur"},
+            "fangs": {"default": "sharp fangs"},
+            "cock": {
+                "default": "wolf cock sheathed",
+                "aroused": "red wolf cock unsheathed, thick knot visible",
+                "knotted": "massive knot swollen and locked",
+            },
+        },
+        "genital_category": "canine",
+        "covering": "fur",
+        "abilities": ["enhanced_smell", "pack_tactics", "howl"],
+    },
+    
+    "fox": {
+        "name": "Fox",
+        "desc": "Sleek, clever vulpine.",
+        "parts": {
+            "eyes": {"default": "sharp amber eyes"},
+            "ears": {"default": "large triangular ears"},
+            "muzzle": {"default": "slender fox muzzle"},
+            "tail": {"default": "fluffy fox tail"},
+            "fur": {"default": "russet fur with white markings"},
+            "cock": {
+                "default": "fox cock in sheath",
+                "aroused": "slender red cock with modest knot",
+            },
+        },
+        "genital_category": "canine",
+        "covering": "fur",
+        "abilities": ["enhanced_smell", "cunning"],
+    },
+    
+    # -------------------------------------------------------------------------
+    # Feline Species
+    # -------------------------------------------------------------------------
+    "feline": {
+        "name": "Feline",
+        "desc": "Cat-like anthro.",
+        "parts": {
+            "eyes": {"default": "slitted eyes"},
+            "ears": {"default": "triangular cat ears", "alert": "swiveling ears"},
+            "muzzle": {"default": "feline muzzle"},
+            "tail": {"default": "long sinuous tail", "puffed": "puffed tail"},
+            "fur": {"default": "sleek fur"},
+            "claws": {"default": "retractable claws"},
+            "tongue": {"default": "rough tongue"},
+            "cock": {
+                "default": "feline cock sheathed",
+                "aroused": "barbed cock unsheathed",
+            },
+        },
+        "genital_category": "feline",
+        "covering": "fur",
+        "abilities": ["darkvision", "claws", "always_land_on_feet"],
+    },
+    
+    "lion": {
+        "name": "Lion",
+        "desc": "Proud, powerful feline.",
+        "parts": {
+            "eyes": {"default": "golden eyes"},
+            "mane": {"default": "majestic mane"},
+            "ears": {"default": "rounded ears"},
+            "tail": {"default": "tufted tail"},
+            "fur": {"default": "tawny fur"},
+            "cock": {
+                "default": "lion cock sheathed",
+                "aroused": "thick barbed cock emerged",
+            },
+        },
+        "genital_category": "feline",
+        "covering": "fur",
+        "abilities": ["roar", "pride_leader"],
+    },
+    
+    "tiger": {
+        "name": "Tiger",
+        "desc": "Powerful striped predator.",
+        "parts": {
+            "eyes": {"default": "intense amber eyes"},
+            "ears": {"default": "rounded ears with white spots"},
+            "fur": {"default": "orange fur with black stripes"},
+            "tail": {"default": "long striped tail"},
+            "cock": {
+                "default": "tiger cock sheathed",
+                "aroused": "thick barbed cock unsheathed",
+            },
+        },
+        "genital_category": "feline",
+        "covering": "fur",
+        "abilities": ["powerful_build", "ambush"],
+    },
+    
+    # -------------------------------------------------------------------------
+    # Equine Species
+    # -------------------------------------------------------------------------
+    "equine": {
+        "name": "Equine",
+        "desc": "Horse-like anthro.",
+        "parts": {
+            "eyes": {"default": "large dark eyes"},
+            "ears": {"default": "long equine ears"},
+            "muzzle": {"default": "equine muzzle"},
+            "mane": {"default": "flowing mane"},
+            "tail": {"default": "long horse tail"},
+            "hooves": {"default": "solid hooves"},
+            "cock": {
+                "default": "equine cock in sheath",
+                "aroused": "massive flared horse cock",
+                "flaring": "cock flared wide, medial ring prominent",
+            },
+        },
+        "genital_category": "equine",
+        "covering": "short coat",
+        "abilities": ["powerful_kick", "endurance"],
+    },
+    
+    "unicorn": {
+        "name": "Unicorn",
+        "desc": "Magical horned equine.",
+        "parts": {
+            "eyes": {"default": "luminous eyes"},
+            "horn": {"default": "spiraling horn"},
+            "mane": {"default": "shimmering mane"},
+            "tail": {"default": "silken tail"},
+            "coat": {"default": "pure white coat"},
+            "cock": {
+                "default": "equine cock in sheath",
+                "aroused": "glowing flared cock",
+            },
+        },
+        "genital_category": "equine",
+        "covering": "silken coat",
+        "abilities": ["magic", "purity", "teleport"],
+    },
+    
+    # -------------------------------------------------------------------------
+    # Reptilian Species
+    # -------------------------------------------------------------------------
+    "reptile": {
+        "name": "Reptile",
+        "desc": "Scaled lizard-like anthro.",
+        "parts": {
+            "eyes": {"default": "slitted reptilian eyes"},
+            "snout": {"default": "scaled snout"},
+            "scales": {"default": "smooth scales"},
+            "tail": {"default": "thick reptilian tail"},
+            "claws": {"default": "sharp claws"},
+            "cock": {
+                "default": "hemipenes retracted",
+                "aroused": "twin hemipenes emerged",
+            },
+        },
+        "genital_category": "reptile",
+        "covering": "scales",
+        "abilities": ["cold_blooded", "regeneration"],
+    },
+    
+    "dragon": {
+        "name": "Dragon",
+        "desc": "Powerful scaled creature with wings.",
+        "parts": {
+            "eyes": {"default": "ancient slitted eyes"},
+            "horns": {"default": "curved horns"},
+            "snout": {"default": "powerful dragon snout"},
+            "scales": {"default": "thick armored scales"},
+            "wings": {"default": "massive leathery wings"},
+            "tail": {"default": "powerful spiked tail"},
+            "cock": {
+                "default": "dragon cock in slit",
+                "aroused": "ridged dragon cock emerged",
+            },
+        },
+        "genital_category": "reptile",
+        "covering": "scales",
+        "abilities": ["flight", "breath_weapon", "frightful_presence"],
+    },
+    
+    "snake": {
+        "name": "Snake / Naga",
+        "desc": "Serpentine creature.",
+        "parts": {
+            "eyes": {"default": "hypnotic slitted eyes"},
+            "fangs": {"default": "venomous fangs"},
+            "tongue": {"default": "forked tongue"},
+            "scales": {"default": "iridescent scales"},
+            "coils": {"default": "powerful coils"},
+            "cock": {
+                "default": "hemipenes hidden",
+                "aroused": "twin hemipenes emerged from slit",
+            },
+        },
+        "genital_category": "reptile",
+        "covering": "scales",
+        "abilities": ["constrict", "venom", "heat_sense"],
+    },
+    
+    # -------------------------------------------------------------------------
+    # Aquatic Species
+    # -------------------------------------------------------------------------
+    "shark": {
+        "name": "Shark",
+        "desc": "Predatory aquatic anthro.",
+        "parts": {
+            "eyes": {"default": "black shark eyes"},
+            "snout": {"default": "blunt shark snout"},
+            "teeth": {"default": "rows of sharp teeth"},
+            "fin": {"default": "dorsal fin"},
+            "skin": {"default": "rough shark skin"},
+            "gills": {"default": "gills"},
+            "cock": {
+                "default": "claspers retracted",
+                "aroused": "claspers extended",
+            },
+        },
+        "genital_category": "aquatic",
+        "covering": "rough skin",
+        "abilities": ["water_breathing", "blood_sense", "swim_speed"],
+    },
+    
+    "dolphin": {
+        "name": "Dolphin",
+        "desc": "Playful aquatic mammal.",
+        "parts": {
+            "eyes": {"default": "intelligent eyes"},
+            "beak": {"default": "dolphin beak"},
+            "blowhole": {"default": "blowhole"},
+            "fin": {"default": "dorsal fin"},
+            "skin": {"default": "smooth gray skin"},
+            "cock": {
+                "default": "prehensile cock retracted",
+                "aroused": "long prehensile cock extended",
+            },
+        },
+        "genital_category": "aquatic",
+        "covering": "smooth skin",
+        "abilities": ["water_breathing", "echolocation", "swim_speed"],
+    },
+    
+    # -------------------------------------------------------------------------
+    # Avian Species
+    # -------------------------------------------------------------------------
+    "avian": {
+        "name": "Avian",
+        "desc": "Bird-like anthro.",
+        "parts": {
+            "eyes": {"default": "keen bird eyes"},
+            "beak": {"default": "curved beak"},
+            "feathers": {"default": "colorful plumage"},
+            "wings": {"default": "feathered wings"},
+            "talons": {"default": "sharp talons"},
+            "tail_feathers": {"default": "tail feathers"},
+        },
+        "genital_category": "avian",
+        "covering": "feathers",
+        "abilities": ["flight", "keen_sight"],
+    },
+    
+    "raven": {
+        "name": "Raven",
+        "desc": "Intelligent corvid anthro.",
+        "parts": {
+            "eyes": {"default": "cunning black eyes"},
+            "beak": {"default": "sharp black beak"},
+            "feathers": {"default": "glossy black feathers"},
+            "wings": {"default": "dark wings"},
+        },
+        "genital_category": "avian",
+        "covering": "feathers",
+        "abilities": ["flight", "mimicry", "intelligence"],
+    },
+    
+    # -------------------------------------------------------------------------
+    # Monster Species (from Niflheim, Muspelheim, etc.)
+    # -------------------------------------------------------------------------
+    "slime": {
+        "name": "Slime",
+        "desc": "Amorphous creature.",
+        "parts": {
+            "body": {"default": "translucent gelatinous form"},
+            "core": {"default": "glowing core"},
+            "pseudopods": {"default": "shifting pseudopods"},
+            "cock": {
+                "default": "no visible genitals",
+                "aroused": "phallic pseudopod formed",
+            },
+        },
+        "genital_category": "tentacle",
+        "covering": "slime",
+        "abilities": ["amorphous", "absorb", "split"],
+    },
+    
+    "demon": {
+        "name": "Demon",
+        "desc": "Infernal being from Muspelheim.",
+        "parts": {
+            "eyes": {"default": "burning eyes"},
+            "horns": {"default": "curved horns"},
+            "skin": {"default": "red skin"},
+            "tail": {"default": "spaded tail"},
+            "wings": {"default": "leathery bat wings"},
+            "cock": {
+                "default": "demonic cock",
+                "aroused": "ridged infernal cock, dripping with heat",
+            },
+        },
+        "genital_category": "human",  # Demons are human-like
+        "covering": "skin",
+        "abilities": ["fire_resistance", "flight", "corruption"],
+    },
+    
+    "tentacle_beast": {
+        "name": "Tentacle Beast",
+        "desc": "Creature from Niflheim mists.",
+        "parts": {
+            "eyes": {"default": "many unblinking eyes"},
+            "maw": {"default": "beaked maw"},
+            "tentacles": {
+                "default": "writhing tentacles",
+                "aroused": "tentacles dripping with slime",
+            },
+        },
+        "genital_category": "tentacle",
+        "covering": "slime",
+        "abilities": ["grapple", "multiple_attacks", "slime"],
+    },
+    
+    # -------------------------------------------------------------------------
+    # Hybrid / Special
+    # -------------------------------------------------------------------------
+    "futa_human": {
+        "name": "Futanari (Human)",
+        "desc": "Human with both sets of genitals.",
+        "parts": {
+            "eyes": {"default": "eyes"},
+            "hair": {"default": "hair"},
+            "skin": {"default": "skin"},
+            "breasts": {"default": "breasts", "aroused": "flushed breasts"},
+            "cock": {
+                "default": "cock",
+                "aroused": "hard cock",
+            },
+            "pussy": {
+                "default": "pussy",
+                "aroused": "wet pussy",
+            },
+        },
+        "genital_category": "human",
+        "covering": "skin",
+        "abilities": [],
+    },
+    
+    "futa_canine": {
+        "name": "Futanari (Canine)",
+        "desc": "Canine anthro with both sets.",
+        "parts": {
+            "eyes": {"default": "amber eyes"},
+            "ears": {"default": "pointed canine ears"},
+            "muzzle": {"default": "canine muzzle"},
+            "tail": {"default": "bushy tail"},
+            "fur": {"default": "soft fur"},
+            "breasts": {"default": "fur-covered breasts"},
+            "cock": {
+                "default": "canine cock in sheath",
+                "aroused": "red knotted cock unsheathed",
+            },
+            "pussy": {
+                "default": "pussy hidden in fur",
+                "aroused": "wet pussy, folds swollen",
+            },
+        },
+        "genital_category": "canine",
+        "covering": "fur",
+        "abilities": ["enhanced_smell", "pack_tactics"],
+    },
+}
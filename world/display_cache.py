@@ -0,0 +1,133 @@
+"""
+Status Display Cache for Gilderhaven
+=====================================
+
+The status screens (status, stats, resources, the combat panel sent
+after every action) are mostly colour-coded bars, and the same bars come
+up again and again: a full HP bar, 7 of 10 stamina, calm arousal. Each
+one used to be rebuilt character by character on every call.
+
+Two caches sit under them:
+
+- Bars. cached_bar() keeps each rendered bar keyed by the function that
+  draws it and its arguments (value, max, width, colour), so a given bar
+  is drawn once per server run.
+- Panels. cached_panel() keeps one rendered panel per character and
+  panel kind, along with the signature it was built from: the values it
+  displays. A panel is reused while its signature matches and rebuilt
+  as soon as any displayed value changes, so writes from anywhere
+  (setters, direct db writes, combat) invalidate it without hooks.
+
+Both are plain memory and rebuild on demand; the rendercache admin
+command shows their counters and clears them with the room cache.
+
+Usage:
+    from world.display_cache import cached_bar, cached_panel
+
+    def _make_bar(current, maximum, color, length=10):
+        return cached_bar(_draw_bar, current, maximum, color, length)
+
+    signature = (get_energy(character), get_arousal(character))
+    return cached_panel(character, "states", signature, _build_display, character)
+"""
+
+
+# =============================================================================
+# Configuration
+# =============================================================================
+
+# Bars are cheap to store; past this many the table starts over
+BAR_CACHE_SIZE = 4096
+
+# Panels kept, one per character and panel kind
+PANEL_CACHE_SIZE = 2048
+
+# (draw function, *args) -> bar text
+_bars = {}
+
+# (character id, panel) -> (signature, text)
+_panels = {}
+
+_stats = {
+    "bar_hits": 0,
+    "bar_misses": 0,
+    "panel_hits": 0,
+    "panel_misses": 0,
+}
+
+
+# =============================================================================
+# Caches
+# =============================================================================
+
+def cached_bar(draw, *args):
+    """
+    Get a rendered bar, drawing it on first use.
+
+    Args:
+        draw: Function that renders the bar from args
+        *args: Everything the bar depends on (value, max, width, colour)
+
+    Returns:
+        str: The bar text
+    """
+    key = (draw,) + args
+    text = _bars.get(key)
+    if text is not None:
+        _stats["bar_hits"] += 1
+        return text
+    _stats["bar_misses"] += 1
+    if len(_bars) >= BAR_CACHE_SIZE:
+        _bars.clear()
+    text = _bars[key] = draw(*args)
+    return text
+
+
+def cached_panel(character, panel, signature, build, *args):
+    """
+    Get a character's rendered panel, rebuilding it if what it shows changed.
+
+    Args:
+        character: Whose panel it is
+        panel: Panel kind, e.g. "states" or "combat"
+        signature: Hashable tuple of every value the panel displays
+        build: Function that renders the panel from args
+        *args: Passed to build
+
+    Returns:
+        str: The panel text
+    """
+    char_id = getattr(character, "id", None)
+    if char_id is None:
+        return build(*args)
+    key = (char_id, panel)
+    cached = _panels.get(key)
+    if cached is not None and cached[0] == signature:
+        _stats["panel_hits"] += 1
+        return cached[1]
+    _stats["panel_misses"] += 1
+    if cached is None and len(_panels) >= PANEL_CACHE_SIZE:
+        _panels.clear()
+    text = build(*args)
+    _panels[key] = (signature, text)
+    return text
+
+
+# =============================================================================
+# Stats
+# =============================================================================
+
+def get_display_cache_stats():
+    """Hit/miss counters and sizes of the bar and panel caches."""
+    stats = dict(_stats)
+    stats["bars_cached"] = len(_bars)
+    stats["panels_cached"] = len(_panels)
+    return stats
+
+
+def clear_display_cache():
+    """Drop all cached bars and panels and reset the counters."""
+    _bars.clear()
+    _panels.clear()
+    for key in _stats:
+        _stats[key] = 0
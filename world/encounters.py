@@ -3,12 +3,22 @@ Encounter System for Gilderhaven
 
 Handles random encounters, multi-wave combat, area danger levels,
 and integration with the party system.
+
+Encounter creatures are ephemeral: spawn_creature() hands out a pooled,
+in-memory Creature built from CREATURE_TEMPLATES, which CombatInstance
+fights like any character without touching the database. Deleting one
+returns it to the pool for the next wave. A befriended creature is only
+promoted to a persistent Character when its template sets
+"persist_on_befriend" (pets, quest targets); others just leave.
 """
 
-from random import random, randint, choice, shuffle
+from random import randint
 from evennia import create_object
 from evennia.utils import delay
 
+from world.parties import MAX_PARTY_SIZE, get_party_members
+from world.sampling import compile_tiers, get_rng
+
 # =============================================================================
 # ENCOUNTER CONFIGURATION
 # =============================================================================
@@ -262,6 +272,18 @@ AREA_ENCOUNTERS = {
 }
 
 
+# area_key -> (AREA_ENCOUNTERS entry, AliasTable)
+_encounter_samplers = {}
+
+
+def _party_mult(party_size):
+    return 0.8 + party_size * 0.05
+
+
+# Highest chance multiplier any party size can give
+_MAX_PARTY_MULT = max(1.0, _party_mult(MAX_PARTY_SIZE))
+
+
 # =============================================================================
 # Encounter State Machine
 # =============================================================================
@@ -291,8 +313,8 @@ class Encounter:
         self.total_waves = self.template.get("waves", 1)
         self.active = True
         self.combat = None
-        self.spawned_creatures = []
-        self.defeated_creatures = []
+        self.spawned_creatures = []  # creatures out in the current wave
+        self.defeated_creatures = []  # creature types beaten so far
         self.loot_pool = []
         self.exp_pool = 0
         
@@ -400,22 +422,22 @@ class Encounter:
         # Collect loot from defeated creatures
         from world.creatures import get_loot_drops, get_creature_exp
         
+        # Creatures are recycled between waves, so only their types are kept
         for creature in self.spawned_creatures:
-            if creature not in self.defeated_creatures:
-                self.defeated_creatures.append(creature)
-                
-                # Get creature type
-                creature_key = creature.db.creature_type if hasattr(creature, "db") else None
-                if creature_key:
-                    # Add loot
-                    drops = get_loot_drops(creature_key)
-                    self.loot_pool.extend(drops)
-                    
-                    # Add exp
-                    self.exp_pool += get_creature_exp(creature_key)
+            # Get creature type
+            creature_key = creature.db.creature_type if hasattr(creature, "db") else None
+            self.defeated_creatures.append(creature_key)
+            if creature_key:
+                # Add loot
+                drops = get_loot_drops(creature_key)
+                self.loot_pool.extend(drops)
                 
-                # Clean up creature object
-                creature.delete()
+                # Add exp
+                self.exp_pool += get_creature_exp(creature_key)
+            
+            # Back to the pool for the next wave
+            creature.delete()
+        self.spawned_creatures = []
         
         # Check for next wave
         if self.current_wave < self.total_waves:
@@ -479,11 +501,6 @@ class Encounter:
         for char in self.participants:
             char.msg(f"|r=== DEFEAT ===|n")
         
-        # Cleanup spawned creatures
-        for creature in self.spawned_creatures:
-            if creature not in self.defeated_creatures:
-                creature.delete()
-        
         self.cleanup()
     
     def flee(self, character):
@@ -507,6 +524,11 @@ class Encounter:
     
     def cleanup(self):
         """Clean up encounter references."""
+        # Return any creatures still out to the pool
+        for creature in self.spawned_creatures:
+            creature.delete()
+        self.spawned_creatures = []
+        
         # Unlink from location
         if self.location and hasattr(self.location, "ndb"):
             self.location.ndb.encounter = None
@@ -517,6 +539,251 @@ class Encounter:
                 char.ndb.encounter = None
 
 
+# =============================================================================
+# Creature Pool
+# =============================================================================
+
+# Idle creatures kept per creature type
+CREATURE_POOL_SIZE = 16
+
+# creature_key -> [idle Creature]
+_creature_pool = {}
+
+# creature_key -> (template dict, stats dict)
+_creature_stats = {}
+
+_pool_stats = {
+    "created": 0,
+    "reused": 0,
+    "promoted": 0,
+}
+
+
+class _SlotNamespace:
+    """Attribute namespace with slotted common fields; unset names read as None."""
+    
+    __slots__ = ("_extra",)
+    
+    def __init__(self):
+        object.__setattr__(self, "_extra", {})
+    
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return self._extra.get(name)
+    
+    def __setattr__(self, name, value):
+        try:
+            object.__setattr__(self, name, value)
+        except AttributeError:
+            self._extra[name] = value
+    
+    def clear(self):
+        for name in self.__slots__:
+            try:
+                object.__delattr__(self, name)
+            except AttributeError:
+                pass
+        self._extra.clear()
+
+
+class CreatureDB(_SlotNamespace):
+    """Stands in for creature.db with the fields combat reads and writes."""
+    
+    __slots__ = ("is_npc", "creature_type", "resources", "attributes",
+                 "combat_skills", "combat_skill_exp", "equipment",
+                 "befriendable", "befriend_difficulty", "persist_on_befriend", "desc")
+
+
+class CreatureNDB(_SlotNamespace):
+    """Stands in for creature.ndb."""
+    
+    __slots__ = ("combat", "encounter")
+
+
+class Creature:
+    """
+    An in-memory encounter combatant.
+    
+    Looks enough like a Character for CombatInstance (key, db, ndb, msg)
+    but has no database row and is not in its room's contents. delete()
+    returns it to the pool; promote() makes a persistent Character of it.
+    """
+    
+    __slots__ = ("key", "creature_type", "location", "db", "ndb", "pooled", "promoted")
+    
+    id = None
+    pk = None
+    
+    def __init__(self):
+        self.key = None
+        self.creature_type = None
+        self.location = None
+        self.db = CreatureDB()
+        self.ndb = CreatureNDB()
+        self.pooled = False
+        self.promoted = None
+    
+    def __repr__(self):
+        return f"<Creature {self.creature_type} '{self.key}'>"
+    
+    def reset(self, creature_key, template, stats, location):
+        """Fill in a fresh copy of a creature type's combat state."""
+        self.key = template["name"]
+        self.creature_type = creature_key
+        self.location = location
+        self.pooled = False
+        self.promoted = None
+        self.ndb.clear()
+        
+        db = self.db
+        db.clear()
+        db.is_npc = True
+        db.creature_type = creature_key
+        db.resources = {
+            "hp": stats["max_hp"],
+            "stamina": stats["max_stamina"],
+            "composure": stats["max_composure"],
+        }
+        # Combat mutates these, so each creature gets its own copies
+        db.attributes = dict(stats["attributes"])
+        db.combat_skills = dict(stats["skills"])
+        db.befriendable = template.get("befriendable", False)
+        db.befriend_difficulty = template.get("befriend_difficulty", 20)
+        db.persist_on_befriend = template.get("persist_on_befriend", False)
+        db.desc = template.get("desc", "A creature.")
+    
+    def msg(self, *args, **kwargs):
+        pass
+    
+    def get_display_name(self, looker=None, **kwargs):
+        return self.key
+    
+    def promote(self, befriender=None):
+        """Make a persistent Character of this creature (see promote_creature)."""
+        return promote_creature(self, befriender)
+    
+    def delete(self):
+        """Return the creature to the pool."""
+        release_creature(self)
+        return True
+
+
+def _get_creature_stats(creature_key):
+    """Computed stats for a creature type, recomputed if its template changes."""
+    from world.creatures import get_creature_template, get_creature_stats
+    
+    template = get_creature_template(creature_key)
+    if not template:
+        return None, None
+    cached = _creature_stats.get(creature_key)
+    if cached and cached[0] is template:
+        return cached
+    cached = _creature_stats[creature_key] = (template, get_creature_stats(creature_key))
+    return cached
+
+
+def acquire_creature(creature_key, location):
+    """
+    Take a creature from the pool, or build one if the pool is empty.
+    
+    Args:
+        creature_key: Key from CREATURE_TEMPLATES
+        location: Room the creature is fighting in
+    
+    Returns:
+        Creature or None if the creature type is unknown
+    """
+    template, stats = _get_creature_stats(creature_key)
+    if not template:
+        return None
+    
+    idle = _creature_pool.get(creature_key)
+    if idle:
+        creature = idle.pop()
+        _pool_stats["reused"] += 1
+    else:
+        creature = Creature()
+        _pool_stats["created"] += 1
+    
+    creature.reset(creature_key, template, stats, location)
+    return creature
+
+
+def release_creature(creature):
+    """Unlink a creature from its fight and return it to the pool."""
+    if creature.pooled:
+        return
+    creature.pooled = True
+    creature.location = None
+    creature.ndb.clear()
+    
+    idle = _creature_pool.setdefault(creature.creature_type, [])
+    if len(idle) < CREATURE_POOL_SIZE:
+        idle.append(creature)
+
+
+def promote_creature(creature, befriender=None):
+    """
+    Create a persistent Character from an ephemeral creature.
+    
+    Only for creatures something keeps track of afterwards (pets, quest
+    targets); combat calls this on befriend only when the template sets
+    "persist_on_befriend". The new object keeps the creature's current
+    resources and skills. The creature itself stays in its fight and is
+    pooled as usual.
+    
+    Args:
+        creature: Creature to promote
+        befriender: Character who befriended it, if any
+    
+    Returns:
+        Object: The persistent creature (the same one on repeat calls)
+    """
+    if creature.promoted is not None:
+        return creature.promoted
+    
+    db = creature.db
+    attributes = [
+        ("is_npc", True),
+        ("creature_type", creature.creature_type),
+        ("resources", dict(db.resources)),
+        ("attributes", dict(db.attributes)),
+        ("combat_skills", dict(db.combat_skills)),
+        ("befriendable", db.befriendable),
+        ("befriend_difficulty", db.befriend_difficulty),
+        ("desc", db.desc),
+    ]
+    if befriender is not None:
+        attributes.append(("befriended_by", befriender))
+    
+    creature.promoted = create_object(
+        "typeclasses.characters.Character",
+        key=creature.key,
+        location=creature.location,
+        attributes=attributes,
+    )
+    _pool_stats["promoted"] += 1
+    return creature.promoted
+
+
+def clear_creature_pool(creature_key=None):
+    """Drop idle pooled creatures, for one creature type or all of them."""
+    if creature_key is None:
+        _creature_pool.clear()
+        _creature_stats.clear()
+    else:
+        _creature_pool.pop(creature_key, None)
+        _creature_stats.pop(creature_key, None)
+
+
+def get_creature_pool_stats():
+    """Pool counters plus the number of idle creatures held."""
+    stats = dict(_pool_stats)
+    stats["pooled"] = sum(len(idle) for idle in _creature_pool.values())
+    return stats
+
+
 # =============================================================================
 # Helper Functions
 # =============================================================================
@@ -542,13 +809,32 @@ def get_room_danger(room):
     return DANGER_LEVELS.get(DEFAULT_DANGER)
 
 
-def check_random_encounter(character, room):
+def _get_encounter_sampler(area_key):
+    """Compiled encounter table for an area, or None."""
+    table = AREA_ENCOUNTERS.get(area_key)
+    if not table:
+        return None
+    cached = _encounter_samplers.get(area_key)
+    if not cached or cached[0] is not table:
+        cached = _encounter_samplers[area_key] = (table, compile_tiers(table))
+    return cached[1]
+
+
+def compile_encounter_tables():
+    """(Re)compile every area encounter table now rather than on first use."""
+    _encounter_samplers.clear()
+    for area_key in AREA_ENCOUNTERS:
+        _get_encounter_sampler(area_key)
+
+
+def check_random_encounter(character, room, rng=None):
     """
     Check if a random encounter triggers when entering a room.
     
     Args:
         character: The character entering
         room: The room being entered
+        rng: Random generator (defaults to the shared sampling RNG)
         
     Returns:
         str or None: Encounter template key or None
@@ -558,102 +844,51 @@ def check_random_encounter(character, room):
         if character.ndb.encounter or character.ndb.combat:
             return None
     
+    # Get area encounter table
+    area_key = room.db.area if hasattr(room, "db") else None
+    table = _get_encounter_sampler(area_key)
+    if not table:
+        return None
+    
     # Get danger level
     danger = get_room_danger(room)
     
     # Calculate encounter chance
     encounter_mult = danger.get("encounter_mult", 1.0)
     encounter_chance = BASE_ENCOUNTER_CHANCE * encounter_mult
-    
-    # Party size modifier (slightly reduced chance for parties)
-    from world.parties import get_party_members
-    party_size = len(get_party_members(character))
-    if party_size > 1:
-        encounter_chance *= (0.8 + party_size * 0.05)  # Slight increase for larger parties
-    
-    # Roll for encounter
-    if random() > encounter_chance:
+    if encounter_chance <= 0:
         return None
     
-    # Get area encounter table
-    area_key = room.db.area if hasattr(room, "db") else None
-    encounter_table = AREA_ENCOUNTERS.get(area_key)
-    
-    if not encounter_table:
-        return None
-    
-    # Roll for encounter rarity
-    weights = encounter_table.get("weights", {})
-    roll = random()
-    cumulative = 0
-    selected_tier = None
-    
-    for tier in ["rare", "uncommon", "common"]:
-        cumulative += weights.get(tier, 0)
-        if roll < cumulative:
-            selected_tier = tier
-            break
-    
-    if not selected_tier:
+    # Roll for encounter. Party size can raise the chance by at most
+    # _MAX_PARTY_MULT, so most misses never need the party lookup.
+    rng = rng or get_rng()
+    roll = rng.random()
+    if roll > encounter_chance * _MAX_PARTY_MULT:
         return None
     
-    # Get encounters from tier
-    encounters = encounter_table.get(selected_tier, [])
-    if not encounters:
-        # Fall back to lower tiers
-        for tier in ["common", "uncommon", "rare"]:
-            encounters = encounter_table.get(tier, [])
-            if encounters:
-                break
+    # Party size modifier (slightly reduced chance for parties)
+    party_size = len(get_party_members(character))
+    if party_size > 1:
+        encounter_chance *= _party_mult(party_size)  # Slight increase for larger parties
     
-    if not encounters:
+    if roll > encounter_chance:
         return None
     
-    return choice(encounters)
+    return table.sample(rng)
 
 
 def spawn_creature(creature_key, location):
     """
-    Spawn a creature object.
+    Spawn an encounter creature.
     
     Args:
         creature_key: Key from CREATURE_TEMPLATES
         location: Room to spawn in
         
     Returns:
-        Character object or None
+        Creature (pooled, in-memory) or None
     """
-    from world.creatures import get_creature_template, get_creature_stats
-    
-    template = get_creature_template(creature_key)
-    if not template:
-        return None
-    
-    # Create creature
-    creature = create_object(
-        "typeclasses.characters.Character",
-        key=template["name"],
-        location=location,
-    )
-    
-    # Set up stats
-    stats = get_creature_stats(creature_key)
-    creature.db.is_npc = True
-    creature.db.creature_type = creature_key
-    creature.db.resources = {
-        "hp": stats["max_hp"],
-        "stamina": stats["max_stamina"],
-        "composure": stats["max_composure"],
-    }
-    creature.db.attributes = stats["attributes"]
-    creature.db.combat_skills = stats["skills"]
-    creature.db.befriendable = template.get("befriendable", False)
-    creature.db.befriend_difficulty = template.get("befriend_difficulty", 20)
-    
-    # Set description
-    creature.db.desc = template.get("desc", "A creature.")
-    
-    return creature
+    return acquire_creature(creature_key, location)
 
 
 def trigger_encounter(character, encounter_key, force=False):
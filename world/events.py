@@ -0,0 +1,226 @@
+"""
+World Event Bus for Gilderhaven
+================================
+
+In-process publish/subscribe for world-state transitions.
+
+Instead of a system scanning every room or NPC when something changes,
+interested parties subscribe to a topic and the publisher hands each
+event to exactly those subscribers in one dispatch pass.
+
+Topics are typed: each one declares the fields its events carry, and
+publishing an unknown topic or leaving out a field is an error.
+
+Subscriptions have a scope:
+- global: every event on the topic
+- area:   events published for that area (a room's zone)
+- room:   events published for that room
+
+An event published for a room reaches that room's subscribers, its
+area's subscribers and the global ones. An event published with no room
+or area (the clock changing period, say) is world-wide and reaches
+every subscriber of the topic.
+
+Subscriptions live in process memory only; register them at import or
+startup.
+
+Usage:
+    from world.events import subscribe, publish, ROOM_ENTERED
+
+    def on_enter(event):
+        event.obj.msg(f"Welcome to {event.room.key}.")
+
+    subscribe(ROOM_ENTERED, on_enter, room=garden)
+    publish(ROOM_ENTERED, room=garden, area="grove", obj=char, source=None)
+"""
+
+from evennia.utils import logger
+
+
+# =============================================================================
+# Topics
+# =============================================================================
+
+PERIOD_CHANGED = "period_changed"
+WEATHER_CHANGED = "weather_changed"
+SEASON_CHANGED = "season_changed"
+ROOM_ENTERED = "room_entered"
+ROOM_LEFT = "room_left"
+ITEM_CRAFTED = "item_crafted"
+OBJECT_DELETED = "object_deleted"
+
+# topic -> fields every event on it must carry
+TOPICS = {
+    # old/new are TIME_PERIODS names, old_time_period/time_period the
+    # six-period room names; either pair may be unchanged.
+    PERIOD_CHANGED: ("old", "new", "old_time_period", "time_period"),
+    WEATHER_CHANGED: ("old", "new"),
+    SEASON_CHANGED: ("old", "new"),
+    ROOM_ENTERED: ("obj", "source"),
+    ROOM_LEFT: ("obj", "destination"),
+    ITEM_CRAFTED: ("crafter", "recipe", "items", "quality"),
+    # Published world-wide just before a Gilderhaven object or room is
+    # deleted, for registries keyed by its id
+    OBJECT_DELETED: ("obj",),
+}
+
+
+def register_topic(topic, fields=()):
+    """Declare a new topic and the fields its events carry."""
+    TOPICS[topic] = tuple(fields)
+
+
+# =============================================================================
+# Events
+# =============================================================================
+
+class Event:
+    """One published event. Payload fields read as attributes."""
+
+    __slots__ = ("topic", "room", "area", "data")
+
+    def __init__(self, topic, room=None, area=None, data=None):
+        self.topic = topic
+        self.room = room
+        self.area = area
+        self.data = data or {}
+
+    def __getattr__(self, name):
+        try:
+            return self.data[name]
+        except KeyError:
+            raise AttributeError(name)
+
+    def get(self, key, default=None):
+        return self.data.get(key, default)
+
+
+# =============================================================================
+# Subscriptions
+# =============================================================================
+
+# topic -> {"global": [callback], "area": {area: [callback]}, "room": {room id: [callback]}}
+_subscribers = {}
+
+
+def _topic_index(topic):
+    if topic not in TOPICS:
+        raise ValueError(f"Unknown event topic: {topic}")
+    index = _subscribers.get(topic)
+    if index is None:
+        index = _subscribers[topic] = {"global": [], "area": {}, "room": {}}
+    return index
+
+
+def _scope_list(index, room=None, area=None, create=True):
+    if room is not None:
+        scoped, key = index["room"], room.id
+    elif area:
+        scoped, key = index["area"], area
+    else:
+        return index["global"]
+    if create:
+        return scoped.setdefault(key, [])
+    return scoped.get(key, [])
+
+
+def subscribe(topic, callback, room=None, area=None):
+    """
+    Subscribe to a topic.
+
+    Args:
+        topic: Topic name (see TOPICS)
+        callback: Called as callback(event)
+        room: Only receive events for this room
+        area: Only receive events for this area
+    """
+    callbacks = _scope_list(_topic_index(topic), room, area)
+    if callback not in callbacks:
+        callbacks.append(callback)
+
+
+def unsubscribe(topic, callback, room=None, area=None):
+    """Remove a subscription made with the same arguments."""
+    index = _subscribers.get(topic)
+    if not index:
+        return
+    callbacks = _scope_list(index, room, area, create=False)
+    if callback in callbacks:
+        callbacks.remove(callback)
+
+
+def unsubscribe_room(room):
+    """Drop every room-scoped subscription for a room."""
+    for index in _subscribers.values():
+        index["room"].pop(room.id, None)
+
+
+def get_subscriber_count(topic=None):
+    """Number of subscriptions, for one topic or all of them."""
+    topics = [topic] if topic else list(_subscribers)
+    total = 0
+    for name in topics:
+        index = _subscribers.get(name)
+        if not index:
+            continue
+        total += len(index["global"])
+        total += sum(len(cbs) for cbs in index["area"].values())
+        total += sum(len(cbs) for cbs in index["room"].values())
+    return total
+
+
+# =============================================================================
+# Publishing
+# =============================================================================
+
+def publish(topic, room=None, area=None, **data):
+    """
+    Publish an event to the subscribers in its scope.
+
+    Args:
+        topic: Topic name (see TOPICS)
+        room: Room the event happened in, if any
+        area: Area the event happened in (defaults to the room's zone)
+        **data: The topic's fields
+
+    Returns:
+        int: Number of subscribers called
+    """
+    fields = TOPICS.get(topic)
+    if fields is None:
+        raise ValueError(f"Unknown event topic: {topic}")
+    missing = [field for field in fields if field not in data]
+    if missing:
+        raise ValueError(f"Event {topic} missing fields: {', '.join(missing)}")
+
+    index = _subscribers.get(topic)
+    if not index:
+        return 0
+
+    if room is not None and area is None:
+        area = getattr(room, "zone", None)
+
+    if room is None and not area:
+        # World-wide: every scope hears it
+        callbacks = list(index["global"])
+        for scoped in index["area"].values():
+            callbacks.extend(scoped)
+        for scoped in index["room"].values():
+            callbacks.extend(scoped)
+    else:
+        callbacks = list(index["global"])
+        if area:
+            callbacks.extend(index["area"].get(area, ()))
+        if room is not None:
+            callbacks.extend(index["room"].get(room.id, ()))
+
+    if not callbacks:
+        return 0
+
+    event = Event(topic, room, area, data)
+    for callback in callbacks:
+        try:
+            callback(event)
+        except Exception as e:
+            logger.log_err(f"Event subscriber for {topic} failed: {e}")
+    return len(callbacks)
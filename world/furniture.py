@@ -14,7 +14,7 @@ Data Storage (on furniture object):
         "effects": {...},
         "flags": ["adult", "bondage"],
     }
-    furniture.db.occupants = {"left": char_id, ...}
+    furniture.db.occupants = {"left": char_id, ...}  # see world.positions
     furniture.db.owner_id = 123
     furniture.db.placed_in = room_id
 
@@ -945,8 +945,9 @@ def use_furniture(character, furniture, slot=None, position="seated"):
     if capacity <= 0:
         return False, f"You can't sit on {furniture.key}."
     
-    current_occupants = len(furniture.db.occupants or {})
-    if current_occupants >= capacity:
+    from world.positions import get_occupancy
+    occupants = get_occupancy(furniture)
+    if len(occupants) >= capacity:
         return False, f"{furniture.key} is full."
     
     # Determine slot
@@ -954,13 +955,13 @@ def use_furniture(character, furniture, slot=None, position="seated"):
     if slot:
         if slot not in available_slots:
             return False, f"Invalid slot. Available: {', '.join(available_slots)}"
-        if slot in (furniture.db.occupants or {}):
+        if slot in occupants:
             return False, f"That spot is taken."
     else:
         # Find first available slot
         slot = None
         for s in available_slots:
-            if s not in (furniture.db.occupants or {}):
+            if s not in occupants:
                 slot = s
                 break
         if not slot:
@@ -1018,16 +1019,13 @@ def get_occupants(furniture):
     Returns:
         list: Character objects
     """
-    occupants = furniture.db.occupants or {}
-    result = []
+    from world.positions import get_occupancy, _get_character
     
-    for slot, char_id in occupants.items():
-        try:
-            from evennia.objects.models import ObjectDB
-            char = ObjectDB.objects.get(id=char_id)
+    result = []
+    for char_id in get_occupancy(furniture).values():
+        char = _get_character(char_id)
+        if char:
             result.append(char)
-        except:
-            pass
     
     return result
 
@@ -1042,9 +1040,11 @@ def get_available_slots(furniture):
     Returns:
         list: Available slot names
     """
+    from world.positions import get_occupancy
+    
     data = furniture.db.furniture_data or {}
     all_slots = data.get("slots", ["default"])
-    occupied = furniture.db.occupants or {}
+    occupied = get_occupancy(furniture)
     
     return [s for s in all_slots if s not in occupied]
 
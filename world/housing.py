@@ -16,12 +16,27 @@ Architecture:
 - Additional rooms connect to the foyer or each other
 - Players teleport home via command
 
-Data stored on rooms and characters via .db attributes.
+Homes are stored as compact HomeRecords: the home type plus whatever
+differs from its HOME_TYPES template (name, rooms added, upgrades,
+permissions, custom descriptions). Records are Attributes on the
+HomeRegistry script and are indexed by owner in memory, so finding
+someone's home needs no database search.
+
+Rooms exist only while needed. materialize_home() builds a home's rooms
+from its record when someone goes in; once a home has been empty for
+HOME_IDLE_TIMEOUT the HomeRegistry script packs it away again, keeping
+the objects that were inside to put back next time. A character who
+logged out inside a home still counts as being in it, so they wake up
+where they went to sleep.
 No modifications to Character.py required.
 """
 
+import time
+
+from evennia.scripts.scripts import DefaultScript
+from evennia.utils import logger
 from evennia.utils.create import create_object
-from evennia.utils.search import search_object
+from evennia.utils.search import search_object, search_tag
 from world.currency import balance, pay, receive
 
 # =============================================================================
@@ -246,6 +261,443 @@ UPGRADES = {
     },
 }
 
+# Seconds a materialised home can sit empty before it is packed away
+HOME_IDLE_TIMEOUT = 600
+
+# Seconds between idle checks by the HomeRegistry script
+HOME_CHECK_INTERVAL = 120
+
+# Home records are Attributes on the HomeRegistry script in this
+# category, keyed by owner id
+HOME_CATEGORY = "home"
+
+# Characters who logged out inside a home are tagged with its owner id
+# in this category; the home is not packed away while they are offline
+HOME_SLEEPER_CATEGORY = "home_sleeper"
+
+HOME_ROOM_TYPECLASS = "typeclasses.rooms.Room"
+HOME_EXIT_TYPECLASS = "typeclasses.exits.Exit"
+
+
+# =============================================================================
+# HOME RECORDS
+# =============================================================================
+
+class HomeRecord:
+    """
+    Everything about one home that isn't in its HOME_TYPES template.
+    
+    rooms holds one [room_type, custom_desc] pair per room; the foyer is
+    first with room_type None. room_ids are the live rooms in the same
+    order while the home is materialised, and stored the ids of the
+    objects that were in each room when it was packed away.
+    """
+    
+    __slots__ = (
+        "owner_id", "owner_name", "home_type", "home_name", "locked",
+        "permissions", "visitors", "upgrades", "rooms", "room_ids", "stored",
+    )
+    
+    def __init__(self, owner_id, owner_name, home_type="tent", home_name=None,
+                 locked=True, permissions=None, visitors=None, upgrades=None,
+                 rooms=None, room_ids=None, stored=None):
+        self.owner_id = owner_id
+        self.owner_name = owner_name
+        self.home_type = home_type
+        self.home_name = home_name
+        self.locked = locked
+        self.permissions = permissions or {
+            "residents": [],
+            "trusted": [],
+            "guests": [],
+            "banned": [],
+        }
+        self.visitors = visitors or []
+        self.upgrades = upgrades or []
+        self.rooms = rooms or [[None, None]]
+        self.room_ids = room_ids or []
+        self.stored = stored or []
+    
+    def to_record(self):
+        """Compact tuple stored in the Attribute."""
+        return (
+            self.owner_id, self.owner_name, self.home_type, self.home_name,
+            self.locked, self.permissions, self.visitors, self.upgrades,
+            self.rooms, self.room_ids, self.stored,
+        )
+    
+    @classmethod
+    def from_record(cls, record):
+        (owner_id, owner_name, home_type, home_name, locked, permissions,
+         visitors, upgrades, rooms, room_ids, stored) = record
+        return cls(
+            owner_id, owner_name, home_type, home_name, locked,
+            {level: list(ids) for level, ids in dict(permissions).items()},
+            list(visitors), list(upgrades), [list(room) for room in rooms],
+            list(room_ids), [list(ids) for ids in stored],
+        )
+    
+    @property
+    def template(self):
+        return HOME_TYPES.get(self.home_type, HOME_TYPES["tent"])
+    
+    def _upgrade_total(self, bonus):
+        return sum(UPGRADES.get(key, {}).get(bonus, 0) for key in self.upgrades)
+    
+    @property
+    def furniture_slots(self):
+        return self.template["furniture_slots"] + self._upgrade_total("furniture_bonus")
+    
+    @property
+    def storage_slots(self):
+        return self.template["storage_slots"] + self._upgrade_total("storage_bonus")
+    
+    @property
+    def max_rooms(self):
+        return self.template["max_rooms"]
+    
+    @property
+    def features(self):
+        features = list(self.template["features"])
+        for key in self.upgrades:
+            feature = UPGRADES.get(key, {}).get("feature")
+            if feature and feature not in features:
+                features.append(feature)
+        return features
+    
+    @property
+    def is_live(self):
+        return bool(self.room_ids)
+
+
+# owner id -> HomeRecord, loaded from the registry on first use
+_homes = None
+
+# live room id -> owner id
+_room_homes = {}
+
+# owner id -> time.time() a live home was first seen empty
+_empty_since = {}
+
+# owner id -> {character id: permission level}, compiled on first check
+_permission_maps = {}
+
+# owner ids of homes whose owner is in one of its live rooms
+_owner_present = set()
+
+_registry_script = None
+
+
+class HomeRegistry(DefaultScript):
+    """Global script holding every home record; packs away idle homes."""
+    
+    def at_script_creation(self):
+        self.key = "HomeRegistry"
+        self.desc = "Player home records and idle home cleanup"
+        self.interval = HOME_CHECK_INTERVAL
+        self.persistent = True
+    
+    def at_repeat(self):
+        dematerialize_idle_homes()
+
+
+def _get_registry():
+    global _registry_script
+    if _registry_script is None:
+        from evennia import search_script, create_script
+        found = search_script("HomeRegistry", typeclass="world.housing.HomeRegistry")
+        if found:
+            _registry_script = found[0]
+        else:
+            _registry_script = create_script(
+                "world.housing.HomeRegistry", key="HomeRegistry", persistent=True
+            )
+    return _registry_script
+
+
+def start_home_registry():
+    """
+    Ensure the HomeRegistry script exists and load the home index.
+    Called from at_server_start, so live homes track their owner again
+    straight after a reload.
+    """
+    try:
+        _get_index()
+    except Exception as e:
+        logger.log_err(f"Failed to start HomeRegistry: {e}")
+
+
+def _index_home(home):
+    _homes[home.owner_id] = home
+    for room_id in home.room_ids:
+        _room_homes[room_id] = home.owner_id
+
+
+def _get_index():
+    global _homes
+    if _homes is None:
+        _homes = {}
+        attrs = _get_registry().attributes.get(
+            category=HOME_CATEGORY, return_list=True, return_obj=True
+        ) or []
+        for attr in attrs:
+            if attr is not None:
+                _index_home(HomeRecord.from_record(attr.value))
+        for home in _homes.values():
+            if home.room_ids:
+                _watch_home(home)
+    return _homes
+
+
+def save_home(home):
+    """Write one home's record."""
+    _get_registry().attributes.add(str(home.owner_id), home.to_record(), category=HOME_CATEGORY)
+    _index_home(home)
+
+
+def clear_home_cache():
+    """Forget the in-memory index; it reloads from the registry on next use."""
+    global _homes, _registry_script
+    _homes = None
+    _registry_script = None
+    _room_homes.clear()
+    _empty_since.clear()
+    _permission_maps.clear()
+    _owner_present.clear()
+
+
+def migrate_home_room(character):
+    """
+    Turn an old room-based home (character.db.home_id) into a record.
+    
+    The existing rooms become the home's live instance, so nothing in
+    them moves.
+    """
+    home_id = character.db.home_id
+    results = search_object("#" + str(home_id))
+    character.attributes.remove("home_id")
+    character.attributes.remove("owned_rooms")
+    if not results:
+        return None
+    foyer = results[0]
+    
+    home = HomeRecord(
+        character.id, character.key,
+        home_type=foyer.db.home_type or "tent",
+        home_name=foyer.db.home_name or foyer.key,
+        locked=foyer.db.locked if foyer.db.locked is not None else True,
+        permissions=dict(foyer.db.permissions or {}),
+        visitors=list(foyer.db.visitors_allowed or []),
+        upgrades=list(foyer.db.upgrades or []),
+        rooms=[[None, foyer.db.custom_desc]],
+        room_ids=[foyer.id],
+    )
+    for room_id in foyer.db.connected_rooms or []:
+        found = search_object("#" + str(room_id))
+        if found:
+            home.rooms.append([found[0].db.room_type, found[0].db.custom_desc])
+            home.room_ids.append(room_id)
+    
+    save_home(home)
+    _watch_home(home)
+    logger.log_info(f"Migrated home of {character.key} to a home record.")
+    return home
+
+
+# =============================================================================
+# INSTANCES
+# =============================================================================
+
+def _load_rooms(room_ids):
+    """Rooms by id in one query, using cached instances where possible."""
+    from evennia.objects.models import ObjectDB
+    
+    found = {}
+    missing = []
+    for room_id in room_ids:
+        room = ObjectDB.get_cached_instance(room_id)
+        if room is None:
+            missing.append(room_id)
+        else:
+            found[room_id] = room
+    if missing:
+        for room in ObjectDB.objects.filter(id__in=missing):
+            found[room.id] = room
+    return [found.get(room_id) for room_id in room_ids]
+
+
+def _create_home_room(home, index, foyer=None):
+    """Build one room of a home and, for added rooms, its exits."""
+    room_type, custom_desc = home.rooms[index]
+    locks = f"control:id({home.owner_id}) or perm(Admin)"
+    
+    if foyer is None:
+        room = create_object(typeclass=HOME_ROOM_TYPECLASS, key=home.home_name, locks=locks)
+        room.db.is_home = True
+        room.db.owner_id = home.owner_id
+        room.db.furniture_slots = home.furniture_slots
+        room.db.desc = custom_desc or home.template["desc"]
+        return room
+    
+    room_info = ROOM_TYPES.get(room_type, ROOM_TYPES["custom"])
+    room = create_object(
+        typeclass=HOME_ROOM_TYPECLASS,
+        key=f"{home.home_name} - {room_info['name']}",
+        locks=locks,
+    )
+    room.db.is_home = True
+    room.db.is_home_room = True  # Sub-room, not foyer
+    room.db.parent_home_id = foyer.id
+    room.db.room_type = room_type
+    room.db.owner_id = home.owner_id
+    room.db.furniture_slots = room_info["furniture_slots"]
+    room.db.features = list(room_info.get("features", []))
+    room.db.desc = custom_desc or room_info["desc"]
+    
+    # Entry is controlled at the home level, so the exits are open
+    create_object(
+        typeclass=HOME_EXIT_TYPECLASS,
+        key=room_info["name"].lower(),
+        aliases=[room_type],
+        location=foyer,
+        destination=room,
+        locks="traverse:all()"
+    )
+    create_object(
+        typeclass=HOME_EXIT_TYPECLASS,
+        key="foyer",
+        aliases=["back", "main", "out"],
+        location=room,
+        destination=foyer,
+        locks="traverse:all()"
+    )
+    return room
+
+
+def materialize_home(home):
+    """
+    Get a home's foyer, building its rooms from the record if needed.
+    
+    Objects stored when the home was packed away go back where they
+    were.
+    
+    Returns:
+        Room object (the foyer)
+    """
+    if home.room_ids:
+        foyer = _load_rooms(home.room_ids[:1])[0]
+        if foyer is not None:
+            return foyer
+        # Someone deleted the live foyer; start over from the record
+        for room_id in home.room_ids:
+            _room_homes.pop(room_id, None)
+        _owner_present.discard(home.owner_id)
+        home.room_ids = []
+    
+    foyer = _create_home_room(home, 0)
+    rooms = [foyer]
+    for index in range(1, len(home.rooms)):
+        rooms.append(_create_home_room(home, index, foyer))
+    
+    stored_ids = [obj_id for ids in home.stored for obj_id in ids]
+    if stored_ids:
+        from evennia.objects.models import ObjectDB
+        stored_objects = {obj.id: obj for obj in ObjectDB.objects.filter(id__in=stored_ids)}
+        for room, ids in zip(rooms, home.stored):
+            for obj_id in ids:
+                obj = stored_objects.get(obj_id)
+                if obj is not None:
+                    obj.location = room
+    
+    home.room_ids = [room.id for room in rooms]
+    home.stored = []
+    save_home(home)
+    _watch_home(home, rooms)
+    return foyer
+
+
+def _is_occupied(rooms):
+    from evennia.objects.objects import DefaultCharacter
+    return any(
+        isinstance(obj, DefaultCharacter)
+        for room in rooms if room is not None
+        for obj in room.contents
+    )
+
+
+def _has_sleepers(home):
+    """Whether a character logged out inside the home and hasn't returned."""
+    return search_tag(str(home.owner_id), category=HOME_SLEEPER_CATEGORY).exists()
+
+
+def dematerialize_home(home):
+    """
+    Pack a live home back into its record and delete its rooms.
+    
+    Objects in the rooms are kept, out of the world, and restored by
+    materialize_home. Homes with a character inside, or one who logged
+    out inside, are left alone.
+    
+    Returns:
+        bool: True if the home was packed away
+    """
+    if not home.room_ids:
+        return False
+    rooms = _load_rooms(home.room_ids)
+    if _is_occupied(rooms) or _has_sleepers(home):
+        return False
+    
+    stored = []
+    for room in rooms:
+        ids = []
+        if room is not None:
+            for obj in list(room.contents):
+                if obj.destination:
+                    continue  # Exits are rebuilt with the rooms
+                obj.location = None
+                ids.append(obj.id)
+        stored.append(ids)
+    
+    for room in rooms:
+        if room is not None:
+            _unwatch_room(room)
+            room.delete()
+    
+    for room_id in home.room_ids:
+        _room_homes.pop(room_id, None)
+    _empty_since.pop(home.owner_id, None)
+    _owner_present.discard(home.owner_id)
+    home.room_ids = []
+    home.stored = stored
+    save_home(home)
+    return True
+
+
+def dematerialize_idle_homes(timeout=HOME_IDLE_TIMEOUT):
+    """
+    Pack away live homes that have been empty for timeout seconds.
+    
+    Returns:
+        int: Number of homes packed away
+    """
+    now = time.time()
+    packed = 0
+    for home in list(_get_index().values()):
+        if not home.room_ids:
+            continue
+        if _is_occupied(_load_rooms(home.room_ids)):
+            _empty_since.pop(home.owner_id, None)
+            continue
+        since = _empty_since.setdefault(home.owner_id, now)
+        if now - since < timeout:
+            continue
+        if dematerialize_home(home):
+            packed += 1
+        else:
+            # Someone is asleep inside; look again after another timeout
+            _empty_since[home.owner_id] = now
+    return packed
+
 
 # =============================================================================
 # CORE FUNCTIONS - HOME MANAGEMENT
@@ -253,33 +705,78 @@ UPGRADES = {
 
 def get_home(character):
     """
-    Get a character's home room, if they have one.
+    Get a character's home, if they have one.
     
     Returns:
-        Room object or None
+        HomeRecord or None
     """
-    home_id = character.db.home_id
-    if not home_id:
-        return None
+    home = _get_index().get(character.id)
+    if home is None and character.db.home_id:
+        home = migrate_home_room(character)
+    return home
+
+
+def get_home_for_room(room):
+    """
+    Get the home a room belongs to.
     
-    results = search_object("#" + str(home_id))
-    return results[0] if results else None
+    Returns:
+        HomeRecord or None if the room isn't part of a home
+    """
+    if not room.db.is_home:
+        return None
+    owner_id = room.db.owner_id
+    home = _get_index().get(owner_id)
+    if home is None and owner_id:
+        # Possibly an old room-based home not migrated yet
+        owner = search_object("#" + str(owner_id))
+        if owner:
+            home = get_home(owner[0])
+    return home
 
 
 def get_home_by_id(home_id):
     """
-    Get a home room by its ID.
+    Get a home by the database ID of one of its live rooms.
     
     Args:
-        home_id: The database ID of the home room
+        home_id: The database ID of a home room
         
     Returns:
-        Room object or None
+        HomeRecord or None
     """
     if not home_id:
         return None
+    owner_id = _room_homes.get(home_id)
+    if owner_id is not None:
+        return _get_index().get(owner_id)
     results = search_object("#" + str(home_id))
-    return results[0] if results else None
+    return get_home_for_room(results[0]) if results else None
+
+
+def find_home(name):
+    """
+    Find a home by its name or its owner's name (case-insensitive).
+    
+    Returns:
+        HomeRecord or None
+    """
+    name = name.strip().lower()
+    homes = _get_index().values()
+    for home in homes:
+        if (home.home_name or "").lower() == name:
+            return home
+    for home in homes:
+        if (home.owner_name or "").lower() == name:
+            return home
+    return None
+
+
+def _as_home(home):
+    """Accept a HomeRecord or any room of a home."""
+    if home is None or isinstance(home, HomeRecord):
+        return home
+    return get_home_for_room(home)
 
 
 def has_home(character):
@@ -287,44 +784,41 @@ def has_home(character):
     return get_home(character) is not None
 
 
-def get_home_type(home_room):
-    """Get the home type info for a home room."""
-    home_type = home_room.db.home_type or "tent"
-    return HOME_TYPES.get(home_type, HOME_TYPES["tent"])
+def get_home_type(home):
+    """Get the home type info (HOME_TYPES template) for a home."""
+    return _as_home(home).template
 
 
-def get_all_home_rooms(home_room):
+def get_all_home_rooms(home):
     """
-    Get all rooms that are part of a home (foyer + additions).
+    Get the live rooms of a home (foyer first).
     
     Args:
-        home_room: The main/foyer room of the home
+        home: HomeRecord or one of its rooms
         
     Returns:
-        List of room objects
+        List of room objects, empty if the home isn't materialised
     """
-    rooms = [home_room]
-    connected_ids = home_room.db.connected_rooms or []
-    
-    for room_id in connected_ids:
-        results = search_object("#" + str(room_id))
-        if results:
-            rooms.append(results[0])
-    
-    return rooms
+    home = _as_home(home)
+    if not home or not home.room_ids:
+        return []
+    return [room for room in _load_rooms(home.room_ids) if room is not None]
 
 
 def create_home(character, home_type="tent", home_name=None):
     """
     Create a new home for a character.
     
+    Only the record is created; rooms are built the first time someone
+    goes in.
+    
     Args:
         character: The character buying the home
         home_type: Type from HOME_TYPES
         home_name: Custom name (default: "{Name}'s {Type}")
         
     Returns:
-        (success, message, home_room or None)
+        (success, message, HomeRecord or None)
     """
     if has_home(character):
         return (False, "You already own a home.", None)
@@ -345,47 +839,10 @@ def create_home(character, home_type="tent", home_name=None):
     if not home_name:
         home_name = f"{character.key}'s {type_info['name']}"
     
-    # Create the home room
-    # Using base Room typeclass - can be changed to HomeRoom if you create one
-    home_room = create_object(
-        typeclass="typeclasses.rooms.Room",
-        key=home_name,
-        locks=f"control:id({character.id}) or perm(Admin)"
-    )
+    home = HomeRecord(character.id, character.key, home_type=home_type, home_name=home_name)
+    save_home(home)
     
-    # Set up home data
-    home_room.db.is_home = True
-    home_room.db.home_type = home_type
-    home_room.db.home_name = home_name
-    home_room.db.owner_id = character.id
-    home_room.db.owner_name = character.key
-    
-    # Permissions
-    home_room.db.permissions = {
-        "residents": [],
-        "trusted": [],
-        "guests": [],
-        "banned": [],
-    }
-    home_room.db.locked = True
-    home_room.db.visitors_allowed = []  # Temp visitor list
-    
-    # Capacity
-    home_room.db.furniture_slots = type_info["furniture_slots"]
-    home_room.db.storage_slots = type_info["storage_slots"]
-    home_room.db.max_rooms = type_info["max_rooms"]
-    home_room.db.features = list(type_info["features"])
-    home_room.db.upgrades = []
-    home_room.db.connected_rooms = []
-    
-    # Set description
-    home_room.db.desc = type_info["desc"]
-    
-    # Link character to home
-    character.db.home_id = home_room.id
-    character.db.owned_rooms = [home_room.id]
-    
-    return (True, f"Congratulations! You are now the proud owner of {home_name}!", home_room)
+    return (True, f"Congratulations! You are now the proud owner of {home_name}!", home)
 
 
 def upgrade_home(character, new_type):
@@ -403,7 +860,7 @@ def upgrade_home(character, new_type):
     if not home:
         return (False, "You don't own a home.")
     
-    current_type = home.db.home_type
+    current_type = home.home_type
     if new_type not in HOME_TYPES:
         return (False, f"Unknown home type: {new_type}")
     
@@ -420,25 +877,28 @@ def upgrade_home(character, new_type):
     
     pay(character, upgrade_cost)
     
-    # Apply upgrade
-    home.db.home_type = new_type
-    home.db.furniture_slots = new_info["furniture_slots"]
-    home.db.storage_slots = new_info["storage_slots"]
-    home.db.max_rooms = new_info["max_rooms"]
-    
-    # Add new features (keep old ones)
-    current_features = set(home.db.features or [])
-    new_features = set(new_info["features"])
-    home.db.features = list(current_features | new_features)
+    # Capacity and features come from the new template
+    home.home_type = new_type
     
     # Update name if it was default
-    if home.db.home_name == f"{character.key}'s {current_info['name']}":
-        home.db.home_name = f"{character.key}'s {new_info['name']}"
-        home.key = home.db.home_name
+    if home.home_name == f"{character.key}'s {current_info['name']}":
+        home.home_name = f"{character.key}'s {new_info['name']}"
+    
+    save_home(home)
+    _sync_foyer(home)
     
     return (True, f"Your home has been upgraded to a {new_info['name']}!")
 
 
+def _sync_foyer(home):
+    """Copy name and capacity to a live foyer after the record changes."""
+    rooms = get_all_home_rooms(home)
+    if rooms:
+        foyer = rooms[0]
+        foyer.key = home.home_name
+        foyer.db.furniture_slots = home.furniture_slots
+
+
 def add_room(character, room_type):
     """
     Add a new room to a home.
@@ -449,6 +909,7 @@ def add_room(character, room_type):
         
     Returns:
         (success, message, new_room or None)
+        new_room is None unless the home is currently materialised
     """
     home = get_home(character)
     if not home:
@@ -460,14 +921,14 @@ def add_room(character, room_type):
     room_info = ROOM_TYPES[room_type]
     
     # Check max rooms
-    current_rooms = len(home.db.connected_rooms or []) + 1  # +1 for foyer
-    max_rooms = home.db.max_rooms or 1
+    current_rooms = len(home.rooms)
+    max_rooms = home.max_rooms
     if current_rooms >= max_rooms:
         return (False, f"Your home can only have {max_rooms} rooms. Upgrade your home for more space.", None)
     
     # Check required features
     required = room_info.get("requires_feature")
-    if required and required not in (home.db.features or []):
+    if required and required not in home.features:
         return (False, f"Your home needs the '{required}' feature to add a {room_info['name']}.", None)
     
     # Check funds
@@ -477,54 +938,18 @@ def add_room(character, room_type):
     
     pay(character, price)
     
-    # Create the room
-    room_name = f"{home.db.home_name} - {room_info['name']}"
-    new_room = create_object(
-        typeclass="typeclasses.rooms.Room",
-        key=room_name,
-        locks=f"control:id({character.id}) or perm(Admin)"
-    )
+    home.rooms.append([room_type, None])
     
-    # Set up room data
-    new_room.db.is_home = True
-    new_room.db.is_home_room = True  # Sub-room, not foyer
-    new_room.db.parent_home_id = home.id
-    new_room.db.room_type = room_type
-    new_room.db.owner_id = character.id
-    new_room.db.furniture_slots = room_info["furniture_slots"]
-    new_room.db.features = list(room_info.get("features", []))
-    new_room.db.desc = room_info["desc"]
-    new_room.db.custom_desc = None  # Player can set this
-    
-    # Link rooms with exits
-    # Exit from foyer to new room
-    create_object(
-        typeclass="typeclasses.exits.Exit",
-        key=room_info["name"].lower(),
-        aliases=[room_type],
-        location=home,
-        destination=new_room,
-        locks=f"traverse:all()"  # Home entry controlled at room level
-    )
+    # A live home gets the room now; otherwise it's built on next visit
+    new_room = None
+    rooms = get_all_home_rooms(home)
+    if rooms:
+        new_room = _create_home_room(home, len(home.rooms) - 1, rooms[0])
+        home.room_ids.append(new_room.id)
     
-    # Exit back to foyer
-    create_object(
-        typeclass="typeclasses.exits.Exit",
-        key="foyer",
-        aliases=["back", "main", "out"],
-        location=new_room,
-        destination=home,
-        locks=f"traverse:all()"
-    )
-    
-    # Update home data
-    connected = home.db.connected_rooms or []
-    connected.append(new_room.id)
-    home.db.connected_rooms = connected
-    
-    owned = character.db.owned_rooms or []
-    owned.append(new_room.id)
-    character.db.owned_rooms = owned
+    save_home(home)
+    if new_room:
+        _watch_home(home, rooms + [new_room])
     
     return (True, f"A new {room_info['name']} has been added to your home!", new_room)
 
@@ -550,8 +975,7 @@ def purchase_upgrade(character, upgrade_key):
     upgrade_info = UPGRADES[upgrade_key]
     
     # Check if already owned
-    owned_upgrades = home.db.upgrades or []
-    if upgrade_key in owned_upgrades:
+    if upgrade_key in home.upgrades:
         return (False, "You already have that upgrade.")
     
     # Check funds
@@ -561,78 +985,187 @@ def purchase_upgrade(character, upgrade_key):
     
     pay(character, price)
     
-    # Apply upgrade
-    owned_upgrades.append(upgrade_key)
-    home.db.upgrades = owned_upgrades
+    # Bonuses and features are derived from the upgrade list
+    home.upgrades.append(upgrade_key)
+    save_home(home)
+    _sync_foyer(home)
     
-    # Apply bonuses
-    if "storage_bonus" in upgrade_info:
-        home.db.storage_slots = (home.db.storage_slots or 0) + upgrade_info["storage_bonus"]
+    return (True, f"Upgrade purchased: {upgrade_info['name']}!")
+
+
+# =============================================================================
+# PERMISSION INDEX
+# =============================================================================
+# Entry checks run on every door traversal, so each home's permission
+# lists are compiled into one {character id: level} dict, and whether
+# the owner is home is a set kept current by room enter/leave events.
+
+# Permission list in HomeRecord.permissions -> the level it grants
+_PERMISSION_LISTS = {
+    "residents": "resident",
+    "trusted": "trusted",
+    "guests": "guest",
+    "banned": "banned",
+}
+_LEVEL_LISTS = {level: key for key, level in _PERMISSION_LISTS.items()}
+
+
+def _list_level(key):
+    # Lists named after the level itself (older data) count too
+    return _PERMISSION_LISTS.get(key, key if key in PERMISSION_LEVELS else None)
+
+
+def get_permission_map(home):
+    """
+    Compiled {character id: level} map for a home.
     
-    if "furniture_bonus" in upgrade_info:
-        home.db.furniture_slots = (home.db.furniture_slots or 0) + upgrade_info["furniture_bonus"]
+    Built from the permission lists on first use and cached until the
+    permissions change. A character on several lists gets the highest
+    level, except that banned beats everything; the owner is always
+    "owner".
+    """
+    levels = _permission_maps.get(home.owner_id)
+    if levels is None:
+        levels = {char_id: "visitor" for char_id in home.visitors}
+        lists = [(_list_level(key), ids) for key, ids in home.permissions.items()]
+        lists.sort(key=lambda item: 99 if item[0] == "banned" else PERMISSION_LEVELS.get(item[0], 0))
+        for level, ids in lists:
+            if level is None:
+                continue
+            for char_id in ids:
+                levels[char_id] = level
+        levels[home.owner_id] = "owner"
+        _permission_maps[home.owner_id] = levels
+    return levels
+
+
+def _permissions_changed(home):
+    _permission_maps.pop(home.owner_id, None)
+    save_home(home)
+
+
+def _on_home_entered(event):
+    owner_id = _room_homes.get(event.room.id)
+    if owner_id is not None and event.obj.id == owner_id:
+        _owner_present.add(owner_id)
+
+
+def _on_home_left(event):
+    owner_id = _room_homes.get(event.room.id)
+    if owner_id is None or event.obj.id != owner_id:
+        return
+    destination = event.destination
+    if destination is None or _room_homes.get(destination.id) != owner_id:
+        _owner_present.discard(owner_id)
+
+
+def update_owner_presence(character):
+    """
+    Recheck whether a home owner is in one of their home's rooms.
     
-    if "feature" in upgrade_info:
-        features = home.db.features or []
-        features.append(upgrade_info["feature"])
-        home.db.features = features
+    Logging in and out moves a character without the room enter and
+    leave events, so Character calls this from at_post_puppet and
+    at_post_unpuppet.
+    """
+    if character.id not in _get_index():
+        return
+    location = character.location
+    if (location is not None and _room_homes.get(location.id) == character.id
+            and character.sessions.count()):
+        _owner_present.add(character.id)
+    else:
+        _owner_present.discard(character.id)
+
+
+def update_home_sleeper(character):
+    """
+    Note whether a character logged out inside someone's home.
     
-    return (True, f"Upgrade purchased: {upgrade_info['name']}!")
+    Logging out moves the character to None location and remembers the
+    room in db.prelogout_location; the tag keeps that room's home from
+    being packed away until the character is back. Character calls this
+    from at_post_puppet and at_post_unpuppet.
+    """
+    if character.tags.get(category=HOME_SLEEPER_CATEGORY):
+        character.tags.remove(category=HOME_SLEEPER_CATEGORY)
+    if character.location is not None or character.sessions.count():
+        return
+    _get_index()
+    location = character.db.prelogout_location
+    owner_id = _room_homes.get(location.id) if location is not None else None
+    if owner_id is not None:
+        character.tags.add(str(owner_id), category=HOME_SLEEPER_CATEGORY)
+
+
+def _watch_home(home, rooms=None):
+    """Subscribe to a live home's rooms and note whether the owner is in."""
+    from world.events import subscribe, ROOM_ENTERED, ROOM_LEFT
+    
+    if rooms is None:
+        rooms = get_all_home_rooms(home)
+    present = False
+    for room in rooms:
+        subscribe(ROOM_ENTERED, _on_home_entered, room=room)
+        subscribe(ROOM_LEFT, _on_home_left, room=room)
+        present = present or any(obj.id == home.owner_id for obj in room.contents)
+    if present:
+        _owner_present.add(home.owner_id)
+    else:
+        _owner_present.discard(home.owner_id)
+
+
+def _unwatch_room(room):
+    from world.events import unsubscribe, ROOM_ENTERED, ROOM_LEFT
+    unsubscribe(ROOM_ENTERED, _on_home_entered, room=room)
+    unsubscribe(ROOM_LEFT, _on_home_left, room=room)
 
 
 # =============================================================================
 # PERMISSION FUNCTIONS
 # =============================================================================
 
-def get_permission_level(home_room, character):
+def get_permission_level(home, character):
     """
     Get a character's permission level for a home.
     
     Args:
-        home_room: The home (foyer) room
+        home: HomeRecord or one of its rooms
         character: The character to check
         
     Returns:
         Permission level string
     """
-    if not home_room.db.is_home:
+    home = _as_home(home)
+    if not home:
         return "stranger"
-    
-    # Owner check
-    if home_room.db.owner_id == character.id:
-        return "owner"
-    
-    perms = home_room.db.permissions or {}
-    char_id = character.id
-    
-    # Check each level
-    if char_id in perms.get("banned", []):
-        return "banned"
-    if char_id in perms.get("residents", []):
-        return "resident"
-    if char_id in perms.get("trusted", []):
-        return "trusted"
-    if char_id in perms.get("guests", []):
-        return "guest"
-    if char_id in (home_room.db.visitors_allowed or []):
-        return "visitor"
-    
-    return "stranger"
+    return get_permission_map(home).get(character.id, "stranger")
 
 
-def can_enter(home_room, character):
+def is_owner_home(home):
+    """Whether the owner is playing and in one of the home's live rooms."""
+    from evennia.objects.models import ObjectDB
+    
+    home = _as_home(home)
+    if home is None or home.owner_id not in _owner_present:
+        return False
+    # A puppeted owner is always in the object cache
+    owner = ObjectDB.get_cached_instance(home.owner_id)
+    return owner is not None and bool(owner.sessions.count())
+
+
+def can_enter(home, character):
     """
     Check if a character can enter a home.
     
     Args:
-        home_room: The home to enter
+        home: The home to enter (HomeRecord or one of its rooms)
         character: The character trying to enter
         
     Returns:
         (can_enter, reason)
     """
-    level = get_permission_level(home_room, character)
-    level_num = PERMISSION_LEVELS.get(level, 0)
+    home = _as_home(home)
+    level = get_permission_level(home, character)
     
     if level == "banned":
         return (False, "You have been banned from this home.")
@@ -644,13 +1177,11 @@ def can_enter(home_room, character):
         return (True, None)
     
     # Check if locked
-    if home_room.db.locked:
+    if home.locked:
         if level == "guest":
             # Guests can enter if owner is home
-            owner_id = home_room.db.owner_id
-            for obj in home_room.contents:
-                if hasattr(obj, 'id') and obj.id == owner_id:
-                    return (True, None)
+            if is_owner_home(home):
+                return (True, None)
             return (False, "The door is locked and the owner isn't home.")
         
         if level == "visitor":
@@ -662,12 +1193,12 @@ def can_enter(home_room, character):
     return (True, None)
 
 
-def set_permission(home_room, character, target, level):
+def set_permission(home, character, target, level):
     """
     Set a character's permission level for a home.
     
     Args:
-        home_room: The home
+        home: The home
         character: The owner making the change
         target: The character whose permissions are being set
         level: New permission level
@@ -675,101 +1206,104 @@ def set_permission(home_room, character, target, level):
     Returns:
         (success, message)
     """
+    home = _as_home(home)
+    
     # Verify ownership
-    if home_room.db.owner_id != character.id:
+    if home.owner_id != character.id:
         return (False, "Only the owner can change permissions.")
     
-    if level not in PERMISSION_LEVELS:
+    if level not in PERMISSION_LEVELS or level == "owner":
         return (False, f"Unknown permission level: {level}")
     
     # Can't change own permissions
     if target.id == character.id:
         return (False, "You can't change your own permissions.")
     
-    perms = home_room.db.permissions or {
-        "residents": [],
-        "trusted": [],
-        "guests": [],
-        "banned": [],
-    }
-    
+    perms = home.permissions
     target_id = target.id
     
     # Remove from all lists first
-    for key in ["residents", "trusted", "guests", "banned"]:
-        if target_id in perms.get(key, []):
-            perms[key].remove(target_id)
+    for ids in perms.values():
+        if target_id in ids:
+            ids.remove(target_id)
     
-    # Add to new list (if not stranger)
-    if level != "stranger":
-        if level not in perms:
-            perms[level] = []
-        perms[level].append(target_id)
+    # Add to new list (if not stranger); visitor is a one-time invite
+    if level == "visitor":
+        if target_id not in home.visitors:
+            home.visitors.append(target_id)
+    elif level != "stranger":
+        perms.setdefault(_LEVEL_LISTS[level], []).append(target_id)
     
-    home_room.db.permissions = perms
+    _permissions_changed(home)
     
     return (True, f"{target.key}'s permission level set to {level}.")
 
 
-def invite_visitor(home_room, character, target):
+def invite_visitor(home, character, target):
     """
     Temporarily allow someone to enter (one-time visitor).
     
     Args:
-        home_room: The home
+        home: The home
         character: The owner inviting
         target: The character being invited
         
     Returns:
         (success, message)
     """
-    if home_room.db.owner_id != character.id:
-        # Residents can also invite
-        perms = home_room.db.permissions or {}
-        if character.id not in perms.get("residents", []):
-            return (False, "Only the owner or residents can invite visitors.")
+    home = _as_home(home)
+    # Residents can also invite
+    if get_permission_level(home, character) not in ("owner", "resident"):
+        return (False, "Only the owner or residents can invite visitors.")
     
-    visitors = home_room.db.visitors_allowed or []
-    if target.id not in visitors:
-        visitors.append(target.id)
-        home_room.db.visitors_allowed = visitors
+    if target.id not in home.visitors:
+        home.visitors.append(target.id)
+        _permissions_changed(home)
     
     return (True, f"{target.key} has been invited to enter.")
 
 
-def revoke_visitor(home_room, character, target):
+def revoke_visitor(home, character, target):
     """
     Remove someone's temporary visitor access.
     """
-    if home_room.db.owner_id != character.id:
-        perms = home_room.db.permissions or {}
-        if character.id not in perms.get("residents", []):
-            return (False, "Only the owner or residents can manage visitors.")
-    
-    visitors = home_room.db.visitors_allowed or []
-    if target.id in visitors:
-        visitors.remove(target.id)
-        home_room.db.visitors_allowed = visitors
+    home = _as_home(home)
+    if get_permission_level(home, character) not in ("owner", "resident"):
+        return (False, "Only the owner or residents can manage visitors.")
+    
+    if target.id in home.visitors:
+        home.visitors.remove(target.id)
+        _permissions_changed(home)
         return (True, f"{target.key}'s visitor access has been revoked.")
     
     return (False, f"{target.key} wasn't a visitor.")
 
 
-def kick_from_home(home_room, character, target):
+def use_visit(home, character):
+    """Use up a one-time visitor invitation once they're inside."""
+    home = _as_home(home)
+    if character.id in home.visitors:
+        home.visitors.remove(character.id)
+        _permissions_changed(home)
+
+
+def kick_from_home(home, character, target):
     """
     Forcibly remove someone from the home.
     
     Args:
-        home_room: The home
+        home: The home
         character: The owner/resident doing the kicking
         target: The character being kicked
         
     Returns:
         (success, message)
     """
+    home = _as_home(home)
+    
     # Check authority
-    kicker_level = PERMISSION_LEVELS.get(get_permission_level(home_room, character), 0)
-    target_level = PERMISSION_LEVELS.get(get_permission_level(home_room, target), 0)
+    kicker_level = PERMISSION_LEVELS.get(get_permission_level(home, character), 0)
+    target_level = PERMISSION_LEVELS.get(get_permission_level(home, target), 0)
     
     if kicker_level < PERMISSION_LEVELS["resident"]:
         return (False, "You don't have permission to kick people.")
@@ -778,14 +1312,8 @@ def kick_from_home(home_room, character, target):
         return (False, "You can't kick someone with equal or higher permissions.")
     
     # Find where target is
-    all_rooms = get_all_home_rooms(home_room)
-    target_room = None
-    for room in all_rooms:
-        if target in room.contents:
-            target_room = room
-            break
-    
-    if not target_room:
+    location = target.location
+    if not location or location.id not in home.room_ids:
         return (False, f"{target.key} isn't in your home.")
     
     # Find the Grove or a default exit location
@@ -798,10 +1326,10 @@ def kick_from_home(home_room, character, target):
         return (False, "Error: No exit location defined.")
     
     target.move_to(exit_location, quiet=False)
-    target.msg(f"You have been kicked from {home_room.db.home_name}!")
+    target.msg(f"You have been kicked from {home.home_name}!")
     
     # Revoke visitor status
-    revoke_visitor(home_room, character, target)
+    revoke_visitor(home, character, target)
     
     return (True, f"{target.key} has been kicked from your home.")
 
@@ -810,27 +1338,29 @@ def kick_from_home(home_room, character, target):
 # CUSTOMIZATION FUNCTIONS
 # =============================================================================
 
-def set_home_name(home_room, character, new_name):
+def set_home_name(home, character, new_name):
     """
     Rename a home.
     
     Args:
-        home_room: The home
+        home: The home
         character: The owner
         new_name: New name
         
     Returns:
         (success, message)
     """
-    if home_room.db.owner_id != character.id:
+    home = _as_home(home)
+    if home.owner_id != character.id:
         return (False, "Only the owner can rename the home.")
     
     if not new_name or len(new_name) > 50:
         return (False, "Name must be 1-50 characters.")
     
-    old_name = home_room.db.home_name
-    home_room.db.home_name = new_name
-    home_room.key = new_name
+    old_name = home.home_name
+    home.home_name = new_name
+    save_home(home)
+    _sync_foyer(home)
     
     return (True, f"Home renamed from '{old_name}' to '{new_name}'.")
 
@@ -840,7 +1370,7 @@ def set_room_description(room, character, new_desc):
     Set a custom description for a home room.
     
     Args:
-        room: The room to customize
+        room: The (live) room to customize
         character: The character editing
         new_desc: New description
         
@@ -850,15 +1380,8 @@ def set_room_description(room, character, new_desc):
     if not room.db.is_home:
         return (False, "This isn't a home room.")
     
-    # Get the main home
-    if room.db.is_home_room:
-        home_id = room.db.parent_home_id
-        home = search_object("#" + str(home_id))
-        home = home[0] if home else None
-    else:
-        home = room
-    
-    if not home:
+    home = get_home_for_room(room)
+    if not home or room.id not in home.room_ids:
         return (False, "Error finding home.")
     
     # Check permissions
@@ -869,29 +1392,33 @@ def set_room_description(room, character, new_desc):
     if len(new_desc) > 2000:
         return (False, "Description must be under 2000 characters.")
     
-    room.db.custom_desc = new_desc
-    room.db.desc = new_desc  # Also set the actual desc
+    # The record keeps it for when the room is rebuilt
+    home.rooms[home.room_ids.index(room.id)][1] = new_desc
+    save_home(home)
+    room.db.desc = new_desc
     
     return (True, "Room description updated.")
 
 
-def lock_home(home_room, character, lock=True):
+def lock_home(home, character, lock=True):
     """
     Lock or unlock the home.
     
     Args:
-        home_room: The home
+        home: The home
         character: The owner/resident
         lock: True to lock, False to unlock
         
     Returns:
         (success, message)
     """
-    level = get_permission_level(home_room, character)
+    home = _as_home(home)
+    level = get_permission_level(home, character)
     if level not in ["owner", "resident"]:
         return (False, "Only owners and residents can lock/unlock the home.")
     
-    home_room.db.locked = lock
+    home.locked = lock
+    save_home(home)
     state = "locked" if lock else "unlocked"
     
     return (True, f"Your home is now {state}.")
@@ -901,75 +1428,75 @@ def lock_home(home_room, character, lock=True):
 # DISPLAY FUNCTIONS
 # =============================================================================
 
-def get_home_info(home_room):
+def get_home_info(home):
     """
     Get formatted info about a home.
     
     Args:
-        home_room: The home
+        home: The home
         
     Returns:
         Formatted string
     """
-    if not home_room.db.is_home:
+    home = _as_home(home)
+    if not home:
         return "Not a home."
     
-    type_info = HOME_TYPES.get(home_room.db.home_type, HOME_TYPES["tent"])
+    type_info = home.template
     
     lines = []
-    lines.append(f"|w{home_room.db.home_name}|n")
+    lines.append(f"|w{home.home_name}|n")
     lines.append(f"Type: {type_info['name']}")
-    lines.append(f"Owner: {home_room.db.owner_name}")
+    lines.append(f"Owner: {home.owner_name}")
     lines.append("")
     
     # Room count
-    rooms = get_all_home_rooms(home_room)
-    lines.append(f"Rooms: {len(rooms)}/{home_room.db.max_rooms}")
+    lines.append(f"Rooms: {len(home.rooms)}/{home.max_rooms}")
     
     # Room list
-    if len(rooms) > 1:
+    if len(home.rooms) > 1:
         room_names = []
-        for r in rooms:
-            if r.db.room_type:
-                room_names.append(ROOM_TYPES.get(r.db.room_type, {}).get("name", "Room"))
+        for room_type, _ in home.rooms:
+            if room_type:
+                room_names.append(ROOM_TYPES.get(room_type, {}).get("name", "Room"))
             else:
                 room_names.append("Foyer")
         lines.append(f"  {', '.join(room_names)}")
     
     lines.append("")
-    lines.append(f"Furniture Slots: {home_room.db.furniture_slots}")
-    lines.append(f"Storage Slots: {home_room.db.storage_slots}")
+    lines.append(f"Furniture Slots: {home.furniture_slots}")
+    lines.append(f"Storage Slots: {home.storage_slots}")
     
     # Features
-    features = home_room.db.features or []
+    features = home.features
     if features:
         lines.append(f"Features: {', '.join(features)}")
     
     # Upgrades
-    upgrades = home_room.db.upgrades or []
-    if upgrades:
-        upgrade_names = [UPGRADES.get(u, {}).get("name", u) for u in upgrades]
+    if home.upgrades:
+        upgrade_names = [UPGRADES.get(u, {}).get("name", u) for u in home.upgrades]
         lines.append(f"Upgrades: {', '.join(upgrade_names)}")
     
     # Lock status
     lines.append("")
-    lines.append(f"Door: {'|rLocked|n' if home_room.db.locked else '|gUnlocked|n'}")
+    lines.append(f"Door: {'|rLocked|n' if home.locked else '|gUnlocked|n'}")
     
     return "\n".join(lines)
 
 
-def get_permission_list(home_room):
+def get_permission_list(home):
     """
     Get formatted list of permissions.
     
     Args:
-        home_room: The home
+        home: The home
         
     Returns:
         Formatted string
     """
-    perms = home_room.db.permissions or {}
-    lines = [f"|wPermissions for {home_room.db.home_name}|n", ""]
+    home = _as_home(home)
+    perms = home.permissions
+    lines = [f"|wPermissions for {home.home_name}|n", ""]
     
     for level in ["residents", "trusted", "guests", "banned"]:
         char_ids = perms.get(level, [])
@@ -986,10 +1513,9 @@ def get_permission_list(home_room):
             lines.append(f"{level.title()}: None")
     
     # Temp visitors
-    visitors = home_room.db.visitors_allowed or []
-    if visitors:
+    if home.visitors:
         names = []
-        for char_id in visitors:
+        for char_id in home.visitors:
             result = search_object("#" + str(char_id))
             if result:
                 names.append(result[0].key)
@@ -1015,11 +1541,11 @@ def list_available_homes():
     return "\n".join(lines)
 
 
-def list_available_rooms(home_room):
+def list_available_rooms(home):
     """Get formatted list of room types available to add."""
     lines = ["|wAvailable Room Types|n", ""]
     
-    home_features = home_room.db.features or []
+    home_features = _as_home(home).features
     
     for key, info in ROOM_TYPES.items():
         # Check requirements
@@ -1045,11 +1571,11 @@ def list_available_rooms(home_room):
     return "\n".join(lines)
 
 
-def list_available_upgrades(home_room):
+def list_available_upgrades(home):
     """Get formatted list of available upgrades."""
     lines = ["|wAvailable Upgrades|n", ""]
     
-    owned = home_room.db.upgrades or []
+    owned = _as_home(home).upgrades
     
     for key, info in UPGRADES.items():
         if key in owned:
@@ -9,7 +9,7 @@ Comprehensive item management with:
 - Consumables with effects
 - Equipment slots
 - Item quality/durability
-- Stacking for materials
+- Stacking for materials (carried as counts, see world.materials)
 
 Architecture:
 - Items are Objects with item_data attribute
@@ -26,6 +26,9 @@ Usage:
     # Create from template
     item = create_item("iron_ore", location=player)
     
+    # Create many at once (one transaction, bulk Attribute/Tag inserts)
+    items = create_items_bulk([("iron_ore", 5), "copper_ore"], location=player)
+    
     # Check if player has required tool
     if has_tool(player, "pickaxe"):
         # Can mine
@@ -38,6 +41,8 @@ import random
 from evennia import create_object, search_object
 from evennia.utils import logger
 
+from world.registry import LazyRegistry
+
 
 # =============================================================================
 # Item Categories
@@ -95,1361 +100,140 @@ EQUIPMENT_SLOTS = {
 
 
 # =============================================================================
-# Item Templates - Materials
+# Item Templates
 # =============================================================================
+# The templates live in world/data/items.py and load on first use.
 
-MATERIAL_TEMPLATES = {
-    # Foraged Materials
-    "wild_herbs": {
-        "key": "bundle of wild herbs",
-        "aliases": ["herbs", "wild herbs"],
-        "desc": "A bundle of assorted wild herbs, fragrant and fresh.",
-        "category": "material",
-        "subcategory": "herb",
-        "base_value": 5,
-        "weight": 0.1,
-        "stackable": True,
-        "max_stack": 50,
-    },
-    "medicinal_roots": {
-        "key": "medicinal roots",
-        "aliases": ["roots"],
-        "desc": "Gnarled roots with known healing properties.",
-        "category": "material",
-        "subcategory": "herb",
-        "base_value": 12,
-        "weight": 0.2,
-        "stackable": True,
-        "max_stack": 50,
-    },
-    "wild_berries": {
-        "key": "handful of wild berries",
-        "aliases": ["berries", "wild berries"],
-        "desc": "Small, ripe berries. Safe to eat, mildly sweet.",
-        "category": "material",
-        "subcategory": "food_raw",
-        "base_value": 3,
-        "weight": 0.1,
-        "stackable": True,
-        "max_stack": 50,
-        "edible": True,
-        "hunger_restore": 5,
-    },
-    "edible_mushrooms": {
-        "key": "edible mushrooms",
-        "aliases": ["mushrooms"],
-        "desc": "Common forest mushrooms, good for cooking.",
-        "category": "material",
-        "subcategory": "food_raw",
-        "base_value": 4,
-        "weight": 0.1,
-        "stackable": True,
-        "max_stack": 50,
-        "edible": True,
-        "hunger_restore": 8,
-    },
-    "glowing_mushroom": {
-        "key": "glowing mushroom",
-        "aliases": ["glowing mushrooms", "glow mushroom"],
-        "desc": "A mushroom that emits a soft, ethereal glow. Alchemically valuable.",
-        "category": "material",
-        "subcategory": "herb",
-        "base_value": 25,
-        "weight": 0.1,
-        "stackable": True,
-        "max_stack": 20,
-        "flags": ["magical"],
-    },
-    "wild_flowers": {
-        "key": "wild flowers",
-        "aliases": ["flowers"],
-        "desc": "A small bouquet of colorful wildflowers.",
-        "category": "material",
-        "subcategory": "misc",
-        "base_value": 2,
-        "weight": 0.1,
-        "stackable": True,
-        "max_stack": 50,
-    },
-    "forest_nuts": {
-        "key": "forest nuts",
-        "aliases": ["nuts"],
-        "desc": "Assorted nuts gathered from the forest floor.",
-        "category": "material",
-        "subcategory": "food_raw",
-        "base_value": 4,
-        "weight": 0.2,
-        "stackable": True,
-        "max_stack": 50,
-        "edible": True,
-        "hunger_restore": 10,
-    },
-    "bird_egg": {
-        "key": "bird egg",
-        "aliases": ["egg"],
-        "desc": "A small speckled egg from a wild bird's nest.",
-        "category": "material",
-        "subcategory": "food_raw",
-        "base_value": 6,
-        "weight": 0.1,
-        "stackable": True,
-        "max_stack": 20,
-        "edible": True,
-        "hunger_restore": 12,
-    },
-    "honey": {
-        "key": "jar of wild honey",
-        "aliases": ["honey", "wild honey"],
-        "desc": "Sweet golden honey harvested from a wild hive.",
-        "category": "material",
-        "subcategory": "food_raw",
-        "base_value": 15,
-        "weight": 0.3,
-        "stackable": True,
-        "max_stack": 20,
-        "edible": True,
-        "hunger_restore": 15,
-    },
-    
-    # Fishing Materials
-    "common_fish": {
-        "key": "common fish",
-        "aliases": ["fish"],
-        "desc": "An ordinary freshwater fish. Good eating.",
-        "category": "material",
-        "subcategory": "fish",
-        "base_value": 8,
-        "weight": 0.5,
-        "stackable": True,
-        "max_stack": 20,
-        "edible": True,
-        "hunger_restore": 20,
-    },
-    "silver_fish": {
-        "key": "silver fish",
-        "aliases": ["silverfish"],
-        "desc": "A fish with distinctive silver scales. Prized by cooks.",
-        "category": "material",
-        "subcategory": "fish",
-        "base_value": 15,
-        "weight": 0.6,
-        "stackable": True,
-        "max_stack": 20,
-    },
-    "golden_carp": {
-        "key": "golden carp",
-        "aliases": ["carp", "golden fish"],
-        "desc": "A beautiful fish with golden scales. Very valuable.",
-        "category": "material",
-        "subcategory": "fish",
-        "base_value": 50,
-        "weight": 0.8,
-        "stackable": True,
-        "max_stack": 10,
-        "flags": ["rare"],
-    },
-    "old_boot": {
-        "key": "old boot",
-        "aliases": ["boot"],
-        "desc": "A waterlogged boot. Not much use to anyone.",
-        "category": "junk",
-        "base_value": 1,
-        "weight": 0.5,
-        "stackable": False,
-    },
-    "freshwater_clam": {
-        "key": "freshwater clam",
-        "aliases": ["clam"],
-        "desc": "A small clam from the riverbed. Might contain a pearl.",
-        "category": "material",
-        "subcategory": "shellfish",
-        "base_value": 5,
-        "weight": 0.2,
-        "stackable": True,
-        "max_stack": 30,
-    },
-    "river_pearl": {
-        "key": "river pearl",
-        "aliases": ["pearl"],
-        "desc": "A lustrous pearl from a freshwater clam.",
-        "category": "treasure",
-        "base_value": 100,
-        "weight": 0.05,
-        "stackable": True,
-        "max_stack": 20,
-        "flags": ["valuable"],
-    },
-    
-    # Mining Materials
-    "copper_ore": {
-        "key": "copper ore",
-        "aliases": ["copper"],
-        "desc": "Raw copper ore, ready for smelting.",
-        "category": "material",
-        "subcategory": "ore",
-        "base_value": 10,
-        "weight": 1.0,
-        "stackable": True,
-        "max_stack": 50,
-    },
-    "iron_ore": {
-        "key": "iron ore",
-        "aliases": ["iron"],
-        "desc": "Raw iron ore streaked with rust-red coloring.",
-        "category": "material",
-        "subcategory": "ore",
-        "base_value": 15,
-        "weight": 1.2,
-        "stackable": True,
-        "max_stack": 50,
-    },
-    "tin_ore": {
-        "key": "tin ore",
-        "aliases": ["tin"],
-        "desc": "Silvery tin ore, useful for making bronze.",
-        "category": "material",
-        "subcategory": "ore",
-        "base_value": 8,
-        "weight": 0.9,
-        "stackable": True,
-        "max_stack": 50,
-    },
-    "silver_ore": {
-        "key": "silver ore",
-        "aliases": ["silver"],
-        "desc": "Ore with veins of precious silver running through it.",
-        "category": "material",
-        "subcategory": "ore",
-        "base_value": 40,
-        "weight": 1.0,
-        "stackable": True,
-        "max_stack": 50,
-        "flags": ["valuable"],
-    },
-    "gold_ore": {
-        "key": "gold ore",
-        "aliases": ["gold"],
-        "desc": "Heavy ore glittering with gold deposits.",
-        "category": "material",
-        "subcategory": "ore",
-        "base_value": 80,
-        "weight": 1.5,
-        "stackable": True,
-        "max_stack": 30,
-        "flags": ["valuable"],
-    },
-    "raw_gemstone": {
-        "key": "raw gemstone",
-        "aliases": ["gemstone", "gem"],
-        "desc": "An uncut gemstone, cloudy but promising.",
-        "category": "material",
-        "subcategory": "gem",
-        "base_value": 30,
-        "weight": 0.2,
-        "stackable": True,
-        "max_stack": 30,
-    },
-    "coal": {
-        "key": "lump of coal",
-        "aliases": ["coal"],
-        "desc": "Black coal, useful as fuel.",
-        "category": "material",
-        "subcategory": "fuel",
-        "base_value": 3,
-        "weight": 0.5,
-        "stackable": True,
-        "max_stack": 100,
-    },
-    "stone": {
-        "key": "chunk of stone",
-        "aliases": ["stone", "rock"],
-        "desc": "A chunk of common stone.",
-        "category": "material",
-        "subcategory": "stone",
-        "base_value": 1,
-        "weight": 1.0,
-        "stackable": True,
-        "max_stack": 50,
-    },
-    "flint": {
-        "key": "piece of flint",
-        "aliases": ["flint"],
-        "desc": "Sharp flint, good for starting fires or knapping.",
-        "category": "material",
-        "subcategory": "stone",
-        "base_value": 5,
-        "weight": 0.3,
-        "stackable": True,
-        "max_stack": 30,
-    },
-    
-    # Bug Catching Materials
-    "common_butterfly": {
-        "key": "common butterfly",
-        "aliases": ["butterfly"],
-        "desc": "A delicate butterfly with patterned wings.",
-        "category": "material",
-        "subcategory": "bug",
-        "base_value": 5,
-        "weight": 0.01,
-        "stackable": True,
-        "max_stack": 20,
-    },
-    "dragonfly": {
-        "key": "dragonfly",
-        "aliases": [],
-        "desc": "An iridescent dragonfly, wings shimmering.",
-        "category": "material",
-        "subcategory": "bug",
-        "base_value": 12,
-        "weight": 0.01,
-        "stackable": True,
-        "max_stack": 20,
-    },
-    "firefly": {
-        "key": "firefly",
-        "aliases": ["lightning bug"],
-        "desc": "A firefly that glows softly even when captured.",
-        "category": "material",
-        "subcategory": "bug",
-        "base_value": 8,
-        "weight": 0.01,
-        "stackable": True,
-        "max_stack": 30,
-        "flags": ["glowing"],
-    },
-    "beetle": {
-        "key": "beetle",
-        "aliases": [],
-        "desc": "A shiny beetle with a hard carapace.",
-        "category": "material",
-        "subcategory": "bug",
-        "base_value": 4,
-        "weight": 0.02,
-        "stackable": True,
-        "max_stack": 30,
-    },
-    "rare_moth": {
-        "key": "rare moon moth",
-        "aliases": ["moon moth", "moth"],
-        "desc": "A large moth with wings that seem to glow in moonlight.",
-        "category": "material",
-        "subcategory": "bug",
-        "base_value": 35,
-        "weight": 0.02,
-        "stackable": True,
-        "max_stack": 10,
-        "flags": ["rare", "magical"],
-    },
-    "spider_silk": {
-        "key": "spider silk",
-        "aliases": ["silk"],
-        "desc": "Fine silk harvested from spider webs.",
-        "category": "material",
-        "subcategory": "textile",
-        "base_value": 15,
-        "weight": 0.05,
-        "stackable": True,
-        "max_stack": 50,
-    },
-    
-    # Beach/Tidepool Materials
-    "seashell": {
-        "key": "seashell",
-        "aliases": ["shell"],
-        "desc": "A pretty seashell from the beach.",
-        "category": "material",
-        "subcategory": "shell",
-        "base_value": 2,
-        "weight": 0.1,
-        "stackable": True,
-        "max_stack": 50,
-    },
-    "conch_shell": {
-        "key": "conch shell",
-        "aliases": ["conch"],
-        "desc": "A large spiral shell. You can hear the ocean in it.",
-        "category": "material",
-        "subcategory": "shell",
-        "base_value": 10,
-        "weight": 0.4,
-        "stackable": True,
-        "max_stack": 20,
-    },
-    "sea_glass": {
-        "key": "piece of sea glass",
-        "aliases": ["sea glass", "beach glass"],
-        "desc": "Glass worn smooth by the sea, frosted and beautiful.",
-        "category": "material",
-        "subcategory": "misc",
-        "base_value": 5,
-        "weight": 0.1,
-        "stackable": True,
-        "max_stack": 50,
-    },
-    "driftwood": {
-        "key": "piece of driftwood",
-        "aliases": ["driftwood"],
-        "desc": "Weathered wood from the sea, smooth and pale.",
-        "category": "material",
-        "subcategory": "wood",
-        "base_value": 3,
-        "weight": 0.3,
-        "stackable": True,
-        "max_stack": 30,
-    },
-    "crab": {
-        "key": "small crab",
-        "aliases": ["crab"],
-        "desc": "A small crab that keeps trying to pinch you.",
-        "category": "material",
-        "subcategory": "shellfish",
-        "base_value": 8,
-        "weight": 0.3,
-        "stackable": True,
-        "max_stack": 20,
-    },
-    "starfish": {
-        "key": "starfish",
-        "aliases": ["sea star"],
-        "desc": "A colorful five-armed starfish.",
-        "category": "material",
-        "subcategory": "misc",
-        "base_value": 6,
-        "weight": 0.1,
-        "stackable": True,
-        "max_stack": 20,
-    },
-    "sea_urchin": {
-        "key": "sea urchin",
-        "aliases": ["urchin"],
-        "desc": "A spiny sea urchin. Handle with care.",
-        "category": "material",
-        "subcategory": "misc",
-        "base_value": 10,
-        "weight": 0.2,
-        "stackable": True,
-        "max_stack": 20,
-    },
-    "seaweed": {
-        "key": "strand of seaweed",
-        "aliases": ["seaweed", "kelp"],
-        "desc": "Fresh seaweed from the tide pools.",
-        "category": "material",
-        "subcategory": "plant",
-        "base_value": 2,
-        "weight": 0.1,
-        "stackable": True,
-        "max_stack": 50,
-        "edible": True,
-        "hunger_restore": 3,
-    },
-    
-    # Additional Crafting Materials
-    "red_herb": {
-        "key": "red herb",
-        "aliases": ["healing herb"],
-        "desc": "A herb with distinctive red leaves, known for healing properties.",
-        "category": "material",
-        "subcategory": "herb",
-        "base_value": 8,
-        "weight": 0.1,
-        "stackable": True,
-        "max_stack": 50,
-    },
-    "green_herb": {
-        "key": "green herb",
-        "aliases": ["vigor herb"],
-        "desc": "A vibrant green herb that restores energy.",
-        "category": "material",
-        "subcategory": "herb",
-        "base_value": 6,
-        "weight": 0.1,
-        "stackable": True,
-        "max_stack": 50,
-    },
-    "bitter_root": {
-        "key": "bitter root",
-        "aliases": ["antidote root"],
-        "desc": "A bitter tasting root with detoxifying properties.",
-        "category": "material",
-        "subcategory": "herb",
-        "base_value": 15,
-        "weight": 0.2,
-        "stackable": True,
-        "max_stack": 30,
-    },
-    "passion_poppy": {
-        "key": "passion poppy",
-        "aliases": ["passion flower", "red poppy"],
-        "desc": "A red flower with intoxicating properties. Handle with care.",
-        "category": "material",
-        "subcategory": "herb",
-        "base_value": 20,
-        "weight": 0.1,
-        "stackable": True,
-        "max_stack": 30,
-        "flags": ["adult"],
-    },
-    "moon_lily": {
-        "key": "moon lily",
-        "aliases": ["moonflower"],
-        "desc": "A pale flower that blooms only at night. Magically potent.",
-        "category": "material",
-        "subcategory": "herb",
-        "base_value": 40,
-        "weight": 0.1,
-        "stackable": True,
-        "max_stack": 20,
-        "flags": ["magical", "rare"],
-    },
-    "beast_essence": {
-        "key": "beast essence",
-        "aliases": ["beast extract"],
-        "desc": "A shimmering liquid extracted from magical beasts.",
-        "category": "material",
-        "subcategory": "magical",
-        "base_value": 75,
-        "weight": 0.2,
-        "stackable": True,
-        "max_stack": 10,
-        "flags": ["magical", "rare"],
-    },
-    "glowing_algae": {
-        "key": "glowing algae",
-        "aliases": ["luminous algae"],
-        "desc": "Algae that glows with bioluminescent light.",
-        "category": "material",
-        "subcategory": "plant",
-        "base_value": 18,
-        "weight": 0.1,
-        "stackable": True,
-        "max_stack": 30,
-        "flags": ["glowing"],
-    },
-    "empty_vial": {
-        "key": "empty vial",
-        "aliases": ["vial", "glass vial"],
-        "desc": "A small glass vial, perfect for potions.",
-        "category": "material",
-        "subcategory": "container",
-        "base_value": 5,
-        "weight": 0.1,
-        "stackable": True,
-        "max_stack": 50,
-    },
-    "fiber": {
-        "key": "plant fiber",
-        "aliases": ["fiber", "plant fibers"],
-        "desc": "Strong plant fibers useful for rope and cloth.",
-        "category": "material",
-        "subcategory": "textile",
-        "base_value": 2,
-        "weight": 0.1,
-        "stackable": True,
-        "max_stack": 100,
-    },
-    "cloth": {
-        "key": "bolt of cloth",
-        "aliases": ["cloth", "fabric"],
-        "desc": "A bolt of woven fabric.",
-        "category": "material",
-        "subcategory": "textile",
-        "base_value": 15,
-        "weight": 0.3,
-        "stackable": True,
-        "max_stack": 50,
-    },
-    "silk": {
-        "key": "silk fabric",
-        "aliases": ["silk"],
-        "desc": "Fine silk fabric, smooth and luxurious.",
-        "category": "material",
-        "subcategory": "textile",
-        "base_value": 50,
-        "weight": 0.2,
-        "stackable": True,
-        "max_stack": 30,
-        "flags": ["valuable"],
-    },
-    "lace": {
-        "key": "delicate lace",
-        "aliases": ["lace"],
-        "desc": "Intricate lace fabric for fine clothing.",
-        "category": "material",
-        "subcategory": "textile",
-        "base_value": 35,
-        "weight": 0.1,
-        "stackable": True,
-        "max_stack": 30,
-    },
-    "hide": {
-        "key": "animal hide",
-        "aliases": ["hide", "raw hide", "pelt"],
-        "desc": "An untreated animal hide, needs tanning.",
-        "category": "material",
-        "subcategory": "leather",
-        "base_value": 10,
-        "weight": 1.0,
-        "stackable": True,
-        "max_stack": 20,
-    },
-    "leather": {
-        "key": "piece of leather",
-        "aliases": ["leather", "tanned leather"],
-        "desc": "Properly tanned and treated leather.",
-        "category": "material",
-        "subcategory": "leather",
-        "base_value": 25,
-        "weight": 0.5,
-        "stackable": True,
-        "max_stack": 30,
-    },
-    "wood": {
-        "key": "piece of wood",
-        "aliases": ["wood", "timber", "log"],
-        "desc": "A piece of raw wood, suitable for crafting.",
-        "category": "material",
-        "subcategory": "wood",
-        "base_value": 5,
-        "weight": 1.0,
-        "stackable": True,
-        "max_stack": 50,
-    },
-    "plank": {
-        "key": "wooden plank",
-        "aliases": ["plank", "board"],
-        "desc": "A cut and smoothed wooden plank.",
-        "category": "material",
-        "subcategory": "wood",
-        "base_value": 8,
-        "weight": 0.8,
-        "stackable": True,
-        "max_stack": 50,
-    },
-    "flour": {
-        "key": "bag of flour",
-        "aliases": ["flour"],
-        "desc": "Finely ground flour for baking.",
-        "category": "material",
-        "subcategory": "cooking",
-        "base_value": 4,
-        "weight": 0.5,
-        "stackable": True,
-        "max_stack": 30,
-    },
-    "water": {
-        "key": "bottle of water",
-        "aliases": ["water"],
-        "desc": "Clean, fresh water.",
-        "category": "material",
-        "subcategory": "cooking",
-        "base_value": 1,
-        "weight": 0.5,
-        "stackable": True,
-        "max_stack": 30,
-    },
-    "salt": {
-        "key": "pinch of salt",
-        "aliases": ["salt"],
-        "desc": "Fine salt for cooking and preserving.",
-        "category": "material",
-        "subcategory": "cooking",
-        "base_value": 2,
-        "weight": 0.1,
-        "stackable": True,
-        "max_stack": 50,
-    },
-    "egg": {
-        "key": "fresh egg",
-        "aliases": ["egg", "chicken egg"],
-        "desc": "A fresh egg from a chicken.",
-        "category": "material",
-        "subcategory": "cooking",
-        "base_value": 3,
-        "weight": 0.1,
-        "stackable": True,
-        "max_stack": 30,
-    },
-    "chocolate": {
-        "key": "piece of chocolate",
-        "aliases": ["chocolate"],
-        "desc": "Rich, dark chocolate. A luxury ingredient.",
-        "category": "material",
-        "subcategory": "cooking",
-        "base_value": 20,
-        "weight": 0.2,
-        "stackable": True,
-        "max_stack": 20,
-    },
-    "mussel": {
-        "key": "fresh mussel",
-        "aliases": ["mussel"],
-        "desc": "A fresh mussel from the shore.",
-        "category": "material",
-        "subcategory": "shellfish",
-        "base_value": 4,
-        "weight": 0.1,
-        "stackable": True,
-        "max_stack": 50,
-    },
-    "raw_fish": {
-        "key": "raw fish",
-        "aliases": ["uncooked fish"],
-        "desc": "A fresh, uncooked fish.",
-        "category": "material",
-        "subcategory": "fish",
-        "base_value": 6,
-        "weight": 0.4,
-        "stackable": True,
-        "max_stack": 20,
-    },
-    "copper_ingot": {
-        "key": "copper ingot",
-        "aliases": ["copper bar"],
-        "desc": "A bar of refined copper.",
-        "category": "material",
-        "subcategory": "metal",
-        "base_value": 25,
-        "weight": 1.0,
-        "stackable": True,
-        "max_stack": 50,
-    },
-    "iron_ingot": {
-        "key": "iron ingot",
-        "aliases": ["iron bar"],
-        "desc": "A bar of refined iron.",
-        "category": "material",
-        "subcategory": "metal",
-        "base_value": 40,
-        "weight": 1.2,
-        "stackable": True,
-        "max_stack": 50,
-    },
-    "silver_ingot": {
-        "key": "silver ingot",
-        "aliases": ["silver bar"],
-        "desc": "A bar of refined silver.",
-        "category": "material",
-        "subcategory": "metal",
-        "base_value": 100,
-        "weight": 1.0,
-        "stackable": True,
-        "max_stack": 30,
-        "flags": ["valuable"],
-    },
-    "rough_gem": {
-        "key": "rough gemstone",
-        "aliases": ["rough gem", "uncut gem"],
-        "desc": "An uncut gemstone, cloudy but with potential.",
-        "category": "material",
-        "subcategory": "gem",
-        "base_value": 30,
-        "weight": 0.2,
-        "stackable": True,
-        "max_stack": 30,
-    },
-    "cut_gem": {
-        "key": "cut gemstone",
-        "aliases": ["cut gem", "polished gem"],
-        "desc": "A properly cut and polished gemstone.",
-        "category": "material",
-        "subcategory": "gem",
-        "base_value": 75,
-        "weight": 0.1,
-        "stackable": True,
-        "max_stack": 20,
-        "flags": ["valuable"],
-    },
-    "fishing_hook": {
-        "key": "fishing hook",
-        "aliases": ["hook", "fish hook"],
-        "desc": "A small metal hook for fishing.",
-        "category": "material",
-        "subcategory": "misc",
-        "base_value": 2,
-        "weight": 0.01,
-        "stackable": True,
-        "max_stack": 50,
-    },
-    "rope": {
-        "key": "length of rope",
-        "aliases": ["rope"],
-        "desc": "A sturdy rope woven from plant fibers.",
-        "category": "material",
-        "subcategory": "misc",
-        "base_value": 12,
-        "weight": 0.5,
-        "stackable": True,
-        "max_stack": 20,
-    },
-    "chains": {
-        "key": "metal chains",
-        "aliases": ["chains", "chain"],
-        "desc": "Sturdy metal chains with many uses.",
-        "category": "material",
-        "subcategory": "metal",
-        "base_value": 35,
-        "weight": 1.5,
-        "stackable": True,
-        "max_stack": 10,
-        "flags": ["adult"],
-    },
-    "nails": {
-        "key": "iron nails",
-        "aliases": ["nails"],
-        "desc": "A handful of sturdy iron nails.",
-        "category": "material",
-        "subcategory": "metal",
-        "base_value": 1,
-        "weight": 0.1,
-        "stackable": True,
-        "max_stack": 100,
-    },
-    "metal_ring": {
-        "key": "metal ring",
-        "aliases": ["ring", "iron ring"],
-        "desc": "A simple metal ring. Useful for crafting.",
-        "category": "material",
-        "subcategory": "metal",
-        "base_value": 3,
-        "weight": 0.1,
-        "stackable": True,
-        "max_stack": 50,
-    },
-    "gold_ingot": {
-        "key": "gold ingot",
-        "aliases": ["gold bar"],
-        "desc": "A bar of refined gold.",
-        "category": "material",
-        "subcategory": "metal",
-        "base_value": 200,
-        "weight": 1.5,
-        "stackable": True,
-        "max_stack": 20,
-        "flags": ["valuable"],
-    },
-    "herb_paste": {
-        "key": "herb paste",
-        "aliases": ["paste"],
-        "desc": "A ground herbal paste, foundation for many remedies.",
-        "category": "material",
-        "subcategory": "alchemy",
-        "base_value": 8,
-        "weight": 0.2,
-        "stackable": True,
-        "max_stack": 30,
-    },
-    "handle": {
-        "key": "wooden handle",
-        "aliases": ["handle"],
-        "desc": "A shaped wooden handle for tools.",
-        "category": "material",
-        "subcategory": "wood",
-        "base_value": 3,
-        "weight": 0.2,
-        "stackable": True,
-        "max_stack": 30,
-    },
-    "leather_strips": {
-        "key": "leather strips",
-        "aliases": ["strips"],
-        "desc": "Thin strips of leather for crafting.",
-        "category": "material",
-        "subcategory": "leather",
-        "base_value": 5,
-        "weight": 0.1,
-        "stackable": True,
-        "max_stack": 50,
-    },
-    "rubber_ball": {
-        "key": "rubber ball",
-        "aliases": ["ball"],
-        "desc": "A small rubber ball. Has various uses.",
-        "category": "material",
-        "subcategory": "misc",
-        "base_value": 10,
-        "weight": 0.1,
-        "stackable": True,
-        "max_stack": 20,
-    },
-    "bandages": {
-        "key": "bandages",
-        "aliases": ["bandage"],
-        "desc": "Clean cloth bandages for treating wounds.",
-        "category": "consumable",
-        "subcategory": "medicine",
-        "base_value": 8,
-        "weight": 0.1,
-        "stackable": True,
-        "max_stack": 30,
-        "use_effect": {"type": "heal", "amount": 10},
-        "use_message": "You wrap the bandages around your wounds.",
-    },
-}
-
+_TEMPLATE_TABLES = ("MATERIAL_TEMPLATES", "TOOL_TEMPLATES", "CONSUMABLE_TEMPLATES",
+                    "EQUIPMENT_TEMPLATES", "KEY_TEMPLATES")
 
-# =============================================================================
-# Item Templates - Tools
-# =============================================================================
+MATERIAL_TEMPLATES = LazyRegistry("material templates", "world.data.items:MATERIAL_TEMPLATES")
+TOOL_TEMPLATES = LazyRegistry("tool templates", "world.data.items:TOOL_TEMPLATES")
+CONSUMABLE_TEMPLATES = LazyRegistry("consumable templates", "world.data.items:CONSUMABLE_TEMPLATES")
+EQUIPMENT_TEMPLATES = LazyRegistry("equipment templates", "world.data.items:EQUIPMENT_TEMPLATES")
+KEY_TEMPLATES = LazyRegistry("key templates", "world.data.items:KEY_TEMPLATES")
 
-TOOL_TEMPLATES = {
-    # Gathering Tools
-    "basic_fishing_rod": {
-        "key": "basic fishing rod",
-        "aliases": ["fishing rod", "rod", "pole"],
-        "desc": "A simple wooden fishing rod with basic tackle.",
-        "category": "tool",
-        "subcategory": "fishing",
-        "tool_type": "fishing_rod",
-        "tool_tier": 1,
-        "base_value": 50,
-        "weight": 1.5,
-        "durability": 100,
-        "gathering_bonus": 0,
-    },
-    "quality_fishing_rod": {
-        "key": "quality fishing rod",
-        "aliases": ["good rod", "quality rod"],
-        "desc": "A well-crafted fishing rod with quality line.",
-        "category": "tool",
-        "subcategory": "fishing",
-        "tool_type": "fishing_rod",
-        "tool_tier": 2,
-        "base_value": 150,
-        "weight": 1.3,
-        "durability": 200,
-        "gathering_bonus": 10,
-    },
-    "master_fishing_rod": {
-        "key": "master fishing rod",
-        "aliases": ["master rod"],
-        "desc": "An expertly crafted fishing rod, perfectly balanced.",
-        "category": "tool",
-        "subcategory": "fishing",
-        "tool_type": "fishing_rod",
-        "tool_tier": 3,
-        "base_value": 500,
-        "weight": 1.0,
-        "durability": 500,
-        "gathering_bonus": 25,
-    },
-    
-    "basic_pickaxe": {
-        "key": "basic pickaxe",
-        "aliases": ["pickaxe", "pick"],
-        "desc": "A simple pickaxe with a wooden handle and iron head.",
-        "category": "tool",
-        "subcategory": "mining",
-        "tool_type": "pickaxe",
-        "tool_tier": 1,
-        "base_value": 75,
-        "weight": 3.0,
-        "durability": 100,
-        "gathering_bonus": 0,
-    },
-    "quality_pickaxe": {
-        "key": "quality pickaxe",
-        "aliases": ["good pickaxe", "good pick"],
-        "desc": "A well-forged pickaxe that bites into stone easily.",
-        "category": "tool",
-        "subcategory": "mining",
-        "tool_type": "pickaxe",
-        "tool_tier": 2,
-        "base_value": 200,
-        "weight": 2.5,
-        "durability": 200,
-        "gathering_bonus": 10,
-    },
-    "master_pickaxe": {
-        "key": "master pickaxe",
-        "aliases": ["master pick"],
-        "desc": "A masterwork pickaxe that makes mining feel effortless.",
-        "category": "tool",
-        "subcategory": "mining",
-        "tool_type": "pickaxe",
-        "tool_tier": 3,
-        "base_value": 600,
-        "weight": 2.0,
-        "durability": 500,
-        "gathering_bonus": 25,
-    },
-    
-    "bug_net": {
-        "key": "bug catching net",
-        "aliases": ["bug net", "net", "butterfly net"],
-        "desc": "A fine mesh net on a long handle for catching insects.",
-        "category": "tool",
-        "subcategory": "catching",
-        "tool_type": "bug_net",
-        "tool_tier": 1,
-        "base_value": 40,
-        "weight": 0.5,
-        "durability": 50,
-        "gathering_bonus": 0,
-    },
-    "quality_bug_net": {
-        "key": "quality bug net",
-        "aliases": ["good net", "good bug net"],
-        "desc": "A well-made net with a wider mouth and sturdier handle.",
-        "category": "tool",
-        "subcategory": "catching",
-        "tool_type": "bug_net",
-        "tool_tier": 2,
-        "base_value": 120,
-        "weight": 0.4,
-        "durability": 100,
-        "gathering_bonus": 15,
-    },
-    
-    "foraging_basket": {
-        "key": "foraging basket",
-        "aliases": ["basket"],
-        "desc": "A woven basket for gathering herbs and plants.",
-        "category": "tool",
-        "subcategory": "foraging",
-        "tool_type": "foraging_basket",
-        "tool_tier": 1,
-        "base_value": 25,
-        "weight": 0.5,
-        "durability": 75,
-        "gathering_bonus": 5,
-    },
-    "herbalist_satchel": {
-        "key": "herbalist's satchel",
-        "aliases": ["satchel", "herb bag"],
-        "desc": "A leather satchel designed for collecting and preserving herbs.",
-        "category": "tool",
-        "subcategory": "foraging",
-        "tool_type": "foraging_basket",
-        "tool_tier": 2,
-        "base_value": 100,
-        "weight": 0.3,
-        "durability": 150,
-        "gathering_bonus": 15,
-    },
-    
-    "beach_bucket": {
-        "key": "beach bucket",
-        "aliases": ["bucket", "pail"],
-        "desc": "A sturdy bucket for collecting shells and beach finds.",
-        "category": "tool",
-        "subcategory": "beach",
-        "tool_type": "beach_bucket",
-        "tool_tier": 1,
-        "base_value": 20,
-        "weight": 0.5,
-        "durability": 100,
-        "gathering_bonus": 5,
-    },
-    
-    # Crafting Tools
-    "mortar_pestle": {
-        "key": "mortar and pestle",
-        "aliases": ["mortar", "pestle"],
-        "desc": "A stone bowl and grinding tool for preparing alchemical ingredients.",
-        "category": "tool",
-        "subcategory": "alchemy",
-        "tool_type": "mortar_pestle",
-        "tool_tier": 1,
-        "base_value": 40,
-        "weight": 1.5,
-        "durability": 200,
-    },
-    "smithing_hammer": {
-        "key": "smithing hammer",
-        "aliases": ["smith hammer", "forging hammer"],
-        "desc": "A heavy hammer designed for working hot metal on an anvil.",
-        "category": "tool",
-        "subcategory": "smithing",
-        "tool_type": "smithing_hammer",
-        "tool_tier": 1,
-        "base_value": 60,
-        "weight": 2.5,
-        "durability": 300,
-    },
-    "carpentry_tools": {
-        "key": "carpentry toolkit",
-        "aliases": ["carpentry tools", "woodworking tools", "carpenter's tools"],
-        "desc": "A set of saws, chisels, and planes for working wood.",
-        "category": "tool",
-        "subcategory": "woodworking",
-        "tool_type": "carpentry_tools",
-        "tool_tier": 1,
-        "base_value": 80,
-        "weight": 3.0,
-        "durability": 250,
-    },
-    "sewing_kit": {
-        "key": "sewing kit",
-        "aliases": ["sewing tools", "needle and thread"],
-        "desc": "A compact kit with needles, thread, scissors, and thimbles.",
-        "category": "tool",
-        "subcategory": "tailoring",
-        "tool_type": "sewing_kit",
-        "tool_tier": 1,
-        "base_value": 30,
-        "weight": 0.3,
-        "durability": 100,
-    },
-    "jeweler_tools": {
-        "key": "jeweler's toolkit",
-        "aliases": ["jeweler tools", "jeweling tools"],
-        "desc": "Delicate tools for working with precious metals and gems.",
-        "category": "tool",
-        "subcategory": "jewelcrafting",
-        "tool_type": "jeweler_tools",
-        "tool_tier": 1,
-        "base_value": 100,
-        "weight": 0.8,
-        "durability": 150,
-    },
-    "leatherworking_tools": {
-        "key": "leatherworking toolkit",
-        "aliases": ["leather tools", "tanning tools"],
-        "desc": "Tools for cutting, stitching, and treating leather.",
-        "category": "tool",
-        "subcategory": "leatherworking",
-        "tool_type": "leatherworking_tools",
-        "tool_tier": 1,
-        "base_value": 55,
-        "weight": 1.5,
-        "durability": 200,
-    },
-    "cooking_pot": {
-        "key": "cooking pot",
-        "aliases": ["pot", "stew pot"],
-        "desc": "A large iron pot for cooking stews and soups.",
-        "category": "tool",
-        "subcategory": "cooking",
-        "tool_type": "cooking_pot",
-        "tool_tier": 1,
-        "base_value": 35,
-        "weight": 3.0,
-        "durability": 500,
-    },
-}
+# All of the above, merged in that order
+ITEM_TEMPLATES = LazyRegistry(
+    "item templates", *(f"world.data.items:{table}" for table in _TEMPLATE_TABLES)
+)
 
 
 # =============================================================================
-# Item Templates - Consumables
+# Compiled Prototypes
 # =============================================================================
+# Each template is turned once into the exact Attributes, Tags and
+# aliases an item made from it gets, so creating an item is a single
+# create_object() call (or part of a bulk insert).
 
-CONSUMABLE_TEMPLATES = {
-    "health_potion_minor": {
-        "key": "minor health potion",
-        "aliases": ["health potion", "healing potion", "red potion"],
-        "desc": "A small vial of red liquid that restores health.",
-        "category": "consumable",
-        "subcategory": "potion",
-        "base_value": 25,
-        "weight": 0.2,
-        "stackable": True,
-        "max_stack": 20,
-        "use_effect": {"type": "heal", "amount": 20},
-        "use_message": "You drink the potion. Warmth spreads through your body.",
-    },
-    "health_potion_major": {
-        "key": "major health potion",
-        "aliases": ["big health potion", "large healing potion"],
-        "desc": "A large vial of deep red liquid that greatly restores health.",
-        "category": "consumable",
-        "subcategory": "potion",
-        "base_value": 75,
-        "weight": 0.3,
-        "stackable": True,
-        "max_stack": 10,
-        "use_effect": {"type": "heal", "amount": 50},
-        "use_message": "You drink the potion. Injuries mend as energy surges through you.",
-    },
-    
-    "stamina_potion": {
-        "key": "stamina potion",
-        "aliases": ["energy potion", "green potion"],
-        "desc": "A green potion that restores energy.",
-        "category": "consumable",
-        "subcategory": "potion",
-        "base_value": 20,
-        "weight": 0.2,
-        "stackable": True,
-        "max_stack": 20,
-        "use_effect": {"type": "restore_stamina", "amount": 30},
-        "use_message": "You drink the potion. Your fatigue melts away.",
-    },
-    
-    "antidote": {
-        "key": "antidote",
-        "aliases": ["cure poison", "anti-venom"],
-        "desc": "A bitter medicine that cures poison.",
-        "category": "consumable",
-        "subcategory": "medicine",
-        "base_value": 30,
-        "weight": 0.2,
-        "stackable": True,
-        "max_stack": 10,
-        "use_effect": {"type": "cure", "cures": ["poisoned"]},
-        "use_message": "You drink the bitter antidote. The poison in your veins neutralizes.",
-    },
-    
-    "bread": {
-        "key": "loaf of bread",
-        "aliases": ["bread"],
-        "desc": "A fresh loaf of crusty bread.",
-        "category": "consumable",
-        "subcategory": "food",
-        "base_value": 5,
-        "weight": 0.3,
-        "stackable": True,
-        "max_stack": 20,
-        "edible": True,
-        "hunger_restore": 25,
-        "use_message": "You eat the bread. It's simple but filling.",
-    },
-    
-    "cooked_fish": {
-        "key": "cooked fish",
-        "aliases": ["grilled fish", "fish dinner"],
-        "desc": "A nicely grilled fish, seasoned and ready to eat.",
-        "category": "consumable",
-        "subcategory": "food",
-        "base_value": 15,
-        "weight": 0.4,
-        "stackable": True,
-        "max_stack": 10,
-        "edible": True,
-        "hunger_restore": 40,
-        "use_message": "You eat the fish. Delicious!",
-    },
-    
-    "ale": {
-        "key": "mug of ale",
-        "aliases": ["ale", "beer"],
-        "desc": "A frothy mug of ale.",
-        "category": "consumable",
-        "subcategory": "drink",
-        "base_value": 3,
-        "weight": 0.5,
-        "stackable": False,
-        "use_effect": {"type": "apply_effect", "effect": "tipsy", "duration": 300},
-        "use_message": "You drink the ale. It's bitter but refreshing.",
-    },
-    
-    "aphrodisiac_potion": {
-        "key": "aphrodisiac potion",
-        "aliases": ["pink potion", "love potion"],
-        "desc": "A shimmering pink potion that heightens... sensitivity.",
-        "category": "consumable",
-        "subcategory": "potion",
-        "base_value": 50,
-        "weight": 0.2,
-        "stackable": True,
-        "max_stack": 5,
-        "flags": ["adult"],
-        "use_effect": {"type": "apply_effect", "effect": "aroused", "duration": 600},
-        "use_message": "You drink the potion. Heat spreads through your body...",
-    },
-}
-
-
-# =============================================================================
-# Item Templates - Equipment
-# =============================================================================
+ITEM_TYPECLASS = "typeclasses.objects.Object"
 
-EQUIPMENT_TEMPLATES = {
-    "leather_gloves": {
-        "key": "leather gloves",
-        "aliases": ["gloves"],
-        "desc": "Simple leather gloves that protect your hands.",
-        "category": "equipment",
-        "slot": "hands",
-        "base_value": 20,
-        "weight": 0.3,
-        "armor": 1,
-    },
-    
-    "work_boots": {
-        "key": "sturdy work boots",
-        "aliases": ["boots", "work boots"],
-        "desc": "Heavy boots suitable for rough terrain.",
-        "category": "equipment",
-        "slot": "feet",
-        "base_value": 35,
-        "weight": 1.0,
-        "armor": 2,
-    },
-    
-    "simple_ring": {
-        "key": "simple silver ring",
-        "aliases": ["ring", "silver ring"],
-        "desc": "A plain silver ring.",
-        "category": "equipment",
-        "slot": "finger_l",
-        "base_value": 50,
-        "weight": 0.05,
-    },
-    
-    "collar_leather": {
-        "key": "leather collar",
-        "aliases": ["collar"],
-        "desc": "A simple leather collar with a metal ring.",
-        "category": "equipment",
-        "slot": "neck",
-        "base_value": 30,
-        "weight": 0.2,
-        "flags": ["adult", "collar"],
-    },
-    
-    "collar_elegant": {
-        "key": "elegant collar",
-        "aliases": ["nice collar", "fancy collar"],
-        "desc": "A beautifully crafted collar of soft leather with silver fittings.",
-        "category": "equipment",
-        "slot": "neck",
-        "base_value": 150,
-        "weight": 0.2,
-        "flags": ["adult", "collar"],
-    },
-}
+# template key -> (template dict it was compiled from, ItemPrototype)
+_prototypes = {}
 
 
-# =============================================================================
-# Item Templates - Keys and Special
-# =============================================================================
+class ItemPrototype:
+    """An item template compiled into ready-to-apply Attributes and Tags."""
+    
+    __slots__ = ("template_key", "key", "aliases", "tags", "attributes",
+                 "item_data", "stackable", "max_stack")
+    
+    def __init__(self, template_key, template):
+        self.template_key = template_key
+        self.key = template["key"]
+        self.aliases = list(template.get("aliases") or [])
+        self.stackable = template.get("stackable", False)
+        self.max_stack = template.get("max_stack", 1)
+        
+        flags = list(template.get("flags", []))
+        category = template.get("category", "junk")
+        
+        # item_data without the per-item quantity and quality
+        self.item_data = {
+            "category": category,
+            "subcategory": template.get("subcategory"),
+            "base_value": template.get("base_value", 0),
+            "weight": template.get("weight", 0.1),
+            "stackable": self.stackable,
+            "max_stack": self.max_stack,
+            "flags": flags,
+        }
+        
+        attributes = [
+            ("desc", template.get("desc", "")),
+            ("item_template", template_key),
+        ]
+        
+        # Tool-specific data
+        if template.get("tool_type"):
+            attributes.append(("tool_data", {
+                "tool_type": template["tool_type"],
+                "tool_tier": template.get("tool_tier", 1),
+                "gathering_bonus": template.get("gathering_bonus", 0),
+                "durability": template.get("durability", 100),
+                "max_durability": template.get("durability", 100),
+            }))
+        
+        # Consumable-specific data
+        if template.get("use_effect") or template.get("edible"):
+            attributes.append(("consumable_data", {
+                "use_effect": template.get("use_effect"),
+                "use_message": template.get("use_message"),
+                "edible": template.get("edible", False),
+                "hunger_restore": template.get("hunger_restore", 0),
+            }))
+        
+        # Equipment-specific data
+        if template.get("slot"):
+            attributes.append(("equipment_data", {
+                "slot": template["slot"],
+                "armor": template.get("armor", 0),
+                "stats": template.get("stats", {}),
+            }))
+        
+        # Key-specific data
+        if template.get("grants_access"):
+            attributes.append(("key_data", {
+                "grants_access": template["grants_access"],
+            }))
+        
+        self.attributes = attributes
+        
+        # Tag as item, by category and by flag (tag handlers store lowercase)
+        tags = [("item", "object_type"), (category.lower(), "item_category")]
+        tags.extend((flag.lower(), "item_flag") for flag in flags)
+        self.tags = tags
+    
+    def get_attributes(self, quality="common", quantity=1):
+        """(key, value) pairs for one item of this template."""
+        item_data = dict(self.item_data)
+        item_data["flags"] = list(item_data["flags"])
+        item_data["quantity"] = min(quantity, self.max_stack) if self.stackable else 1
+        item_data["quality"] = quality
+        return self.attributes + [("item_data", item_data)]
 
-KEY_TEMPLATES = {
-    "curator_card": {
-        "key": "Curator's access card",
-        "aliases": ["access card", "card", "curator card"],
-        "desc": "A cream-colored card with elegant script. It grants access to the Curator's private areas.",
-        "category": "key",
-        "base_value": 0,
-        "weight": 0.01,
-        "flags": ["quest", "no_sell", "no_drop"],
-        "grants_access": ["curator_office", "curator_archives"],
-    },
-    
-    "home_key": {
-        "key": "house key",
-        "aliases": ["key", "home key"],
-        "desc": "A key to your home.",
-        "category": "key",
-        "base_value": 0,
-        "weight": 0.05,
-        "flags": ["no_sell"],
-    },
-}
 
+def get_item_prototype(template_key):
+    """
+    Get the compiled prototype for a template, compiling it on first use.
+    
+    A template replaced in ITEM_TEMPLATES is recompiled automatically;
+    call clear_item_prototypes() after editing one in place.
+    """
+    template = ITEM_TEMPLATES.get(template_key)
+    if template is None:
+        return None
+    cached = _prototypes.get(template_key)
+    if cached and cached[0] is template:
+        return cached[1]
+    prototype = ItemPrototype(template_key, template)
+    _prototypes[template_key] = (template, prototype)
+    return prototype
 
-# =============================================================================
-# Combine All Templates
-# =============================================================================
 
-ITEM_TEMPLATES = {}
-ITEM_TEMPLATES.update(MATERIAL_TEMPLATES)
-ITEM_TEMPLATES.update(TOOL_TEMPLATES)
-ITEM_TEMPLATES.update(CONSUMABLE_TEMPLATES)
-ITEM_TEMPLATES.update(EQUIPMENT_TEMPLATES)
-ITEM_TEMPLATES.update(KEY_TEMPLATES)
+def clear_item_prototypes():
+    """Drop all compiled prototypes."""
+    _prototypes.clear()
 
 
 # =============================================================================
@@ -1495,82 +279,113 @@ def create_item(template_key, location=None, quality="common", quantity=1):
     Returns:
         Object: The created item
     """
-    template = get_item_template(template_key)
-    if not template:
+    prototype = get_item_prototype(template_key)
+    if not prototype:
         logger.log_err(f"Unknown item template: {template_key}")
         return None
     
-    # Create the object
-    item = create_object(
-        "typeclasses.objects.Object",
-        key=template["key"],
+    # Attributes, tags and aliases are all applied as part of creation
+    return create_object(
+        ITEM_TYPECLASS,
+        key=prototype.key,
         location=location,
+        aliases=prototype.aliases or None,
+        tags=prototype.tags,
+        attributes=prototype.get_attributes(quality, quantity),
     )
+
+
+def create_items_bulk(entries, location=None, attributes=None):
+    """
+    Create many items in one database transaction.
     
-    if not item:
-        return None
-    
-    # Set up item data
-    item.db.desc = template.get("desc", "")
-    item.db.item_template = template_key
-    item.db.item_data = {
-        "category": template.get("category", "junk"),
-        "subcategory": template.get("subcategory"),
-        "base_value": template.get("base_value", 0),
-        "weight": template.get("weight", 0.1),
-        "stackable": template.get("stackable", False),
-        "max_stack": template.get("max_stack", 1),
-        "quantity": min(quantity, template.get("max_stack", 1)) if template.get("stackable") else 1,
-        "quality": quality,
-        "flags": template.get("flags", []),
-    }
-    
-    # Tool-specific data
-    if template.get("tool_type"):
-        item.db.tool_data = {
-            "tool_type": template["tool_type"],
-            "tool_tier": template.get("tool_tier", 1),
-            "gathering_bonus": template.get("gathering_bonus", 0),
-            "durability": template.get("durability", 100),
-            "max_durability": template.get("durability", 100),
-        }
-    
-    # Consumable-specific data
-    if template.get("use_effect") or template.get("edible"):
-        item.db.consumable_data = {
-            "use_effect": template.get("use_effect"),
-            "use_message": template.get("use_message"),
-            "edible": template.get("edible", False),
-            "hunger_restore": template.get("hunger_restore", 0),
-        }
-    
-    # Equipment-specific data
-    if template.get("slot"):
-        item.db.equipment_data = {
-            "slot": template["slot"],
-            "armor": template.get("armor", 0),
-            "stats": template.get("stats", {}),
-        }
-    
-    # Key-specific data
-    if template.get("grants_access"):
-        item.db.key_data = {
-            "grants_access": template["grants_access"],
-        }
-    
-    # Add aliases
-    if template.get("aliases"):
-        item.aliases.add(template["aliases"])
+    Objects are still created one at a time so typeclass hooks run, but
+    every item's Attributes, Tags and aliases go in as bulk inserts
+    afterwards. Linking bulk-inserted Attributes needs their ids back
+    from the insert; on backends that can't return them (MySQL, older
+    SQLite) Attributes are added per item with batch_add instead.
     
-    # Tag as item
-    item.tags.add("item", category="object_type")
-    item.tags.add(template.get("category", "junk"), category="item_category")
+    Args:
+        entries: Template keys, or (template_key, quantity[, quality])
+            tuples
+        location: Where to place every item
+        attributes: Extra (key, value) pairs to set on every item
     
-    # Add flag tags
-    for flag in template.get("flags", []):
-        item.tags.add(flag, category="item_flag")
+    Returns:
+        list: The created items in entry order; unknown templates are
+        logged and skipped
+    """
+    from django.db import connection, transaction
+    from evennia.objects.models import ObjectDB
+    from evennia.typeclasses.attributes import Attribute
+    from evennia.typeclasses.tags import Tag
+    from evennia.utils.dbserialize import to_pickle
+    
+    plan = []
+    for entry in entries:
+        entry = (entry,) if isinstance(entry, str) else tuple(entry)
+        prototype = get_item_prototype(entry[0])
+        if not prototype:
+            logger.log_err(f"Unknown item template: {entry[0]}")
+            continue
+        quantity = entry[1] if len(entry) > 1 else 1
+        quality = entry[2] if len(entry) > 2 else "common"
+        plan.append((prototype, quantity, quality))
+    
+    if not plan:
+        return []
+    extra = list(attributes or [])
+    
+    with transaction.atomic():
+        items = [
+            create_object(ITEM_TYPECLASS, key=prototype.key, location=location)
+            for prototype, _, _ in plan
+        ]
+        
+        bulk_attributes = connection.features.can_return_rows_from_bulk_insert
+        attr_rows = []
+        attr_owners = []
+        tag_links = []
+        for item, (prototype, quantity, quality) in zip(items, plan):
+            item_attributes = prototype.get_attributes(quality, quantity) + extra
+            if bulk_attributes:
+                for key, value in item_attributes:
+                    attr_rows.append(Attribute(db_key=key, db_value=to_pickle(value), db_model="objectdb"))
+                    attr_owners.append(item.id)
+            else:
+                item.attributes.batch_add(*item_attributes)
+            for tag, category in prototype.tags:
+                tag_links.append((item.id, (tag, category, None)))
+            for alias in prototype.aliases:
+                tag_links.append((item.id, (alias.lower(), None, "alias")))
+        
+        if attr_rows:
+            Attribute.objects.bulk_create(attr_rows)
+            AttributeLink = ObjectDB.db_attributes.through
+            AttributeLink.objects.bulk_create([
+                AttributeLink(objectdb_id=owner_id, attribute_id=attr.id)
+                for owner_id, attr in zip(attr_owners, attr_rows)
+            ])
+        
+        # Tags are shared rows; only the links are per item
+        tags = {}
+        for spec in {spec for _, spec in tag_links}:
+            key, category, tagtype = spec
+            lookup = dict(db_key=key, db_category=category, db_tagtype=tagtype, db_model="objectdb")
+            tags[spec] = Tag.objects.filter(**lookup).first() or Tag.objects.create(**lookup)
+        TagLink = ObjectDB.db_tags.through
+        TagLink.objects.bulk_create([
+            TagLink(objectdb_id=owner_id, tag_id=tags[spec].id)
+            for owner_id, spec in tag_links
+        ])
+    
+    # The handlers cached what existed before the bulk inserts
+    for item in items:
+        item.attributes.reset_cache()
+        item.tags.reset_cache()
+        item.aliases.reset_cache()
     
-    return item
+    return items
 
 
 def is_item(obj):
@@ -2036,12 +851,14 @@ def find_item_in_inventory(character, template_key):
 
 def count_items(character, template_key):
     """
-    Count total quantity of an item type.
+    Count total quantity of an item type, ledger materials included.
     
     Returns:
         int: Total count
     """
-    total = 0
+    from world.materials import count_material
+    
+    total = count_material(character, template_key)
     for item in character.contents:
         if is_item(item) and item.db.item_template == template_key:
             total += get_item_quantity(item)
@@ -2052,6 +869,9 @@ def give_item(character, template_key, quantity=1, quality="common"):
     """
     Give an item to a character, handling stacking.
     
+    Materials go into the character's material ledger (world.materials)
+    as counts; everything else is created as an object.
+    
     Args:
         character: Recipient
         template_key: Item template
@@ -2059,12 +879,18 @@ def give_item(character, template_key, quantity=1, quality="common"):
         quality: Item quality
     
     Returns:
-        Object: The item (or existing stack)
+        Object or int: The item (or existing stack), or for a ledger
+        material the character's new total of it
     """
+    from world.materials import is_ledger_material, add_material
+    
     template = get_item_template(template_key)
     if not template:
         return None
     
+    if is_ledger_material(template_key):
+        return add_material(character, template_key, quantity, quality)
+    
     # Check if stackable and character has existing stack
     if template.get("stackable"):
         existing = find_item_in_inventory(character, template_key)
@@ -2091,8 +917,11 @@ def take_item(character, template_key, quantity=1):
     Returns:
         int: Amount actually removed
     """
-    removed = 0
-    remaining = quantity
+    from world.materials import remove_material
+    
+    # Ledger counts first, then any objects
+    removed = sum(amount for _, amount in remove_material(character, template_key, quantity))
+    remaining = quantity - removed
     
     # Find all matching items
     items = [i for i in character.contents if is_item(i) and i.db.item_template == template_key]
@@ -0,0 +1,333 @@
+"""
+Material Ledger for Gilderhaven
+================================
+
+Gathered materials (herbs, ore, fish and the like) are counts, not
+objects. Each character has one record holding how many of each
+material they carry at each quality:
+
+    {"iron_ore": {"common": 40, "rare": 3}, "wild_herbs": {"common": 12}}
+
+The record is a single Attribute on the character ("materials"),
+cached in memory after first read. Gathering, crafting, shops and quests
+add and remove counts here. A material only becomes a real item object
+when it leaves the ledger: dropped, or otherwise handed out with
+materialize_material(). Picking such an object up folds it back in.
+
+Ledger materials are stackable templates in LEDGER_CATEGORIES that are
+not eaten or used and carry none of LEDGER_EXCLUDED_FLAGS. Everything
+else stays an object as before.
+
+Usage:
+    from world.materials import add_material, count_material, remove_material
+
+    add_material(char, "iron_ore", 5)
+    if count_material(char, "iron_ore") >= 3:
+        remove_material(char, "iron_ore", 3)
+"""
+
+from evennia.utils import logger
+
+
+# =============================================================================
+# Configuration
+# =============================================================================
+
+MATERIALS_ATTR = "materials"
+
+# Template categories kept as counts
+LEDGER_CATEGORIES = ("material",)
+
+# Templates with any of these flags stay objects
+LEDGER_EXCLUDED_FLAGS = ("quest", "unique")
+
+# char.id -> {template_key: {quality: quantity}}
+_ledgers = {}
+
+# char.ids whose carried material objects have been folded in
+_materials_checked = set()
+
+
+# =============================================================================
+# Eligibility
+# =============================================================================
+
+def is_ledger_material(template_key):
+    """Whether a template is carried as a count rather than an object."""
+    from world.items import get_item_template
+
+    template = get_item_template(template_key)
+    if not template or not template.get("stackable"):
+        return False
+    if template.get("category") not in LEDGER_CATEGORIES:
+        return False
+    if template.get("edible") or template.get("use_effect"):
+        return False
+    flags = template.get("flags", [])
+    return not any(flag in flags for flag in LEDGER_EXCLUDED_FLAGS)
+
+
+def _quality_order():
+    from world.items import ITEM_QUALITIES
+    return list(ITEM_QUALITIES)
+
+
+# =============================================================================
+# Ledger Access
+# =============================================================================
+
+def _get_ledger(character):
+    """The cached ledger dict for a character (mutable; save after edits)."""
+    ledger = _ledgers.get(character.id)
+    if ledger is None:
+        stored = character.attributes.get(MATERIALS_ATTR) or {}
+        ledger = {key: dict(by_quality) for key, by_quality in dict(stored).items()}
+        _ledgers[character.id] = ledger
+    if character.id not in _materials_checked:
+        _materials_checked.add(character.id)
+        absorb_inventory(character)
+    return ledger
+
+
+def _save_ledger(character, ledger):
+    # Drop emptied entries so the record only holds what is carried
+    for key in [k for k, by_quality in ledger.items() if not any(by_quality.values())]:
+        del ledger[key]
+    character.attributes.add(MATERIALS_ATTR, ledger)
+
+
+def clear_material_cache(character=None):
+    """Drop cached ledgers, for one character or all of them."""
+    if character is None:
+        _ledgers.clear()
+        _materials_checked.clear()
+        return
+    _ledgers.pop(character.id, None)
+    _materials_checked.discard(character.id)
+
+
+def get_materials(character):
+    """
+    Everything in a character's ledger.
+
+    Returns:
+        list: (template_key, quality, quantity), sorted by template then
+        quality tier
+    """
+    order = {quality: i for i, quality in enumerate(_quality_order())}
+    rows = []
+    for key, by_quality in _get_ledger(character).items():
+        for quality, quantity in by_quality.items():
+            if quantity > 0:
+                rows.append((key, quality, quantity))
+    rows.sort(key=lambda row: (row[0], order.get(row[1], 0)))
+    return rows
+
+
+def count_material(character, template_key, quality=None):
+    """How many of a material a character carries (any quality by default)."""
+    by_quality = _get_ledger(character).get(template_key)
+    if not by_quality:
+        return 0
+    if quality is not None:
+        return by_quality.get(quality, 0)
+    return sum(by_quality.values())
+
+
+def add_material(character, template_key, quantity=1, quality="common"):
+    """
+    Add a material to a character's ledger.
+
+    Returns:
+        int: The character's new total of that material, or 0 if the
+        template is not a ledger material
+    """
+    if quantity <= 0 or not is_ledger_material(template_key):
+        return 0
+    ledger = _get_ledger(character)
+    by_quality = ledger.setdefault(template_key, {})
+    by_quality[quality] = by_quality.get(quality, 0) + quantity
+    _save_ledger(character, ledger)
+    return sum(by_quality.values())
+
+
+def remove_material(character, template_key, quantity=1, quality=None):
+    """
+    Remove a material from a character's ledger.
+
+    With no quality given, the lowest qualities are used up first.
+
+    Returns:
+        list: (quality, quantity) pairs actually removed
+    """
+    ledger = _get_ledger(character)
+    by_quality = ledger.get(template_key)
+    if not by_quality or quantity <= 0:
+        return []
+
+    if quality is not None:
+        qualities = [quality]
+    else:
+        order = _quality_order()
+        qualities = order + [q for q in by_quality if q not in order]
+
+    removed = []
+    remaining = quantity
+    for tier in qualities:
+        have = by_quality.get(tier, 0)
+        if have <= 0:
+            continue
+        took = min(have, remaining)
+        by_quality[tier] = have - took
+        removed.append((tier, took))
+        remaining -= took
+        if remaining <= 0:
+            break
+
+    if removed:
+        _save_ledger(character, ledger)
+    return removed
+
+
+def find_material(character, name):
+    """
+    Match a name the player typed against their ledger materials.
+
+    Template keys, item names and aliases match; exact matches win over
+    prefix matches.
+
+    Returns:
+        str or None: The template key
+    """
+    from world.items import get_item_template
+
+    name = name.strip().lower()
+    if not name:
+        return None
+    partial = None
+    for key in _get_ledger(character):
+        template = get_item_template(key) or {}
+        names = [key, key.replace("_", " "), template.get("key", "").lower()]
+        names += [alias.lower() for alias in template.get("aliases", [])]
+        if name in names:
+            return key
+        if partial is None and any(candidate.startswith(name) for candidate in names):
+            partial = key
+    return partial
+
+
+# =============================================================================
+# Display
+# =============================================================================
+
+def get_material_value(template_key, quality="common", quantity=1, for_sale=True):
+    """Value of ledger materials, priced the same way as item stacks."""
+    from world.items import ITEM_QUALITIES, get_item_template
+
+    base_value = (get_item_template(template_key) or {}).get("base_value", 0)
+    quality_data = ITEM_QUALITIES.get(quality, ITEM_QUALITIES["common"])
+    value = int(base_value * quality_data["value_mult"]) * quantity
+    if for_sale:
+        value = int(value * 0.5)  # Shops buy at 50%
+    return max(1, value) if base_value > 0 else 0
+
+
+def get_material_display_name(template_key, quality="common", quantity=1):
+    """Formatted name for a ledger row, like get_item_display_name()."""
+    from world.items import ITEM_QUALITIES, get_item_template
+
+    name = (get_item_template(template_key) or {}).get("key", template_key)
+    color = ITEM_QUALITIES.get(quality, ITEM_QUALITIES["common"])["color"]
+    name = f"{color}{name}|n"
+    if quantity > 1:
+        name = f"{name} (x{quantity})"
+    return name
+
+
+# =============================================================================
+# Objects
+# =============================================================================
+
+def materialize_material(character, template_key, quantity=None, quality=None, location=None):
+    """
+    Turn ledger counts into real item objects.
+
+    Args:
+        character: Whose ledger to take from
+        template_key: Material to take
+        quantity: How many (default: all of it)
+        quality: Only this quality (default: lowest first)
+        location: Where the objects go (default: the character)
+
+    Returns:
+        list: The created stack objects, each at most max_stack
+    """
+    from world.items import create_items_bulk, get_item_template
+
+    if quantity is None:
+        quantity = count_material(character, template_key, quality)
+    removed = remove_material(character, template_key, quantity, quality)
+    if not removed:
+        return []
+
+    max_stack = (get_item_template(template_key) or {}).get("max_stack", 1) or 1
+    entries = []
+    for tier, amount in removed:
+        while amount > 0:
+            stack = min(amount, max_stack)
+            entries.append((template_key, stack, tier))
+            amount -= stack
+
+    location = character if location is None else location
+    try:
+        return create_items_bulk(entries, location=location)
+    except Exception:
+        # Put the counts back rather than lose them
+        ledger = _get_ledger(character)
+        by_quality = ledger.setdefault(template_key, {})
+        for tier, amount in removed:
+            by_quality[tier] = by_quality.get(tier, 0) + amount
+        _save_ledger(character, ledger)
+        raise
+
+
+def absorb_item(character, item):
+    """
+    Fold a material object into a character's ledger and delete it.
+
+    Returns:
+        bool: True if the item was absorbed
+    """
+    from world.items import is_item, get_item_data
+
+    if not is_item(item):
+        return False
+    template_key = item.db.item_template
+    if not template_key or not is_ledger_material(template_key):
+        return False
+
+    data = get_item_data(item)
+    quantity = data.get("quantity", 1)
+    quality = data.get("quality", "common")
+    if add_material(character, template_key, quantity, quality):
+        item.delete()
+        return True
+    return False
+
+
+def absorb_inventory(character):
+    """
+    Fold every material object a character carries into their ledger.
+
+    Runs automatically the first time a character's ledger is read.
+
+    Returns:
+        int: Number of objects absorbed
+    """
+    absorbed = 0
+    for obj in list(character.contents):
+        if absorb_item(character, obj):
+            absorbed += 1
+    if absorbed:
+        logger.log_info(f"Material ledger: absorbed {absorbed} stacks for {character.key}.")
+    return absorbed
@@ -0,0 +1,363 @@
+"""
+Memory Management for Gilderhaven
+==================================
+
+Keeps Evennia's typeclass cache (the idmapper) under a memory budget.
+
+Build scripts instantiate thousands of objects that stay cached after
+the build. Evennia's own idmapper flush drops everything it can at once
+and warns when it has to run more than once in five minutes. This module
+evicts in policy order instead, before that point is reached:
+
+- never: puppeted characters, anything they carry, rooms with a
+  puppeted character in them, and objects a module registry holds
+  (see register_pin_check)
+- first: items, then furniture, that nobody has touched recently
+- then: NPCs, exits, empty rooms and unpuppeted characters
+
+Eviction tiers are typeclass-level: a class sets EVICTION_TIER to one of
+EVICTION_ORDER and earlier tiers go first. Within a tier the least
+recently touched object goes first; objects are touched when they move.
+
+The MemoryManager script checks process RSS every MEMORY_CHECK_INTERVAL
+seconds and, when it is over MEMORY_BUDGET_MB, evicts down to
+MEMORY_TARGET_MB. RSS seldom drops once Python has the pages, so after
+an eviction run the next one waits until RSS has grown another
+MEMORY_REGROWTH_MB. Evicted objects are simply reloaded from the
+database the next time something asks for them.
+
+A module that keeps objects in a registry of its own must either store
+ids and look the objects up again, or pin what it holds:
+
+    register_pin_check("positions", lambda obj: obj.id in _dirty_positions)
+
+Usage:
+    from world.memory import get_cache_report, flush_objects
+
+    report = get_cache_report()
+    flush_objects(typeclass="typeclasses.objects.Furniture")
+"""
+
+import gc
+import os
+import sys
+import time
+
+from django.conf import settings
+from evennia.utils import logger
+from evennia.scripts.scripts import DefaultScript
+
+
+# =============================================================================
+# Configuration
+# =============================================================================
+
+# Evennia runs its own global flush at IDMAPPER_CACHE_MAXSIZE (200 MB by
+# default); the budget sits below that so it never has to.
+_IDMAPPER_MAX_MB = getattr(settings, "IDMAPPER_CACHE_MAXSIZE", 200)
+MEMORY_BUDGET_MB = int(_IDMAPPER_MAX_MB * 0.8)
+MEMORY_TARGET_MB = int(_IDMAPPER_MAX_MB * 0.6)
+
+# Seconds between budget checks
+MEMORY_CHECK_INTERVAL = 120
+
+# After evicting, RSS must grow this much more before evicting again
+MEMORY_REGROWTH_MB = max(1, int(_IDMAPPER_MAX_MB * 0.1))
+
+# Rough cost of one cached Attribute, used for accounting
+ATTRIBUTE_SIZE_ESTIMATE = 600
+
+# Typeclasses name their tier in EVICTION_TIER; earlier tiers go first
+EVICTION_ORDER = ("item", "furniture", "npc", "exit", "room", "character")
+_TIER_RANK = {tier: rank for rank, tier in enumerate(EVICTION_ORDER)}
+
+# obj.id -> time.time() of last touch
+_last_touched = {}
+
+# name -> check(obj), True when a module registry holds obj
+_pin_checks = {}
+
+_eviction_stats = {
+    "evicted": 0,
+    "budget_runs": 0,
+    "last_run": None,
+    "rss_after_evict": None,   # RSS after the last run that evicted
+}
+
+
+# =============================================================================
+# Policy
+# =============================================================================
+
+def get_eviction_tier(obj):
+    """Eviction tier name for an object; NPC characters count as "npc"."""
+    tier = getattr(obj, "EVICTION_TIER", "item")
+    if tier == "character" and obj.tags.has("npc", category="object_type"):
+        return "npc"
+    return tier
+
+
+def _is_puppeted(obj):
+    return bool(obj.sessions.count())
+
+
+def register_pin_check(name, check):
+    """
+    Keep objects a module registry holds out of eviction.
+
+    Evicting an object a registry still holds would leave the registry
+    working on a stale copy while everything else loads a new one.
+
+    Args:
+        name: Unique name for the check; registering again replaces it
+        check: Called as check(obj), returns True to pin obj
+    """
+    _pin_checks[name] = check
+
+
+def is_pinned(obj):
+    """
+    Whether an object must stay cached.
+
+    Pinned are puppeted characters, whatever they carry, rooms with a
+    puppeted character in them, and anything a pin check claims.
+    """
+    if _is_puppeted(obj):
+        return True
+    if any(check(obj) for check in _pin_checks.values()):
+        return True
+    location = obj.location
+    if location is not None and _is_puppeted(location):
+        return True
+    if location is None and not obj.destination:
+        # A room: pinned while anyone is playing in it
+        return any(_is_puppeted(content) for content in obj.contents)
+    return False
+
+
+def touch(obj):
+    """Mark an object as recently used."""
+    _last_touched[obj.id] = time.time()
+
+
+def _on_room_entered(event):
+    now = time.time()
+    _last_touched[event.room.id] = now
+    _last_touched[event.obj.id] = now
+
+
+def _on_object_deleted(event):
+    _last_touched.pop(event.obj.id, None)
+
+
+def _subscribe():
+    from world.events import subscribe, ROOM_ENTERED, OBJECT_DELETED
+    subscribe(ROOM_ENTERED, _on_room_entered)
+    subscribe(OBJECT_DELETED, _on_object_deleted)
+
+
+_subscribe()
+
+
+# =============================================================================
+# Accounting
+# =============================================================================
+
+def get_rss_mb():
+    """Resident set size of this process in MB, or None if unknown."""
+    try:
+        with open("/proc/self/statm") as statm:
+            pages = int(statm.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        import resource
+        # Peak rather than current, but the best available off Linux
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+    except (ImportError, ValueError):
+        return None
+
+
+def _cached_objects():
+    from evennia.objects.models import ObjectDB
+    return ObjectDB.get_all_cached_instances()
+
+
+def estimate_size(obj):
+    """
+    Estimated bytes an object holds in the cache.
+
+    Shallow sizes of the instance and its fields plus a flat cost per
+    cached Attribute; good for comparing typeclasses, not exact.
+    """
+    size = sys.getsizeof(obj) + sys.getsizeof(obj.__dict__)
+    size += sum(sys.getsizeof(value) for value in obj.__dict__.values())
+    handler = obj.__dict__.get("attributes")
+    if handler is not None:
+        backend = getattr(handler, "backend", handler)
+        size += len(getattr(backend, "_cache", None) or ()) * ATTRIBUTE_SIZE_ESTIMATE
+    return size
+
+
+def get_cache_report():
+    """
+    Cached objects grouped by typeclass.
+
+    Returns:
+        list: (typeclass_path, count, estimated bytes, pinned count),
+        largest first
+    """
+    by_typeclass = {}
+    for obj in _cached_objects():
+        entry = by_typeclass.setdefault(obj.typeclass_path, [0, 0, 0])
+        entry[0] += 1
+        entry[1] += estimate_size(obj)
+        if is_pinned(obj):
+            entry[2] += 1
+
+    report = [(path, count, size, pinned) for path, (count, size, pinned) in by_typeclass.items()]
+    report.sort(key=lambda row: row[2], reverse=True)
+    return report
+
+
+def get_memory_stats():
+    """Budget, RSS and eviction counters."""
+    stats = dict(_eviction_stats)
+    stats["rss_mb"] = get_rss_mb()
+    stats["budget_mb"] = MEMORY_BUDGET_MB
+    stats["target_mb"] = MEMORY_TARGET_MB
+    stats["cached_objects"] = len(_cached_objects())
+    return stats
+
+
+# =============================================================================
+# Eviction
+# =============================================================================
+
+def evict(obj):
+    """
+    Drop one object from the idmapper cache.
+
+    The object's at_idmapper_flush() decides; Gilderhaven typeclasses use
+    it to refuse when pinned and to drop rebuildable ndb caches first.
+
+    Returns:
+        bool: True if the object was evicted
+    """
+    if not obj.at_idmapper_flush():
+        return False
+    obj.flush_from_cache(force=True)
+    _last_touched.pop(obj.id, None)
+    _eviction_stats["evicted"] += 1
+    return True
+
+
+def flush_objects(typeclass=None, max_count=None, free_bytes=None):
+    """
+    Evict cached objects in policy order.
+
+    Args:
+        typeclass: Only objects whose typeclass path ends with this
+        max_count: Stop after evicting this many
+        free_bytes: Stop once this many estimated bytes are evicted
+
+    Returns:
+        tuple: (objects evicted, estimated bytes freed)
+    """
+    candidates = []
+    for obj in _cached_objects():
+        if typeclass and not obj.typeclass_path.endswith(typeclass):
+            continue
+        if is_pinned(obj):
+            continue
+        candidates.append(obj)
+
+    candidates.sort(key=lambda obj: (
+        _TIER_RANK.get(get_eviction_tier(obj), 0),
+        _last_touched.get(obj.id, 0.0),
+    ))
+
+    evicted = freed = 0
+    for obj in candidates:
+        if max_count is not None and evicted >= max_count:
+            break
+        if free_bytes is not None and freed >= free_bytes:
+            break
+        size = estimate_size(obj)
+        if evict(obj):
+            evicted += 1
+            freed += size
+
+    if evicted:
+        gc.collect()
+    return evicted, freed
+
+
+def enforce_memory_budget():
+    """
+    Evict down to MEMORY_TARGET_MB if RSS is over MEMORY_BUDGET_MB.
+
+    RSS rarely shrinks after an eviction, so once a run has evicted, the
+    next only evicts when RSS has grown MEMORY_REGROWTH_MB beyond where
+    that run left it, and then only about that much.
+
+    Returns:
+        int: Objects evicted
+    """
+    _eviction_stats["budget_runs"] += 1
+    _eviction_stats["last_run"] = time.time()
+
+    # Objects Evennia flushed or deleted itself no longer need a touch time
+    cached_ids = set(obj.id for obj in _cached_objects())
+    for obj_id in [obj_id for obj_id in _last_touched if obj_id not in cached_ids]:
+        del _last_touched[obj_id]
+
+    rss = get_rss_mb()
+    if rss is None or rss <= MEMORY_BUDGET_MB:
+        _eviction_stats["rss_after_evict"] = None
+        return 0
+
+    baseline = _eviction_stats["rss_after_evict"]
+    if baseline is None:
+        free_mb = rss - MEMORY_TARGET_MB
+    elif rss - baseline >= MEMORY_REGROWTH_MB:
+        free_mb = rss - baseline
+    else:
+        return 0
+
+    evicted, freed = flush_objects(free_bytes=int(free_mb * 1024 * 1024))
+    _eviction_stats["rss_after_evict"] = get_rss_mb()
+    logger.log_info(
+        f"Memory budget: RSS {rss:.0f} MB over {MEMORY_BUDGET_MB} MB, "
+        f"evicted {evicted} objects (~{freed / (1024 * 1024):.1f} MB)."
+    )
+    return evicted
+
+
+# =============================================================================
+# Manager Script
+# =============================================================================
+
+class MemoryManager(DefaultScript):
+    """Global script that keeps the object cache under the memory budget."""
+
+    def at_script_creation(self):
+        self.key = "MemoryManager"
+        self.desc = "Evicts cached objects to stay under the memory budget"
+        self.interval = MEMORY_CHECK_INTERVAL
+        self.persistent = True
+
+    def at_repeat(self):
+        enforce_memory_budget()
+
+
+def start_memory_manager():
+    """Ensure the MemoryManager script exists. Called from at_server_start."""
+    try:
+        from evennia import search_script, create_script
+        if not search_script("MemoryManager", typeclass="world.memory.MemoryManager"):
+            create_script("world.memory.MemoryManager", key="MemoryManager", persistent=True)
+    except Exception as e:
+        logger.log_err(f"Failed to start MemoryManager: {e}")
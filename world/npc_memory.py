@@ -0,0 +1,318 @@
+"""
+NPC Memory Store for Gilderhaven
+=================================
+
+What each NPC remembers about each character, stored as one compact
+record per (npc, character) pair.
+
+Each pair lives in its own Attribute on the NPC (key = character id,
+category "npc_memory"), so reading or writing one relationship never
+loads or re-pickles the NPC's memory of anyone else. A record holds:
+
+- flags: an int bitset. Bit positions are allocated per NPC in
+  npc.db.npc_flag_names, which only ever grows.
+- counters: dict of name -> int
+- values: dict of name -> arbitrary value (set_npc_memory)
+- last_seen: timestamp of the last write
+
+Records are cached in a bounded LRU. Pairs nobody has touched for
+NPC_MEMORY_STALE_DAYS are moved to the "npc_memory_archive" category by
+a sweep that runs on the first period change each
+NPC_MEMORY_ARCHIVE_INTERVAL; an archived pair is restored on next
+access. Deleting a character deletes every NPC's memory of it.
+
+Usage:
+    from world.npc_memory import get_relation, save_relation
+
+    rel = get_relation(npc, character)
+    if not rel.has_flag(npc, "met"):
+        rel.set_flag(npc, "met")
+        rel.counters["gifts"] = rel.counters.get("gifts", 0) + 1
+        save_relation(npc, character, rel)
+"""
+
+import time
+from collections import OrderedDict
+
+from evennia import search_tag
+from evennia.utils import logger
+
+
+# =============================================================================
+# Configuration
+# =============================================================================
+
+NPC_MEMORY_CATEGORY = "npc_memory"
+NPC_MEMORY_ARCHIVE_CATEGORY = "npc_memory_archive"
+
+# Relationships held in the in-memory LRU across all NPCs
+NPC_MEMORY_CACHE_SIZE = 2000
+
+# Pairs untouched for this long are archived by archive_stale_memory()
+NPC_MEMORY_STALE_DAYS = 30
+
+# Seconds between sweeps of every NPC for stale pairs
+NPC_MEMORY_ARCHIVE_INTERVAL = 24 * 3600
+
+_last_archive_sweep = 0.0
+
+
+# =============================================================================
+# Relation Record
+# =============================================================================
+
+class NPCRelation:
+    """One NPC's memory of one character."""
+
+    __slots__ = ("flags", "counters", "values", "last_seen")
+
+    def __init__(self, flags=0, counters=None, values=None, last_seen=None):
+        self.flags = flags
+        self.counters = counters or {}
+        self.values = values or {}
+        self.last_seen = last_seen
+
+    def to_record(self):
+        """Compact tuple stored in the Attribute."""
+        return (self.flags, dict(self.counters), dict(self.values), self.last_seen)
+
+    @classmethod
+    def from_record(cls, record):
+        flags, counters, values, last_seen = record
+        return cls(flags, dict(counters), dict(values), last_seen)
+
+    def has_flag(self, npc, flag):
+        bit = _flag_bit(npc, flag, create=False)
+        return bit is not None and bool(self.flags & (1 << bit))
+
+    def set_flag(self, npc, flag):
+        self.flags |= 1 << _flag_bit(npc, flag)
+
+    def clear_flag(self, npc, flag):
+        bit = _flag_bit(npc, flag, create=False)
+        if bit is not None:
+            self.flags &= ~(1 << bit)
+
+    def flag_names(self, npc):
+        names = npc.db.npc_flag_names or []
+        return [name for bit, name in enumerate(names) if self.flags & (1 << bit)]
+
+    def as_dict(self, npc):
+        """Flattened view in the old per-character memory dict shape."""
+        memory = dict(self.values)
+        memory.update(self.counters)
+        for name in self.flag_names(npc):
+            memory[name] = True
+        if self.last_seen:
+            memory["last_seen"] = self.last_seen
+        return memory
+
+
+# (npc.id, character.id) -> NPCRelation, most recently used last
+_relation_cache = OrderedDict()
+
+# npc.id -> {flag name: bit}
+_flag_bits = {}
+
+
+def _flag_bit(npc, flag, create=True):
+    """Get (or allocate) the bit used for a flag on this NPC."""
+    bits = _flag_bits.get(npc.id)
+    if bits is None:
+        names = npc.db.npc_flag_names or []
+        bits = _flag_bits[npc.id] = {name: i for i, name in enumerate(names)}
+
+    bit = bits.get(flag)
+    if bit is None and create:
+        names = list(npc.db.npc_flag_names or [])
+        bit = len(names)
+        names.append(flag)
+        npc.db.npc_flag_names = names
+        bits[flag] = bit
+    return bit
+
+
+def _cache_put(key, relation):
+    _relation_cache[key] = relation
+    _relation_cache.move_to_end(key)
+    while len(_relation_cache) > NPC_MEMORY_CACHE_SIZE:
+        _relation_cache.popitem(last=False)
+
+
+# =============================================================================
+# Store Access
+# =============================================================================
+
+def get_relation(npc, character):
+    """
+    Get the relation record for a pair, loading only that pair.
+
+    Returns a fresh, unsaved record if the NPC has no memory of them.
+    """
+    key = (npc.id, character.id)
+    relation = _relation_cache.get(key)
+    if relation is not None:
+        _relation_cache.move_to_end(key)
+        return relation
+
+    if npc.attributes.has("npc_memory"):
+        migrate_npc_memory(npc)
+
+    attr_key = str(character.id)
+    record = npc.attributes.get(attr_key, category=NPC_MEMORY_CATEGORY)
+    if record is None:
+        record = npc.attributes.get(attr_key, category=NPC_MEMORY_ARCHIVE_CATEGORY)
+        if record is not None:
+            # Restore an archived relationship
+            npc.attributes.remove(attr_key, category=NPC_MEMORY_ARCHIVE_CATEGORY)
+            npc.attributes.add(attr_key, record, category=NPC_MEMORY_CATEGORY)
+
+    relation = NPCRelation.from_record(record) if record else NPCRelation()
+    _cache_put(key, relation)
+    return relation
+
+
+def save_relation(npc, character, relation):
+    """Write one pair's record, stamping last_seen."""
+    relation.last_seen = time.time()
+    npc.attributes.add(str(character.id), relation.to_record(), category=NPC_MEMORY_CATEGORY)
+    _cache_put((npc.id, character.id), relation)
+
+
+def forget_relation(npc, character):
+    """Remove everything an NPC remembers about a character."""
+    _relation_cache.pop((npc.id, character.id), None)
+    attr_key = str(character.id)
+    npc.attributes.remove(attr_key, category=NPC_MEMORY_CATEGORY)
+    npc.attributes.remove(attr_key, category=NPC_MEMORY_ARCHIVE_CATEGORY)
+
+
+def forget_character(character):
+    """
+    Remove every NPC's memory of a character.
+
+    Returns:
+        int: Number of NPCs that remembered them
+    """
+    from evennia.objects.models import ObjectDB
+
+    npcs = ObjectDB.objects.filter(
+        db_attributes__db_key=str(character.id),
+        db_attributes__db_category__in=(NPC_MEMORY_CATEGORY, NPC_MEMORY_ARCHIVE_CATEGORY),
+    ).distinct()
+    count = 0
+    for npc in npcs:
+        forget_relation(npc, character)
+        count += 1
+    return count
+
+
+def clear_memory_cache(npc=None):
+    """Drop cached records, for one NPC or all of them."""
+    if npc is None:
+        _relation_cache.clear()
+        _flag_bits.clear()
+        return
+    for key in [k for k in _relation_cache if k[0] == npc.id]:
+        del _relation_cache[key]
+    _flag_bits.pop(npc.id, None)
+
+
+# =============================================================================
+# Maintenance
+# =============================================================================
+
+def archive_stale_memory(npc, max_age_days=NPC_MEMORY_STALE_DAYS):
+    """
+    Move relationships untouched for max_age_days to the archive category.
+
+    Returns:
+        int: Number of relationships archived
+    """
+    cutoff = time.time() - max_age_days * 86400
+    attrs = npc.attributes.get(
+        category=NPC_MEMORY_CATEGORY, return_list=True, return_obj=True
+    ) or []
+
+    archived = 0
+    for attr in attrs:
+        if attr is None:
+            continue
+        record = attr.value
+        last_seen = record[3] if record else None
+        if last_seen and last_seen >= cutoff:
+            continue
+        npc.attributes.add(attr.key, record, category=NPC_MEMORY_ARCHIVE_CATEGORY)
+        npc.attributes.remove(attr.key, category=NPC_MEMORY_CATEGORY)
+        _relation_cache.pop((npc.id, int(attr.key)), None)
+        archived += 1
+    return archived
+
+
+def archive_all_stale_memory(max_age_days=NPC_MEMORY_STALE_DAYS):
+    """
+    Archive stale relationships on every NPC.
+
+    Returns:
+        int: Number of relationships archived
+    """
+    archived = 0
+    for npc in search_tag("npc", category="object_type"):
+        try:
+            archived += archive_stale_memory(npc, max_age_days)
+        except Exception as e:
+            logger.log_err(f"Error archiving memory for {npc.key}: {e}")
+    if archived:
+        logger.log_info(f"NPC memory: archived {archived} stale relationships.")
+    return archived
+
+
+def _on_period_changed(event):
+    global _last_archive_sweep
+    now = time.time()
+    if now - _last_archive_sweep < NPC_MEMORY_ARCHIVE_INTERVAL:
+        return
+    _last_archive_sweep = now
+    archive_all_stale_memory()
+
+
+def _on_object_deleted(event):
+    obj = event.obj
+    if obj.tags.has("npc", category="object_type"):
+        # Its records go with its Attributes; only the cache is left
+        clear_memory_cache(obj)
+    elif obj.is_typeclass("typeclasses.characters.Character", exact=False):
+        forget_character(obj)
+
+
+def _subscribe():
+    from world.events import subscribe, PERIOD_CHANGED, OBJECT_DELETED
+    subscribe(PERIOD_CHANGED, _on_period_changed)
+    subscribe(OBJECT_DELETED, _on_object_deleted)
+
+
+_subscribe()
+
+
+def migrate_npc_memory(npc):
+    """
+    Convert an old npc.db.npc_memory dict-of-dicts into per-pair records.
+
+    True values become flags, ints become counters, everything else is
+    kept as a value.
+    """
+    legacy = npc.attributes.get("npc_memory") or {}
+    now = time.time()
+    for char_id, memory in dict(legacy).items():
+        relation = NPCRelation(last_seen=now)
+        for name, value in dict(memory).items():
+            if value is True:
+                relation.set_flag(npc, name)
+            elif isinstance(value, int) and not isinstance(value, bool):
+                relation.counters[name] = value
+            else:
+                relation.values[name] = value
+        npc.attributes.add(str(char_id), relation.to_record(), category=NPC_MEMORY_CATEGORY)
+    npc.attributes.remove("npc_memory")
+    if legacy:
+        logger.log_info(f"Migrated NPC memory for {npc.key}: {len(legacy)} relationships.")
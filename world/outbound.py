@@ -0,0 +1,218 @@
+"""
+Outbound Message Batching for Gilderhaven
+==========================================
+
+One action usually sends several lines to the same people: a departure
+and an arrival, a follow message per party member, a combat line per
+hit, a sound carried into every neighbouring room. Each msg() used to
+be its own trip through the session handler and over AMP to the portal.
+
+While batching is on, plain text sent to a session is held until the
+current reactor tick ends. Then each session's lines go out joined into
+one send. Anything else (prompts, OOB data, text with options) first
+flushes that session's held text, then goes straight through, so
+nothing is reordered. Text carrying send kwargs ({"type": "say"}) only
+joins text with the same kwargs.
+
+Ambient lines (random events, creature tells, fae moments) go through
+send_ambient(), which caps how many a room gets in a time window so a
+busy room isn't buried in them.
+
+server/conf/serversession.py routes every session's output through
+session_data_out(). Turn batching off with MESSAGE_BATCHING = False in
+settings, or at runtime with the msgbatch admin command.
+
+Usage:
+    from world.outbound import send_ambient, get_outbound_stats
+
+    send_ambient(room, "|xA breeze stirs the leaves.|n")
+    get_outbound_stats()   # {"messages": ..., "sends": ..., "coalesced": ...}
+"""
+
+import time
+from collections import deque
+
+from django.conf import settings
+from evennia.utils import logger
+
+
+# =============================================================================
+# Configuration
+# =============================================================================
+
+# At most this many ambient lines per room per this many seconds
+AMBIENT_RATE_LIMIT = getattr(settings, "AMBIENT_RATE_LIMIT", (3, 60.0))
+
+_enabled = getattr(settings, "MESSAGE_BATCHING", True)
+
+# session -> (send function, [[text kwargs, [lines]], ...])
+_queues = {}
+
+# Pending reactor call that flushes the queues, if any
+_flush_call = None
+
+# room id -> deque of recent ambient send times
+_ambient_times = {}
+
+_stats = {
+    "messages": 0,        # text messages held for batching
+    "sends": 0,           # sends made when flushing them
+    "coalesced": 0,       # messages that rode along in another's send
+    "passthrough": 0,     # outputs sent straight through
+    "flushes": 0,         # end-of-tick flushes
+    "ambient_sent": 0,
+    "ambient_dropped": 0,
+}
+
+
+# =============================================================================
+# Batching
+# =============================================================================
+
+def _batchable_text(kwargs):
+    """
+    The (text, text kwargs) of a plain text output, or None.
+
+    Only outputs carrying nothing but text (and empty options) batch.
+    """
+    if kwargs.get("options") or any(key not in ("text", "options") for key in kwargs):
+        return None
+    text = kwargs.get("text")
+    if isinstance(text, str):
+        return text, {}
+    if isinstance(text, (tuple, list)) and 1 <= len(text) <= 2 and isinstance(text[0], str):
+        meta = text[1] if len(text) == 2 else {}
+        if isinstance(meta, dict):
+            return text[0], meta
+    return None
+
+
+def session_data_out(session, send, kwargs):
+    """
+    Send or hold one output for a session. Called from ServerSession.data_out.
+
+    Args:
+        session: The ServerSession
+        send: The session's unbatched data_out
+        kwargs: The output, as passed to data_out
+    """
+    global _flush_call
+    text = _batchable_text(kwargs) if _enabled else None
+    if text is None:
+        if session in _queues:
+            _flush_session(session)
+        _stats["passthrough"] += 1
+        send(**kwargs)
+        return
+
+    line, meta = text
+    entry = _queues.get(session)
+    if entry is None:
+        entry = _queues[session] = (send, [])
+    chunks = entry[1]
+    if chunks and chunks[-1][0] == meta:
+        chunks[-1][1].append(line)
+    else:
+        chunks.append([meta, [line]])
+    _stats["messages"] += 1
+
+    if _flush_call is None:
+        from twisted.internet import reactor
+        if reactor.running:
+            _flush_call = reactor.callLater(0, flush_outbound)
+        else:
+            # No reactor to end the tick (e.g. evennia shell)
+            flush_outbound()
+
+
+def _flush_session(session):
+    send, chunks = _queues.pop(session)
+    for meta, lines in chunks:
+        text = "\n".join(lines)
+        _stats["sends"] += 1
+        _stats["coalesced"] += len(lines) - 1
+        try:
+            send(text=(text, meta) if meta else text)
+        except Exception as e:
+            logger.log_err(f"Outbound: send to session {getattr(session, 'sessid', '?')} failed: {e}")
+
+
+def flush_outbound():
+    """Send everything held. Runs at the end of each tick that queued text."""
+    global _flush_call
+    _flush_call = None
+    if not _queues:
+        return
+    _stats["flushes"] += 1
+    for session in list(_queues):
+        _flush_session(session)
+
+
+# =============================================================================
+# Ambient Rate Limits
+# =============================================================================
+
+def send_ambient(room, text, exclude=None, **kwargs):
+    """
+    Send an ambient line to a room, unless it has had its share lately.
+
+    Args:
+        room: The room
+        text: The line
+        exclude: Objects not to send it to
+        **kwargs: Passed to msg_contents
+
+    Returns:
+        bool: Whether it was sent
+    """
+    limit, window = AMBIENT_RATE_LIMIT
+    now = time.time()
+    times = _ambient_times.get(room.id)
+    if times is None:
+        times = _ambient_times[room.id] = deque()
+    while times and now - times[0] > window:
+        times.popleft()
+    if len(times) >= limit:
+        _stats["ambient_dropped"] += 1
+        return False
+    times.append(now)
+    _stats["ambient_sent"] += 1
+    room.msg_contents(text, exclude=exclude, **kwargs)
+    return True
+
+
+# =============================================================================
+# Control and Stats
+# =============================================================================
+
+def is_batching():
+    """Whether outbound text is being batched."""
+    return _enabled
+
+
+def enable_batching():
+    """Start batching outbound text."""
+    global _enabled
+    _enabled = True
+
+
+def disable_batching():
+    """Stop batching; anything held is sent now."""
+    global _enabled
+    _enabled = False
+    flush_outbound()
+
+
+def get_outbound_stats():
+    """Counters for batched, sent and coalesced messages and ambient limits."""
+    stats = dict(_stats)
+    stats["enabled"] = _enabled
+    stats["held"] = sum(len(lines) for _, chunks in _queues.values() for _, lines in chunks)
+    stats["limited_rooms"] = sum(1 for times in _ambient_times.values() if len(times) >= AMBIENT_RATE_LIMIT[0])
+    return stats
+
+
+def reset_outbound_stats():
+    """Zero the counters."""
+    for key in _stats:
+        _stats[key] = 0
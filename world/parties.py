@@ -614,7 +614,7 @@ def distribute_loot(party, loot_items, source_name=""):
     Returns:
         dict: {character: [(item, amount), ...]}
     """
-    from world.items import create_item, give_item
+    from world.items import create_items_bulk
     
     if not party:
         return {}
@@ -645,12 +645,10 @@ def distribute_loot(party, loot_items, source_name=""):
             distributions[leader].append((item_key, amount))
             leader.msg(f"|gYou obtained: {item_key} x{amount}|n")
     
-    # Actually create and give items
+    # Actually create and give items, one batch per member
     for member, items in distributions.items():
-        for item_key, amount in items:
-            item = create_item(item_key, location=member)
-            if item and amount > 1:
-                item.db.quantity = amount
+        if items:
+            create_items_bulk(items, location=member)
     
     return distributions
 
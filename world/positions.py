@@ -11,7 +11,7 @@ Positions are stored on characters and affect:
 - Interactions with furniture
 - Paired/group activities
 
-Data Storage:
+Data Storage (written behind from memory, see Position Graph):
     character.db.position = {
         "pose": "sitting",           # Current position type
         "furniture_id": 123,         # Furniture being used (or None)
@@ -20,6 +20,11 @@ Data Storage:
         "custom_desc": "...",        # Optional custom description
         "flags": ["restrained"],     # Position flags
     }
+    furniture.db.occupants = {"seat_1": 456}
+
+Positions and furniture occupancy are read and changed in memory; the
+Attributes are only the persisted copy. Room descriptions get the
+sentences for everyone present in one pass via get_positions_for_room().
 
 Usage:
     from world.positions import (
@@ -42,7 +47,9 @@ Usage:
 """
 
 import time
-from evennia.utils import logger
+from evennia.utils import logger, delay
+
+from world.memory import register_pin_check
 
 
 # =============================================================================
@@ -434,6 +441,101 @@ POSITION_CATEGORIES = {
 }
 
 
+# =============================================================================
+# Position Graph
+# =============================================================================
+# character id -> position dict and furniture id -> {slot: character id},
+# each loaded from its Attribute on first read. Changes are written back
+# to the Attributes POSITION_FLUSH_DELAY seconds later.
+
+POSITION_FLUSH_DELAY = 30
+
+_positions = {}         # character id -> position dict, or None if standing
+_occupancy = {}         # furniture id -> {slot: character id}
+_dirty_positions = {}   # character id -> character awaiting write-back
+_dirty_occupancy = {}   # furniture id -> furniture awaiting write-back
+_flush_pending = False
+
+
+def _awaiting_write(obj):
+    # The write-back holds the object itself; evicting it would save a stale copy
+    return obj.id in _dirty_positions or obj.id in _dirty_occupancy
+
+
+register_pin_check("positions", _awaiting_write)
+
+
+def _get_pos(character):
+    """A character's in-memory position dict (None when standing)."""
+    char_id = character.id
+    if char_id not in _positions:
+        stored = character.db.position
+        if stored:
+            stored = dict(stored)
+            stored["partner_ids"] = list(stored.get("partner_ids", []))
+            stored["flags"] = list(stored.get("flags", []))
+        _positions[char_id] = stored or None
+    return _positions[char_id]
+
+
+def _put_pos(character, pos):
+    _positions[character.id] = pos
+    _position_changed(character)
+
+
+def _position_changed(character):
+    """Queue a character's position for write-behind."""
+    _dirty_positions[character.id] = character
+    _schedule_flush()
+
+
+def get_occupancy(furniture):
+    """
+    In-memory {slot: character id} for a piece of furniture.
+    
+    Callers that change it must call _occupancy_changed().
+    """
+    occupants = _occupancy.get(furniture.id)
+    if occupants is None:
+        occupants = _occupancy[furniture.id] = dict(furniture.db.occupants or {})
+    return occupants
+
+
+def _occupancy_changed(furniture):
+    """Queue a piece of furniture's occupancy for write-behind."""
+    _dirty_occupancy[furniture.id] = furniture
+    _schedule_flush()
+
+
+def _schedule_flush():
+    global _flush_pending
+    if not _flush_pending:
+        _flush_pending = True
+        delay(POSITION_FLUSH_DELAY, flush_positions)
+
+
+def flush_positions():
+    """
+    Write all pending positions and occupancy to the database.
+    
+    Runs on a timer after changes, and should also be called before the
+    server stops.
+    """
+    global _flush_pending
+    _flush_pending = False
+    characters = list(_dirty_positions.values())
+    furniture = list(_dirty_occupancy.values())
+    _dirty_positions.clear()
+    _dirty_occupancy.clear()
+    
+    for character in characters:
+        if getattr(character, "pk", None):
+            character.db.position = _positions.get(character.id)
+    for furn in furniture:
+        if getattr(furn, "pk", None):
+            furn.db.occupants = dict(_occupancy.get(furn.id, {}))
+
+
 # =============================================================================
 # Core Functions
 # =============================================================================
@@ -445,7 +547,7 @@ def get_position(character):
     Returns:
         dict: Position data or None if standing
     """
-    return character.db.position
+    return _get_pos(character)
 
 
 def get_position_type(character):
@@ -455,7 +557,7 @@ def get_position_type(character):
     Returns:
         str: Position type (e.g., "sitting", "kneeling") or "standing"
     """
-    pos = character.db.position
+    pos = _get_pos(character)
     if not pos:
         return "standing"
     return pos.get("pose", "standing")
@@ -473,13 +575,13 @@ def get_position_info(position_type):
 
 def is_standing(character):
     """Check if character is standing (default position)."""
-    pos = character.db.position
+    pos = _get_pos(character)
     return not pos or pos.get("pose") == "standing"
 
 
 def is_mobile(character):
     """Check if character can move in their current position."""
-    pos = character.db.position
+    pos = _get_pos(character)
     if not pos:
         return True
     
@@ -506,7 +608,7 @@ def can_move(character):
         return False
     
     # Check if on furniture
-    pos = character.db.position
+    pos = _get_pos(character)
     if pos and pos.get("furniture_id"):
         return False
     
@@ -522,7 +624,7 @@ def can_move(character):
 
 def has_flag(character, flag):
     """Check if character's position has a specific flag."""
-    pos = character.db.position
+    pos = _get_pos(character)
     if not pos:
         return False
     return flag in pos.get("flags", [])
@@ -587,12 +689,12 @@ def set_position(character, pose, furniture=None, slot=None, partner=None,
         position_data["flags"].extend(flags)
     
     # Clear old position first
-    old_pos = character.db.position
+    old_pos = _get_pos(character)
     if old_pos:
         _cleanup_old_position(character, old_pos)
     
     # Set new position
-    character.db.position = position_data
+    _put_pos(character, position_data)
     
     # Update furniture occupancy
     if furniture:
@@ -626,7 +728,7 @@ def clear_position(character, silent=False):
     Returns:
         tuple: (success, message)
     """
-    pos = character.db.position
+    pos = _get_pos(character)
     if not pos or pos.get("pose") == "standing":
         return True, "Already standing."
     
@@ -638,7 +740,7 @@ def clear_position(character, silent=False):
     _cleanup_old_position(character, pos)
     
     # Clear position
-    character.db.position = None
+    _put_pos(character, None)
     
     if not silent:
         character.msg("You stand up.")
@@ -656,11 +758,11 @@ def force_clear_position(character, silent=False):
     Force clear position even if restrained.
     Use for admin commands or when furniture is destroyed.
     """
-    pos = character.db.position
+    pos = _get_pos(character)
     if pos:
         _cleanup_old_position(character, pos)
     
-    character.db.position = None
+    _put_pos(character, None)
     
     if not silent:
         character.msg("You are released and stand up.")
@@ -681,7 +783,7 @@ def get_position_display(character, viewer=None):
     Returns:
         str: Position description (e.g., "sitting on the wooden chair")
     """
-    pos = character.db.position
+    pos = _get_pos(character)
     
     if not pos or pos.get("pose") == "standing":
         return "standing"
@@ -729,11 +831,40 @@ def get_position_for_room(character):
     Returns:
         str: Full sentence like "CharName is sitting on the chair."
     """
-    pos = character.db.position
-    
+    pos = _get_pos(character)
     if not pos or pos.get("pose") == "standing":
         return None  # Don't show standing characters specially
+    return _room_sentence(character, pos, {})
+
+
+def get_positions_for_room(room, characters=None):
+    """
+    Position sentences for everyone in a room who isn't standing.
+    
+    Positions come from memory and furniture and partners are resolved
+    from the room's own contents first, so a render costs no queries.
+    
+    Args:
+        room: The room being rendered
+        characters: Who to include (default: everything in the room)
+    
+    Returns:
+        list: Sentences in the order of characters
+    """
+    contents = room.contents
+    if characters is None:
+        characters = contents
+    local = {obj.id: obj for obj in contents}
     
+    lines = []
+    for character in characters:
+        pos = _get_pos(character)
+        if pos and pos.get("pose") != "standing":
+            lines.append(_room_sentence(character, pos, local))
+    return lines
+
+
+def _room_sentence(character, pos, local):
     pose = pos.get("pose", "standing")
     pos_info = POSITIONS.get(pose, {})
     desc = pos_info.get("desc", f"is {pose}")
@@ -744,23 +875,17 @@ def get_position_for_room(character):
     
     # Substitute furniture name
     if "{furniture}" in desc:
-        furniture = _get_furniture(pos.get("furniture_id"))
-        if furniture:
-            desc = desc.replace("{furniture}", furniture.key)
-        else:
-            desc = desc.replace("{furniture}", "something")
+        furniture_id = pos.get("furniture_id")
+        furniture = local.get(furniture_id) or _get_furniture(furniture_id)
+        desc = desc.replace("{furniture}", furniture.key if furniture else "something")
     
     # Substitute partner name
     if "{partner}" in desc:
         partner_ids = pos.get("partner_ids", [])
+        partner = None
         if partner_ids:
-            partner = _get_character(partner_ids[0])
-            if partner:
-                desc = desc.replace("{partner}", partner.key)
-            else:
-                desc = desc.replace("{partner}", "someone")
-        else:
-            desc = desc.replace("{partner}", "someone")
+            partner = local.get(partner_ids[0]) or _get_character(partner_ids[0])
+        desc = desc.replace("{partner}", partner.key if partner else "someone")
     
     return f"|c{character.key}|n {desc}."
 
@@ -771,7 +896,7 @@ def get_position_for_room(character):
 
 def get_partner(character):
     """Get character's position partner, if any."""
-    pos = character.db.position
+    pos = _get_pos(character)
     if not pos:
         return None
     
@@ -784,7 +909,7 @@ def get_partner(character):
 
 def get_partners(character):
     """Get all of character's position partners."""
-    pos = character.db.position
+    pos = _get_pos(character)
     if not pos:
         return []
     
@@ -799,7 +924,7 @@ def get_partners(character):
 
 def add_partner(character, partner):
     """Add a partner to character's current position."""
-    pos = character.db.position
+    pos = _get_pos(character)
     if not pos:
         return False, "You're not in a position that supports partners."
     
@@ -808,6 +933,7 @@ def add_partner(character, partner):
     
     if partner.id not in pos["partner_ids"]:
         pos["partner_ids"].append(partner.id)
+        _position_changed(character)
     
     _link_partner(character, partner)
     return True, f"Added {partner.key} as partner."
@@ -815,12 +941,13 @@ def add_partner(character, partner):
 
 def remove_partner(character, partner):
     """Remove a partner from character's position."""
-    pos = character.db.position
+    pos = _get_pos(character)
     if not pos:
         return False, "No position to remove partner from."
     
     if partner.id in pos.get("partner_ids", []):
         pos["partner_ids"].remove(partner.id)
+        _position_changed(character)
     
     _unlink_partner(character, partner)
     return True, f"Removed {partner.key} as partner."
@@ -832,7 +959,7 @@ def remove_partner(character, partner):
 
 def get_furniture(character):
     """Get the furniture character is using, if any."""
-    pos = character.db.position
+    pos = _get_pos(character)
     if not pos:
         return None
     
@@ -845,7 +972,7 @@ def get_furniture(character):
 
 def get_furniture_slot(character):
     """Get which furniture slot character is using."""
-    pos = character.db.position
+    pos = _get_pos(character)
     if not pos:
         return None
     return pos.get("furniture_slot")
@@ -926,26 +1053,28 @@ def get_positions_for_furniture(furniture):
 # Internal Helpers
 # =============================================================================
 
+def _get_object(obj_id):
+    """Object by ID, from the idmapper cache when it's loaded."""
+    if not obj_id:
+        return None
+    from evennia.objects.models import ObjectDB
+    obj = ObjectDB.get_cached_instance(obj_id)
+    if obj is None:
+        try:
+            obj = ObjectDB.objects.get(id=obj_id)
+        except ObjectDB.DoesNotExist:
+            return None
+    return obj
+
+
 def _get_furniture(furniture_id):
     """Get furniture object by ID."""
-    if not furniture_id:
-        return None
-    try:
-        from evennia.objects.models import ObjectDB
-        return ObjectDB.objects.get(id=furniture_id)
-    except:
-        return None
+    return _get_object(furniture_id)
 
 
 def _get_character(char_id):
     """Get character object by ID."""
-    if not char_id:
-        return None
-    try:
-        from evennia.objects.models import ObjectDB
-        return ObjectDB.objects.get(id=char_id)
-    except:
-        return None
+    return _get_object(char_id)
 
 
 def _cleanup_old_position(character, old_pos):
@@ -965,41 +1094,38 @@ def _cleanup_old_position(character, old_pos):
 
 def _occupy_furniture(furniture, character, slot=None):
     """Add character to furniture's occupants."""
-    if not furniture.db.occupants:
-        furniture.db.occupants = {}
-    
     slot = slot or "default"
-    furniture.db.occupants[slot] = character.id
+    get_occupancy(furniture)[slot] = character.id
+    _occupancy_changed(furniture)
 
 
 def _vacate_furniture(furniture, character):
     """Remove character from furniture's occupants."""
-    if not furniture.db.occupants:
-        return
+    occupants = get_occupancy(furniture)
     
     # Find and remove character from any slot
-    to_remove = []
-    for slot, occupant_id in furniture.db.occupants.items():
-        if occupant_id == character.id:
-            to_remove.append(slot)
-    
+    to_remove = [slot for slot, occupant_id in occupants.items() if occupant_id == character.id]
     for slot in to_remove:
-        del furniture.db.occupants[slot]
+        del occupants[slot]
+    if to_remove:
+        _occupancy_changed(furniture)
 
 
 def _link_partner(character, partner):
     """Create mutual partner link."""
-    partner_pos = partner.db.position
+    partner_pos = _get_pos(partner)
     if partner_pos:
         if "partner_ids" not in partner_pos:
             partner_pos["partner_ids"] = []
         if character.id not in partner_pos["partner_ids"]:
             partner_pos["partner_ids"].append(character.id)
+            _position_changed(partner)
 
 
 def _unlink_partner(character, partner):
     """Remove mutual partner link."""
-    partner_pos = partner.db.position
+    partner_pos = _get_pos(partner)
     if partner_pos and "partner_ids" in partner_pos:
         if character.id in partner_pos["partner_ids"]:
             partner_pos["partner_ids"].remove(character.id)
+            _position_changed(partner)
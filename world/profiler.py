@@ -0,0 +1,376 @@
+"""
+Command Profiler for Gilderhaven
+=================================
+
+Opt-in cost accounting for commands. While profiling is on, every
+command run through the base Command classes in commands/command.py
+records:
+
+- wall time, in a latency histogram per command (p50/p95/p99)
+- database queries issued
+- Attribute reads and writes
+- messages sent to sessions
+
+Numbers are aggregated in memory per command key. Nothing is stored
+per call, so profiling can be left on under load. When it is off, each
+command pays one flag check.
+
+Counters are global and diffed around each command. Work that runs in
+the middle of a command (a ticker, a deferred callback) is counted
+against that command; with Evennia's single reactor thread that is
+rare.
+
+Turn it on with the `cmdprofile` admin command, or set
+COMMAND_PROFILING = True in settings to start with it on.
+
+Usage:
+    from world.profiler import enable_profiling, get_profile_report, dump_profile
+
+    enable_profiling()
+    ...
+    for row in get_profile_report(sort="p95"):
+        print(row["key"], row["p95_ms"])
+    dump_profile()   # server/logs/command_profile.json
+"""
+
+import json
+import os
+import time
+from bisect import bisect_left
+
+from django.conf import settings
+from evennia.utils import logger
+
+
+# =============================================================================
+# Configuration
+# =============================================================================
+
+# Histogram bucket upper bounds in ms: 0.05 ms to ~60 s, 25% apart
+HISTOGRAM_BOUNDS = tuple(0.05 * 1.25 ** i for i in range(64))
+
+PROFILE_FILENAME = "command_profile.json"
+
+# Report columns get_profile_report() can sort by
+SORT_FIELDS = ("total", "calls", "mean", "p50", "p95", "p99", "max", "queries", "attr_reads",
+               "attr_writes", "msgs")
+
+_enabled = False
+_enabled_at = None
+
+# Running totals while profiling is on; commands diff these
+_counters = {
+    "queries": 0,
+    "attr_reads": 0,
+    "attr_writes": 0,
+    "msgs": 0,
+}
+
+# command key -> CommandStats
+_command_stats = {}
+
+# (owner, name, original or None if inherited) for every patched method
+_patches = []
+
+
+# =============================================================================
+# Histograms
+# =============================================================================
+
+class LatencyHistogram:
+    """Fixed log-scale buckets of call durations in ms."""
+
+    __slots__ = ("counts", "count", "total", "max")
+
+    def __init__(self):
+        self.counts = [0] * (len(HISTOGRAM_BOUNDS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, ms):
+        self.counts[bisect_left(HISTOGRAM_BOUNDS, ms)] += 1
+        self.count += 1
+        self.total += ms
+        if ms > self.max:
+            self.max = ms
+
+    def percentile(self, pct):
+        """
+        Duration below which pct percent of calls fell.
+
+        Accurate to one bucket (25%), and never above the slowest call.
+        """
+        if not self.count:
+            return 0.0
+        rank = max(1, int(self.count * pct / 100.0 + 0.5))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                if index >= len(HISTOGRAM_BOUNDS):
+                    return self.max
+                return min(HISTOGRAM_BOUNDS[index], self.max)
+        return self.max
+
+    def buckets(self):
+        """Non-empty buckets as {upper bound in ms: count}."""
+        out = {}
+        for index, count in enumerate(self.counts):
+            if count:
+                bound = HISTOGRAM_BOUNDS[index] if index < len(HISTOGRAM_BOUNDS) else float("inf")
+                out[round(bound, 3)] = count
+        return out
+
+
+class CommandStats:
+    """Aggregated cost of one command key."""
+
+    __slots__ = ("key", "latency", "queries", "attr_reads", "attr_writes", "msgs")
+
+    def __init__(self, key):
+        self.key = key
+        self.latency = LatencyHistogram()
+        self.queries = 0
+        self.attr_reads = 0
+        self.attr_writes = 0
+        self.msgs = 0
+
+    def as_dict(self, with_buckets=False):
+        calls = self.latency.count
+        row = {
+            "key": self.key,
+            "calls": calls,
+            "total_ms": round(self.latency.total, 3),
+            "mean_ms": round(self.latency.total / calls, 3) if calls else 0.0,
+            "p50_ms": round(self.latency.percentile(50), 3),
+            "p95_ms": round(self.latency.percentile(95), 3),
+            "p99_ms": round(self.latency.percentile(99), 3),
+            "max_ms": round(self.latency.max, 3),
+            "queries": self.queries,
+            "attr_reads": self.attr_reads,
+            "attr_writes": self.attr_writes,
+            "msgs": self.msgs,
+        }
+        if with_buckets:
+            row["histogram"] = {str(bound): count for bound, count in self.latency.buckets().items()}
+        return row
+
+
+# =============================================================================
+# Instrumentation
+# =============================================================================
+
+def _count_query(execute, sql, params, many, context):
+    _counters["queries"] += 1
+    return execute(sql, params, many, context)
+
+
+def _counting(original, counter):
+    def wrapper(*args, **kwargs):
+        _counters[counter] += 1
+        return original(*args, **kwargs)
+    wrapper.__name__ = original.__name__
+    wrapper.__doc__ = original.__doc__
+    return wrapper
+
+
+def _patch(owner, name, counter):
+    original = getattr(owner, name, None)
+    if original is None:
+        return
+    _patches.append((owner, name, vars(owner).get(name)))
+    setattr(owner, name, _counting(original, counter))
+
+
+def _install():
+    """Hook the query, Attribute and message counters in."""
+    from django.db import connection
+    from evennia.typeclasses.attributes import AttributeHandler
+    from evennia.utils.utils import class_from_module
+
+    if _count_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_count_query)
+
+    # obj.db.<name> goes through get/add too
+    for name in ("get", "has"):
+        _patch(AttributeHandler, name, "attr_reads")
+    for name in ("add", "batch_add", "remove", "clear"):
+        _patch(AttributeHandler, name, "attr_writes")
+
+    # Every outgoing message passes through its session's data_out,
+    # before any batching into fewer sends
+    session_class = class_from_module(settings.SERVER_SESSION_CLASS)
+    _patch(session_class, "data_out", "msgs")
+
+
+def _uninstall():
+    from django.db import connection
+
+    if _count_query in connection.execute_wrappers:
+        connection.execute_wrappers.remove(_count_query)
+    while _patches:
+        owner, name, original = _patches.pop()
+        if original is None:
+            # Was inherited; drop the wrapper to expose it again
+            delattr(owner, name)
+        else:
+            setattr(owner, name, original)
+
+
+# =============================================================================
+# Control
+# =============================================================================
+
+def is_profiling():
+    """Whether commands are being profiled."""
+    return _enabled
+
+
+def enable_profiling():
+    """Start profiling commands. Collected numbers are kept."""
+    global _enabled, _enabled_at
+    if _enabled:
+        return
+    try:
+        _install()
+    except Exception as e:
+        _uninstall()
+        logger.log_err(f"Command profiler: could not install counters: {e}")
+        return
+    _enabled = True
+    _enabled_at = time.time()
+    logger.log_info("Command profiler enabled.")
+
+
+def disable_profiling():
+    """Stop profiling commands. Collected numbers are kept."""
+    global _enabled
+    if not _enabled:
+        return
+    _enabled = False
+    _uninstall()
+    logger.log_info("Command profiler disabled.")
+
+
+def reset_profile():
+    """Forget everything collected so far."""
+    global _enabled_at
+    _command_stats.clear()
+    _enabled_at = time.time() if _enabled else None
+
+
+def start_profiler():
+    """Enable profiling if settings.COMMAND_PROFILING is set. Called from at_server_start."""
+    if getattr(settings, "COMMAND_PROFILING", False):
+        enable_profiling()
+
+
+# =============================================================================
+# Recording
+# =============================================================================
+
+def start_command(cmd):
+    """Snapshot the counters as a command starts. Called from at_pre_cmd."""
+    if not _enabled:
+        return
+    cmd._profile_start = (
+        time.perf_counter(),
+        _counters["queries"],
+        _counters["attr_reads"],
+        _counters["attr_writes"],
+        _counters["msgs"],
+    )
+
+
+def end_command(cmd):
+    """Record a command's cost. Called from at_post_cmd."""
+    start = cmd.__dict__.pop("_profile_start", None)
+    if start is None or not _enabled:
+        return
+    elapsed_ms = (time.perf_counter() - start[0]) * 1000.0
+
+    key = cmd.key
+    stats = _command_stats.get(key)
+    if stats is None:
+        stats = _command_stats[key] = CommandStats(key)
+    stats.latency.add(elapsed_ms)
+    stats.queries += _counters["queries"] - start[1]
+    stats.attr_reads += _counters["attr_reads"] - start[2]
+    stats.attr_writes += _counters["attr_writes"] - start[3]
+    stats.msgs += _counters["msgs"] - start[4]
+
+
+def record_command(key, elapsed_ms, queries=0, attr_reads=0, attr_writes=0, msgs=0):
+    """Record one call measured elsewhere, e.g. by a load test."""
+    stats = _command_stats.get(key)
+    if stats is None:
+        stats = _command_stats[key] = CommandStats(key)
+    stats.latency.add(elapsed_ms)
+    stats.queries += queries
+    stats.attr_reads += attr_reads
+    stats.attr_writes += attr_writes
+    stats.msgs += msgs
+
+
+# =============================================================================
+# Reporting
+# =============================================================================
+
+def get_profile_report(sort="total", limit=None):
+    """
+    Per-command numbers, most expensive first.
+
+    Args:
+        sort: One of SORT_FIELDS
+        limit: Only the first this many rows
+
+    Returns:
+        list: Row dicts (see CommandStats.as_dict); counters are totals,
+        not per call
+    """
+    if sort not in SORT_FIELDS:
+        sort = "total"
+    field = sort if sort in ("calls", "queries", "attr_reads", "attr_writes", "msgs") else f"{sort}_ms"
+    rows = [stats.as_dict() for stats in _command_stats.values()]
+    rows.sort(key=lambda row: row[field], reverse=True)
+    return rows[:limit] if limit else rows
+
+
+def get_counters():
+    """Snapshot of the running query/Attribute/message totals."""
+    return dict(_counters)
+
+
+def get_profile_stats():
+    """Profiler state: whether it is on, since when, and what it has seen."""
+    return {
+        "enabled": _enabled,
+        "since": _enabled_at,
+        "commands": len(_command_stats),
+        "calls": sum(stats.latency.count for stats in _command_stats.values()),
+    }
+
+
+def dump_profile(path=None):
+    """
+    Write every command's numbers and histogram to a JSON file.
+
+    Args:
+        path: File to write (default: PROFILE_FILENAME in settings.LOG_DIR)
+
+    Returns:
+        str: The path written
+    """
+    if path is None:
+        path = os.path.join(getattr(settings, "LOG_DIR", "."), PROFILE_FILENAME)
+    data = get_profile_stats()
+    data["written"] = time.time()
+    data["histogram_bounds_ms"] = [round(bound, 3) for bound in HISTOGRAM_BOUNDS]
+    data["profile"] = {
+        key: stats.as_dict(with_buckets=True)
+        for key, stats in sorted(_command_stats.items())
+    }
+    with open(path, "w") as handle:
+        json.dump(data, handle, indent=2)
+    return path
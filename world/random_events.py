@@ -25,6 +25,9 @@ import random
 import time
 from evennia.utils import logger
 
+from world.outbound import send_ambient
+from world.sampling import SubsetCache
+
 # =============================================================================
 # Event Definitions
 # =============================================================================
@@ -284,99 +287,155 @@ WORLD_EVENTS = {
 }
 
 
+# =============================================================================
+# Compiled Event Pools
+# =============================================================================
+
+# (id(events dict), registered keys or None) -> (events dict, SubsetCache, room tags)
+_event_pools = {}
+
+
+def compile_event_pools():
+    """(Re)compile the built-in event pools now rather than on first use."""
+    _event_pools.clear()
+    for events in (AMBIENT_EVENTS, ROOM_EVENTS, PERSONAL_EVENTS, WORLD_EVENTS):
+        _get_event_pool(events)
+
+
 # =============================================================================
 # Event Checking & Firing
 # =============================================================================
 
-def check_event_conditions(event, room=None, character=None):
+def _get_event_pool(events, keys=None):
     """
-    Check if an event's conditions are met.
+    Compiled pool for an events dict, optionally limited to some keys.
     
-    Args:
-        event: Event dict
-        room: Room to check (optional)
-        character: Character to check (optional)
+    Returns:
+        tuple: (events dict, SubsetCache, room tags any condition reads)
+    """
+    pool_key = (id(events), keys)
+    cached = _event_pools.get(pool_key)
+    if cached and cached[0] is events:
+        return cached
+    
+    entries = [
+        (key, event.get("weight", 1), event)
+        for key, event in events.items()
+        if keys is None or key in keys
+    ]
+    room_tags = frozenset(
+        tag for _, _, event in entries
+        for tag in event.get("conditions", {}).get("tags", ())
+    )
+    cached = _event_pools[pool_key] = (events, SubsetCache(entries), room_tags)
+    return cached
+
+
+def clear_event_pools():
+    """Drop compiled event pools; call after editing an event dict in place."""
+    _event_pools.clear()
+
+
+def _event_context(room=None, room_tags=()):
+    """
+    Everything event conditions read, as a hashable tuple.
     
     Returns:
-        bool: True if conditions met
+        tuple: (time, weather, season, outdoors, tags), with outdoors and
+        tags None when there is no room
     """
+    time_period = weather = season = None
+    try:
+        from world.world_state import get_world_state
+        clock = get_world_state()
+        time_period, weather, season = clock.get_time_period(), clock.get_weather(), clock.get_season()
+    except ImportError:
+        pass
+    
+    if room is None:
+        return (time_period, weather, season, None, None)
+    
+    outdoors = bool(room.tags.has("outdoor", category="room_type") or room.db.outdoor)
+    tags = frozenset(tag for tag in room_tags if room.tags.has(tag))
+    return (time_period, weather, season, outdoors, tags)
+
+
+def _conditions_met(event, context):
+    """Check an event's conditions against an _event_context() tuple."""
     conditions = event.get("conditions", {})
+    if not conditions:
+        return True
+    time_period, weather, season, outdoors, tags = context
     
     # Check outdoors
-    if "outdoors" in conditions:
-        if room:
-            is_outdoor = room.tags.has("outdoor", category="room_type") or \
-                        room.db.outdoor
-            if conditions["outdoors"] != is_outdoor:
-                return False
+    if "outdoors" in conditions and outdoors is not None:
+        if conditions["outdoors"] != outdoors:
+            return False
     
     # Check time
-    if "time" in conditions:
-        try:
-            from world.world_state import get_time_period
-            current_time = get_time_period()
-            if current_time not in conditions["time"]:
-                return False
-        except ImportError:
-            pass
+    if "time" in conditions and time_period is not None:
+        if time_period not in conditions["time"]:
+            return False
     
     # Check weather
-    if "weather" in conditions:
-        try:
-            from world.world_state import get_weather
-            current_weather = get_weather()
-            if current_weather not in conditions["weather"]:
-                return False
-        except ImportError:
-            pass
+    if "weather" in conditions and weather is not None:
+        if weather not in conditions["weather"]:
+            return False
+    
+    # Check season
+    if "season" in conditions and season is not None:
+        if season not in conditions["season"]:
+            return False
     
     # Check room tags
-    if "tags" in conditions and room:
-        required_tags = conditions["tags"]
-        has_any = False
-        for tag in required_tags:
-            if room.tags.has(tag):
-                has_any = True
-                break
-        if not has_any:
+    if "tags" in conditions and tags is not None:
+        if not tags.intersection(conditions["tags"]):
             return False
     
     return True
 
 
-def select_weighted_event(events, room=None, character=None):
+def check_event_conditions(event, room=None, character=None):
+    """
+    Check if an event's conditions are met.
+    
+    Args:
+        event: Event dict
+        room: Room to check (optional)
+        character: Character to check (optional)
+    
+    Returns:
+        bool: True if conditions met
+    """
+    room_tags = event.get("conditions", {}).get("tags", ())
+    return _conditions_met(event, _event_context(room, room_tags))
+
+
+def select_weighted_event(events, room=None, character=None, keys=None, rng=None):
     """
     Select an event from a dict based on weight and conditions.
     
+    The events that pass for a given time, weather, season and room
+    shape are compiled once into an alias table and reused.
+    
     Args:
         events: Dict of event_key: event_dict
         room: Room context
         character: Character context
+        keys: Only consider these event keys (e.g. a room's registered events)
+        rng: Random generator (defaults to the shared sampling RNG)
     
     Returns:
         tuple: (event_key, event_dict) or (None, None)
     """
-    valid_events = []
-    
-    for key, event in events.items():
-        if check_event_conditions(event, room, character):
-            weight = event.get("weight", 1)
-            valid_events.append((key, event, weight))
+    if keys is not None:
+        keys = frozenset(keys)
+    _, pool, room_tags = _get_event_pool(events, keys)
     
-    if not valid_events:
+    event_key = pool.sample(_event_context(room, room_tags), _conditions_met, rng)
+    if event_key is None:
         return None, None
-    
-    # Weighted selection
-    total_weight = sum(e[2] for e in valid_events)
-    roll = random.random() * total_weight
-    
-    cumulative = 0
-    for key, event, weight in valid_events:
-        cumulative += weight
-        if roll <= cumulative:
-            return key, event
-    
-    return valid_events[-1][0], valid_events[-1][1]
+    return event_key, events[event_key]
 
 
 def fire_ambient_event(room):
@@ -392,13 +451,9 @@ def fire_ambient_event(room):
     # Get room's registered ambient events, or use defaults
     registered = room.db.ambient_events
     
-    if registered:
-        # Filter to registered events
-        events = {k: v for k, v in AMBIENT_EVENTS.items() if k in registered}
-    else:
-        events = AMBIENT_EVENTS
-    
-    event_key, event = select_weighted_event(events, room=room)
+    event_key, event = select_weighted_event(
+        AMBIENT_EVENTS, room=room, keys=registered or None
+    )
     
     if not event:
         return False
@@ -410,10 +465,8 @@ def fire_ambient_event(room):
     
     message = random.choice(messages)
     
-    # Send to room
-    room.msg_contents(f"|x{message}|n")
-    
-    return True
+    # Send to room, unless it has had enough ambience lately
+    return send_ambient(room, f"|x{message}|n")
 
 
 def fire_room_event(room):
@@ -428,12 +481,9 @@ def fire_room_event(room):
     """
     registered = room.db.room_events
     
-    if registered:
-        events = {k: v for k, v in ROOM_EVENTS.items() if k in registered}
-    else:
-        events = ROOM_EVENTS
-    
-    event_key, event = select_weighted_event(events, room=room)
+    event_key, event = select_weighted_event(
+        ROOM_EVENTS, room=room, keys=registered or None
+    )
     
     if not event:
         return False
@@ -0,0 +1,137 @@
+"""
+Lazy Data Registries for Gilderhaven
+=====================================
+
+The big static tables (item templates, recipes, dialogue trees,
+creatures, quests, species) live in world/data/ modules. Each game
+module names its table as a LazyRegistry, which imports the data module
+the first time the table is read. Command modules import the game
+modules at cmdset creation. A server start or reload therefore only
+pays for the tables something actually uses, and only when it uses
+them.
+
+A registry behaves like the dict it wraps: get, [], in, iteration,
+items(), update() and item assignment all work. Tables that used to be
+merged at import (ITEM_TEMPLATES) list several sources, which are
+merged in order on load.
+
+Usage:
+    from world.registry import LazyRegistry
+
+    RECIPE_TEMPLATES = LazyRegistry("recipes", "world.data.recipes:RECIPE_TEMPLATES")
+
+    RECIPE_TEMPLATES.get("herb_paste")    # loads world.data.recipes here
+"""
+
+import importlib
+import time
+from collections.abc import MutableMapping
+
+
+# Every registry created, in creation order
+_registries = []
+
+
+class LazyRegistry(MutableMapping):
+    """
+    A dict of static data, loaded from its source modules on first use.
+
+    Sources are "module.path:NAME" strings. A single source is used as
+    is, so the registry and the module attribute stay the same dict;
+    several are merged into a new dict.
+    """
+
+    __slots__ = ("name", "sources", "load_ms", "_data")
+
+    def __init__(self, name, *sources):
+        self.name = name
+        self.sources = sources
+        self.load_ms = None
+        self._data = None
+        _registries.append(self)
+
+    # -- loading --
+
+    @property
+    def loaded(self):
+        return self._data is not None
+
+    def load(self):
+        """Import the sources now (if not already) and return the dict."""
+        if self._data is None:
+            start = time.perf_counter()
+            tables = []
+            for source in self.sources:
+                module_path, attr = source.split(":")
+                tables.append(getattr(importlib.import_module(module_path), attr))
+            if len(tables) == 1:
+                data = tables[0]
+            else:
+                data = {}
+                for table in tables:
+                    data.update(table)
+            self._data = data
+            self.load_ms = (time.perf_counter() - start) * 1000.0
+        return self._data
+
+    def unload(self):
+        """Forget the loaded dict; the next read loads it again."""
+        self._data = None
+        self.load_ms = None
+
+    # -- dict interface --
+
+    def __getitem__(self, key):
+        return (self._data if self._data is not None else self.load())[key]
+
+    def __setitem__(self, key, value):
+        (self._data if self._data is not None else self.load())[key] = value
+
+    def __delitem__(self, key):
+        del (self._data if self._data is not None else self.load())[key]
+
+    def __iter__(self):
+        return iter(self._data if self._data is not None else self.load())
+
+    def __len__(self):
+        return len(self._data if self._data is not None else self.load())
+
+    def __contains__(self, key):
+        return key in (self._data if self._data is not None else self.load())
+
+    def get(self, key, default=None):
+        return (self._data if self._data is not None else self.load()).get(key, default)
+
+    def keys(self):
+        return (self._data if self._data is not None else self.load()).keys()
+
+    def values(self):
+        return (self._data if self._data is not None else self.load()).values()
+
+    def items(self):
+        return (self._data if self._data is not None else self.load()).items()
+
+    def copy(self):
+        return dict(self.load())
+
+    def __repr__(self):
+        state = f"{len(self._data)} entries" if self._data is not None else "not loaded"
+        return f"<LazyRegistry {self.name}: {state}>"
+
+
+def get_registries():
+    """Every registry, with whether it has loaded and how long that took."""
+    return [(reg.name, reg.loaded, reg.load_ms) for reg in _registries]
+
+
+def load_all_registries():
+    """
+    Load every registry now, e.g. to warm up after a reload.
+
+    Returns:
+        float: Total ms spent loading
+    """
+    start = time.perf_counter()
+    for reg in _registries:
+        reg.load()
+    return (time.perf_counter() - start) * 1000.0
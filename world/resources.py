@@ -28,6 +28,8 @@ import time
 from evennia import create_object
 from evennia.utils import logger
 
+from world.events import subscribe, PERIOD_CHANGED, SEASON_CHANGED
+
 # =============================================================================
 # Resource Type Definitions
 # =============================================================================
@@ -299,6 +301,28 @@ def is_depleted(node, harvester=None):
     return data.get("current_harvests", 0) <= 0
 
 
+# Season and time period as of the last world event; cleared by the event
+# bus on change and refilled from the world clock on the next check.
+_world_conditions = {}
+
+
+def _on_world_changed(event):
+    _world_conditions.clear()
+
+
+def _current_conditions():
+    if not _world_conditions:
+        from world.time_weather import get_world_clock
+        clock = get_world_clock()
+        _world_conditions["season"] = clock.get_season()
+        _world_conditions["time"] = clock.get_time_period()
+    return _world_conditions
+
+
+subscribe(PERIOD_CHANGED, _on_world_changed)
+subscribe(SEASON_CHANGED, _on_world_changed)
+
+
 def is_available(node, harvester=None):
     """
     Check if resource node is currently available.
@@ -325,25 +349,13 @@ def is_available(node, harvester=None):
     
     # Check season
     seasons = data.get("seasons")
-    if seasons:
-        try:
-            from world.world_state import get_season
-            current_season = get_season()
-            if current_season not in seasons:
-                return False, f"This can only be harvested in {', '.join(seasons)}."
-        except ImportError:
-            pass  # World state not available, skip check
+    if seasons and _current_conditions()["season"] not in seasons:
+        return False, f"This can only be harvested in {', '.join(seasons)}."
     
     # Check time of day
     time_available = data.get("time_available")
-    if time_available:
-        try:
-            from world.world_state import get_time_period
-            current_time = get_time_period()
-            if current_time not in time_available:
-                return False, f"This can only be harvested during {', '.join(time_available)}."
-        except ImportError:
-            pass
+    if time_available and _current_conditions()["time"] not in time_available:
+        return False, f"This can only be harvested during {', '.join(time_available)}."
     
     return True, None
 
@@ -388,7 +400,7 @@ def harvest(node, harvester, tool=None):
         dict: {
             "success": bool,
             "message": str,
-            "yield": Object or None,
+            "yield": Object, or None if it went into the material ledger,
             "quality": int or None,
             "rarity": str or None,
         }
@@ -438,8 +450,14 @@ def harvest(node, harvester, tool=None):
         _consume_harvest(node, harvester, data)
         return {"success": False, "message": fail_msg}
     
-    # Create the yielded item
-    item = _create_yield_item(yield_result, harvester, data)
+    # Materials are counted in the harvester's ledger; anything else is
+    # created as an object
+    name = _add_yield_to_ledger(yield_result, harvester)
+    if name is None:
+        item = _create_yield_item(yield_result, harvester, data)
+        name = item.key
+    else:
+        item = None
     
     # Consume harvest
     _consume_harvest(node, harvester, data)
@@ -447,7 +465,7 @@ def harvest(node, harvester, tool=None):
     # Build success message
     rarity = yield_result.get("rarity", "common")
     rarity_data = RARITY_TIERS.get(rarity, RARITY_TIERS["common"])
-    item_display = f"{rarity_data['color']}{item.key}|n"
+    item_display = f"{rarity_data['color']}{name}|n"
     
     success_msg = type_data.get("success_msg", "You harvest {item}!").format(
         item=item_display
@@ -547,6 +565,31 @@ def _determine_yield(data):
     return weighted[0] if weighted else None
 
 
+def _add_yield_to_ledger(yield_result, harvester):
+    """
+    Add the yield to the harvester's material ledger if it belongs there.
+    
+    Yields with their own typeclass or attributes stay objects, as do
+    keys that aren't ledger materials (see world.materials).
+    
+    Returns:
+        str: The material's name, or None if the yield needs an object
+    """
+    from world.items import ITEM_QUALITIES, get_item_template, give_item
+    from world.materials import is_ledger_material
+    
+    if yield_result.get("typeclass") or yield_result.get("attributes"):
+        return None
+    template_key = yield_result.get("key", "").lower().replace(" ", "_")
+    if not is_ledger_material(template_key):
+        return None
+    
+    rarity = yield_result.get("rarity", "common")
+    quality = rarity if rarity in ITEM_QUALITIES else "common"
+    give_item(harvester, template_key, quantity=1, quality=quality)
+    return get_item_template(template_key).get("key", template_key)
+
+
 def _create_yield_item(yield_result, harvester, node_data):
     """
     Create the yielded item object.
@@ -0,0 +1,216 @@
+"""
+Weighted Sampling for Gilderhaven
+==================================
+
+Shared O(1) weighted random selection for encounter tables, spawn
+tables, creature attacks and random event pools.
+
+A weighted pool is compiled once into an AliasTable (Vose's alias
+method). After that, each roll costs one random number, one index and
+one comparison, however many entries the pool has. Callers compile
+their tables at import, or on first use, and keep them.
+
+When only part of a pool applies, for example events allowed at night in
+the rain, SubsetCache builds one table per distinct context and reuses
+it. The context is any hashable summary of what the filter depends on.
+
+Every roll draws from one module RNG. Call seed_rng() to make a run
+reproducible.
+
+Usage:
+    from world.sampling import AliasTable, compile_tiers, seed_rng
+
+    table = AliasTable(["wolf", "slime", None], [3, 6, 1])
+    creature = table.sample()
+
+    seed_rng(42)   # same rolls every run from here on
+"""
+
+import random
+
+
+# Shared RNG for every table; reseed with seed_rng()
+_rng = random.Random()
+
+
+def seed_rng(value=None):
+    """Reseed the shared sampling RNG (None reseeds from the OS)."""
+    _rng.seed(value)
+
+
+def get_rng():
+    """The shared sampling RNG, for rolls that sit alongside table samples."""
+    return _rng
+
+
+# =============================================================================
+# Alias Tables
+# =============================================================================
+
+class AliasTable:
+    """
+    A weighted pool compiled for O(1) sampling.
+
+    Entries with zero or negative weight can never be drawn. An empty
+    table, or one whose weights are all zero, samples None.
+    """
+
+    __slots__ = ("items", "weights", "total", "_prob", "_alias")
+
+    def __init__(self, items, weights):
+        pairs = [(item, float(weight)) for item, weight in zip(items, weights) if weight > 0]
+        self.items = [item for item, _ in pairs]
+        self.weights = [weight for _, weight in pairs]
+        self.total = sum(self.weights)
+
+        n = len(self.items)
+        self._prob = [1.0] * n
+        self._alias = list(range(n))
+        if not n:
+            return
+
+        # Vose: scale to mean 1, then pair each short column with a long one
+        scaled = [weight * n / self.total for weight in self.weights]
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            short, long = small.pop(), large.pop()
+            self._prob[short] = scaled[short]
+            self._alias[short] = long
+            scaled[long] -= 1.0 - scaled[short]
+            (small if scaled[long] < 1.0 else large).append(long)
+        # Leftovers are 1.0 up to float error
+        for i in small + large:
+            self._prob[i] = 1.0
+
+    def __len__(self):
+        return len(self.items)
+
+    def __bool__(self):
+        return bool(self.items)
+
+    def sample(self, rng=None):
+        """Draw one item, or None from an empty table."""
+        n = len(self.items)
+        if not n:
+            return None
+        roll = (rng or _rng).random() * n
+        column = int(roll)
+        if roll - column < self._prob[column]:
+            return self.items[column]
+        return self.items[self._alias[column]]
+
+    def probability(self, item):
+        """Chance of drawing an item (summed if it appears more than once)."""
+        if not self.total:
+            return 0.0
+        return sum(w for i, w in zip(self.items, self.weights) if i == item) / self.total
+
+
+def compile_weights(mapping, weight_key="weight", default=1):
+    """
+    Build an AliasTable over a dict of key -> entry dict.
+
+    Each entry's weight is entry[weight_key] (default if missing).
+    Sampling returns the key.
+    """
+    keys = list(mapping)
+    return AliasTable(keys, [mapping[key].get(weight_key, default) for key in keys])
+
+
+def compile_tiers(table, tiers=("rare", "uncommon", "common"),
+                  fallback=("common", "uncommon", "rare")):
+    """
+    Compile a rarity-tiered table into a single AliasTable.
+
+    The table has a list of keys per tier and a "weights" dict of
+    tier -> probability. A tier is picked by its probability and a key
+    uniformly from its list. A picked tier with no keys uses the first
+    non-empty tier in fallback. Any probability left over below 1 is
+    the chance of no result, which samples None.
+
+    Args:
+        table: {"common": [...], ..., "weights": {"common": 0.6, ...}}
+        tiers: Tier names to read
+        fallback: Tier order to use when a picked tier is empty
+
+    Returns:
+        AliasTable
+    """
+    weights = table.get("weights", {})
+    fallback_keys = next((table[tier] for tier in fallback if table.get(tier)), [])
+
+    outcomes = {}
+    used = 0.0
+    for tier in tiers:
+        weight = min(weights.get(tier, 0), max(0.0, 1.0 - used))
+        used += weight
+        keys = table.get(tier) or fallback_keys
+        if weight <= 0:
+            continue
+        if not keys:
+            # Nothing anywhere to pick; the roll finds no result
+            outcomes[None] = outcomes.get(None, 0.0) + weight
+            continue
+        for key in keys:
+            outcomes[key] = outcomes.get(key, 0.0) + weight / len(keys)
+
+    if used < 1.0:
+        outcomes[None] = outcomes.get(None, 0.0) + 1.0 - used
+    return AliasTable(list(outcomes), list(outcomes.values()))
+
+
+def compile_cumulative(items, chances, default_index=0):
+    """
+    Compile a "walk the cumulative chance" pick into an AliasTable.
+
+    Each item's chance counts until the running total reaches 1. If the
+    total stays under 1, the rest goes to items[default_index].
+    """
+    weights = [0.0] * len(items)
+    cumulative = 0.0
+    for i, chance in enumerate(chances):
+        step = min(cumulative + chance, 1.0) - min(cumulative, 1.0)
+        weights[i] = max(0.0, step)
+        cumulative += chance
+    if items and cumulative < 1.0:
+        weights[default_index] += 1.0 - cumulative
+    return AliasTable(items, weights)
+
+
+# =============================================================================
+# Conditional Subsets
+# =============================================================================
+
+class SubsetCache:
+    """
+    Alias tables for the parts of one pool that apply in a context.
+
+    Entries are (item, weight, data) tuples. table(context, predicate)
+    keeps predicate(data, context) entries. The result is cached under
+    the context, so the context must capture everything the predicate
+    reads.
+    """
+
+    __slots__ = ("entries", "max_size", "_tables")
+
+    def __init__(self, entries, max_size=256):
+        self.entries = list(entries)
+        self.max_size = max_size
+        self._tables = {}
+
+    def table(self, context, predicate):
+        table = self._tables.get(context)
+        if table is None:
+            kept = [(item, weight) for item, weight, data in self.entries if predicate(data, context)]
+            table = AliasTable([item for item, _ in kept], [weight for _, weight in kept])
+            if len(self._tables) >= self.max_size:
+                self._tables.clear()
+            self._tables[context] = table
+        return table
+
+    def sample(self, context, predicate, rng=None):
+        return self.table(context, predicate).sample(rng)
+
+    def clear(self):
+        self._tables.clear()
@@ -40,10 +40,13 @@ Usage:
 """
 
 import random
+import string
 import time
 from evennia import CmdSet
-from evennia.commands.command import Command
-from evennia.utils import logger, evmenu
+from commands.command import Command
+from evennia.utils import logger, evmenu, delay
+
+from world.memory import register_pin_check
 
 # =============================================================================
 # Scene Data Structure
@@ -112,15 +115,24 @@ TEXT FORMATTING:
 # Scene State
 # =============================================================================
 
+# How long advanced scene progress may sit in memory before it is written
+# back to character.db.active_scene (seconds).
+SCENE_FLUSH_DELAY = 30
+
+
 class SceneState:
     """
     Tracks a character's progress through a scene.
-    Stored on character.db.active_scene during scene.
+    
+    Lives on character.ndb.active_scene while the scene runs. Progress is
+    written behind to character.db.active_scene by flush_scene_states(),
+    so a reload can pick the scene back up.
     """
     
     def __init__(self, scene_id, scene_data, character):
         self.scene_id = scene_id
-        self.scene_data = scene_data
+        self.scene = _resolve_compiled(scene_data, scene_id)
+        self.scene_data = self.scene.data
         self.character = character
         self.current_node = "start"
         self.history = []  # Nodes visited
@@ -132,8 +144,8 @@ class SceneState:
         return {
             "scene_id": self.scene_id,
             "current_node": self.current_node,
-            "history": self.history,
-            "flags": self.flags,
+            "history": list(self.history),
+            "flags": dict(self.flags),
             "started_at": self.started_at,
         }
     
@@ -142,12 +154,207 @@ class SceneState:
         """Deserialize from storage."""
         state = cls(data["scene_id"], scene_data, character)
         state.current_node = data["current_node"]
-        state.history = data["history"]
-        state.flags = data["flags"]
+        state.history = list(data["history"])
+        state.flags = dict(data["flags"])
         state.started_at = data["started_at"]
         return state
 
 
+_dirty_scene_states = {}   # character.id -> SceneState awaiting write-back
+_flush_pending = False
+
+
+def _awaiting_write(obj):
+    # SceneState holds its character; keep it cached until the write-back
+    return obj.id in _dirty_scene_states
+
+
+register_pin_check("scenes", _awaiting_write)
+
+
+def _mark_scene_dirty(state):
+    """Queue a state for write-behind persistence."""
+    global _flush_pending
+    _dirty_scene_states[state.character.id] = state
+    if not _flush_pending:
+        _flush_pending = True
+        delay(SCENE_FLUSH_DELAY, flush_scene_states)
+
+
+def flush_scene_states():
+    """
+    Write all pending scene progress to the database.
+    
+    Runs on a timer after progress changes, and should also be called
+    before the server stops.
+    """
+    global _flush_pending
+    _flush_pending = False
+    pending = list(_dirty_scene_states.values())
+    _dirty_scene_states.clear()
+    
+    for state in pending:
+        character = state.character
+        if not getattr(character, "pk", None):
+            continue
+        # Only persist scenes that are still running
+        if character.ndb.active_scene is state:
+            character.db.active_scene = state.to_dict()
+
+
+# =============================================================================
+# Compiled Scenes
+# =============================================================================
+
+_formatter = string.Formatter()
+
+# Scene dict keys that are metadata rather than nodes
+SCENE_META_KEYS = ("id", "title", "tags")
+
+
+class SceneTemplate:
+    """
+    Scene text pre-parsed into literal and placeholder parts.
+    
+    Simple {name}-style placeholders are substituted directly; anything
+    fancier (format specs, attribute access) falls back to str.format.
+    """
+    
+    __slots__ = ("raw", "parts", "fields", "literal", "simple")
+    
+    def __init__(self, text):
+        self.raw = text
+        self.parts = []
+        self.fields = set()
+        self.simple = True
+        try:
+            for literal, field, spec, conversion in _formatter.parse(text):
+                if literal:
+                    self.parts.append((literal, None))
+                if field is not None:
+                    if spec or conversion or not field.isidentifier():
+                        self.simple = False
+                    self.parts.append((None, field))
+                    self.fields.add(field)
+        except ValueError:
+            # Malformed braces - show the text as written
+            self.parts = [(text, None)]
+            self.fields = set()
+        self.literal = "".join(p[0] for p in self.parts if p[1] is None)
+    
+    def render(self, character, state=None):
+        """Render with character/state substitutions."""
+        if not self.fields:
+            return self.literal
+        
+        try:
+            if not self.simple:
+                roots = {f.split(".")[0].split("[")[0] for f in self.fields}
+                subs = {root: _scene_substitution(root, character, state) for root in roots}
+                return self.raw.format(**subs)
+            
+            out = []
+            for literal, field in self.parts:
+                if field is None:
+                    out.append(literal)
+                else:
+                    out.append(format(_scene_substitution(field, character, state)))
+            return "".join(out)
+        except (KeyError, IndexError, AttributeError, ValueError) as e:
+            logger.log_warn(f"Scene text missing substitution: {e}")
+            return self.raw
+
+
+class SceneChoice:
+    """A compiled choice with its conditions resolved to callables."""
+    
+    __slots__ = ("text", "goto", "effects", "conditions", "hidden", "disabled_text")
+    
+    def __init__(self, choice):
+        self.text = choice.get("text", "")
+        self.goto = choice.get("goto")
+        self.effects = choice.get("effects", [])
+        self.conditions = compile_scene_conditions(choice.get("condition"))
+        self.hidden = choice.get("hidden", True)  # Default: hide if condition fails
+        self.disabled_text = choice.get("disabled_text", f"|x{self.text} (unavailable)|n")
+
+
+class SceneNode:
+    """A compiled scene node."""
+    
+    __slots__ = ("key", "texts", "choices", "effects", "goto", "delay", "end")
+    
+    def __init__(self, key, node):
+        self.key = key
+        text = node.get("text", "")
+        texts = text if isinstance(text, list) else [text]
+        self.texts = tuple(SceneTemplate(t) for t in texts) or (SceneTemplate(""),)
+        self.choices = tuple(SceneChoice(c) for c in node.get("choices", []))
+        self.effects = node.get("effects", [])
+        goto = node.get("goto")
+        if isinstance(goto, list):
+            goto = tuple(goto)
+        self.goto = goto
+        self.delay = node.get("delay", 0)
+        self.end = node.get("end", False)
+    
+    def links(self):
+        """All node keys this node can lead to."""
+        if isinstance(self.goto, tuple):
+            yield from self.goto
+        elif self.goto:
+            yield self.goto
+        for choice in self.choices:
+            if choice.goto:
+                yield choice.goto
+
+
+class CompiledScene:
+    """A scene dict compiled into SceneNodes with validated links."""
+    
+    __slots__ = ("id", "data", "nodes")
+    
+    def __init__(self, scene_id, scene_data):
+        self.id = scene_id
+        self.data = scene_data
+        self.nodes = {
+            key: SceneNode(key, node)
+            for key, node in scene_data.items()
+            if key not in SCENE_META_KEYS and isinstance(node, dict)
+        }
+        self.validate()
+    
+    def validate(self):
+        """Log any missing start node or dangling links. Returns problem count."""
+        problems = 0
+        if "start" not in self.nodes:
+            logger.log_err(f"Scene '{self.id}' has no 'start' node.")
+            problems += 1
+        for node in self.nodes.values():
+            for goto in node.links():
+                if goto not in self.nodes:
+                    logger.log_warn(
+                        f"Scene '{self.id}': node '{node.key}' links to missing node '{goto}'."
+                    )
+                    problems += 1
+        return problems
+
+
+def compile_scene(scene_id, scene_data):
+    """Compile a scene dict. Registered scenes are compiled once in register_scene."""
+    return CompiledScene(scene_id, scene_data)
+
+
+def _resolve_compiled(scene_data, scene_id=None):
+    """Get the compiled form of a scene dict, compiling ad-hoc scenes on demand."""
+    if isinstance(scene_data, CompiledScene):
+        return scene_data
+    compiled = _compiled_scenes.get(scene_data.get("id") or scene_id)
+    if compiled is not None and compiled.data is scene_data:
+        return compiled
+    return compile_scene(scene_id or scene_data.get("id", "unnamed_scene"), scene_data)
+
+
 # =============================================================================
 # Scene Registry
 # =============================================================================
@@ -155,10 +362,13 @@ class SceneState:
 # Global registry of all scenes
 SCENE_REGISTRY = {}
 
+# Compiled form of every registered scene, by id
+_compiled_scenes = {}
+
 
 def register_scene(scene_id, scene_data):
     """
-    Register a scene in the global registry.
+    Register a scene in the global registry and compile it.
     
     Args:
         scene_id: Unique identifier
@@ -166,6 +376,7 @@ def register_scene(scene_id, scene_data):
     """
     scene_data["id"] = scene_id
     SCENE_REGISTRY[scene_id] = scene_data
+    _compiled_scenes[scene_id] = compile_scene(scene_id, scene_data)
 
 
 def get_scene(scene_id):
@@ -173,6 +384,11 @@ def get_scene(scene_id):
     return SCENE_REGISTRY.get(scene_id)
 
 
+def get_compiled_scene(scene_id):
+    """Get the compiled form of a registered scene."""
+    return _compiled_scenes.get(scene_id)
+
+
 def get_scenes_by_tag(tag):
     """Get all scenes with a specific tag."""
     return [s for s in SCENE_REGISTRY.values() if tag in s.get("tags", [])]
@@ -182,51 +398,118 @@ def get_scenes_by_tag(tag):
 # Text Formatting
 # =============================================================================
 
+def _pronouns(character):
+    # STUB: Pull actual pronouns from character when that system exists
+    return character.db.pronouns or {"subject": "they", "object": "them", "possessive": "their"}
+
+
+def _currency(character):
+    from world.currency import balance
+    return balance(character)
+
+
+# Substitutions are only computed when a template actually uses them
+_BASE_SUBSTITUTIONS = {
+    "name": lambda character: character.key,
+    "pronoun": lambda character: _pronouns(character).get("subject", "they"),
+    "possessive": lambda character: _pronouns(character).get("possessive", "their"),
+    "object": lambda character: _pronouns(character).get("object", "them"),
+    "currency": _currency,
+}
+
+
+def _scene_substitution(field, character, state=None):
+    """Resolve one placeholder. Scene flags override the base substitutions."""
+    if state is not None and field in state.flags:
+        return state.flags[field]
+    getter = _BASE_SUBSTITUTIONS.get(field)
+    if getter is None:
+        raise KeyError(field)
+    return getter(character)
+
+
 def format_scene_text(text, character, state=None):
     """
     Format scene text with character-specific substitutions.
     
     Args:
-        text: Raw text with {placeholders}
+        text: Raw text with {placeholders}, a list of them, or SceneTemplate(s)
         character: Character object
         state: Optional SceneState for scene-local data
     
     Returns:
         str: Formatted text
     """
-    if isinstance(text, list):
+    if isinstance(text, (list, tuple)):
         text = random.choice(text)
-    
-    # Character substitutions
-    # STUB: Pull actual pronouns from character when that system exists
-    pronouns = character.db.pronouns or {"subject": "they", "object": "them", "possessive": "their"}
-    
-    from world.currency import balance
-    
-    subs = {
-        "name": character.key,
-        "pronoun": pronouns.get("subject", "they"),
-        "possessive": pronouns.get("possessive", "their"),
-        "object": pronouns.get("object", "them"),
-        "currency": balance(character),
-    }
-    
-    # Add state flags if present
-    if state:
-        subs.update(state.flags)
-    
-    # Safe format (ignore missing keys)
-    try:
-        return text.format(**subs)
-    except KeyError as e:
-        logger.log_warn(f"Scene text missing substitution: {e}")
-        return text
+    if not isinstance(text, SceneTemplate):
+        text = SceneTemplate(text)
+    return text.render(character, state)
 
 
 # =============================================================================
 # Condition Checking (reuse from triggers.py)
 # =============================================================================
 
+# Scene conditions compile to callables taking (character, state).
+
+def _compile_scene_flag(condition):
+    flag = condition.get("flag")
+    value = condition.get("value", True)
+    return lambda character, state: bool(state) and state.flags.get(flag) == value
+
+
+def _compile_visited_node(condition):
+    node = condition.get("node")
+    return lambda character, state: bool(state) and node in state.history
+
+
+def _compile_not_visited_node(condition):
+    node = condition.get("node")
+    return lambda character, state: bool(state) and node not in state.history
+
+
+def _compile_scene_random(condition):
+    chance = condition.get("chance", 0.5)
+    return lambda character, state: random.random() < chance
+
+
+SCENE_CONDITION_COMPILERS = {
+    "scene_flag": _compile_scene_flag,
+    "visited_node": _compile_visited_node,
+    "not_visited_node": _compile_not_visited_node,
+    "random": _compile_scene_random,
+}
+
+
+def compile_scene_condition(condition):
+    """
+    Compile a scene condition dict into a (character, state) callable.
+    Standard conditions are delegated to the trigger condition compiler.
+    """
+    compiler = SCENE_CONDITION_COMPILERS.get(condition.get("type"))
+    if compiler:
+        return compiler(condition)
+    
+    from world.triggers import compile_condition
+    check = compile_condition(condition)
+    return lambda character, state: check(character, None, {"state": state})
+
+
+def compile_scene_conditions(conditions):
+    """Compile a condition dict or list into a tuple of callables."""
+    if not conditions:
+        return ()
+    
+    # Normalize to list if single dict passed
+    if isinstance(conditions, dict):
+        conditions = [conditions]
+    elif not isinstance(conditions, list):
+        return ()
+    
+    return tuple(compile_scene_condition(c) for c in conditions if isinstance(c, dict))
+
+
 def check_scene_condition(condition, character, state=None):
     """
     Check if a scene condition is met.
@@ -240,54 +523,18 @@ def check_scene_condition(condition, character, state=None):
     Returns:
         bool: True if condition met
     """
-    cond_type = condition.get("type")
-    
-    # Scene-specific conditions
-    if cond_type == "scene_flag":
-        flag = condition.get("flag")
-        value = condition.get("value", True)
-        if state:
-            return state.flags.get(flag) == value
-        return False
-    
-    if cond_type == "visited_node":
-        node = condition.get("node")
-        if state:
-            return node in state.history
-        return False
-    
-    if cond_type == "not_visited_node":
-        node = condition.get("node")
-        if state:
-            return node not in state.history
-        return False
-    
-    if cond_type == "random":
-        chance = condition.get("chance", 0.5)
-        return random.random() < chance
-    
-    # Delegate to trigger system for standard conditions
-    from world.triggers import check_condition
-    return check_condition(condition, character, target=None, context={"state": state})
+    return compile_scene_condition(condition)(character, state)
 
 
 def check_all_scene_conditions(conditions, character, state=None):
-    """Check if all conditions pass."""
+    """Check if all conditions pass. Accepts dicts or compiled callables."""
     if not conditions:
         return True
-    
-    # Normalize to list if single dict passed
-    if isinstance(conditions, dict):
-        conditions = [conditions]
-    elif not isinstance(conditions, list):
-        return True
-    
-    for condition in conditions:
-        if not isinstance(condition, dict):
-            continue
-        if not check_scene_condition(condition, character, state):
-            return False
-    return True
+    if isinstance(conditions, tuple):
+        compiled = conditions
+    else:
+        compiled = compile_scene_conditions(conditions)
+    return all(check(character, state) for check in compiled)
 
 
 # =============================================================================
@@ -349,63 +596,44 @@ def execute_scene_effects(effects, character, state=None):
 # Scene Display & Navigation
 # =============================================================================
 
-def display_node(character, node_data, state):
+def display_node(character, node, state):
     """
     Display a scene node to the character.
     
     Args:
         character: Character viewing
-        node_data: Node dict
+        node: SceneNode
         state: SceneState
     """
     # Format and display text
-    text = node_data.get("text", "")
-    formatted = format_scene_text(text, character, state)
+    formatted = format_scene_text(node.texts, character, state)
     
     character.msg("\n" + formatted + "\n")
     
     # Execute node entry effects
-    effects = node_data.get("effects", [])
-    execute_scene_effects(effects, character, state)
+    execute_scene_effects(node.effects, character, state)
 
 
-def get_available_choices(node_data, character, state):
+def get_available_choices(node, character, state):
     """
     Get choices available to the character.
     
     Args:
-        node_data: Node dict
+        node: SceneNode
         character: Character
         state: SceneState
     
     Returns:
-        list: Available choice dicts with index
+        list: (index, SceneChoice, disabled) tuples
     """
-    choices = node_data.get("choices", [])
     available = []
     
-    for i, choice in enumerate(choices):
-        condition = choice.get("condition")
-        hidden = choice.get("hidden", True)  # Default: hide if condition fails
-        
-        if condition:
-            # Normalize condition to list of dicts
-            if isinstance(condition, dict):
-                cond_list = [condition]
-            elif isinstance(condition, list):
-                cond_list = condition
-            else:
-                # Invalid condition format, treat as no condition
-                cond_list = []
-            
-            if not cond_list or check_all_scene_conditions(cond_list, character, state):
-                available.append({"index": i + 1, **choice})
-            elif not hidden:
-                # Show disabled choice
-                disabled_text = choice.get("disabled_text", f"|x{choice['text']} (unavailable)|n")
-                available.append({"index": i + 1, "text": disabled_text, "disabled": True})
-        else:
-            available.append({"index": i + 1, **choice})
+    for i, choice in enumerate(node.choices, 1):
+        if not choice.conditions or all(check(character, state) for check in choice.conditions):
+            available.append((i, choice, False))
+        elif not choice.hidden:
+            # Show disabled choice
+            available.append((i, choice, True))
     
     return available
 
@@ -416,18 +644,19 @@ def display_choices(character, choices):
     
     Args:
         character: Character
-        choices: List of available choice dicts
+        choices: List from get_available_choices
     """
     if not choices:
         return
     
-    character.msg("")  # Blank line
-    for choice in choices:
-        if choice.get("disabled"):
-            character.msg(f"  {choice['index']}. {choice['text']}")
+    lines = [""]  # Blank line
+    for index, choice, disabled in choices:
+        if disabled:
+            lines.append(f"  {index}. {choice.disabled_text}")
         else:
-            character.msg(f"  |w{choice['index']}.|n {choice['text']}")
-    character.msg("")
+            lines.append(f"  |w{index}.|n {choice.text}")
+    lines.append("")
+    character.msg("\n".join(lines))
 
 
 # =============================================================================
@@ -457,16 +686,19 @@ def start_scene(character, scene_data, scene_id=None):
     scene_id = scene_id or scene_data.get("id", "unnamed_scene")
     
     # Check if already in a scene
-    if character.db.active_scene:
+    if is_in_scene(character):
         character.msg("|yYou're already in a scene. Use 'scene abort' to exit.|n")
         return None
     
     # Create state
     state = SceneState(scene_id, scene_data, character)
     
-    # Store on character
+    # Keep the live state in memory; persist a snapshot for recovery
+    character.ndb.active_scene = state
     character.db.active_scene = state.to_dict()
-    character.db.active_scene_data = scene_data  # Store full data for recovery
+    if get_compiled_scene(scene_id) is not state.scene:
+        # Unregistered scene - store full data so it can be recovered
+        character.db.active_scene_data = scene_data
     
     # Add scene command set
     character.cmdset.add(SceneCmdSet, persistent=False)
@@ -477,6 +709,13 @@ def start_scene(character, scene_data, scene_id=None):
     return state
 
 
+def _goto_node(character, state, next_node):
+    """Move state to a new node and queue it for write-behind."""
+    state.history.append(state.current_node)
+    state.current_node = next_node
+    _mark_scene_dirty(state)
+
+
 def advance_scene(character, state=None, choice_index=None):
     """
     Advance to the next node in a scene.
@@ -493,24 +732,22 @@ def advance_scene(character, state=None, choice_index=None):
             character.msg("|rYou're not in a scene.|n")
             return
     
-    scene_data = state.scene_data
-    current_node = state.current_node
-    node_data = scene_data.get(current_node)
+    node = state.scene.nodes.get(state.current_node)
     
-    if not node_data:
-        character.msg(f"|rError: Node '{current_node}' not found in scene.|n")
+    if not node:
+        character.msg(f"|rError: Node '{state.current_node}' not found in scene.|n")
         end_scene(character, state)
         return
     
     # If a choice was made, process it
     if choice_index is not None:
-        choices = get_available_choices(node_data, character, state)
+        choices = get_available_choices(node, character, state)
         
         # Find the choice
         selected = None
-        for choice in choices:
-            if choice["index"] == choice_index:
-                if choice.get("disabled"):
+        for index, choice, disabled in choices:
+            if index == choice_index:
+                if disabled:
                     character.msg("|rThat option is not available.|n")
                     display_choices(character, choices)
                     return
@@ -523,42 +760,35 @@ def advance_scene(character, state=None, choice_index=None):
             return
         
         # Execute choice effects
-        execute_scene_effects(selected.get("effects", []), character, state)
+        execute_scene_effects(selected.effects, character, state)
         
         # Move to next node
-        next_node = selected.get("goto")
-        if next_node:
-            state.history.append(current_node)
-            state.current_node = next_node
-            character.db.active_scene = state.to_dict()
+        if selected.goto:
+            _goto_node(character, state, selected.goto)
             
             # Display new node
             advance_scene(character, state)
             return
     
     # Display current node
-    display_node(character, node_data, state)
+    display_node(character, node, state)
     
     # Check for end
-    if node_data.get("end"):
+    if node.end:
         end_scene(character, state)
         return
     
     # Check for auto-advance
-    goto = node_data.get("goto")
+    goto = node.goto
     if goto:
-        state.history.append(current_node)
-        
         # Handle random goto
-        if isinstance(goto, list):
+        if isinstance(goto, tuple):
             goto = random.choice(goto)
         
-        state.current_node = goto
-        character.db.active_scene = state.to_dict()
+        _goto_node(character, state, goto)
         
         # Delay if specified
-        delay = node_data.get("delay", 0)
-        if delay:
+        if node.delay:
             # STUB: Use delay_command or script for actual delay
             character.msg("|x(Press enter to continue...)|n")
             # For now, just advance immediately
@@ -567,7 +797,7 @@ def advance_scene(character, state=None, choice_index=None):
         return
     
     # Show choices
-    choices = get_available_choices(node_data, character, state)
+    choices = get_available_choices(node, character, state)
     if choices:
         display_choices(character, choices)
     else:
@@ -585,8 +815,12 @@ def end_scene(character, state=None):
         state: SceneState (optional)
     """
     # Clear state
-    character.db.active_scene = None
-    character.db.active_scene_data = None
+    character.ndb.active_scene = None
+    _dirty_scene_states.pop(character.id, None)
+    if character.db.active_scene is not None:
+        character.db.active_scene = None
+    if character.db.active_scene_data is not None:
+        character.db.active_scene_data = None
     
     # Remove command set
     character.cmdset.remove(SceneCmdSet)
@@ -600,21 +834,32 @@ def get_active_scene(character):
     """
     Get the character's active scene state.
     
+    Uses the in-memory state when present, otherwise restores it from
+    the last persisted snapshot (e.g. after a reload).
+    
     Returns:
         SceneState or None
     """
+    state = character.ndb.active_scene
+    if state is not None:
+        return state
+    
     state_data = character.db.active_scene
-    scene_data = character.db.active_scene_data
+    if not state_data:
+        return None
     
-    if not state_data or not scene_data:
+    scene = get_compiled_scene(state_data.get("scene_id")) or character.db.active_scene_data
+    if not scene:
         return None
     
-    return SceneState.from_dict(state_data, scene_data, character)
+    state = SceneState.from_dict(state_data, scene, character)
+    character.ndb.active_scene = state
+    return state
 
 
 def is_in_scene(character):
     """Check if character is currently in a scene."""
-    return character.db.active_scene is not None
+    return character.ndb.active_scene is not None or character.db.active_scene is not None
 
 
 # =============================================================================
@@ -727,10 +972,9 @@ class CmdSceneStatus(Command):
         self.caller.msg(f"|wNodes visited:|n {len(state.history)}")
         
         # Re-display current node
-        node_data = state.scene_data.get(state.current_node, {})
-        choices = get_available_choices(node_data, self.caller, state)
-        if choices:
-            display_choices(self.caller, choices)
+        node = state.scene.nodes.get(state.current_node)
+        if node:
+            display_choices(self.caller, get_available_choices(node, self.caller, state))
 
 
 class SceneCmdSet(CmdSet):
@@ -6,7 +6,7 @@ Comprehensive shop management with:
 - Shop inventories (template-based stock)
 - Dynamic pricing (buy/sell markup)
 - NPC shopkeeper integration
-- Limited stock with restocking
+- Limited stock with lazy, time-based restocking
 - Shop specializations
 - Sell interface for players
 
@@ -30,17 +30,24 @@ Usage:
     
     # Sell an item
     sell_item(player, shop, item_object)
+    
+    # Sell materials from the character's material ledger
+    sell_material(player, shop, "iron_ore", 10)
 """
 
-from evennia import search_object
+import time
+
+from evennia import search_tag
 from evennia.utils import logger
 
 from world.items import (
-    ITEM_TEMPLATES, get_item_template, create_item, is_item,
-    get_item_data, get_item_value, get_item_display_name,
+    ITEM_TEMPLATES, ITEM_QUALITIES, get_item_template, get_item_prototype,
+    create_item, is_item, get_item_data, get_item_value, get_item_display_name,
     give_item, take_item, find_item_in_inventory
 )
+from world.materials import count_material, remove_material
 from world.currency import balance, pay, receive
+from world.time_weather import SECONDS_PER_GAME_HOUR
 
 
 # =============================================================================
@@ -195,6 +202,12 @@ SHOP_INVENTORIES = {
 # Shop Setup and Management
 # =============================================================================
 
+# Stock refills lazily: each item stores its count and the time it was last
+# counted, and the current stock is worked out on read from how many restock
+# intervals have passed since. One interval is one game day.
+SHOP_RESTOCK_INTERVAL = 24 * SECONDS_PER_GAME_HOUR
+
+
 def setup_shop(obj, shop_type, custom_inventory=None):
     """
     Set up a shop on an NPC or object.
@@ -222,18 +235,23 @@ def setup_shop(obj, shop_type, custom_inventory=None):
         "flags": shop_data.get("flags", []),
     }
     
-    # Initialize stock from template
-    obj.db.shop_stock = {}
+    # Stock configuration (static) and levels (count, counted_at)
+    now = time.time()
+    shop_stock = {}
+    levels = {}
     items_list = custom_inventory if custom_inventory else inventory_data.get("items", [])
     
     for item_entry in items_list:
         template_key = item_entry["template"]
-        obj.db.shop_stock[template_key] = {
-            "current_stock": item_entry.get("stock", 10),
+        shop_stock[template_key] = {
             "max_stock": item_entry.get("stock", 10),
             "restock_rate": item_entry.get("restock_rate", 1),
             "flags": item_entry.get("flags", []),
         }
+        levels[template_key] = (item_entry.get("stock", 10), now)
+    
+    obj.db.shop_stock = shop_stock
+    obj.db.shop_stock_levels = levels
     
     obj.db.shop_buys = {
         "categories": inventory_data.get("buys_categories", []),
@@ -242,6 +260,7 @@ def setup_shop(obj, shop_type, custom_inventory=None):
     }
     
     obj.tags.add("shop", category="object_type")
+    invalidate_shop_prices(obj)
     
     return True
 
@@ -251,20 +270,157 @@ def is_shop(obj):
     return obj.tags.has("shop", category="object_type")
 
 
+def get_all_shops():
+    """Get every shop in the game via the shop tag index."""
+    return search_tag("shop", category="object_type")
+
+
 def get_shop_data(obj):
     """Get shop configuration."""
     return obj.db.shop_data or {}
 
 
+def _current_level(stock_config, level, now):
+    """Work out the current stock from the last count and elapsed time."""
+    count, counted_at = level
+    maximum = stock_config.get("max_stock", 10)
+    rate = stock_config.get("restock_rate", 1)
+    if count >= maximum or rate <= 0:
+        return count
+    intervals = int((now - counted_at) // SHOP_RESTOCK_INTERVAL)
+    return min(maximum, count + rate * intervals)
+
+
+def _get_levels(shop):
+    """Get stored stock levels, converting shops set up before lazy restock."""
+    levels = shop.db.shop_stock_levels
+    if levels is None:
+        now = time.time()
+        levels = {
+            template_key: (entry.get("current_stock", entry.get("max_stock", 10)), now)
+            for template_key, entry in (shop.db.shop_stock or {}).items()
+        }
+        shop.db.shop_stock_levels = levels
+    return levels
+
+
+def get_current_stock(shop, template_key, now=None):
+    """Get how many of an item a shop has right now (0 if not stocked)."""
+    config = (shop.db.shop_stock or {}).get(template_key)
+    if not config:
+        return 0
+    level = _get_levels(shop).get(template_key)
+    if level is None:
+        return 0
+    return _current_level(config, level, now or time.time())
+
+
 def get_shop_stock(obj):
-    """Get current shop stock."""
-    return obj.db.shop_stock or {}
+    """
+    Get current shop stock.
+    
+    Returns:
+        dict: template_key -> {"current_stock", "max_stock", "restock_rate", "flags"}
+    """
+    config = obj.db.shop_stock or {}
+    levels = _get_levels(obj) if config else {}
+    now = time.time()
+    
+    stock = {}
+    for template_key, entry in config.items():
+        level = levels.get(template_key)
+        current = _current_level(entry, level, now) if level else 0
+        stock[template_key] = dict(entry, current_stock=current)
+    return stock
+
+
+def _set_stock_level(shop, template_key, count, now=None):
+    """Record a new count, keeping progress toward the next restock."""
+    now = now or time.time()
+    levels = dict(_get_levels(shop))
+    _, counted_at = levels.get(template_key, (0, now))
+    elapsed = max(0, now - counted_at) % SHOP_RESTOCK_INTERVAL
+    levels[template_key] = (count, now - elapsed)
+    shop.db.shop_stock_levels = levels
 
 
 # =============================================================================
 # Pricing Functions
 # =============================================================================
 
+# Per-shop catalog: shop.id -> (buy_markup, {template_key: row}). Each row
+# holds the resolved template data a listing or purchase needs, so prices
+# are computed once per shop rather than on every look. The entry is
+# rebuilt when the shop's markup changes, and dropped by
+# invalidate_shop_prices() when stock config or item templates change.
+_shop_catalogs = {}
+
+
+class ShopCatalogRow:
+    """Precomputed listing data for one item in one shop."""
+    
+    __slots__ = ("key", "name", "category", "price", "adult")
+    
+    def __init__(self, key, name, category, price, adult):
+        self.key = key
+        self.name = name
+        self.category = category
+        self.price = price
+        self.adult = adult
+
+
+def invalidate_shop_prices(shop=None):
+    """
+    Drop cached price tables, for one shop or all of them.
+    
+    Call after editing a shop's stock config or any ITEM_TEMPLATES entry.
+    """
+    if shop is None:
+        _shop_catalogs.clear()
+    else:
+        _shop_catalogs.pop(shop.id, None)
+
+
+def get_shop_catalog(shop):
+    """
+    Get the precomputed price table for a shop.
+    
+    Returns:
+        dict: template_key -> ShopCatalogRow (only items with a template)
+    """
+    markup = get_shop_data(shop).get("buy_markup", 1.0)
+    cached = _shop_catalogs.get(shop.id)
+    if cached and cached[0] == markup:
+        return cached[1]
+    
+    catalog = {}
+    for template_key, entry in (shop.db.shop_stock or {}).items():
+        template = get_item_template(template_key)
+        if not template:
+            continue
+        catalog[template_key] = ShopCatalogRow(
+            template_key,
+            template.get("key", template_key),
+            template.get("category", "misc"),
+            max(1, int(template.get("base_value", 0) * markup)),
+            "adult" in entry.get("flags", []) or "adult" in template.get("flags", []),
+        )
+    
+    _shop_catalogs[shop.id] = (markup, catalog)
+    return catalog
+
+
+def set_shop_markup(shop, buy_markup=None, sell_markdown=None):
+    """Change a shop's markup/markdown; the price table rebuilds on next use."""
+    shop_data = dict(get_shop_data(shop))
+    if buy_markup is not None:
+        shop_data["buy_markup"] = buy_markup
+    if sell_markdown is not None:
+        shop_data["sell_markdown"] = sell_markdown
+    shop.db.shop_data = shop_data
+    invalidate_shop_prices(shop)
+
+
 def get_buy_price(shop, template_key):
     """
     Get the price to buy an item from a shop.
@@ -276,23 +432,14 @@ def get_buy_price(shop, template_key):
     Returns:
         int: Price in coins, or 0 if not for sale
     """
-    shop_data = get_shop_data(shop)
-    stock = get_shop_stock(shop)
-    
-    if template_key not in stock:
-        return 0
-    
-    if stock[template_key].get("current_stock", 0) <= 0:
+    row = get_shop_catalog(shop).get(template_key)
+    if not row:
         return 0
     
-    template = get_item_template(template_key)
-    if not template:
+    if get_current_stock(shop, template_key) <= 0:
         return 0
     
-    base_value = template.get("base_value", 0)
-    markup = shop_data.get("buy_markup", 1.0)
-    
-    return max(1, int(base_value * markup))
+    return row.price
 
 
 def get_sell_price(shop, item):
@@ -309,14 +456,42 @@ def get_sell_price(shop, item):
     if not is_item(item):
         return 0
     
+    base_value = get_item_value(item, for_sale=False)
+    return _sell_price(shop, get_item_data(item), item.db.item_template, base_value)
+
+
+def get_material_sell_price(shop, template_key, quality="common"):
+    """
+    Get the price a shop will pay for one ledger material.
+    
+    Args:
+        shop: The shop object
+        template_key: Material template
+        quality: Quality tier being sold
+    
+    Returns:
+        int: Price in coins per unit, or 0 if shop won't buy
+    """
+    prototype = get_item_prototype(template_key)
+    if not prototype:
+        return 0
+    
+    item_data = prototype.item_data
+    quality_data = ITEM_QUALITIES.get(quality, ITEM_QUALITIES["common"])
+    base_value = int(item_data.get("base_value", 0) * quality_data["value_mult"])
+    if item_data.get("base_value", 0) > 0:
+        base_value = max(1, base_value)
+    return _sell_price(shop, item_data, template_key, base_value)
+
+
+def _sell_price(shop, item_data, template, base_value):
+    """Shop buy rules and markdown, shared by items and ledger materials."""
     shop_data = get_shop_data(shop)
     buys = shop.db.shop_buys or {}
-    item_data = get_item_data(item)
     
     # Check if shop buys this category
     category = item_data.get("category")
     subcategory = item_data.get("subcategory")
-    template = item.db.item_template
     
     will_buy = False
     
@@ -335,7 +510,6 @@ def get_sell_price(shop, item):
         return 0
     
     # Calculate price
-    base_value = get_item_value(item, for_sale=False)
     markdown = shop_data.get("sell_markdown", 0.5)
     
     return max(1, int(base_value * markdown))
@@ -358,7 +532,10 @@ def get_shop_inventory_display(shop, viewer, show_adult=False):
         str: Formatted inventory
     """
     shop_data = get_shop_data(shop)
-    stock = get_shop_stock(shop)
+    catalog = get_shop_catalog(shop)
+    levels = _get_levels(shop) if catalog else {}
+    config = shop.db.shop_stock or {}
+    now = time.time()
     
     lines = []
     lines.append(f"|w{shop_data.get('name', 'Shop')}|n")
@@ -369,41 +546,26 @@ def get_shop_inventory_display(shop, viewer, show_adult=False):
     
     # Group by category
     by_category = {}
-    for template_key, stock_data in stock.items():
-        template = get_item_template(template_key)
-        if not template:
-            continue
-        
+    for template_key, row in catalog.items():
         # Skip adult items if not showing
-        if not show_adult and "adult" in stock_data.get("flags", []):
-            continue
-        if not show_adult and "adult" in template.get("flags", []):
+        if row.adult and not show_adult:
             continue
         
-        current = stock_data.get("current_stock", 0)
+        level = levels.get(template_key)
+        current = _current_level(config[template_key], level, now) if level else 0
         if current <= 0:
             continue
         
-        cat = template.get("category", "misc")
-        if cat not in by_category:
-            by_category[cat] = []
-        
-        price = get_buy_price(shop, template_key)
-        by_category[cat].append({
-            "key": template_key,
-            "name": template.get("key", template_key),
-            "price": price,
-            "stock": current,
-        })
+        by_category.setdefault(row.category, []).append((row, current))
     
     if not by_category:
         lines.append("  |xNothing for sale.|n")
     else:
         for cat, items in sorted(by_category.items()):
             lines.append(f"|c{cat.title()}:|n")
-            for item in items:
-                stock_str = f"x{item['stock']}" if item['stock'] < 99 else ""
-                lines.append(f"  |w{item['name']}|n - {item['price']}c {stock_str}")
+            for row, current in items:
+                stock_str = f"x{current}" if current < 99 else ""
+                lines.append(f"  |w{row.name}|n - {row.price}c {stock_str}")
             lines.append("")
     
     lines.append("-" * 50)
@@ -472,13 +634,14 @@ def buy_item(character, shop, template_key, quantity=1):
     if not is_shop(shop):
         return (False, "This isn't a shop.")
     
-    stock = get_shop_stock(shop)
+    row = get_shop_catalog(shop).get(template_key)
     
     # Check if item is in stock
-    if template_key not in stock:
+    if not row:
         return (False, "That item isn't sold here.")
     
-    current_stock = stock[template_key].get("current_stock", 0)
+    now = time.time()
+    current_stock = get_current_stock(shop, template_key, now)
     if current_stock <= 0:
         return (False, "That item is out of stock.")
     
@@ -486,7 +649,7 @@ def buy_item(character, shop, template_key, quantity=1):
         return (False, f"Only {current_stock} in stock.")
     
     # Get price
-    unit_price = get_buy_price(shop, template_key)
+    unit_price = row.price
     total_price = unit_price * quantity
     
     # Check if buyer can afford
@@ -499,14 +662,12 @@ def buy_item(character, shop, template_key, quantity=1):
         return (False, "Transaction failed.")
     
     # Reduce stock
-    shop.db.shop_stock[template_key]["current_stock"] = current_stock - quantity
+    _set_stock_level(shop, template_key, current_stock - quantity, now)
     
     # Give item to buyer
-    template = get_item_template(template_key)
-    item_name = template.get("key", template_key) if template else template_key
+    item_name = row.name
     
-    for _ in range(quantity):
-        give_item(character, template_key)
+    give_item(character, template_key, quantity)
     
     return (True, f"You bought {item_name}" + (f" x{quantity}" if quantity > 1 else "") + f" for {total_price}c.")
 
@@ -563,15 +724,58 @@ def sell_item(character, shop, item, quantity=1):
     return (True, f"You sold {item_name}" + (f" x{quantity}" if quantity > 1 else "") + f" for {total_price}c.")
 
 
+def sell_material(character, shop, template_key, quantity=1, quality=None):
+    """
+    Sell ledger materials to a shop.
+    
+    Args:
+        character: The seller
+        shop: The shop
+        template_key: Material template
+        quantity: How many
+        quality: Only this quality (default: lowest first)
+    
+    Returns:
+        tuple: (success, message)
+    """
+    if not is_shop(shop):
+        return (False, "This isn't a shop.")
+    
+    template = get_item_template(template_key) or {}
+    item_name = template.get("key", template_key)
+    
+    have = count_material(character, template_key, quality)
+    if have <= 0:
+        return (False, f"You don't have any {item_name}.")
+    if quantity > have:
+        return (False, f"You only have {have}.")
+    
+    # Whether the shop buys it does not depend on quality
+    if get_material_sell_price(shop, template_key, quality or "common") <= 0:
+        return (False, f"This shop doesn't buy {item_name}.")
+    
+    removed = remove_material(character, template_key, quantity, quality)
+    total_price = sum(
+        get_material_sell_price(shop, template_key, tier) * amount
+        for tier, amount in removed
+    )
+    
+    # Pay seller
+    receive(character, total_price)
+    
+    return (True, f"You sold {item_name}" + (f" x{quantity}" if quantity > 1 else "") + f" for {total_price}c.")
+
+
 # =============================================================================
 # Stock Management
 # =============================================================================
 
 def restock_shop(shop):
     """
-    Restock a shop's inventory.
+    Restock a shop's inventory by one interval immediately.
     
-    Should be called periodically (e.g., daily).
+    Stock refills on its own as time passes; this is for forcing a
+    restock (admin commands, events).
     
     Args:
         shop: The shop to restock
@@ -579,24 +783,25 @@ def restock_shop(shop):
     if not is_shop(shop):
         return
     
-    stock = get_shop_stock(shop)
+    config = shop.db.shop_stock or {}
+    now = time.time()
+    levels = dict(_get_levels(shop))
     
-    for template_key, stock_data in stock.items():
-        current = stock_data.get("current_stock", 0)
-        maximum = stock_data.get("max_stock", 10)
-        rate = stock_data.get("restock_rate", 1)
-        
-        if current < maximum and rate > 0:
-            new_stock = min(maximum, current + rate)
-            shop.db.shop_stock[template_key]["current_stock"] = new_stock
+    for template_key, entry in config.items():
+        current = _current_level(entry, levels.get(template_key, (0, now)), now)
+        maximum = entry.get("max_stock", 10)
+        rate = entry.get("restock_rate", 1)
+        if rate > 0:
+            current = min(maximum, current + rate)
+        levels[template_key] = (current, now)
+    
+    shop.db.shop_stock_levels = levels
 
 
 def restock_all_shops():
     """Restock all shops in the game."""
-    shops = search_object(None, typeclass="typeclasses.characters.Character")
-    for obj in shops:
-        if is_shop(obj):
-            restock_shop(obj)
+    for shop in get_all_shops():
+        restock_shop(shop)
 
 
 # =============================================================================
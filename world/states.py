@@ -10,6 +10,8 @@ Separate from combat resources - these are RP/exploration states.
 from random import random, randint
 from evennia.utils import delay
 
+from world.display_cache import cached_bar, cached_panel
+
 # =============================================================================
 # STATE DEFINITIONS
 # =============================================================================
@@ -650,6 +652,15 @@ def get_state_display(character, verbose=False):
         character: Character to display
         verbose: If True, show numeric values
     """
+    # Levels follow from the values, so the values are all the panel shows
+    signature = (
+        verbose, get_energy(character), get_condition(character), get_arousal(character),
+        get_cleanliness(character), get_intoxication(character),
+    )
+    return cached_panel(character, "states", signature, _build_state_display, character, verbose)
+
+
+def _build_state_display(character, verbose):
     lines = ["|w=== STATUS ===|n"]
     
     # Energy
@@ -703,6 +714,10 @@ def get_state_display(character, verbose=False):
 
 def _make_bar(current, maximum, color, length=10):
     """Create a visual bar."""
+    return cached_bar(_draw_bar, current, maximum, color, length)
+
+
+def _draw_bar(current, maximum, color, length):
     filled = int((current / maximum) * length) if maximum > 0 else 0
     empty = length - filled
     return f"{color}{'█' * filled}|n{'░' * empty}"
@@ -710,6 +725,10 @@ def _make_bar(current, maximum, color, length=10):
 
 def _make_arousal_bar(level, length=5):
     """Create arousal bar (discrete levels)."""
+    return cached_bar(_draw_arousal_bar, level, length)
+
+
+def _draw_arousal_bar(level, length):
     colors = ["|w", "|Y", "|y", "|M", "|m", "|R"]
     filled = level
     empty = MAX_AROUSAL - level
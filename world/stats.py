@@ -30,6 +30,8 @@ from typing import Dict, List, Tuple, Optional, Any, Callable
 from enum import Enum
 from evennia.utils import logger
 
+from world.display_cache import cached_bar, cached_panel
+
 
 # =============================================================================
 # CONSTANTS
@@ -749,6 +751,10 @@ def add_notoriety(character, amount: int, reason: str = "", silent: bool = False
 
 def get_stat_bar(value: int, max_val: int = 100, width: int = 20) -> str:
     """Generate a visual stat bar."""
+    return cached_bar(_draw_stat_bar, value, max_val, width)
+
+
+def _draw_stat_bar(value: int, max_val: int, width: int) -> str:
     filled = int((value / max_val) * width)
     empty = width - filled
     
@@ -768,6 +774,10 @@ def get_stat_bar(value: int, max_val: int = 100, width: int = 20) -> str:
 
 def get_arousal_bar(value: int, width: int = 20) -> str:
     """Generate arousal bar with appropriate coloring."""
+    return cached_bar(_draw_arousal_bar, value, width)
+
+
+def _draw_arousal_bar(value: int, width: int) -> str:
     filled = int((value / 100) * width)
     empty = width - filled
     
@@ -783,8 +793,25 @@ def get_arousal_bar(value: int, width: int = 20) -> str:
     return f"{color}[{'█' * filled}{'░' * empty}]|n {value}/100"
 
 
+_DISPLAYED_STATS = (
+    "stamina", "composure", "arousal", "willpower", "sensitivity",
+    "resilience", "corruption", "notoriety",
+)
+
+
 def display_stats(character) -> str:
     """Generate full stat display for a character."""
+    # Every state, combined state and flag follows from these
+    signature = (
+        tuple(get_stat(character, stat) for stat in _DISPLAYED_STATS),
+        bool(character.db.orgasm_denied),
+        bool(character.db.orgasm_locked),
+        bool(character.db.movement_blocked),
+    )
+    return cached_panel(character, "stats", signature, _build_stats_display, character)
+
+
+def _build_stats_display(character) -> str:
     lines = []
     lines.append("|w=== Character Stats ===|n")
     lines.append("")
@@ -11,10 +11,13 @@ Game time tracking with:
 - Time-gated content hooks
 
 Architecture:
-- Single TimeManager script tracks global time
+- One in-process WorldClock holds time, weather and season. Game time is
+  derived from a stored epoch, so reading it never touches the database.
+- The TimeManager script persists the epoch and weather and drives
+  WorldClock.tick(), which publishes period/weather/season changes on
+  the world event bus (world.events)
 - Rooms can have area-specific weather
-- NPCs check schedules via hooks
-- Events can be time-triggered
+- NPCs follow schedules by subscribing to period changes
 
 Usage:
     from world.time_weather import (
@@ -31,13 +34,19 @@ Usage:
     # Time-gated content
     if is_night():
         spawn_dangerous_encounter()
+    
+    # React to changes instead of polling
+    from world.events import subscribe, WEATHER_CHANGED
+    subscribe(WEATHER_CHANGED, on_weather_changed)
 """
 
 import time
 import random
-from evennia import DefaultScript, search_object
+from evennia import DefaultScript
 from evennia.utils import logger
 
+from world.events import subscribe, publish, PERIOD_CHANGED, WEATHER_CHANGED, SEASON_CHANGED
+
 
 # =============================================================================
 # TIME CONFIGURATION
@@ -199,20 +208,297 @@ AREA_WEATHER = {
 
 
 # =============================================================================
-# GLOBAL TIME STATE
+# WORLD CLOCK
 # =============================================================================
 
-# These get set by the TimeManager script
-_game_time = {
-    "hour": 8,
-    "day": 1,
-    "month": 0,
-    "year": 1,
-    "last_update": time.time(),
+# Six-period day used by room descriptions, triggers and world_state callers.
+# "night" wraps past midnight.
+ROOM_TIME_PERIODS = {
+    "dawn": (5, 7),
+    "morning": (7, 12),
+    "midday": (12, 14),
+    "afternoon": (14, 17),
+    "evening": (17, 20),
+    "night": (20, 5),
 }
 
-_global_weather = "clear"
-_weather_duration = 0  # Hours until weather change
+# Where the game clock starts on a fresh database (8 AM, 1 Springseed, Year 1)
+START_TIME = {"hour": 8, "day": 1, "month": 2, "year": 1}
+
+
+def _period_for_hour(periods, hour):
+    for period, (start, end) in periods.items():
+        if start <= end:
+            if start <= hour < end:
+                return period
+        elif hour >= start or hour < end:
+            return period
+    return "night"
+
+
+# hour -> period lookups, so reading the period is a list index
+_PERIOD_BY_HOUR = [_period_for_hour(TIME_PERIODS, h) for h in range(24)]
+_ROOM_PERIOD_BY_HOUR = [_period_for_hour(ROOM_TIME_PERIODS, h) for h in range(24)]
+
+
+def _hours_from_parts(hour, day, month, year):
+    """Game hours since the start of Year 1 for a calendar position."""
+    return (((year - 1) * len(MONTHS) + month) * 28 + (day - 1)) * 24 + hour
+
+
+class WorldClock:
+    """
+    The one authoritative clock, weather and season for the game.
+
+    Game time is never stored as hour/day/month fields. The clock keeps the
+    real timestamp at which game time began (the epoch) and works the
+    current hour out from it arithmetically, so reading the time costs no
+    database access and nothing has to tick for time to pass.
+
+    Weather is held in memory along with the game hour at which it expires.
+    Both epoch and weather are written to the TimeManager script only when
+    they change. tick() (driven by the TimeManager) rolls expired weather
+    and publishes period/weather/season changes on the world event bus.
+    """
+
+    def __init__(self, script=None, epoch=None, weather="clear", weather_until=0.0):
+        self.script = script
+        self.epoch = epoch if epoch is not None else time.time()
+        self.weather = weather
+        self.weather_until = weather_until
+        self._period = self.get_period()
+        self._time_period = self.get_time_period()
+        self._season = self.get_season()
+
+    # -------------------------------------------------------------------------
+    # Reading the time
+    # -------------------------------------------------------------------------
+
+    def game_hours(self):
+        """Game hours elapsed since the start of Year 1 (fractional)."""
+        return (time.time() - self.epoch) / SECONDS_PER_GAME_HOUR
+
+    def get_time(self):
+        """
+        Get current game time.
+
+        Returns:
+            dict: {hour, day, month, year, day_of_week, month_name, season}
+        """
+        hours = int(self.game_hours())
+        days, hour = divmod(hours, 24)
+        months, day_index = divmod(days, 28)
+        years, month = divmod(months, len(MONTHS))
+        month_name, season = MONTHS[month]
+
+        return {
+            "hour": hour,
+            "day": day_index + 1,
+            "month": month,
+            "year": years + 1,
+            "day_of_week": DAYS_OF_WEEK[day_index % 7],
+            "month_name": month_name,
+            "season": season,
+        }
+
+    def get_hour(self):
+        return int(self.game_hours()) % 24
+
+    def get_month(self):
+        return (int(self.game_hours()) // (24 * 28)) % len(MONTHS)
+
+    def get_period(self):
+        """Period in the seven-period TIME_PERIODS scheme."""
+        return _PERIOD_BY_HOUR[self.get_hour()]
+
+    def get_time_period(self):
+        """Period in the six-period ROOM_TIME_PERIODS scheme."""
+        return _ROOM_PERIOD_BY_HOUR[self.get_hour()]
+
+    def get_season(self):
+        return MONTHS[self.get_month()][1]
+
+    def get_season_day(self):
+        """Day within the current season (seasons can span the year end)."""
+        days = int(self.game_hours()) // 24
+        month = (days // 28) % len(MONTHS)
+        season = MONTHS[month][1]
+        months_back = 0
+        while months_back < len(MONTHS) - 1:
+            if MONTHS[(month - months_back - 1) % len(MONTHS)][1] != season:
+                break
+            months_back += 1
+        return months_back * 28 + days % 28 + 1
+
+    def get_weather(self):
+        return self.weather
+
+    def weather_hours_left(self):
+        return max(0, int(self.weather_until - self.game_hours()))
+
+    # -------------------------------------------------------------------------
+    # Changing the time
+    # -------------------------------------------------------------------------
+
+    def set_time(self, hour=None, day=None, month=None, year=None):
+        """Jump to a calendar position. Unspecified parts are kept."""
+        current = self.get_time()
+        hour = current["hour"] if hour is None else max(0, min(23, hour))
+        day = current["day"] if day is None else max(1, min(28, day))
+        month = current["month"] if month is None else max(0, min(len(MONTHS) - 1, month))
+        year = current["year"] if year is None else max(1, year)
+
+        weather_left = self.weather_until - self.game_hours()
+        self.epoch = time.time() - _hours_from_parts(hour, day, month, year) * SECONDS_PER_GAME_HOUR
+        self.weather_until = self.game_hours() + weather_left
+        self._save()
+        self.tick()
+
+    def advance(self, hours=1):
+        """Move the clock forward by a number of game hours."""
+        self.epoch -= hours * SECONDS_PER_GAME_HOUR
+        self._save()
+        self.tick()
+
+    def set_time_period(self, period):
+        """
+        Move forward to the start of the next occurrence of a room period.
+
+        Returns:
+            bool: False if the period is unknown
+        """
+        if period not in ROOM_TIME_PERIODS:
+            return False
+        if self.get_time_period() != period:
+            hours = (ROOM_TIME_PERIODS[period][0] - self.get_hour()) % 24
+            self.advance(hours or 24)
+        return True
+
+    def set_season(self, season):
+        """Jump to the first month of a season in the current year."""
+        for idx, (name, month_season) in enumerate(MONTHS):
+            if month_season == season:
+                self.set_time(month=idx, day=1)
+                return True
+        return False
+
+    def set_weather(self, condition, duration=None):
+        """
+        Set the weather condition.
+
+        Args:
+            condition: Weather key
+            duration: Game hours until it changes (None = random 4-12)
+        """
+        old_weather = self.weather
+        self.weather = condition
+        self.weather_until = self.game_hours() + (duration or random.randint(4, 12))
+        self._save()
+        if old_weather != condition:
+            publish(WEATHER_CHANGED, old=old_weather, new=condition)
+
+    def roll_weather(self):
+        """Roll new random weather based on season."""
+        weights = SEASONS.get(self.get_season(), {}).get("weather_weights", {"clear": 100})
+        condition = random.choices(list(weights), weights=list(weights.values()))[0]
+        self.set_weather(condition)
+
+    def tick(self):
+        """Roll expired weather and publish anything that changed."""
+        if self.game_hours() >= self.weather_until:
+            self.roll_weather()
+
+        period = self.get_period()
+        time_period = self.get_time_period()
+        if period != self._period or time_period != self._time_period:
+            old, old_time_period = self._period, self._time_period
+            self._period, self._time_period = period, time_period
+            publish(PERIOD_CHANGED, old=old, new=period,
+                    old_time_period=old_time_period, time_period=time_period)
+
+        season = self.get_season()
+        if season != self._season:
+            old, self._season = self._season, season
+            publish(SEASON_CHANGED, old=old, new=season)
+
+    def _save(self):
+        if self.script:
+            self.script.db.epoch = self.epoch
+            self.script.db.weather = self.weather
+            self.script.db.weather_until = self.weather_until
+
+    # -------------------------------------------------------------------------
+    # world_state compatibility
+    # -------------------------------------------------------------------------
+
+    def get_full_state(self):
+        return {
+            "time": self.get_time_period(),
+            "period": self.get_period(),
+            "hour": self.get_hour(),
+            "weather": self.weather,
+            "season": self.get_season(),
+            "season_day": self.get_season_day(),
+        }
+
+
+_world_clock = None
+
+
+def start_world_clock():
+    """
+    Resolve the world clock from its TimeManager script.
+
+    Called once from at_server_start. Creates the script on a fresh
+    database and converts a TimeManager that still stores hour/day/month
+    fields to an epoch.
+
+    Returns:
+        WorldClock: The clock
+    """
+    global _world_clock
+
+    script = None
+    try:
+        from evennia import search_script, create_script
+        scripts = search_script("TimeManager", typeclass="world.time_weather.TimeManager")
+        script = scripts[0] if scripts else create_script(
+            "world.time_weather.TimeManager", key="TimeManager", persistent=True,
+        )
+    except Exception as e:
+        logger.log_err(f"Failed to resolve TimeManager, world clock will not persist: {e}")
+
+    now = time.time()
+    db = script.db if script else None
+    epoch = db.epoch if db else None
+
+    if epoch is None:
+        parts = dict(START_TIME)
+        if db and db.hour is not None:
+            parts = {
+                "hour": db.hour,
+                "day": db.day or 1,
+                "month": db.month or 0,
+                "year": db.year or 1,
+            }
+        epoch = now - _hours_from_parts(**parts) * SECONDS_PER_GAME_HOUR
+        game_hours = (now - epoch) / SECONDS_PER_GAME_HOUR
+        weather = (db.weather if db else None) or "clear"
+        weather_left = (db.weather_hours_left if db else None) or random.randint(4, 12)
+        _world_clock = WorldClock(script, epoch, weather, game_hours + weather_left)
+        _world_clock._save()
+        if db:
+            for legacy in ("hour", "day", "month", "year", "last_real_time", "weather_hours_left"):
+                script.attributes.remove(legacy)
+    else:
+        _world_clock = WorldClock(script, epoch, db.weather or "clear", db.weather_until or 0.0)
+
+    return _world_clock
+
+
+def get_world_clock():
+    """Get the world clock, resolving it on first use outside the server."""
+    return _world_clock or start_world_clock()
 
 
 # =============================================================================
@@ -220,23 +506,8 @@ _weather_duration = 0  # Hours until weather change
 # =============================================================================
 
 def get_time_manager():
-    """Get or create the TimeManager script."""
-    scripts = search_object("TimeManager", typeclass="world.time_weather.TimeManager")
-    if scripts:
-        return scripts[0]
-    
-    # Create if doesn't exist
-    from evennia import create_script
-    try:
-        script = create_script(
-            "world.time_weather.TimeManager",
-            key="TimeManager",
-            persistent=True,
-        )
-        return script
-    except Exception as e:
-        logger.log_err(f"Failed to create TimeManager: {e}")
-        return None
+    """Get the TimeManager script that persists the world clock."""
+    return get_world_clock().script
 
 
 def get_time():
@@ -246,25 +517,12 @@ def get_time():
     Returns:
         dict: {hour, day, month, year, day_of_week, month_name, season}
     """
-    manager = get_time_manager()
-    if manager:
-        return manager.get_time()
-    
-    # Fallback to static time
-    return {
-        "hour": 12,
-        "day": 1,
-        "month": 0,
-        "year": 1,
-        "day_of_week": "Moonday",
-        "month_name": "Deepwinter",
-        "season": "winter",
-    }
+    return get_world_clock().get_time()
 
 
 def get_hour():
     """Get current hour (0-23)."""
-    return get_time()["hour"]
+    return get_world_clock().get_hour()
 
 
 def get_period():
@@ -274,13 +532,7 @@ def get_period():
     Returns:
         str: "dawn", "morning", "afternoon", "evening", "night", "midnight", "late_night"
     """
-    hour = get_hour()
-    
-    for period, (start, end) in TIME_PERIODS.items():
-        if start <= hour < end:
-            return period
-    
-    return "night"
+    return get_world_clock().get_period()
 
 
 def get_period_description():
@@ -326,7 +578,7 @@ def get_month():
 
 def get_season():
     """Get current season."""
-    return get_time()["season"]
+    return get_world_clock().get_season()
 
 
 def get_season_description():
@@ -377,10 +629,7 @@ def get_time_string():
 
 def get_global_weather():
     """Get current global weather condition."""
-    manager = get_time_manager()
-    if manager:
-        return manager.db.weather or "clear"
-    return "clear"
+    return get_world_clock().weather
 
 
 def get_weather(location=None):
@@ -474,9 +723,7 @@ def set_weather(condition, duration=None):
         condition: Weather key
         duration: Hours until auto-change (None = random)
     """
-    manager = get_time_manager()
-    if manager:
-        manager.set_weather(condition, duration)
+    get_world_clock().set_weather(condition, duration)
 
 
 # =============================================================================
@@ -485,233 +732,139 @@ def set_weather(condition, duration=None):
 
 class TimeManager(DefaultScript):
     """
-    Global script that tracks game time and weather.
+    Global script that persists and drives the world clock.
     
-    Runs continuously, updating time based on real time elapsed.
+    It stores the clock's epoch and weather (see WorldClock) and calls
+    tick() every minute so weather rolls over and change events go out.
+    It does not hold the current time itself.
     """
     
     def at_script_creation(self):
         """Set up the time manager."""
         self.key = "TimeManager"
-        self.desc = "Tracks game time and weather"
+        self.desc = "Persists and drives the world clock"
         self.interval = 60  # Check every minute
         self.persistent = True
         
-        # Initialize time
-        self.db.hour = 8  # Start at 8 AM
-        self.db.day = 1
-        self.db.month = 2  # Springseed (spring)
-        self.db.year = 1
-        self.db.last_real_time = time.time()
-        
-        # Initialize weather
-        self.db.weather = "clear"
-        self.db.weather_hours_left = random.randint(4, 12)
-        
         logger.log_info("TimeManager created")
     
     def at_repeat(self):
-        """Called every interval - update time."""
-        self.update_time()
-    
-    def update_time(self):
-        """Update game time based on real time elapsed."""
-        now = time.time()
-        elapsed_real = now - (self.db.last_real_time or now)
-        self.db.last_real_time = now
-        
-        # Calculate game hours elapsed
-        hours_elapsed = elapsed_real / SECONDS_PER_GAME_HOUR
-        
-        if hours_elapsed < 1:
-            return
-        
-        # Track period changes for announcements
-        old_period = self._get_period(self.db.hour)
-        
-        # Advance time
-        full_hours = int(hours_elapsed)
-        self.db.hour += full_hours
-        
-        # Handle day rollover
-        while self.db.hour >= 24:
-            self.db.hour -= 24
-            self.db.day += 1
-            
-            # Handle month rollover (28 days per month)
-            if self.db.day > 28:
-                self.db.day = 1
-                self.db.month += 1
-                
-                # Handle year rollover (13 months)
-                if self.db.month >= 13:
-                    self.db.month = 0
-                    self.db.year += 1
-        
-        # Update weather
-        self.db.weather_hours_left = (self.db.weather_hours_left or 0) - full_hours
-        if self.db.weather_hours_left <= 0:
-            self.roll_weather()
-        
-        # Check for period change announcements
-        new_period = self._get_period(self.db.hour)
-        if old_period != new_period:
-            self.announce_period_change(new_period)
-        
-        # Trigger NPC schedule updates
-        self.update_npc_schedules()
-    
-    def _get_period(self, hour):
-        """Get period for a given hour."""
-        for period, (start, end) in TIME_PERIODS.items():
-            if start <= hour < end:
-                return period
-        return "night"
-    
-    def announce_period_change(self, new_period):
-        """Announce time period changes to outdoor rooms."""
-        # Get all rooms (this could be optimized with tags)
-        from evennia.objects.models import ObjectDB
-        
-        messages = {
-            "dawn": "|yThe sun begins to rise, painting the sky with color.|n",
-            "morning": "|yMorning light spreads across the land.|n",
-            "afternoon": "|yThe sun reaches its peak overhead.|n",
-            "evening": "|yThe sun begins its descent, casting long shadows.|n",
-            "night": "|xDarkness falls as night arrives.|n",
-            "midnight": "|xThe deepest part of night settles in.|n",
-            "late_night": "|xThe night grows old, dawn still hours away.|n",
-        }
-        
-        msg = messages.get(new_period)
-        if not msg:
-            return
-        
-        # Only announce to outdoor, occupied rooms
-        try:
-            from typeclasses.rooms import Room
-            for room in ObjectDB.objects.filter(db_typeclass_path__contains="Room"):
-                if room.tags.has("indoor", category="room_flag"):
-                    continue
-                if room.contents:
-                    for obj in room.contents:
-                        if hasattr(obj, 'msg') and hasattr(obj, 'has_account'):
-                            if obj.has_account:
-                                obj.msg(msg)
-        except Exception as e:
-            logger.log_err(f"Error announcing period change: {e}")
-    
-    def roll_weather(self):
-        """Roll new random weather based on season."""
-        season = self.get_season()
-        weights = SEASONS.get(season, {}).get("weather_weights", {"clear": 100})
-        
-        # Weighted random selection
-        total = sum(weights.values())
-        roll = random.randint(1, total)
-        
-        cumulative = 0
-        for condition, weight in weights.items():
-            cumulative += weight
-            if roll <= cumulative:
-                self.set_weather(condition)
-                return
-        
-        self.set_weather("clear")
-    
-    def set_weather(self, condition, duration=None):
-        """Set weather condition."""
-        old_weather = self.db.weather
-        self.db.weather = condition
-        self.db.weather_hours_left = duration or random.randint(4, 12)
-        
-        # Announce if weather changed significantly
-        if old_weather != condition:
-            self.announce_weather_change(old_weather, condition)
-    
-    def announce_weather_change(self, old_weather, new_weather):
-        """Announce weather changes to outdoor rooms."""
-        transitions = {
-            ("clear", "rain"): "Clouds gather overhead and rain begins to fall.",
-            ("clear", "storm"): "Dark clouds roll in as a storm approaches!",
-            ("clear", "snow"): "Snowflakes begin to drift down from the sky.",
-            ("rain", "clear"): "The rain stops and the clouds begin to part.",
-            ("rain", "storm"): "The rain intensifies into a full storm!",
-            ("storm", "clear"): "The storm passes, leaving clear skies.",
-            ("storm", "rain"): "The storm weakens to a steady rain.",
-            ("snow", "clear"): "The snow stops falling, leaving a white blanket.",
-            ("snow", "blizzard"): "The wind picks up, turning the snow into a blizzard!",
-            ("blizzard", "snow"): "The blizzard calms to gentle snowfall.",
-        }
-        
-        msg = transitions.get((old_weather, new_weather))
-        if not msg:
-            new_data = WEATHER_CONDITIONS.get(new_weather, {})
-            msg = f"The weather changes: {new_data.get('name', new_weather)}."
-        
-        msg = f"|c{msg}|n"
-        
-        # Announce to outdoor rooms
-        try:
-            from evennia.objects.models import ObjectDB
-            for room in ObjectDB.objects.filter(db_typeclass_path__contains="Room"):
-                if room.tags.has("indoor", category="room_flag"):
-                    continue
-                if room.contents:
-                    for obj in room.contents:
-                        if hasattr(obj, 'msg') and hasattr(obj, 'has_account'):
-                            if obj.has_account:
-                                obj.msg(msg)
-        except Exception as e:
-            logger.log_err(f"Error announcing weather change: {e}")
-    
-    def update_npc_schedules(self):
-        """Update NPC positions based on schedules."""
-        period = self._get_period(self.db.hour)
-        
-        try:
-            from world.npcs import get_scheduled_location, move_npc_to_schedule
-            from evennia import search_object
-            
-            # Find all NPCs
-            npcs = search_object(None, attribute_name="npc_template")
-            for npc in npcs:
-                scheduled = get_scheduled_location(npc, period)
-                if scheduled and npc.location and npc.location.key != scheduled:
-                    move_npc_to_schedule(npc, period)
-        except Exception as e:
-            logger.log_err(f"Error updating NPC schedules: {e}")
+        """Called every interval - publish any time/weather changes."""
+        get_world_clock().tick()
     
     def get_time(self):
         """Get current game time dict."""
-        day_of_week_idx = (self.db.day - 1) % 7
-        month_data = MONTHS[self.db.month]
-        
-        return {
-            "hour": self.db.hour,
-            "day": self.db.day,
-            "month": self.db.month,
-            "year": self.db.year,
-            "day_of_week": DAYS_OF_WEEK[day_of_week_idx],
-            "month_name": month_data[0],
-            "season": month_data[1],
-        }
+        return get_world_clock().get_time()
     
     def get_season(self):
         """Get current season."""
-        month_data = MONTHS[self.db.month]
-        return month_data[1]
+        return get_world_clock().get_season()
     
     def set_time(self, hour=None, day=None, month=None, year=None):
         """Manually set time (admin function)."""
-        if hour is not None:
-            self.db.hour = max(0, min(23, hour))
-        if day is not None:
-            self.db.day = max(1, min(28, day))
-        if month is not None:
-            self.db.month = max(0, min(12, month))
-        if year is not None:
-            self.db.year = max(1, year)
+        get_world_clock().set_time(hour=hour, day=day, month=month, year=year)
+    
+    def set_weather(self, condition, duration=None):
+        """Set weather condition."""
+        get_world_clock().set_weather(condition, duration)
+    
+    def roll_weather(self):
+        """Roll new random weather based on season."""
+        get_world_clock().roll_weather()
+
+
+# =============================================================================
+# CHANGE ANNOUNCEMENTS
+# =============================================================================
+# Subscribed to the world event bus below. Only online characters can hear
+# an announcement, so these walk the connected sessions rather than rooms.
+
+def _msg_outdoor_players(msg):
+    """Send a message to puppeted characters in outdoor rooms."""
+    from evennia import SESSION_HANDLER
+    
+    for session in SESSION_HANDLER.get_sessions():
+        puppet = session.puppet
+        if not puppet or not puppet.location:
+            continue
+        if puppet.location.tags.has("indoor", category="room_flag"):
+            continue
+        puppet.msg(msg)
+
+
+def announce_period_change(event):
+    """Announce time period changes to outdoor rooms."""
+    if event.old == event.new:
+        return
+    
+    messages = {
+        "dawn": "|yThe sun begins to rise, painting the sky with color.|n",
+        "morning": "|yMorning light spreads across the land.|n",
+        "afternoon": "|yThe sun reaches its peak overhead.|n",
+        "evening": "|yThe sun begins its descent, casting long shadows.|n",
+        "night": "|xDarkness falls as night arrives.|n",
+        "midnight": "|xThe deepest part of night settles in.|n",
+        "late_night": "|xThe night grows old, dawn still hours away.|n",
+    }
+    
+    msg = messages.get(event.new)
+    if not msg:
+        return
+    
+    # Only announce to outdoor, occupied rooms
+    try:
+        _msg_outdoor_players(msg)
+    except Exception as e:
+        logger.log_err(f"Error announcing period change: {e}")
+
+
+def announce_weather_change(event):
+    """Announce weather changes to outdoor rooms."""
+    transitions = {
+        ("clear", "rain"): "Clouds gather overhead and rain begins to fall.",
+        ("clear", "storm"): "Dark clouds roll in as a storm approaches!",
+        ("clear", "snow"): "Snowflakes begin to drift down from the sky.",
+        ("rain", "clear"): "The rain stops and the clouds begin to part.",
+        ("rain", "storm"): "The rain intensifies into a full storm!",
+        ("storm", "clear"): "The storm passes, leaving clear skies.",
+        ("storm", "rain"): "The storm weakens to a steady rain.",
+        ("snow", "clear"): "The snow stops falling, leaving a white blanket.",
+        ("snow", "blizzard"): "The wind picks up, turning the snow into a blizzard!",
+        ("blizzard", "snow"): "The blizzard calms to gentle snowfall.",
+    }
+    
+    msg = transitions.get((event.old, event.new))
+    if not msg:
+        new_data = WEATHER_CONDITIONS.get(event.new, {})
+        msg = f"The weather changes: {new_data.get('name', event.new)}."
+    
+    try:
+        _msg_outdoor_players(f"|c{msg}|n")
+    except Exception as e:
+        logger.log_err(f"Error announcing weather change: {e}")
+
+
+def announce_season_change(event):
+    """Announce the season change to all players."""
+    from evennia import SESSION_HANDLER
+    
+    messages = {
+        "spring": "The world awakens as |gspring|n arrives. Flowers begin to bloom.",
+        "summer": "The warmth of |ysummer|n spreads across the land.",
+        "autumn": "Leaves turn golden as |rautumn|n settles in.",
+        "winter": "A chill fills the air as |wwinter|n takes hold.",
+    }
+    
+    msg = messages.get(event.new, "The seasons change.")
+    
+    for session in SESSION_HANDLER.get_sessions():
+        if session.puppet:
+            session.puppet.msg(f"\n|w[World]|n {msg}\n")
+
+
+subscribe(PERIOD_CHANGED, announce_period_change)
+subscribe(WEATHER_CHANGED, announce_weather_change)
+subscribe(SEASON_CHANGED, announce_season_change)
 
 
 # =============================================================================
@@ -750,31 +903,17 @@ def advance_time(hours=1):
     Args:
         hours: Hours to advance
     """
-    manager = get_time_manager()
-    if manager:
-        manager.db.hour += hours
-        # Let normal update handle rollovers
-        manager.update_time()
+    get_world_clock().advance(hours)
 
 
 def set_time_of_day(hour):
     """Set time to specific hour (0-23)."""
-    manager = get_time_manager()
-    if manager:
-        manager.set_time(hour=hour)
+    get_world_clock().set_time(hour=hour)
 
 
 def set_season(season):
     """Set to a specific season."""
-    manager = get_time_manager()
-    if not manager:
-        return
-    
-    # Find a month in that season
-    for idx, (name, s) in enumerate(MONTHS):
-        if s == season:
-            manager.set_time(month=idx)
-            return
+    get_world_clock().set_season(season)
 
 
 def force_weather(condition, duration=None):
@@ -786,9 +925,7 @@ def get_time_debug():
     """Get debug string with all time info."""
     game_time = get_time()
     weather = get_global_weather()
-    
-    manager = get_time_manager()
-    weather_left = manager.db.weather_hours_left if manager else 0
+    weather_left = get_world_clock().weather_hours_left()
     
     return (
         f"Time: {get_formatted_time()}\n"
@@ -32,6 +32,8 @@ import random
 import time
 from evennia.utils import logger
 
+from world.events import subscribe, PERIOD_CHANGED, WEATHER_CHANGED, SEASON_CHANGED
+
 # =============================================================================
 # Trigger Definitions Storage
 # =============================================================================
@@ -46,9 +48,10 @@ from evennia.utils import logger
 #     "once": False,        # If True, trigger removes itself after firing
 #     "cooldown": 0,        # Seconds before can fire again
 #     "probability": 1.0,   # Chance to fire (0.0-1.0)
-#     "last_fired": None,   # Timestamp of last fire
 #     "enabled": True,
 # }
+#
+# Last-fired timestamps are not stored here; see the Trigger Index section.
 
 
 # =============================================================================
@@ -89,6 +92,204 @@ GLOBAL_TRIGGER_TYPES = [
 # Condition Types
 # =============================================================================
 
+# Conditions are compiled once into callables with the signature
+# (actor, target, context) -> bool. Any import a condition needs happens at
+# compile time, so evaluating a compiled condition is a plain function call.
+
+def _compile_time_is(condition):
+    from world.time_weather import get_world_clock
+    value = condition.get("value")
+    return lambda actor, target, context: get_world_clock().get_time_period() == value
+
+
+def _compile_time_between(condition):
+    from world.time_weather import get_world_clock
+    valid = frozenset(condition.get("values", []))
+    return lambda actor, target, context: get_world_clock().get_time_period() in valid
+
+
+def _compile_weather_is(condition):
+    from world.time_weather import get_world_clock
+    value = condition.get("value")
+    return lambda actor, target, context: get_world_clock().get_weather() == value
+
+
+def _compile_weather_in(condition):
+    from world.time_weather import get_world_clock
+    valid = frozenset(condition.get("values", []))
+    return lambda actor, target, context: get_world_clock().get_weather() in valid
+
+
+def _compile_season_is(condition):
+    from world.time_weather import get_world_clock
+    value = condition.get("value")
+    return lambda actor, target, context: get_world_clock().get_season() == value
+
+
+def _compile_has_item(condition):
+    item_key = condition.get("item")
+
+    def _check(actor, target, context):
+        if hasattr(actor, 'contents'):
+            return any(obj.key == item_key for obj in actor.contents)
+        return False
+    return _check
+
+
+def _compile_has_effect(condition):
+    from world.effects import has_effect
+    effect = condition.get("effect")
+    return lambda actor, target, context: has_effect(actor, effect)
+
+
+def _compile_lacks_effect(condition):
+    from world.effects import has_effect
+    effect = condition.get("effect")
+    return lambda actor, target, context: not has_effect(actor, effect)
+
+
+def _compile_has_tag(condition):
+    tag = condition.get("tag")
+    category = condition.get("category")
+    return lambda actor, target, context: actor.tags.has(tag, category=category)
+
+
+def _compile_currency_gte(condition):
+    from world.currency import balance
+    amount = condition.get("amount", 0)
+    return lambda actor, target, context: balance(actor) >= amount
+
+
+def _compile_currency_lt(condition):
+    from world.currency import balance
+    amount = condition.get("amount", 0)
+    return lambda actor, target, context: balance(actor) < amount
+
+
+def _compile_random(condition):
+    chance = condition.get("chance", 0.5)
+    return lambda actor, target, context: random.random() < chance
+
+
+def _compile_attr_equals(condition):
+    attr = condition.get("attr")
+    value = condition.get("value")
+    return lambda actor, target, context: getattr(actor.db, attr, None) == value
+
+
+def _compile_attr_gte(condition):
+    attr = condition.get("attr")
+    value = condition.get("value", 0)
+    return lambda actor, target, context: getattr(actor.db, attr, 0) >= value
+
+
+def _compile_is_player(condition):
+    return lambda actor, target, context: (
+        hasattr(actor, 'account') and actor.account is not None
+    )
+
+
+def _compile_is_character(condition):
+    char_key = (condition.get("key") or "").lower()
+    return lambda actor, target, context: actor.key.lower() == char_key
+
+
+def _compile_first_visit(condition):
+    def _check(actor, target, context):
+        if target:
+            visited_key = f"visited_{target.id}"
+            return not actor.tags.has(visited_key, category="visited")
+        return False
+    return _check
+
+
+def _always(actor, target, context):
+    return True
+
+
+def _never(actor, target, context):
+    return False
+
+
+# Conditions that depend only on world time/weather/season. Triggers hold
+# these apart and re-check them only after the world event bus reports a
+# change, so an enter trigger gated on "night" costs nothing by day.
+ENVIRONMENT_CONDITION_TYPES = frozenset({
+    "time_is", "time_between", "weather_is", "weather_in", "season_is",
+})
+
+CONDITION_COMPILERS = {
+    "time_is": _compile_time_is,
+    "time_between": _compile_time_between,
+    "weather_is": _compile_weather_is,
+    "weather_in": _compile_weather_in,
+    "season_is": _compile_season_is,
+    "has_item": _compile_has_item,
+    "has_effect": _compile_has_effect,
+    "lacks_effect": _compile_lacks_effect,
+    "has_tag": _compile_has_tag,
+    "currency_gte": _compile_currency_gte,
+    "currency_lt": _compile_currency_lt,
+    "random": _compile_random,
+    "attr_equals": _compile_attr_equals,
+    "attr_gte": _compile_attr_gte,
+    "is_player": _compile_is_player,
+    "is_character": _compile_is_character,
+    "first_visit": _compile_first_visit,
+    "always": lambda condition: _always,
+    "never": lambda condition: _never,
+}
+
+# Compiled conditions keyed by a hashable snapshot of the condition dict
+_compiled_conditions = {}
+
+
+def _freeze(value):
+    """Turn a condition dict into a hashable cache key."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def compile_condition(condition):
+    """
+    Compile a condition dict into a callable.
+    
+    Args:
+        condition: dict with "type" and type-specific params
+    
+    Returns:
+        callable: (actor, target, context) -> bool
+    """
+    try:
+        key = _freeze(condition)
+        compiled = _compiled_conditions.get(key)
+    except TypeError:
+        key, compiled = None, None
+    if compiled is not None:
+        return compiled
+    
+    cond_type = condition.get("type")
+    compiler = CONDITION_COMPILERS.get(cond_type)
+    if compiler is None:
+        # Unknown condition type - log warning once and pass
+        logger.log_warn(f"Unknown trigger condition type: {cond_type}")
+        compiled = _always
+    else:
+        compiled = compiler(condition)
+    
+    if key is not None:
+        _compiled_conditions[key] = compiled
+    return compiled
+
+
+def compile_conditions(conditions):
+    """Compile a list of condition dicts into a tuple of callables."""
+    return tuple(compile_condition(c) for c in conditions or ())
+
+
 def check_condition(condition, actor, target=None, context=None):
     """
     Check if a condition is met.
@@ -102,109 +303,7 @@ def check_condition(condition, actor, target=None, context=None):
     Returns:
         bool: True if condition met
     """
-    cond_type = condition.get("type")
-    context = context or {}
-    
-    # Time conditions
-    if cond_type == "time_is":
-        from world.world_state import get_time_period
-        return get_time_period() == condition.get("value")
-    
-    if cond_type == "time_between":
-        from world.world_state import get_time_period
-        period = get_time_period()
-        valid = condition.get("values", [])
-        return period in valid
-    
-    # Weather conditions
-    if cond_type == "weather_is":
-        from world.world_state import get_weather
-        return get_weather() == condition.get("value")
-    
-    if cond_type == "weather_in":
-        from world.world_state import get_weather
-        weather = get_weather()
-        valid = condition.get("values", [])
-        return weather in valid
-    
-    # Season conditions
-    if cond_type == "season_is":
-        from world.world_state import get_season
-        return get_season() == condition.get("value")
-    
-    # Actor has item
-    if cond_type == "has_item":
-        item_key = condition.get("item")
-        if hasattr(actor, 'contents'):
-            return any(obj.key == item_key for obj in actor.contents)
-        return False
-    
-    # Actor has effect
-    if cond_type == "has_effect":
-        from world.effects import has_effect
-        return has_effect(actor, condition.get("effect"))
-    
-    # Actor lacks effect
-    if cond_type == "lacks_effect":
-        from world.effects import has_effect
-        return not has_effect(actor, condition.get("effect"))
-    
-    # Actor has tag
-    if cond_type == "has_tag":
-        tag = condition.get("tag")
-        category = condition.get("category")
-        return actor.tags.has(tag, category=category)
-    
-    # Currency check
-    if cond_type == "currency_gte":
-        from world.currency import balance
-        return balance(actor) >= condition.get("amount", 0)
-    
-    if cond_type == "currency_lt":
-        from world.currency import balance
-        return balance(actor) < condition.get("amount", 0)
-    
-    # Random chance
-    if cond_type == "random":
-        chance = condition.get("chance", 0.5)
-        return random.random() < chance
-    
-    # Attribute check
-    if cond_type == "attr_equals":
-        attr = condition.get("attr")
-        value = condition.get("value")
-        return getattr(actor.db, attr, None) == value
-    
-    if cond_type == "attr_gte":
-        attr = condition.get("attr")
-        value = condition.get("value", 0)
-        return getattr(actor.db, attr, 0) >= value
-    
-    # Is player (not NPC)
-    if cond_type == "is_player":
-        return hasattr(actor, 'account') and actor.account is not None
-    
-    # Is specific character
-    if cond_type == "is_character":
-        char_key = condition.get("key")
-        return actor.key.lower() == char_key.lower()
-    
-    # First time entering (doesn't have visited flag)
-    if cond_type == "first_visit":
-        if target:
-            visited_key = f"visited_{target.id}"
-            return not actor.tags.has(visited_key, category="visited")
-        return False
-    
-    # Always true/false (for testing)
-    if cond_type == "always":
-        return True
-    if cond_type == "never":
-        return False
-    
-    # Unknown condition type - log warning and pass
-    logger.log_warn(f"Unknown trigger condition type: {cond_type}")
-    return True
+    return compile_condition(condition)(actor, target, context or {})
 
 
 def check_all_conditions(conditions, actor, target=None, context=None):
@@ -223,8 +322,9 @@ def check_all_conditions(conditions, actor, target=None, context=None):
     if not conditions:
         return True
     
+    context = context or {}
     for condition in conditions:
-        if not check_condition(condition, actor, target, context):
+        if not compile_condition(condition)(actor, target, context):
             return False
     return True
 
@@ -449,27 +549,124 @@ def execute_effects(effects, actor, target=None, context=None):
     return success_count
 
 
+# =============================================================================
+# Trigger Index
+# =============================================================================
+
+# .db.triggers stays the persistent source of truth. For checking, each
+# target's list is compiled once into CompiledTriggers grouped by trigger
+# type; the management functions below drop the entry whenever they edit
+# the stored list. Cooldown timestamps live in a side table keyed by
+# (target id, trigger id), so firing a trigger never re-pickles the list.
+
+_trigger_index = {}   # target.id -> {trigger_type: (CompiledTrigger, ...)}
+_last_fired = {}      # (target.id, trigger_id) -> timestamp
+
+
+# Bumped by the world event bus whenever period, weather or season changes
+_environment_version = 0
+
+
+def _on_environment_changed(event):
+    global _environment_version
+    _environment_version += 1
+
+
+subscribe(PERIOD_CHANGED, _on_environment_changed)
+subscribe(WEATHER_CHANGED, _on_environment_changed)
+subscribe(SEASON_CHANGED, _on_environment_changed)
+
+
+class CompiledTrigger:
+    """A trigger dict with its conditions compiled into callables."""
+    
+    __slots__ = ("id", "type", "conditions", "environment", "effects", "once",
+                 "cooldown", "probability", "enabled", "_env_version", "_env_ok")
+    
+    def __init__(self, trigger):
+        conditions = trigger.get("conditions") or ()
+        self.id = trigger.get("id")
+        self.type = trigger.get("type")
+        self.conditions = compile_conditions(
+            [c for c in conditions if c.get("type") not in ENVIRONMENT_CONDITION_TYPES]
+        )
+        self.environment = compile_conditions(
+            [c for c in conditions if c.get("type") in ENVIRONMENT_CONDITION_TYPES]
+        )
+        self._env_version = None
+        self._env_ok = True
+        self.effects = trigger.get("effects", [])
+        self.once = trigger.get("once", False)
+        self.cooldown = trigger.get("cooldown", 0) or 0
+        self.probability = trigger.get("probability", 1.0)
+        self.enabled = trigger.get("enabled", True)
+    
+    def get(self, key, default=None):
+        """Dict-style access so callers written for trigger dicts still work."""
+        return getattr(self, key, default) if key in self.__slots__ else default
+    
+    def environment_ok(self):
+        """Whether the time/weather/season conditions hold, re-checked per change."""
+        if self._env_version != _environment_version:
+            self._env_ok = all(check(None, None, {}) for check in self.environment)
+            self._env_version = _environment_version
+        return self._env_ok
+
+
+def _compile_target(target):
+    """Build (or fetch) the per-type index for a target."""
+    index = _trigger_index.get(target.id)
+    if index is not None:
+        return index
+    
+    index = {}
+    for trigger in target.db.triggers or []:
+        compiled = CompiledTrigger(trigger)
+        if not compiled.enabled:
+            continue
+        index.setdefault(compiled.type, []).append(compiled)
+        # Carry over timestamps written by older code into the side table
+        if compiled.cooldown and trigger.get("last_fired"):
+            _last_fired.setdefault((target.id, compiled.id), trigger["last_fired"])
+    
+    index = {ttype: tuple(triggers) for ttype, triggers in index.items()}
+    _trigger_index[target.id] = index
+    return index
+
+
+def invalidate_triggers(target):
+    """Drop the compiled index for a target after its triggers change."""
+    _trigger_index.pop(target.id, None)
+
+
+def reset_trigger_cooldowns(target=None):
+    """Clear cooldown state, for one target or everywhere."""
+    if target is None:
+        _last_fired.clear()
+        return
+    for key in [k for k in _last_fired if k[0] == target.id]:
+        del _last_fired[key]
+
+
 # =============================================================================
 # Trigger Checking & Firing
 # =============================================================================
 
 def get_triggers(target, trigger_type=None):
     """
-    Get all triggers on a target, optionally filtered by type.
+    Get all enabled triggers on a target, optionally filtered by type.
     
     Args:
         target: Object/room with triggers
         trigger_type: Optional type filter
     
     Returns:
-        list: Trigger dicts
+        tuple: CompiledTriggers
     """
-    triggers = target.db.triggers or []
-    
+    index = _compile_target(target)
     if trigger_type:
-        triggers = [t for t in triggers if t.get("type") == trigger_type]
-    
-    return [t for t in triggers if t.get("enabled", True)]
+        return index.get(trigger_type, ())
+    return tuple(t for triggers in index.values() for t in triggers)
 
 
 def check_trigger(trigger, actor, target, context=None):
@@ -477,7 +674,7 @@ def check_trigger(trigger, actor, target, context=None):
     Check if a trigger should fire.
     
     Args:
-        trigger: Trigger dict
+        trigger: CompiledTrigger (or raw trigger dict)
         actor: Triggering character
         target: Object/room with trigger
         context: Additional context
@@ -485,26 +682,32 @@ def check_trigger(trigger, actor, target, context=None):
     Returns:
         bool: True if trigger should fire
     """
+    if not isinstance(trigger, CompiledTrigger):
+        trigger = CompiledTrigger(trigger)
+    
     # Check if enabled
-    if not trigger.get("enabled", True):
+    if not trigger.enabled:
         return False
     
     # Check cooldown
-    cooldown = trigger.get("cooldown", 0)
-    if cooldown > 0:
-        last_fired = trigger.get("last_fired")
-        if last_fired and (time.time() - last_fired) < cooldown:
+    if trigger.cooldown > 0:
+        last_fired = _last_fired.get((target.id, trigger.id))
+        if last_fired and (time.time() - last_fired) < trigger.cooldown:
             return False
     
+    # Check world time/weather/season
+    if trigger.environment and not trigger.environment_ok():
+        return False
+    
     # Check probability
-    probability = trigger.get("probability", 1.0)
-    if probability < 1.0 and random.random() > probability:
+    if trigger.probability < 1.0 and random.random() > trigger.probability:
         return False
     
     # Check conditions
-    conditions = trigger.get("conditions", [])
-    if not check_all_conditions(conditions, actor, target, context):
-        return False
+    context = context or {}
+    for condition in trigger.conditions:
+        if not condition(actor, target, context):
+            return False
     
     return True
 
@@ -514,7 +717,7 @@ def fire_trigger(trigger, actor, target, context=None):
     Fire a trigger, executing its effects.
     
     Args:
-        trigger: Trigger dict
+        trigger: CompiledTrigger (or raw trigger dict)
         actor: Character receiving effects
         target: Object/room with trigger
         context: Additional context
@@ -522,18 +725,18 @@ def fire_trigger(trigger, actor, target, context=None):
     Returns:
         bool: True if trigger fired
     """
-    effects = trigger.get("effects", [])
-    execute_effects(effects, actor, target, context)
+    if not isinstance(trigger, CompiledTrigger):
+        trigger = CompiledTrigger(trigger)
     
-    # Update last_fired
-    trigger["last_fired"] = time.time()
+    # Record before running effects so a chained trigger can't re-enter
+    if trigger.cooldown:
+        _last_fired[(target.id, trigger.id)] = time.time()
     
-    # Remove if one-shot
-    if trigger.get("once", False):
-        triggers = target.db.triggers or []
-        trigger_id = trigger.get("id")
-        target.db.triggers = [t for t in triggers if t.get("id") != trigger_id]
+    # Remove if one-shot - the only case that still writes the stored list
+    if trigger.once:
+        remove_trigger(target, trigger.id)
     
+    execute_effects(trigger.effects, actor, target, context)
     return True
 
 
@@ -551,8 +754,10 @@ def check_and_fire_triggers(target, trigger_type, actor, context=None):
         int: Number of triggers fired
     """
     triggers = get_triggers(target, trigger_type)
-    fired_count = 0
+    if not triggers:
+        return 0
     
+    fired_count = 0
     for trigger in triggers:
         if check_trigger(trigger, actor, target, context):
             if fire_trigger(trigger, actor, target, context):
@@ -563,9 +768,8 @@ def check_and_fire_triggers(target, trigger_type, actor, context=None):
 
 def fire_trigger_by_id(target, trigger_id, actor, context=None):
     """Fire a specific trigger by ID."""
-    triggers = target.db.triggers or []
-    for trigger in triggers:
-        if trigger.get("id") == trigger_id:
+    for trigger in get_triggers(target):
+        if trigger.id == trigger_id:
             if check_trigger(trigger, actor, target, context):
                 return fire_trigger(trigger, actor, target, context)
     return False
@@ -638,10 +842,10 @@ def add_trigger(target, trigger_type, effects, conditions=None,
         "cooldown": cooldown,
         "probability": probability,
         "enabled": True,
-        "last_fired": None,
     }
     
     target.db.triggers.append(trigger)
+    invalidate_triggers(target)
     return trigger_id
 
 
@@ -650,6 +854,8 @@ def remove_trigger(target, trigger_id):
     if target.db.triggers:
         target.db.triggers = [t for t in target.db.triggers 
                              if t.get("id") != trigger_id]
+        invalidate_triggers(target)
+        _last_fired.pop((target.id, trigger_id), None)
         return True
     return False
 
@@ -664,6 +870,7 @@ def clear_triggers(target, trigger_type=None):
                              if t.get("type") != trigger_type]
     else:
         target.db.triggers = []
+    invalidate_triggers(target)
 
 
 def enable_trigger(target, trigger_id, enabled=True):
@@ -672,6 +879,7 @@ def enable_trigger(target, trigger_id, enabled=True):
         for trigger in target.db.triggers:
             if trigger.get("id") == trigger_id:
                 trigger["enabled"] = enabled
+                invalidate_triggers(target)
                 return True
     return False
 
@@ -731,7 +939,11 @@ def add_trap_trigger(target, trigger_type, effect_key, message,
 
 
 def add_time_triggered_message(room, time_period, message):
-    """Add message that shows at specific time of day."""
+    """
+    Add message that shows at specific time of day.
+    
+    The time condition is only re-evaluated when the period changes.
+    """
     return add_trigger(
         room, "enter",
         effects=[{"type": "message", "text": message}],